@@ -426,6 +426,36 @@ def initialize_bot():
 
         return 1
 
+    finally:
+        # Write any playback state still waiting for its write-behind flush.
+        # The audio manager imports the state manager as utils.* (src is on
+        # sys.path), so that is the instance holding the pending writes.
+        try:
+            from utils.state_manager import state_manager
+
+            state_manager.flush_playback_state()
+        except Exception as flush_error:
+            log_error_with_traceback("Failed to flush playback state", flush_error)
+
+        # Snapshot listening stats so the next start has no session log to
+        # replay (the bot tracks voice sessions through src.utils.*)
+        try:
+            from src.utils.listening_stats import listening_stats_manager
+
+            listening_stats_manager.close()
+        except Exception as stats_error:
+            log_error_with_traceback("Failed to snapshot listening stats", stats_error)
+
+        # Finish queued database writes and checkpoint the WAL. The quiz,
+        # daily verse and backup managers are imported as src.utils.*, so
+        # that is the data store instance holding the queued writes.
+        try:
+            from src.utils.data_store import data_store
+
+            data_store.close()
+        except Exception as close_error:
+            log_error_with_traceback("Failed to close data store", close_error)
+
 
 # =============================================================================
 # Main Entry Point
@@ -20,10 +20,12 @@
 
 import asyncio
 import glob
+import math
 import os
 import traceback
 from pathlib import Path
 from datetime import datetime, timedelta
+from typing import Optional
 
 import discord
 from discord.ext import commands
@@ -75,11 +77,25 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 # =============================================================================
 import logging
 
+# =============================================================================
+# Import Backup Manager
+# =============================================================================
+# Imported under src.utils like the quiz and daily verse managers, so the
+# backup snapshots the one data store instance that receives their writes
+from src.utils.backup_manager import start_backup_scheduler
+
 # =============================================================================
 # Import Daily Verses Manager
 # =============================================================================
 from src.utils.daily_verses import setup_daily_verses
 
+# =============================================================================
+# Import Listening Stats Manager
+# =============================================================================
+# Under src.utils like the leaderboard command, which reads this manager's
+# in-memory totals, so both use one ListeningStatsManager
+from src.utils.listening_stats import track_voice_join, track_voice_leave
+
 # =============================================================================
 # Import Quiz Manager
 # =============================================================================
@@ -95,11 +111,6 @@ from src.version import BOT_NAME, BOT_VERSION
 # =============================================================================
 from utils.audio_manager import AudioManager
 
-# =============================================================================
-# Import Backup Manager
-# =============================================================================
-from utils.backup_manager import start_backup_scheduler
-
 # =============================================================================
 # Import Control Panel Manager
 # =============================================================================
@@ -111,9 +122,9 @@ from utils.control_panel import setup_control_panel
 from utils.discord_logger import setup_discord_logger, get_discord_logger
 
 # =============================================================================
-# Import Listening Stats Manager
+# Import Loudness Defaults
 # =============================================================================
-from utils.listening_stats import track_voice_join, track_voice_leave
+from utils.loudness import DEFAULT_TARGET_LUFS
 
 # =============================================================================
 # Import Rich Presence Manager
@@ -517,6 +528,45 @@ DEFAULT_SHUFFLE = os.getenv("DEFAULT_SHUFFLE", "false").lower() == "true"
 DEFAULT_LOOP = os.getenv("DEFAULT_LOOP", "false").lower() == "true"
 
 
+
+def _parse_loudness_target() -> Optional[float]:
+    """Read LOUDNESS_TARGET_LUFS, falling back to the default if invalid"""
+    value = os.getenv("LOUDNESS_TARGET_LUFS", str(DEFAULT_TARGET_LUFS)).strip()
+    if value.lower() in ("", "off", "none"):
+        return None
+    try:
+        target = float(value)
+        if math.isfinite(target):
+            return target
+    except ValueError:
+        pass
+    log_warning_with_context(
+        "Invalid LOUDNESS_TARGET_LUFS, using the default",
+        f"{value!r} is not a number or 'off'; using {DEFAULT_TARGET_LUFS} LUFS",
+    )
+    return DEFAULT_TARGET_LUFS
+
+
+# Loudness normalization target in LUFS ("off" disables normalization)
+LOUDNESS_TARGET_LUFS = _parse_loudness_target()
+
+# Optional HTTP origin for reciters not stored locally, with a local disk cache
+REMOTE_AUDIO_URL = os.getenv("REMOTE_AUDIO_URL", "").strip() or None
+REMOTE_CACHE_DIR = os.getenv("REMOTE_CACHE_DIR", "audio_cache/remote")
+REMOTE_CACHE_MAX_BYTES = int(float(os.getenv("REMOTE_CACHE_MAX_GB") or "2") * 1024**3)
+REMOTE_PREFETCH_SURAHS = int(os.getenv("REMOTE_PREFETCH_SURAHS") or "2")
+
+# Extra voice channels that relay the main recitation (shared decode)
+BROADCAST_CHANNEL_IDS = [
+    int(channel_id)
+    for channel_id in os.getenv("BROADCAST_CHANNEL_IDS", "").split(",")
+    if channel_id.strip().isdigit()
+]
+
+# Pause decoding while no human is in the main or broadcast channels
+IDLE_WHEN_EMPTY = os.getenv("IDLE_WHEN_EMPTY", "true").lower() == "true"
+
+
 # =============================================================================
 # Configuration Validation
 # =============================================================================
@@ -854,6 +904,11 @@ async def on_ready():
                 default_reciter=DEFAULT_RECITER,
                 default_shuffle=DEFAULT_SHUFFLE,
                 default_loop=DEFAULT_LOOP,
+                loudness_target=LOUDNESS_TARGET_LUFS,
+                remote_audio_url=REMOTE_AUDIO_URL,
+                remote_cache_dir=REMOTE_CACHE_DIR,
+                remote_cache_max_bytes=REMOTE_CACHE_MAX_BYTES,
+                remote_prefetch_count=REMOTE_PREFETCH_SURAHS,
             )
             audio_manager.set_rich_presence(rich_presence)
             log_perfect_tree_section(
@@ -1131,6 +1186,8 @@ async def on_ready():
                         setup_interval,
                         setup_leaderboard,
                         setup_question,
+                        setup_schedule,
+                        setup_seek,
                         setup_verse,
                     )
 
@@ -1138,6 +1195,8 @@ async def on_ready():
                     await setup_interval(bot)
                     await setup_leaderboard(bot)
                     await setup_question(bot)
+                    await setup_schedule(bot, audio_manager)
+                    await setup_seek(bot, audio_manager)
                     await setup_verse(bot)
 
                     # Sync commands to Discord with force sync
@@ -1148,7 +1207,7 @@ async def on_ready():
                             ("status", "✅ Slash commands synced successfully"),
                             (
                                 "available_commands",
-                                "/credits, /interval, /leaderboard, /question, /verse",
+                                "/credits, /interval, /leaderboard, /question, /schedule, /seek, /verse",
                             ),
                             ("sync_method", "Discord Tree API"),
                         ],
@@ -1165,6 +1224,13 @@ async def on_ready():
                 # Start playing audio using AudioManager
                 try:
                     await audio_manager.start_playback()
+
+                    # Relay playback to any extra broadcast channels
+                    await connect_broadcast_channels()
+
+                    # Start idle if nobody is in the channel yet
+                    await update_listener_count()
+
                     log_perfect_tree_section(
                         "Bot Initialization Complete",
                         [
@@ -1840,6 +1906,12 @@ async def on_voice_state_update(member, before, after):
                         audio_manager.set_voice_client(voice_client)
             return
 
+        # =============================================================================
+        # Listener Count (Idle Mode)
+        # =============================================================================
+        if not member.bot and before.channel != after.channel:
+            await update_listener_count()
+
         # =============================================================================
         # User Voice State Handling (Logging & Role Management)
         # =============================================================================
@@ -2711,6 +2783,72 @@ async def _handle_http_error(exc_value, event, kwargs):
         log_error_with_traceback("Error handling HTTP error", e)
 
 
+async def update_listener_count():
+    """
+    Report how many humans can hear the recitation to the audio manager.
+
+    Counts non-bot members in the main channel and every broadcast channel;
+    the audio manager pauses decoding while the count is zero.
+    """
+    global audio_manager
+
+    if not IDLE_WHEN_EMPTY or not audio_manager:
+        return
+
+    try:
+        listeners = 0
+        for channel_id in [TARGET_CHANNEL_ID, *BROADCAST_CHANNEL_IDS]:
+            channel = bot.get_channel(channel_id)
+            if isinstance(channel, discord.VoiceChannel):
+                listeners += sum(1 for m in channel.members if not m.bot)
+
+        await audio_manager.update_listener_count(listeners)
+
+    except Exception as e:
+        log_error_with_traceback("Error counting voice channel listeners", e)
+
+
+async def connect_broadcast_channels():
+    """
+    Connect to each configured broadcast channel and relay the main playback.
+
+    Listener channels share the main channel's decode and Opus encode, so
+    each extra channel only adds a packet queue.
+    """
+    global audio_manager
+
+    if not BROADCAST_CHANNEL_IDS or not audio_manager:
+        return
+
+    for channel_id in BROADCAST_CHANNEL_IDS:
+        try:
+            channel = bot.get_channel(channel_id)
+            if not isinstance(channel, discord.VoiceChannel):
+                log_warning_with_context(
+                    "Broadcast channel not found", f"Channel ID: {channel_id}"
+                )
+                continue
+
+            voice_client = channel.guild.voice_client
+            if voice_client and voice_client is audio_manager.voice_client:
+                # Discord allows one voice connection per server
+                log_warning_with_context(
+                    "Broadcast channel skipped",
+                    f"{channel.name} is in the main channel's server",
+                )
+                continue
+
+            if not voice_client or not voice_client.is_connected():
+                voice_client = await channel.connect(reconnect=True, timeout=60)
+
+            audio_manager.add_broadcast_client(voice_client)
+
+        except Exception as e:
+            log_error_with_traceback(
+                f"Error connecting broadcast channel {channel_id}", e
+            )
+
+
 async def _attempt_voice_reconnection(reason):
     """
     Attempt to reconnect to voice channel with error recovery.
@@ -9,6 +9,8 @@ from .credits import CreditsCog, setup as setup_credits
 from .interval import IntervalCog, setup as setup_interval
 from .leaderboard import LeaderboardCog, setup as setup_leaderboard
 from .question import QuestionCog, setup as setup_question
+from .schedule import ScheduleCog, setup as setup_schedule
+from .seek import SeekCog, setup as setup_seek
 from .verse import VerseCog, setup as setup_verse
 
 # Export all cogs and setup functions
@@ -18,11 +20,15 @@ __all__ = [
     "IntervalCog",
     "LeaderboardCog",
     "QuestionCog",
+    "ScheduleCog",
+    "SeekCog",
     "VerseCog",
     # Setup functions
     "setup_credits",
     "setup_interval",
     "setup_leaderboard",
     "setup_question",
+    "setup_schedule",
+    "setup_seek",
     "setup_verse",
 ]
@@ -4,21 +4,17 @@
 # Displays quiz points leaderboard with pagination using Discord.py Cogs
 # =============================================================================
 
-import json
 import os
 from datetime import datetime, timezone
-from pathlib import Path
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from src.utils.data_store import data_store
 from src.utils.listening_stats import format_listening_time, get_user_listening_stats
 from src.utils.tree_log import log_error_with_traceback, log_perfect_tree_section
 
-# Path to quiz stats file
-QUIZ_STATS_FILE = Path("data/quiz_stats.json")
-
 # =============================================================================
 # Pagination View Class
 # =============================================================================
@@ -207,25 +203,12 @@ class LeaderboardCog(commands.Cog):
     async def leaderboard(self, interaction: discord.Interaction):
         """Display the quiz points leaderboard with pagination"""
         try:
-            # Load fresh quiz stats from file each time
+            # Top 30 by points, then correct answers (indexed query)
             try:
-                if QUIZ_STATS_FILE.exists():
-                    with open(QUIZ_STATS_FILE, "r", encoding="utf-8") as f:
-                        quiz_stats = json.load(f)
-                else:
-                    quiz_stats = {"user_scores": {}}
+                sorted_users = await data_store.get_quiz_leaderboard(limit=30)
             except Exception as e:
                 log_error_with_traceback("Error loading quiz stats for leaderboard", e)
-                quiz_stats = {"user_scores": {}}
-
-            user_scores = quiz_stats.get("user_scores", {})
-
-            # Sort users by points (primary) and correct answers (secondary)
-            sorted_users = sorted(
-                user_scores.items(),
-                key=lambda x: (x[1]["points"], x[1].get("correct", 0)),
-                reverse=True,
-            )[:30]
+                sorted_users = []
 
             if not sorted_users:
                 # No users to display
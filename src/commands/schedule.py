@@ -0,0 +1,180 @@
+# =============================================================================
+# QuranBot - Schedule Command (Cog)
+# =============================================================================
+# Show when upcoming surahs will start using Discord.py Cogs
+# =============================================================================
+
+import time
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from src.utils.playback_timeline import format_eta
+from src.utils.surah_mapper import get_surah_display, validate_surah_number
+from src.utils.tree_log import (
+    log_error_with_traceback,
+    log_perfect_tree_section,
+    log_user_interaction,
+)
+
+# Surahs listed when no surah is given
+SCHEDULE_LIST_LENGTH = 10
+
+
+def format_start(seconds_from_now: float) -> str:
+    """Format a projected start as Discord's local time plus a short ETA"""
+    start = int(time.time() + seconds_from_now)
+    return f"<t:{start}:t> ({format_eta(seconds_from_now)})"
+
+
+# =============================================================================
+# Schedule Cog
+# =============================================================================
+
+
+class ScheduleCog(commands.Cog):
+    """Schedule command cog for projected surah start times"""
+
+    def __init__(self, bot, audio_manager):
+        self.bot = bot
+        self.audio_manager = audio_manager
+
+    @app_commands.command(
+        name="schedule",
+        description="🗓️ See when the next surahs (or a specific surah) will start",
+    )
+    @app_commands.describe(surah="Surah number (1-114) to look up")
+    async def schedule(
+        self, interaction: discord.Interaction, surah: Optional[int] = None
+    ):
+        """
+        Show projected start times.
+
+        Usage:
+        /schedule
+        /schedule surah:18
+        """
+        try:
+            if surah is not None and not validate_surah_number(surah):
+                embed = discord.Embed(
+                    title="❌ Invalid Surah",
+                    description="Surah number must be between 1 and 114",
+                    color=0xFF6B6B,
+                )
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+                return
+
+            manager = self.audio_manager
+            timeline = manager.get_timeline()
+            remaining = manager.get_remaining_time()
+
+            log_user_interaction(
+                interaction_type="slash_command",
+                user_name=interaction.user.display_name,
+                user_id=interaction.user.id,
+                action_description="Used /schedule",
+                details={
+                    "surah": surah,
+                    "current_surah": manager.current_surah,
+                    "projected_tracks": len(timeline) if timeline else 0,
+                },
+            )
+
+            embed = discord.Embed(title="🗓️ Recitation Schedule", color=0x00D4AA)
+            embed.add_field(
+                name="Now Playing",
+                value=f"{get_surah_display(manager.current_surah)} · "
+                f"ends {format_eta(remaining)}",
+                inline=False,
+            )
+
+            if surah is not None:
+                start = timeline.start_of(surah, remaining) if timeline else None
+                if surah == manager.current_surah:
+                    value = "Playing now"
+                elif start is not None:
+                    value = f"Starts {format_start(start)}"
+                elif manager.is_loop_enabled:
+                    value = "Not scheduled: loop mode repeats the current surah"
+                else:
+                    value = "Not scheduled yet (shuffle has not drawn it)"
+                embed.add_field(
+                    name=get_surah_display(surah), value=value, inline=False
+                )
+            else:
+                lines = [
+                    f"`{position + 1:>2}.` {get_surah_display(number)} — "
+                    f"{format_start(start)}"
+                    for position, (number, start, _) in enumerate(
+                        timeline.entries(remaining, SCHEDULE_LIST_LENGTH)
+                        if timeline
+                        else []
+                    )
+                ]
+                embed.add_field(
+                    name="Up Next",
+                    value="\n".join(lines)
+                    or "🔁 Loop mode is on: the current surah repeats",
+                    inline=False,
+                )
+
+            notes = []
+            if manager.is_paused or manager.is_idle:
+                notes.append("Playback is paused; times assume it continues now")
+            if timeline and not timeline.is_exact:
+                notes.append("Some durations are unknown, so times are early estimates")
+            if notes:
+                embed.set_footer(text=" · ".join(notes))
+
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+
+        except Exception as e:
+            log_error_with_traceback("Error in schedule command", e)
+            try:
+                if not interaction.response.is_done():
+                    await interaction.response.send_message(
+                        "❌ An error occurred while building the schedule.",
+                        ephemeral=True,
+                    )
+            except Exception:
+                pass
+
+
+# =============================================================================
+# Cog Setup
+# =============================================================================
+
+
+async def setup(bot, audio_manager):
+    """
+    Set up the Schedule cog
+    """
+    try:
+        await bot.add_cog(ScheduleCog(bot, audio_manager))
+
+        log_perfect_tree_section(
+            "Schedule Cog Setup - Complete",
+            [
+                ("status", "✅ Schedule cog loaded successfully"),
+                ("cog_name", "ScheduleCog"),
+                ("command_name", "/schedule"),
+            ],
+            "✅",
+        )
+
+    except Exception as setup_error:
+        log_error_with_traceback("Failed to set up schedule cog", setup_error)
+        raise
+
+
+# =============================================================================
+# Export Functions (for backward compatibility)
+# =============================================================================
+
+__all__ = [
+    "ScheduleCog",
+    "format_start",
+    "setup",
+]
@@ -0,0 +1,180 @@
+# =============================================================================
+# QuranBot - Seek Command (Cog)
+# =============================================================================
+# Jump to a position within the current surah using Discord.py Cogs
+# =============================================================================
+
+import re
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from src.utils.tree_log import (
+    log_error_with_traceback,
+    log_perfect_tree_section,
+    log_user_interaction,
+)
+
+TIMESTAMP_PATTERN = re.compile(r"^(?:(\d+):)?(\d{1,3}):(\d{1,2})$|^(\d+)$")
+
+
+def parse_timestamp(value: str) -> float:
+    """
+    Parse a timestamp into seconds.
+
+    Supported formats:
+    - "1:30" -> 90 seconds
+    - "01:02:03" -> 3723 seconds
+    - "45" -> 45 seconds
+
+    Returns:
+        float: Position in seconds
+
+    Raises:
+        ValueError: If format is invalid
+    """
+    match = TIMESTAMP_PATTERN.match((value or "").strip())
+    if not match:
+        raise ValueError(
+            f"Invalid timestamp: '{value}'. Use formats like '1:30', '1:02:03' or '90'"
+        )
+
+    hours, minutes, seconds, plain_seconds = match.groups()
+    if plain_seconds is not None:
+        return float(plain_seconds)
+
+    if (hours is not None and int(minutes) >= 60) or int(seconds) >= 60:
+        raise ValueError(
+            f"Invalid timestamp: '{value}'. Minutes and seconds must be below 60"
+        )
+
+    return float(int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds))
+
+
+# =============================================================================
+# Seek Cog
+# =============================================================================
+
+
+class SeekCog(commands.Cog):
+    """Seek command cog for jumping within the current surah"""
+
+    def __init__(self, bot, audio_manager):
+        self.bot = bot
+        self.audio_manager = audio_manager
+
+    @app_commands.command(
+        name="seek",
+        description="⏩ Jump to a position in the current surah (e.g. 1:30)",
+    )
+    @app_commands.describe(position="Position as mm:ss, h:mm:ss or seconds")
+    async def seek(self, interaction: discord.Interaction, position: str):
+        """
+        Restart the current surah at the given position.
+
+        Usage:
+        /seek position:12:45
+        """
+        try:
+            try:
+                seconds = parse_timestamp(position)
+            except ValueError as e:
+                embed = discord.Embed(
+                    title="❌ Invalid Position",
+                    description=str(e),
+                    color=0xFF6B6B,
+                )
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+                return
+
+            # Seeking may first build the file's seek index, which can take
+            # longer than Discord's 3-second response deadline
+            await interaction.response.defer(ephemeral=True)
+            applied = await self.audio_manager.seek_to(seconds)
+
+            log_user_interaction(
+                interaction_type="slash_command",
+                user_name=interaction.user.display_name,
+                user_id=interaction.user.id,
+                action_description=f"Used /seek to {position}",
+                details={
+                    "position": position,
+                    "seconds": seconds,
+                    "surah": self.audio_manager.current_surah,
+                    "applied": applied,
+                },
+            )
+
+            if applied:
+                embed = discord.Embed(
+                    title="⏩ Seeked",
+                    description=f"Playing from **{self.audio_manager._format_time(seconds)}**",
+                    color=0x00D4AA,
+                )
+            else:
+                duration = self.audio_manager._get_current_file_duration()
+                embed = discord.Embed(
+                    title="❌ Cannot Seek",
+                    description=(
+                        f"Position must be within the current surah "
+                        f"(0:00 – {self.audio_manager._format_time(duration)})"
+                        if self.audio_manager.is_playing and duration > 0
+                        else "Playback is not running"
+                    ),
+                    color=0xFF6B6B,
+                )
+
+            await interaction.followup.send(embed=embed, ephemeral=True)
+
+        except Exception as e:
+            log_error_with_traceback("Error in seek command", e)
+            try:
+                if not interaction.response.is_done():
+                    await interaction.response.send_message(
+                        "❌ An error occurred while seeking.", ephemeral=True
+                    )
+                else:
+                    await interaction.followup.send(
+                        "❌ An error occurred while seeking.", ephemeral=True
+                    )
+            except Exception:
+                pass
+
+
+# =============================================================================
+# Cog Setup
+# =============================================================================
+
+
+async def setup(bot, audio_manager):
+    """
+    Set up the Seek cog
+    """
+    try:
+        await bot.add_cog(SeekCog(bot, audio_manager))
+
+        log_perfect_tree_section(
+            "Seek Cog Setup - Complete",
+            [
+                ("status", "✅ Seek cog loaded successfully"),
+                ("cog_name", "SeekCog"),
+                ("command_name", "/seek"),
+            ],
+            "✅",
+        )
+
+    except Exception as setup_error:
+        log_error_with_traceback("Failed to set up seek cog", setup_error)
+        raise
+
+
+# =============================================================================
+# Export Functions (for backward compatibility)
+# =============================================================================
+
+__all__ = [
+    "SeekCog",
+    "parse_timestamp",
+    "setup",
+]
@@ -0,0 +1,530 @@
+# =============================================================================
+# QuranBot - Audio Library Manifest (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Persistent manifest of the on-disk audio library so that reciter discovery,
+# surah→file lookups and track durations never require globbing folders or
+# parsing MP3 headers on the playback hot path.
+#
+# Key Features:
+# - One manifest file covering every reciter folder
+# - Per-file duration, size, mtime and surah number
+# - Incremental refresh driven by folder mtimes
+# - New reciter folders picked up without a restart
+# - Reciters hosted on a remote origin merged in from its manifest
+# - Packed reciter archives discovered with one header read each
+# - O(1) in-memory duration and surah→file lookups
+#
+# Technical Implementation:
+# - Manifest loaded once at startup and kept in memory
+# - Only folders whose mtime changed are rescanned
+# - Only files whose size/mtime changed are re-probed with mutagen
+# - Archives are re-read only when their size/mtime changed
+# - Atomic temp-file + rename writes
+# - save_async() serializes on the event loop and writes/fsyncs in a thread
+#
+# File Structure:
+# /data/
+#   audio_library.json     - Library manifest
+#
+# Required Dependencies:
+# - mutagen: MP3 duration detection (only when a file changes)
+# =============================================================================
+
+import asyncio
+import json
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from mutagen.mp3 import MP3  # For MP3 duration detection
+
+from .audio_pack import PACK_SUFFIX, read_pack_header
+from .tree_log import log_error_with_traceback, log_perfect_tree_section
+
+MANIFEST_VERSION = 1
+SURAH_FILENAME_PATTERN = re.compile(r"^(\d+)\.mp3$", re.IGNORECASE)
+
+
+class AudioLibrary:
+    """
+    Persistent, incrementally refreshed manifest of the audio library.
+
+    The manifest is the single source of truth for what audio exists on disk.
+    AudioManager asks it for reciters, file lists, durations and surah→file
+    mappings; none of those lookups touch the filesystem once loaded.
+
+    Manifest Structure:
+    {
+        "version": 1,
+        "reciters": {
+            "<reciter>": {
+                "folder_mtime": float,
+                "files": {
+                    "001.mp3": {"surah": 1, "size": int, "mtime": float,
+                                "duration": float}
+                }
+            },
+            "<packed reciter>": {
+                "packed": true,
+                "folder": "<audio>/<reciter>.qpack",
+                "pack_size": int, "pack_mtime": float,
+                "files": {...}
+            },
+            "<remote reciter>": {
+                "remote": true,
+                "folder": "<local cache folder>",
+                "files": {...}
+            }
+        }
+    }
+
+    Implementation Notes:
+    - refresh() stats the base folder and each reciter folder only
+    - Files are re-probed only when their size or mtime changed
+    - Extra per-file keys written by other components are preserved
+    """
+
+    def __init__(
+        self,
+        audio_base_folder: str = "audio",
+        manifest_file: str = "data/audio_library.json",
+    ):
+        self.audio_base_folder = audio_base_folder
+        self.manifest_file = Path(manifest_file)
+
+        self._manifest: Dict[str, Any] = {"version": MANIFEST_VERSION, "reciters": {}}
+        self._loaded = False
+
+        # In-memory lookup tables rebuilt from the manifest
+        self._file_lists: Dict[str, List[str]] = {}
+        self._surah_lists: Dict[str, List[int]] = {}
+        self._surah_files: Dict[str, Dict[int, str]] = {}
+        self._durations: Dict[str, float] = {}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+        # Serialized snapshots are numbered so an older one never replaces
+        # a newer one when writes finish out of order
+        self._write_lock = threading.Lock()
+        self._snapshot_generation = 0
+        self._written_generation = 0
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def load(self) -> bool:
+        """Load the manifest from disk once"""
+        try:
+            self._loaded = True
+
+            if not self.manifest_file.exists():
+                return False
+
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+
+            if (
+                not isinstance(manifest, dict)
+                or manifest.get("version") != MANIFEST_VERSION
+                or not isinstance(manifest.get("reciters"), dict)
+            ):
+                log_perfect_tree_section(
+                    "Audio Library - Manifest Outdated",
+                    [
+                        ("manifest_file", str(self.manifest_file)),
+                        ("action", "🔄 Rebuilding manifest from disk"),
+                    ],
+                    "⚠️",
+                )
+                return False
+
+            self._manifest = manifest
+            self._rebuild_lookups()
+            return True
+
+        except (json.JSONDecodeError, ValueError) as e:
+            log_error_with_traceback("Audio library manifest corrupted, rebuilding", e)
+            self._manifest = {"version": MANIFEST_VERSION, "reciters": {}}
+            return False
+        except Exception as e:
+            log_error_with_traceback("Error loading audio library manifest", e)
+            return False
+
+    def save(self) -> bool:
+        """Atomically write the manifest to disk"""
+        try:
+            return self._write_snapshot(*self._serialize())
+        except Exception as e:
+            log_error_with_traceback("Error saving audio library manifest", e)
+            return False
+
+    async def save_async(self) -> bool:
+        """Write the manifest without blocking the event loop on disk I/O"""
+        try:
+            # Serialize here: the manifest is only mutated on the loop
+            return await asyncio.to_thread(self._write_snapshot, *self._serialize())
+        except Exception as e:
+            log_error_with_traceback("Error saving audio library manifest", e)
+            return False
+
+    def _serialize(self):
+        self._manifest["last_updated"] = datetime.now(timezone.utc).isoformat()
+        self._snapshot_generation += 1
+        return self._snapshot_generation, json.dumps(self._manifest, ensure_ascii=False)
+
+    def _write_snapshot(self, generation: int, data: str) -> bool:
+        with self._write_lock:
+            if generation < self._written_generation:
+                return True
+
+            self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.manifest_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+            temp_file.replace(self.manifest_file)
+            self._written_generation = generation
+            return True
+
+    # =========================================================================
+    # Refresh
+    # =========================================================================
+
+    def refresh(self) -> bool:
+        """
+        Bring the manifest in line with the audio folder.
+
+        Only reciter folders whose mtime changed since the last refresh are
+        rescanned, and only files whose size or mtime changed are re-probed.
+
+        Returns:
+            bool: True if the manifest changed
+        """
+        try:
+            if not self._loaded:
+                self.load()
+
+            reciters = self._manifest["reciters"]
+            changed = False
+            rescanned = []
+            probed_files = 0
+
+            present = set()
+            packs = {}
+            if os.path.isdir(self.audio_base_folder):
+                for item in os.listdir(self.audio_base_folder):
+                    folder_path = os.path.join(self.audio_base_folder, item)
+                    if item.endswith(PACK_SUFFIX) and os.path.isfile(folder_path):
+                        packs[item[: -len(PACK_SUFFIX)]] = folder_path
+                        continue
+                    if not os.path.isdir(folder_path):
+                        continue
+
+                    present.add(item)
+                    folder_mtime = os.stat(folder_path).st_mtime
+                    record = reciters.get(item)
+
+                    if record and record.get("folder_mtime") == folder_mtime:
+                        continue
+
+                    probed_files += self._scan_reciter(item, folder_path, folder_mtime)
+                    rescanned.append(item)
+                    changed = True
+
+            # Packed reciters (a folder of the same name takes precedence)
+            for reciter, pack_path in packs.items():
+                if reciter in present:
+                    continue
+                present.add(reciter)
+                stat = os.stat(pack_path)
+                record = reciters.get(reciter)
+                if (
+                    record
+                    and record.get("pack_size") == stat.st_size
+                    and record.get("pack_mtime") == stat.st_mtime
+                ):
+                    continue
+
+                self._scan_pack(reciter, pack_path, stat)
+                rescanned.append(reciter)
+                changed = True
+
+            # Forget reciters whose folder disappeared (remote ones have none)
+            for reciter in list(reciters):
+                if reciter not in present and not reciters[reciter].get("remote"):
+                    del reciters[reciter]
+                    changed = True
+
+            if changed:
+                self._rebuild_lookups()
+                self.save()
+
+                log_perfect_tree_section(
+                    "Audio Library - Manifest Refreshed",
+                    [
+                        ("reciters", len(self._file_lists)),
+                        ("rescanned_folders", len(rescanned)),
+                        ("probed_files", probed_files),
+                        ("manifest_file", str(self.manifest_file)),
+                    ],
+                    "📚",
+                )
+
+            return changed
+
+        except Exception as e:
+            log_error_with_traceback("Error refreshing audio library", e)
+            return False
+
+    def _scan_reciter(self, reciter: str, folder_path: str, folder_mtime: float) -> int:
+        """Rescan one reciter folder, re-probing only changed files"""
+        record = self._manifest["reciters"].get(reciter) or {"files": {}}
+        old_files = record.get("files", {})
+        new_files = {}
+        probed = 0
+
+        for filename in os.listdir(folder_path):
+            match = SURAH_FILENAME_PATTERN.match(filename)
+            if not match:
+                continue
+
+            file_path = os.path.join(folder_path, filename)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+
+            entry = old_files.get(filename)
+            if (
+                entry
+                and entry.get("size") == stat.st_size
+                and entry.get("mtime") == stat.st_mtime
+            ):
+                new_files[filename] = entry
+                continue
+
+            new_files[filename] = {
+                "surah": int(match.group(1)),
+                "size": stat.st_size,
+                "mtime": stat.st_mtime,
+                "duration": self._probe_duration(file_path),
+            }
+            probed += 1
+
+        self._manifest["reciters"][reciter] = {
+            "folder_mtime": folder_mtime,
+            "files": new_files,
+        }
+        return probed
+
+    def _scan_pack(self, reciter: str, pack_path: str, stat: os.stat_result):
+        """Read a packed reciter's header, keeping entries whose file is unchanged"""
+        header = read_pack_header(pack_path)
+        record = self._manifest["reciters"].get(reciter) or {}
+        old_files = record.get("files", {})
+        files = {}
+
+        for filename, packed in header.get("files", {}).items():
+            old = old_files.get(filename)
+            if (
+                old
+                and old.get("size") == packed.get("size")
+                and old.get("mtime") == packed.get("mtime")
+            ):
+                files[filename] = old
+                continue
+
+            # Everything but the payload offset (the pack store reads that)
+            files[filename] = {k: v for k, v in packed.items() if k != "offset"}
+
+        self._manifest["reciters"][reciter] = {
+            "packed": True,
+            "folder": pack_path,
+            "pack_size": stat.st_size,
+            "pack_mtime": stat.st_mtime,
+            "files": files,
+        }
+
+    def merge_remote(self, reciters: Dict[str, Any], cache_folder: str) -> List[str]:
+        """
+        Add the reciters listed in a remote origin's manifest.
+
+        Local reciter folders take precedence over remote reciters of the
+        same name. Remote files live under cache_folder once downloaded.
+
+        Returns:
+            List[str]: Reciters served from the origin
+        """
+        try:
+            if not self._loaded:
+                self.load()
+
+            records = self._manifest["reciters"]
+            merged = []
+            for reciter, record in reciters.items():
+                existing = records.get(reciter)
+                if existing and not existing.get("remote"):
+                    continue
+                if not isinstance(record, dict):
+                    continue
+
+                old_files = existing.get("files", {}) if existing else {}
+                files = {}
+                for filename, entry in (record.get("files") or {}).items():
+                    match = SURAH_FILENAME_PATTERN.match(filename)
+                    if not match or not isinstance(entry, dict):
+                        continue
+
+                    old = old_files.get(filename)
+                    if (
+                        old
+                        and old.get("size") == entry.get("size")
+                        and old.get("mtime") == entry.get("mtime")
+                    ):
+                        files[filename] = old  # Keep locally computed fields
+                        continue
+
+                    files[filename] = {
+                        "surah": int(match.group(1)),
+                        "size": entry.get("size", 0),
+                        "mtime": entry.get("mtime", 0.0),
+                        "duration": float(entry.get("duration") or 0.0),
+                    }
+
+                records[reciter] = {
+                    "remote": True,
+                    "folder": os.path.join(cache_folder, reciter),
+                    "files": files,
+                }
+                merged.append(reciter)
+
+            # Forget remote reciters the origin no longer serves
+            for reciter in list(records):
+                if records[reciter].get("remote") and reciter not in merged:
+                    del records[reciter]
+
+            self._rebuild_lookups()
+            self.save()
+
+            log_perfect_tree_section(
+                "Audio Library - Remote Reciters Merged",
+                [
+                    ("remote_reciters", len(merged)),
+                    ("cache_folder", cache_folder),
+                ],
+                "🌐",
+            )
+            return merged
+
+        except Exception as e:
+            log_error_with_traceback("Error merging remote audio manifest", e)
+            return []
+
+    def is_remote(self, reciter: str) -> bool:
+        """Check whether a reciter is served from a remote origin"""
+        record = self._manifest["reciters"].get(reciter)
+        return bool(record and record.get("remote"))
+
+    def _probe_duration(self, file_path: str) -> float:
+        """Read MP3 duration from file headers"""
+        try:
+            audio = MP3(file_path)
+            if audio.info and hasattr(audio.info, "length"):
+                return float(audio.info.length)
+        except Exception:
+            pass
+        return 0.0
+
+    def _rebuild_lookups(self):
+        """Rebuild in-memory lookup tables from the manifest"""
+        self._file_lists = {}
+        self._surah_lists = {}
+        self._surah_files = {}
+        self._durations = {}
+        self._entries = {}
+
+        for reciter, record in self._manifest["reciters"].items():
+            files = record.get("files", {})
+            if not files:
+                continue
+
+            folder_path = record.get("folder") or os.path.join(
+                self.audio_base_folder, reciter
+            )
+            paths = []
+            surahs = []
+            surah_map = {}
+
+            for filename in sorted(files):
+                entry = files[filename]
+                path = os.path.join(folder_path, filename)
+                paths.append(path)
+                surahs.append(entry.get("surah", 0))
+                surah_map.setdefault(entry.get("surah", 0), path)
+                self._durations[path] = float(entry.get("duration") or 0.0)
+                self._entries[path] = entry
+
+            self._file_lists[reciter] = paths
+            self._surah_lists[reciter] = surahs
+            self._surah_files[reciter] = surah_map
+
+    # =========================================================================
+    # Lookups (all O(1) / in-memory)
+    # =========================================================================
+
+    def get_reciters(self) -> List[str]:
+        """Get reciters that have at least one audio file"""
+        return sorted(self._file_lists)
+
+    def get_files(self, reciter: str) -> List[str]:
+        """Get the sorted audio file paths for a reciter"""
+        return list(self._file_lists.get(reciter, []))
+
+    def get_surah_numbers(self, reciter: str) -> List[int]:
+        """Get the surah number of each file, parallel to get_files()"""
+        return list(self._surah_lists.get(reciter, []))
+
+    def get_surah_file(self, reciter: str, surah_number: int) -> Optional[str]:
+        """Get the audio file path for a reciter's surah"""
+        return self._surah_files.get(reciter, {}).get(surah_number)
+
+    def get_duration(self, file_path: str) -> float:
+        """Get the cached duration of an audio file in seconds"""
+        return self._durations.get(file_path, 0.0)
+
+    def get_entry(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Get the manifest entry for an audio file"""
+        return self._entries.get(file_path)
+
+    def update_entry(self, file_path: str, **fields: Any) -> bool:
+        """
+        Attach extra metadata to a file's manifest entry.
+
+        Fields survive refreshes for as long as the file's size and mtime are
+        unchanged; a changed file gets a fresh entry, invalidating them.
+        Call save() afterwards to persist.
+
+        Returns:
+            bool: True if the file is in the manifest
+        """
+        entry = self._entries.get(file_path)
+        if entry is None:
+            return False
+        entry.update(fields)
+        return True
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = ["AudioLibrary", "MANIFEST_VERSION"]
@@ -11,34 +11,88 @@
 # Key Features:
 # - Multi-reciter support with dynamic discovery
 # - State persistence across bot restarts
-# - Precise playback position tracking
-# - Shuffle and loop functionality
+# - Precise playback position tracking (monotonic playback clock)
+# - Live ayah number from per-reciter timing files
+# - Reciter switches continue from the same ayah (timing alignment)
+# - Shuffle (no-repeat, persisted shuffle bag) and loop functionality
 # - Control panel integration
 # - Rich presence updates
 #
 # Technical Implementation:
 # - Uses FFmpeg for audio processing
+# - Streams pre-encoded Opus (passthrough) when available
+# - Static per-track loudness normalization from precomputed EBU R128 values
+# - Prefetches the next track's source for gapless transitions
+# - Frame-accurate MP3 seeking via a persisted byte-offset index
+# - One decode/encode fanned out to extra listener voice channels
+# - Supervised FFmpeg children: metrics, stderr capture, stall restarts
+# - Background integrity scan; known corrupt/truncated files are skipped
+# - Optional HTTP origin for reciters with an LRU disk cache and streaming
+# - Idle mode: the pipeline pauses while no human is listening
+# - Packed per-reciter archives streamed through mmap
+# - Rapid control-panel clicks coalesced through a playback command queue
+# - Explicit play queue (user-queued surahs, history, repeat mode)
+# - Projected start times of upcoming surahs (/schedule)
+# - Playback events journaled every second for crash-exact resume
 # - Async/await for non-blocking operations
-# - Mutagen for MP3 metadata handling
+# - Persistent audio library manifest for durations and file lookups
 # - State persistence with JSON storage
 # - Event-driven architecture
 #
 # Required Dependencies:
 # - discord.py: Discord API wrapper
-# - mutagen: MP3 metadata reading
+# - mutagen: MP3 metadata reading (via the audio library manifest)
 # - FFmpeg: Audio processing (path configurable)
 # =============================================================================
 
 import asyncio
-import glob
+import hashlib
 import os
-import re
 import time
+from array import array
 from typing import Any, Dict, List, Optional
 
 import discord
-from mutagen.mp3 import MP3  # For MP3 duration detection
 
+from .audio_library import AudioLibrary
+from .audio_pack import AudioPackStore, split_packed_path
+from .audio_prefetch import PREFETCH_LEAD_SECONDS, PrimedAudioSource
+from .ayah_timing import AyahTimingIndex
+from .broadcast_player import BroadcastHub
+from .ffmpeg_supervisor import FFmpegSupervisor, StderrRing, SupervisedSource
+from .idle_monitor import IdleMonitor, process_cpu_seconds
+from .integrity_verifier import IntegrityVerifier
+from .loudness import DEFAULT_TARGET_LUFS, LoudnessAnalyzer
+from .opus_cache import DEFAULT_BITRATE_KBPS, OpusCache
+from .play_queue import REPEAT_ALL, REPEAT_ONE, PlayQueue
+from .playback_clock import PlaybackClock
+from .playback_journal import (
+    EVENT_PAUSE,
+    EVENT_RECITER,
+    EVENT_RESUME,
+    EVENT_SEEK,
+    EVENT_START,
+    EVENT_STOP,
+    EVENT_TICK,
+    TICK_SECONDS,
+)
+from .playback_commands import (
+    COMMAND_JUMP,
+    COMMAND_NEXT,
+    COMMAND_PREVIOUS,
+    COMMAND_RECITER,
+    PlaybackCommandQueue,
+    coalesce,
+)
+from .playback_timeline import DEFAULT_PROJECTION_TRACKS, PlaybackTimeline
+from .remote_audio import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_MAX_CACHE_BYTES,
+    DEFAULT_PREFETCH_COUNT,
+    RemoteAudioCache,
+)
+from .seek_index import SeekIndex
+from .shuffle_bag import ShuffleBag
 from .state_manager import state_manager
 from .surah_mapper import (
     get_surah_display,
@@ -54,6 +108,9 @@ from .tree_log import (
     log_warning_with_context,
 )
 
+# Journal ticks between full playback state saves (one minute)
+STATE_SNAPSHOT_TICKS = 60
+
 
 class AudioManager:
     """
@@ -76,6 +133,7 @@ class AudioManager:
     - default_reciter: Default reciter name
     - default_shuffle: Initial shuffle state
     - default_loop: Initial loop state
+    - loudness_target: Normalization target in LUFS (None disables it)
 
     Audio File Structure:
     /audio_base_folder/
@@ -98,6 +156,11 @@ class AudioManager:
         default_reciter: str = "Saad Al Ghamdi",
         default_shuffle: bool = False,
         default_loop: bool = False,
+        loudness_target: Optional[float] = DEFAULT_TARGET_LUFS,
+        remote_audio_url: Optional[str] = None,
+        remote_cache_dir: str = DEFAULT_CACHE_DIR,
+        remote_cache_max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        remote_prefetch_count: int = DEFAULT_PREFETCH_COUNT,
     ):
         self.bot = bot
         self.ffmpeg_path = ffmpeg_path
@@ -110,6 +173,16 @@ class AudioManager:
         self.default_shuffle = default_shuffle
         self.default_loop = default_loop
 
+        # Single source of truth for the position within the current track
+        self.clock = PlaybackClock()
+
+        # Queued surahs, play history and repeat mode (is_loop_enabled)
+        self.play_queue = PlayQueue()
+
+        # Projected start times, rebuilt only when the upcoming order changes
+        self._timeline: Optional[PlaybackTimeline] = None
+        self._timeline_key: Optional[tuple] = None
+
         # Playback state - will be restored from saved state
         self.current_surah = 1
         self.current_reciter = default_reciter
@@ -121,9 +194,17 @@ class AudioManager:
         self.current_audio_files: List[str] = []
         self.current_file_index = 0
 
+        # Bidirectional surah ↔ file index lookup, rebuilt per file list load
+        self._index_to_surah = array("i")
+        self._surah_to_index = array("i", [-1]) * 115
+        self.missing_surahs: List[int] = []
+
         # Jump operation flag to prevent automatic index increment
         self._jump_occurred = False
 
+        # Navigation from the control panel, applied by the playback loop
+        self.commands = PlaybackCommandQueue()
+
         # Control panel reference
         self.control_panel_view = None
 
@@ -134,9 +215,76 @@ class AudioManager:
             asyncio.Task
         ] = None  # New task for real-time position tracking
 
-        # Position tracking state
-        self.track_start_time = None  # When current track started playing
-        self.track_pause_time = None  # When track was paused (if any)
+        # Track transition timing (end of one track -> play() of the next)
+        self._last_track_end: Optional[float] = None
+        self.transition_stats = {
+            "count": 0,
+            "last_ms": 0.0,
+            "avg_ms": 0.0,
+            "max_ms": 0.0,
+            "prefetch_hits": 0,
+            "prefetch_misses": 0,
+        }
+
+        # Next track's source, prepared shortly before the current one ends
+        self.prefetch_task: Optional[asyncio.Task] = None
+        self._prefetched_source: Optional[PrimedAudioSource] = None
+        self._planned_next_index: Optional[int] = None
+
+        # Shuffle mode play order, persisted and rebuilt when the file list changes
+        self.shuffle_bag = ShuffleBag()
+
+        # Persistent library manifest (durations, file lists, surah→file map)
+        self.library = AudioLibrary(audio_base_folder)
+
+        # Per-file loudness measurements (None when normalization is off)
+        self.loudness = (
+            LoudnessAnalyzer(ffmpeg_path, self.library, loudness_target)
+            if loudness_target is not None
+            else None
+        )
+
+        # Pre-encoded Ogg Opus cache for passthrough playback
+        self.opus_cache = OpusCache(ffmpeg_path, self.library, loudness=self.loudness)
+
+        # Reciters hosted on an HTTP origin, cached locally (None when unused)
+        self.remote_audio = (
+            RemoteAudioCache(
+                remote_audio_url,
+                remote_cache_dir,
+                remote_cache_max_bytes,
+                remote_prefetch_count,
+            )
+            if remote_audio_url
+            else None
+        )
+        self._remote_synced = False
+
+        # Memory-mapped packed reciter archives
+        self.packs = AudioPackStore()
+
+        # Per-file health from the background integrity scan
+        self.integrity = IntegrityVerifier(self.library)
+
+        # MP3 frame byte-offset tables for resume and /seek
+        self.seek_index = SeekIndex(self.library)
+        self._pending_seek: Optional[float] = None
+
+        # Ayah start times per reciter/surah, loaded on first lookup
+        self.ayah_timings = AyahTimingIndex(audio_base_folder)
+
+        # Reciter switch awaiting its first audio, and the last completed one
+        self._pending_reciter_switch: Optional[Dict[str, Any]] = None
+        self.last_reciter_switch: Optional[Dict[str, Any]] = None
+
+        # Extra voice clients that relay the main channel's Opus packets
+        self.broadcast = BroadcastHub()
+
+        # FFmpeg child metrics and stalled-decoder restarts
+        self.ffmpeg_supervisor = FFmpegSupervisor()
+
+        # Listener count and idle mode accounting
+        self.idle_monitor = IdleMonitor(cpu_time=self._pipeline_cpu_seconds)
 
         # Available reciters (based on audio folder structure)
         self.available_reciters = self._discover_reciters()
@@ -144,6 +292,53 @@ class AudioManager:
         # Load previous state
         self._load_saved_state()
 
+    @property
+    def current_position(self) -> float:
+        """Position in seconds within the current track, read from the playback clock"""
+        return self.clock.position()
+
+    @current_position.setter
+    def current_position(self, position: float):
+        self.clock.seek(position)
+
+    @property
+    def is_loop_enabled(self) -> bool:
+        """Individual surah repeat, kept as the play queue's repeat mode"""
+        return self.play_queue.repeat == REPEAT_ONE
+
+    @is_loop_enabled.setter
+    def is_loop_enabled(self, enabled: bool):
+        self.play_queue.set_repeat(REPEAT_ONE if enabled else REPEAT_ALL)
+
+    def _load_play_queue(self):
+        """Restore the play queue from its snapshot and logged changes"""
+        try:
+            snapshot, deltas = state_manager.load_play_queue()
+            self.play_queue.restore(snapshot, deltas)
+            if self.play_queue.needs_compaction():
+                self._save_play_queue()
+        except Exception as e:
+            log_error_with_traceback("Error restoring play queue", e)
+
+    def _save_play_queue(self):
+        """Persist play queue changes (a snapshot once enough have piled up)"""
+        deltas = self.play_queue.drain_deltas()
+        if self.play_queue.needs_compaction():
+            if state_manager.save_play_queue_snapshot(self.play_queue.to_dict()):
+                self.play_queue.mark_snapshot()
+        elif deltas:
+            state_manager.append_play_queue_deltas(deltas)
+
+    def _journal_event(self, kind: int):
+        """Append the current surah and position to the playback journal"""
+        state_manager.record_playback_event(
+            kind,
+            self.current_surah,
+            self.current_position,
+            self.current_reciter,
+            self.is_playing and not self.is_paused and not self.is_idle,
+        )
+
     def _load_saved_state(self):
         """Load previous playback state from state manager"""
         try:
@@ -158,6 +353,9 @@ class AudioManager:
 
             self.current_position = state["current_position"]
 
+            # Queued surahs and history survive restarts
+            self._load_play_queue()
+
             # Always reset loop and shuffle to environment defaults on restart
             self.is_loop_enabled = self.default_loop
             self.is_shuffle_enabled = self.default_shuffle
@@ -202,7 +400,8 @@ class AudioManager:
                 "Audio Manager - Position Saving",
                 [
                     ("status", "✅ Started periodic state saving"),
-                    ("interval", "5 seconds"),
+                    ("journal_interval", f"{TICK_SECONDS:g} seconds"),
+                    ("snapshot_interval", f"{STATE_SNAPSHOT_TICKS * TICK_SECONDS:g} seconds"),
                 ],
                 "💾",
             )
@@ -211,11 +410,21 @@ class AudioManager:
             log_error_with_traceback("Error starting position saving", e)
 
     async def _position_save_loop(self):
-        """Periodically save playback position"""
+        """Journal the position every tick, save the full state every minute"""
         try:
             save_counter = 0  # Counter to control logging frequency
+            tick_counter = 0
             while True:
-                await asyncio.sleep(5)  # Save every 5 seconds
+                await asyncio.sleep(TICK_SECONDS)
+
+                # One small journal append per tick while audio advances
+                if self.is_playing and self.clock.is_running:
+                    self._journal_event(EVENT_TICK)
+
+                tick_counter += 1
+                if tick_counter < STATE_SNAPSHOT_TICKS:
+                    continue
+                tick_counter = 0
                 save_counter += 1
 
                 if self.is_playing and self.rich_presence:
@@ -226,9 +435,7 @@ class AudioManager:
                         total_time = 0  # Could be enhanced with audio file metadata
 
                         # Save state silently most of the time, only log every 5 minutes
-                        should_log = (
-                            save_counter >= 60
-                        )  # Log every 60th save (5 minutes)
+                        should_log = save_counter >= 5
 
                         state_manager.save_playback_state(
                             current_surah=self.current_surah,
@@ -267,22 +474,9 @@ class AudioManager:
                 await asyncio.sleep(15)  # Update every 15 seconds
                 update_counter += 1
 
-                if self.is_playing and self.track_start_time:
+                if self.is_playing and self.clock.is_running:
                     try:
-                        # Calculate current position based on elapsed time
-                        import time
-
-                        current_time = time.time()
-                        elapsed_time = current_time - self.track_start_time
-
-                        # Get track duration to ensure we don't exceed it
-                        track_duration = self._get_current_file_duration()
-
-                        # Ensure position doesn't exceed track duration
-                        if track_duration > 0:
-                            self.current_position = min(elapsed_time, track_duration)
-                        else:
-                            self.current_position = elapsed_time
+                        # Position is read from the playback clock; nothing to compute
 
                         # Update rich presence with new time
                         if self.rich_presence:
@@ -306,7 +500,7 @@ class AudioManager:
                                 {
                                     "emoji": surah_emoji,
                                     "surah": surah_name,
-                                    "verse": "1",  # Could be enhanced with actual verse tracking
+                                    "verse": str(self.get_current_ayah() or 1),
                                     "total": verse_count,
                                     "reciter": self.current_reciter,
                                     "playback_time": self._get_playback_time_display(),
@@ -348,18 +542,12 @@ class AudioManager:
                 ],
                 "🔍",
             )
-            reciters = []
-
-            if os.path.exists(self.audio_base_folder):
-                # First pass: collect all valid reciters
-                items = sorted(os.listdir(self.audio_base_folder))
-                for item in items:
-                    folder_path = os.path.join(self.audio_base_folder, item)
-                    if os.path.isdir(folder_path):
-                        # Check if folder contains mp3 files
-                        mp3_files = glob.glob(os.path.join(folder_path, "*.mp3"))
-                        if mp3_files:
-                            reciters.append((item, len(mp3_files)))
+            # Incremental refresh: only changed folders are rescanned
+            self.library.refresh()
+            reciters = [
+                (reciter, len(self.library.get_files(reciter)))
+                for reciter in self.library.get_reciters()
+            ]
 
             result = (
                 sorted([r[0] for r in reciters]) if reciters else ["Saad Al Ghamdi"]
@@ -476,6 +664,36 @@ class AudioManager:
         except Exception as e:
             log_error_with_traceback("Error setting voice client", e)
 
+    def add_broadcast_client(self, voice_client: discord.VoiceClient) -> bool:
+        """Relay the current playback to another voice client"""
+        subscriber = self.broadcast.subscribe(voice_client)
+        channel = getattr(voice_client, "channel", None)
+        log_perfect_tree_section(
+            "Broadcast - Listener Added" if subscriber else "Broadcast - Listener Failed",
+            [
+                ("channel", getattr(channel, "name", "Unknown")),
+                ("listeners", self.broadcast.get_subscriber_count()),
+                ("decode", "Shared with main channel"),
+            ],
+            "📡" if subscriber else "⚠️",
+        )
+        return subscriber is not None
+
+    def remove_broadcast_client(self, voice_client: discord.VoiceClient) -> bool:
+        """Stop relaying playback to a voice client"""
+        removed = self.broadcast.unsubscribe(voice_client)
+        if removed:
+            channel = getattr(voice_client, "channel", None)
+            log_perfect_tree_section(
+                "Broadcast - Listener Removed",
+                [
+                    ("channel", getattr(channel, "name", "Unknown")),
+                    ("listeners", self.broadcast.get_subscriber_count()),
+                ],
+                "📡",
+            )
+        return removed
+
     def get_current_audio_folder(self) -> str:
         """Get the current audio folder path"""
         return os.path.join(self.audio_base_folder, self.current_reciter)
@@ -493,16 +711,20 @@ class AudioManager:
             )
             audio_folder = self.get_current_audio_folder()
 
-            if not os.path.exists(audio_folder):
+            if (
+                not os.path.exists(audio_folder)
+                and self.current_reciter not in self.library.get_reciters()
+            ):
                 log_warning_with_context(
                     f"Audio folder not found: {audio_folder}",
                     f"Reciter: {self.current_reciter}",
                 )
                 return False
 
-            self.current_audio_files = sorted(
-                glob.glob(os.path.join(audio_folder, "*.mp3"))
-            )
+            # Pick up files added since the last refresh, then read from memory
+            self.library.refresh()
+            self.ayah_timings.invalidate(self.current_reciter)
+            self.current_audio_files = self.library.get_files(self.current_reciter)
 
             if not self.current_audio_files:
                 log_warning_with_context(
@@ -511,9 +733,15 @@ class AudioManager:
                 )
                 return False
 
+            # Build surah ↔ index arrays once for this file list
+            self._build_surah_index()
+
             # Update file index to match current surah
             self._update_file_index_for_surah()
 
+            # Reuse the saved shuffle order unless the file list changed
+            self._load_shuffle_bag()
+
             # Check for missing surahs and log them
             self._check_missing_surahs()
 
@@ -530,35 +758,85 @@ class AudioManager:
             log_error_with_traceback("Error loading audio files", e)
             return False
 
+    def _build_surah_index(self):
+        """Build the surah → file index and file index → surah arrays"""
+        self._index_to_surah = array(
+            "i", self.library.get_surah_numbers(self.current_reciter)
+        )
+        self._surah_to_index = array("i", [-1]) * 115
+
+        for i, surah_number in enumerate(self._index_to_surah):
+            # First file wins if a surah appears twice (e.g. "1.mp3" and "001.mp3")
+            if 1 <= surah_number <= 114 and self._surah_to_index[surah_number] < 0:
+                self._surah_to_index[surah_number] = i
+
+        self.missing_surahs = [
+            surah_number
+            for surah_number in range(1, 115)
+            if self._surah_to_index[surah_number] < 0
+        ]
+
+    def _get_library_signature(self) -> str:
+        """Fingerprint the current reciter's file list for the shuffle bag"""
+        names = "\n".join(os.path.basename(path) for path in self.current_audio_files)
+        return hashlib.sha1(
+            f"{self.current_reciter}\n{names}".encode("utf-8")
+        ).hexdigest()
+
+    def _load_shuffle_bag(self):
+        """Restore the saved shuffle bag, or build a new one for this file list"""
+        try:
+            size = len(self.current_audio_files)
+            signature = self._get_library_signature()
+
+            if self.shuffle_bag.restore(
+                state_manager.load_shuffle_bag(), size, signature
+            ):
+                self.shuffle_bag.sync(self.current_file_index)
+                status = "♻️ Restored saved order"
+            else:
+                self.shuffle_bag.reset(size, signature, self.current_file_index)
+                self._save_shuffle_bag()
+                status = "🔀 New order for this file list"
+
+            log_perfect_tree_section(
+                "Shuffle Bag - Ready",
+                [
+                    ("reciter", self.current_reciter),
+                    ("files", size),
+                    ("status", status),
+                ],
+                "🔀",
+            )
+        except Exception as e:
+            log_error_with_traceback("Error loading shuffle bag", e)
+
+    def _save_shuffle_bag(self):
+        """Persist the shuffle bag after its cursor or order changed"""
+        state_manager.save_shuffle_bag(self.shuffle_bag.to_dict())
+
+    def _get_file_index_for_surah(self, surah_number: int) -> Optional[int]:
+        """Get the file index holding a surah, or None if it is missing"""
+        if not 1 <= surah_number <= 114:
+            return None
+        index = self._surah_to_index[surah_number]
+        return index if index >= 0 else None
+
     def _update_file_index_for_surah(self):
         """Update file index to match current surah"""
         try:
-            target_filename = f"{self.current_surah:03d}.mp3"
-            for i, audio_file in enumerate(self.current_audio_files):
-                if os.path.basename(audio_file) == target_filename:
-                    self.current_file_index = i
-                    break
+            index = self._get_file_index_for_surah(self.current_surah)
+            if index is not None:
+                self.current_file_index = index
         except Exception as e:
             log_error_with_traceback("Error updating file index for surah", e)
 
     def _check_missing_surahs(self):
         """Check for missing surahs in the current reciter's collection"""
         try:
-            # Get list of available surah numbers from filenames
-            available_surahs = set()
-            for audio_file in self.current_audio_files:
-                filename = os.path.basename(audio_file)
-                try:
-                    # Extract surah number from filename (e.g., "001.mp3" -> 1)
-                    surah_num = int(filename.split(".")[0])
-                    if 1 <= surah_num <= 114:  # Valid surah range
-                        available_surahs.add(surah_num)
-                except (ValueError, IndexError):
-                    continue
-
-            # Find missing surahs
-            all_surahs = set(range(1, 115))  # Surahs 1-114
-            missing_surahs = sorted(all_surahs - available_surahs)
+            # Missing surahs come from the index built at load time
+            missing_surahs = self.missing_surahs
+            available_count = 114 - len(missing_surahs)
 
             if missing_surahs:
                 # Log missing surahs in groups for better readability
@@ -587,7 +865,7 @@ class AudioManager:
                     "Audio Collection - Missing Surahs",
                     [
                         ("reciter", self.current_reciter),
-                        ("available_surahs", f"{len(available_surahs)}/114"),
+                        ("available_surahs", f"{available_count}/114"),
                         ("missing_count", len(missing_surahs)),
                         ("missing_surahs", ", ".join(missing_ranges)),
                         (
@@ -628,6 +906,8 @@ class AudioManager:
                 )
                 return
 
+            await self._sync_remote_library()
+
             if not self.load_audio_files():
                 log_warning_with_context(
                     "Cannot start playback", "No audio files loaded"
@@ -640,6 +920,9 @@ class AudioManager:
             # Start position saving
             self._start_position_saving()
 
+            # Encode, index, measure and verify in the background
+            self._start_background_stages()
+
             # Start new playback task
             self.playback_task = asyncio.create_task(
                 self._playback_loop(resume_position=resume_position)
@@ -657,6 +940,35 @@ class AudioManager:
         except Exception as e:
             log_async_error("start_playback", e, f"Reciter: {self.current_reciter}")
 
+    def _start_background_stages(self):
+        """Start the background library stages for the current reciter"""
+        # Pre-encode the library to Opus in the background, upcoming tracks first
+        index = self.current_file_index
+        upcoming = self.current_audio_files[index:] + self.current_audio_files[:index]
+
+        # Packed files keep their seek tables in the archive; remote files
+        # join these stages once they are downloaded
+        upcoming = [f for f in upcoming if os.path.isfile(f)]
+        self.opus_cache.start_background_encoding(
+            upcoming, self._get_channel_bitrate()
+        )
+
+        # Index MP3 frames for instant resume and /seek
+        self.seek_index.start_background_indexing(upcoming)
+
+        # Measure loudness once per file for static gain normalization
+        if self.loudness:
+            self.loudness.start_background_analysis(upcoming)
+
+        # Verify every reciter's files (current reciter first)
+        library_files = list(upcoming)
+        for reciter in self.library.get_reciters():
+            if reciter != self.current_reciter:
+                library_files.extend(
+                    f for f in self.library.get_files(reciter) if os.path.isfile(f)
+                )
+        self.integrity.start_background_verification(library_files)
+
     async def stop_playback(self):
         """Stop the audio playback"""
         try:
@@ -678,6 +990,7 @@ class AudioManager:
                         )
                 except Exception as e:
                     log_error_with_traceback("Error saving final state", e)
+                self._journal_event(EVENT_STOP)
 
             # Stop position saving task
             if self.position_save_task and not self.position_save_task.done():
@@ -694,6 +1007,12 @@ class AudioManager:
                 except asyncio.CancelledError:
                     pass
 
+            # Tear down any prefetched next track
+            self._cancel_prefetch()
+
+            # Nothing is left to apply queued navigation
+            self.commands.clear()
+
             if self.voice_client and self.voice_client.is_playing():
                 self.voice_client.stop()
 
@@ -729,20 +1048,15 @@ class AudioManager:
     async def pause_playback(self):
         """Pause the audio playback"""
         try:
-            if self.voice_client and self.voice_client.is_playing():
+            if self.voice_client and (
+                self.voice_client.is_playing() or self.is_idle
+            ):
                 self.voice_client.pause()
                 self.is_paused = True
 
-                # Store pause time to maintain accurate position tracking
-                import time
-
-                self.track_pause_time = time.time()
-
-                # Update current position based on elapsed time before pause
-                if self.track_start_time:
-                    self.current_position = (
-                        self.track_pause_time - self.track_start_time
-                    )
+                # Freeze the position while paused
+                self.clock.pause()
+                self._journal_event(EVENT_PAUSE)
 
                 # Update control panel
                 if self.control_panel_view:
@@ -768,16 +1082,14 @@ class AudioManager:
         """Resume the audio playback"""
         try:
             if self.voice_client and self.voice_client.is_paused():
-                self.voice_client.resume()
                 self.is_paused = False
 
-                # Adjust track start time to account for pause duration
-                if self.track_pause_time and self.track_start_time:
-                    import time
-
-                    pause_duration = time.time() - self.track_pause_time
-                    self.track_start_time += pause_duration  # Shift start time forward
-                    self.track_pause_time = None  # Clear pause time
+                # Continue from the position frozen at pause (idle mode keeps
+                # the pipeline held until a listener joins)
+                if not self.is_idle:
+                    self.voice_client.resume()
+                    self.clock.resume()
+                self._journal_event(EVENT_RESUME)
 
                 # Update control panel
                 if self.control_panel_view:
@@ -806,21 +1118,19 @@ class AudioManager:
                 log_warning_with_context("Cannot skip to next", "No audio files loaded")
                 return
 
+            # While playing, the playback loop applies it (coalescing rapid clicks)
+            if self._queue_command(COMMAND_NEXT):
+                return
+
             # Stop current playback
             if self.voice_client and self.voice_client.is_playing():
                 self.voice_client.stop()
 
             # Move to next track
-            if self.is_shuffle_enabled:
-                import random
+            self._step_next()
 
-                self.current_file_index = random.randint(
-                    0, len(self.current_audio_files) - 1
-                )
-            else:
-                self.current_file_index = (self.current_file_index + 1) % len(
-                    self.current_audio_files
-                )
+            # The index is already set; the playback loop must not advance again
+            self._jump_occurred = True
 
             # Update current surah
             self._update_current_surah()
@@ -848,21 +1158,19 @@ class AudioManager:
                 )
                 return
 
+            # While playing, the playback loop applies it (coalescing rapid clicks)
+            if self._queue_command(COMMAND_PREVIOUS):
+                return
+
             # Stop current playback
             if self.voice_client and self.voice_client.is_playing():
                 self.voice_client.stop()
 
             # Move to previous track
-            if self.is_shuffle_enabled:
-                import random
+            self._step_previous()
 
-                self.current_file_index = random.randint(
-                    0, len(self.current_audio_files) - 1
-                )
-            else:
-                self.current_file_index = (self.current_file_index - 1) % len(
-                    self.current_audio_files
-                )
+            # The index is already set; the playback loop must not advance again
+            self._jump_occurred = True
 
             # Update current surah
             self._update_current_surah()
@@ -891,33 +1199,19 @@ class AudioManager:
                 return
 
             # Find the audio file for this Surah
-            target_filename = f"{surah_number:03d}.mp3"
-            target_index = None
-
-            # Debug: Log the search process
-            search_items = [("jump_search_target", f"Looking for: {target_filename}")]
-
-            for i, audio_file in enumerate(self.current_audio_files):
-                filename = os.path.basename(audio_file)
-                search_items.append(("jump_search_check", f"Index {i}: {filename}"))
-                if filename == target_filename:
-                    target_index = i
-                    search_items.append(("jump_search_found", f"Found at index: {i}"))
-                    break
-
-            log_perfect_tree_section(
-                "Audio Jump - Search Process",
-                search_items,
-                "🔍",
-            )
+            target_index = self._get_file_index_for_surah(surah_number)
 
             if target_index is None:
                 log_warning_with_context(
                     f"Audio file not found for Surah {surah_number}",
-                    f"Looking for: {target_filename}",
+                    f"Reciter: {self.current_reciter}",
                 )
                 return
 
+            # While playing, the playback loop applies it (coalescing rapid clicks)
+            if self._queue_command(COMMAND_JUMP, surah_number):
+                return
+
             # Stop current playback
             if self.voice_client and self.voice_client.is_playing():
                 self.voice_client.stop()
@@ -953,69 +1247,360 @@ class AudioManager:
         except Exception as e:
             log_async_error("jump_to_surah", e, f"Target Surah: {surah_number}")
 
+    async def seek_to(self, position: float) -> bool:
+        """
+        Restart the current track at a position in seconds.
+
+        Returns:
+            bool: True if the seek was applied
+        """
+        try:
+            if not self.playback_task or self.playback_task.done():
+                log_warning_with_context("Cannot seek", "Playback is not running")
+                return False
+
+            if not self.current_audio_files:
+                log_warning_with_context("Cannot seek", "No audio files loaded")
+                return False
+
+            duration = self._get_current_file_duration()
+            if position < 0 or (duration > 0 and position >= duration):
+                log_warning_with_context(
+                    "Seek position out of range",
+                    f"Position: {position:.1f}s, Duration: {duration:.1f}s",
+                )
+                return False
+
+            current_file = self.current_audio_files[self.current_file_index]
+            await self.seek_index.ensure_index(current_file)
+
+            # The playback loop replays this track from the pending position
+            self._pending_seek = position
+            self._jump_occurred = True
+
+            if self.voice_client and (
+                self.voice_client.is_playing() or self.voice_client.is_paused()
+            ):
+                self.voice_client.stop()
+
+            log_perfect_tree_section(
+                "Audio Seek - Success",
+                [
+                    ("surah", self.current_surah),
+                    ("seek_to", self._format_time(position)),
+                    (
+                        "method",
+                        "Frame index"
+                        if self.seek_index.get_seek_point(current_file, position)
+                        else "FFmpeg -ss",
+                    ),
+                ],
+                "⏩",
+            )
+            return True
+
+        except Exception as e:
+            log_async_error("seek_to", e, f"Position: {position}")
+            return False
+
     async def switch_reciter(self, reciter_name: str):
         """Switch to a different reciter"""
         try:
+            if reciter_name not in self.available_reciters:
+                # A reciter folder may have been added since startup
+                self._remote_synced = False
+                await self._sync_remote_library()
+                if self.library.refresh():
+                    self.available_reciters = (
+                        self.library.get_reciters() or self.available_reciters
+                    )
+
             if reciter_name not in self.available_reciters:
                 log_warning_with_context(
                     "Reciter not available", f"Reciter: {reciter_name}"
                 )
                 return
 
+            # Note the ayah being recited; the new reciter continues from it
+            switch = {
+                "to": reciter_name,
+                "surah": self.current_surah,
+                "ayah": self.ayah_timings.get_ayah(
+                    self.current_reciter, self.current_surah, self.current_position
+                ),
+                "started_at": time.monotonic(),
+            }
+
+            # While playing, the playback loop switches without a restart
+            if self._queue_command(COMMAND_RECITER, switch):
+                return
+
             # Stop current playback
             await self.stop_playback()
 
-            # Switch reciter
-            old_reciter = self.current_reciter
-            self.current_reciter = reciter_name
+            if await self._apply_reciter_switch(switch):
+                # Restart playback (at the aligned ayah, if any)
+                await self.start_playback(resume_position=self.current_position > 0)
 
-            # Reload audio files
-            if self.load_audio_files():
-                log_perfect_tree_section(
-                    "Reciter Switch - Success",
-                    [
-                        ("switching_reciter", f"From {old_reciter} to {reciter_name}"),
-                        ("reciter_switched", f"{old_reciter} → {reciter_name}"),
-                    ],
-                    "🎙️",
+        except Exception as e:
+            log_async_error("switch_reciter", e, f"Target reciter: {reciter_name}")
+
+    async def _apply_reciter_switch(self, switch: Dict[str, Any]) -> bool:
+        """
+        Load another reciter's files, lined up with the ayah that was playing.
+
+        Returns:
+            bool: True if the new reciter's files loaded
+        """
+        old_reciter = self.current_reciter
+        reciter_name = switch["to"]
+
+        # Navigation applied in the same batch makes the captured ayah stale
+        ayah = switch["ayah"] if switch["surah"] == self.current_surah else None
+
+        self.current_reciter = reciter_name
+        if not self.load_audio_files():
+            # Revert if failed
+            self.current_reciter = old_reciter
+            self.load_audio_files()
+            log_warning_with_context(
+                "Failed to switch reciter", f"Reverted to: {old_reciter}"
+            )
+            return False
+
+        # Seconds differ between recordings; ayah boundaries do not
+        start_position = None
+        if ayah is not None:
+            start_position = self.ayah_timings.get_ayah_start(
+                reciter_name, self.current_surah, ayah
+            )
+        self.current_position = start_position or 0.0
+        self._journal_event(EVENT_RECITER)
+        self._pending_reciter_switch = {
+            "from": old_reciter,
+            "to": reciter_name,
+            "surah": self.current_surah,
+            "ayah": ayah if start_position is not None else None,
+            "position": self.current_position,
+            "started_at": switch["started_at"],
+        }
+
+        log_perfect_tree_section(
+            "Reciter Switch - Success",
+            [
+                ("switching_reciter", f"From {old_reciter} to {reciter_name}"),
+                ("reciter_switched", f"{old_reciter} → {reciter_name}"),
+                (
+                    "continue_from",
+                    f"Ayah {ayah} at {self._format_time(self.current_position)}"
+                    if start_position is not None
+                    else "Start of surah (no ayah timings)",
+                ),
+            ],
+            "🎙️",
+        )
+
+        # Log reciter switch to Discord
+        from src.utils.discord_logger import get_discord_logger
+        discord_logger = get_discord_logger()
+        if discord_logger:
+            try:
+                await discord_logger.log_bot_activity(
+                    "reciter_switch",
+                    f"switched reciter from {old_reciter} to {reciter_name}",
+                    {
+                        "Previous Reciter": old_reciter,
+                        "New Reciter": reciter_name,
+                        "Current Surah": f"{self.current_surah}. {self._get_surah_name(self.current_surah)}",
+                        "Audio Files": f"{len(self.current_audio_files)} files loaded",
+                        "Action": (
+                            f"Continuing from ayah {ayah}"
+                            if start_position is not None
+                            else "Automatic restart with new reciter"
+                        ),
+                    }
                 )
+            except:
+                pass
 
-                # Log reciter switch to Discord
-                from src.utils.discord_logger import get_discord_logger
-                discord_logger = get_discord_logger()
-                if discord_logger:
-                    try:
-                        await discord_logger.log_bot_activity(
-                            "reciter_switch",
-                            f"switched reciter from {old_reciter} to {reciter_name}",
-                            {
-                                "Previous Reciter": old_reciter,
-                                "New Reciter": reciter_name,
-                                "Current Surah": f"{self.current_surah}. {self._get_surah_name(self.current_surah)}",
-                                "Audio Files": f"{len(self.current_audio_files)} files loaded",
-                                "Action": "Automatic restart with new reciter"
-                            }
-                        )
-                    except:
-                        pass
+        return True
 
-                # Restart playback
-                await self.start_playback()
-            else:
-                # Revert if failed
-                self.current_reciter = old_reciter
-                self.load_audio_files()
+    def _queue_command(self, kind: str, value: Any = None) -> bool:
+        """
+        Hand a navigation command to the running playback loop.
+
+        Returns:
+            bool: False if playback is not running (the caller applies it directly)
+        """
+        if not self.playback_task or self.playback_task.done():
+            return False
+
+        depth = self.commands.submit(kind, value)
+
+        # Ending the track wakes the loop; clicks that follow find nothing playing
+        if self.voice_client and (
+            self.voice_client.is_playing() or self.voice_client.is_paused()
+        ):
+            self.voice_client.stop()
+
+        log_perfect_tree_section(
+            "Playback Command - Queued",
+            [
+                ("command", kind),
+                ("queue_depth", depth),
+            ],
+            "🎛️",
+        )
+        return True
+
+    async def _apply_playback_commands(self) -> bool:
+        """
+        Apply the queued navigation commands as a single move.
+
+        Returns:
+            bool: True if playback should start at current_position
+        """
+        batch = await self.commands.take_batch()
+        if not batch:
+            return False
+
+        target = coalesce(batch)
+        navigated = target["surah"] is not None or target["steps"] != 0
+
+        if target["surah"] is not None:
+            index = self._get_file_index_for_surah(target["surah"])
+            if index is not None:
+                self.current_file_index = index
+        for _ in range(target["steps"]):
+            self._step_next()
+        for _ in range(-target["steps"]):
+            self._step_previous()
+
+        self._planned_next_index = None
+        self._update_current_surah()
+        self.current_position = 0.0
+
+        resume = False
+        switch = target["reciter"]
+        if switch:
+            if navigated:
+                switch = dict(switch, ayah=None)
+            if await self._apply_reciter_switch(switch):
+                self._start_background_stages()
+                resume = self.current_position > 0
+
+        log_perfect_tree_section(
+            "Playback Commands - Applied",
+            [
+                ("commands", len(batch)),
+                ("coalesced", len(batch) - 1),
+                ("target", f"Surah {self.current_surah}"),
+                ("reciter", self.current_reciter),
+            ],
+            "🎛️",
+        )
+        return resume
+
+    def _step_next(self):
+        """Move to the next track, reusing the planned (and possibly prefetched) one"""
+        if self.is_loop_enabled and not self.play_queue:
+            # Loop mode plans a repeat, but skipping should still move on
+            self.current_file_index = (self.current_file_index + 1) % len(
+                self.current_audio_files
+            )
+        else:
+            self._advance_to_next()
+
+        # The plan was for the track just left
+        self._planned_next_index = None
+
+    def _step_previous(self):
+        """Move to the previous track (in shuffle mode, the one actually heard before)"""
+        previous_index = None
+        if self.is_shuffle_enabled:
+            self.shuffle_bag.sync(self.current_file_index)
+            previous_index = self.shuffle_bag.previous()
+            self._save_shuffle_bag()
+
+        if previous_index is not None:
+            self.current_file_index = previous_index
+        else:
+            self.current_file_index = (self.current_file_index - 1) % len(
+                self.current_audio_files
+            )
+        self._planned_next_index = None
+
+    def queue_surah(self, surah_number: int, play_next: bool = False) -> bool:
+        """
+        Queue a surah to play after the current one.
+
+        Args:
+            surah_number: Surah to queue
+            play_next: Put it at the front of the queue instead of the end
+
+        Returns:
+            bool: True if the surah was queued
+        """
+        try:
+            if not validate_surah_number(surah_number):
+                log_warning_with_context(
+                    "Invalid Surah number", f"Surah: {surah_number}"
+                )
+                return False
+
+            if self._get_file_index_for_surah(surah_number) is None:
+                log_warning_with_context(
+                    f"Audio file not found for Surah {surah_number}",
+                    f"Reciter: {self.current_reciter}",
+                )
+                return False
+
+            queued = (
+                self.play_queue.push_next(surah_number)
+                if play_next
+                else self.play_queue.push(surah_number)
+            )
+            if not queued:
                 log_warning_with_context(
-                    "Failed to switch reciter", f"Reverted to: {old_reciter}"
+                    "Play queue is full", f"Queued: {len(self.play_queue)} surahs"
                 )
+                return False
+            self._save_play_queue()
+
+            # The track after this one may have changed
+            self._planned_next_index = None
+            self._replan_prefetch()
+
+            log_perfect_tree_section(
+                "Play Queue - Surah Added",
+                [
+                    ("surah", get_surah_display(surah_number)),
+                    ("position", "Next" if play_next else len(self.play_queue)),
+                    ("queue_length", len(self.play_queue)),
+                ],
+                "➕",
+            )
+            return True
 
         except Exception as e:
-            log_async_error("switch_reciter", e, f"Target reciter: {reciter_name}")
+            log_error_with_traceback("Error queueing surah", e)
+            return False
+
+    def clear_play_queue(self) -> int:
+        """Remove every queued surah, returning how many were dropped"""
+        dropped = self.play_queue.clear()
+        if dropped:
+            self._save_play_queue()
+            self._planned_next_index = None
+            self._replan_prefetch()
+        return dropped
 
     def toggle_loop(self):
         """Toggle individual surah loop mode (24/7 playback continues regardless)"""
         try:
             self.is_loop_enabled = not self.is_loop_enabled
+            self._save_play_queue()
+            self._replan_prefetch()
             log_perfect_tree_section(
                 "Audio Settings - Loop Toggle",
                 [
@@ -1039,6 +1624,7 @@ class AudioManager:
         """Toggle shuffle mode"""
         try:
             self.is_shuffle_enabled = not self.is_shuffle_enabled
+            self._replan_prefetch()
             log_perfect_tree_section(
                 "Audio Settings - Shuffle Toggle",
                 [
@@ -1055,16 +1641,7 @@ class AudioManager:
             if self.current_audio_files and self.current_file_index < len(
                 self.current_audio_files
             ):
-                current_file = self.current_audio_files[self.current_file_index]
-                filename = os.path.basename(current_file)
-
-                # Extract surah number from filename
-                match = re.search(r"(\d+)", filename)
-                if match:
-                    self.current_surah = int(match.group(1))
-                else:
-                    # Fallback: use file index + 1
-                    self.current_surah = self.current_file_index + 1
+                self.current_surah = self._index_to_surah[self.current_file_index]
 
                 # Ensure surah is within valid range
                 if not (1 <= self.current_surah <= 114):
@@ -1074,6 +1651,80 @@ class AudioManager:
             log_error_with_traceback("Error updating current surah", e)
             self.current_surah = 1
 
+    @property
+    def is_idle(self) -> bool:
+        """True while playback is held because no human is listening"""
+        return self.idle_monitor.is_idle
+
+    def _pipeline_cpu_seconds(self) -> float:
+        """Get CPU seconds used by the bot and its FFmpeg children so far"""
+        current = self.ffmpeg_supervisor.current
+        child = current.get_metrics()["cpu_seconds"] if current else None
+        return process_cpu_seconds() + (child or 0.0)
+
+    def _hold_for_idle(self):
+        """Stop pulling audio from FFmpeg and freeze the position"""
+        if self.voice_client and self.voice_client.is_playing():
+            self.voice_client.pause()
+        self.clock.pause()
+
+    def _release_idle(self):
+        """Continue playback held by idle mode (a manual pause stays paused)"""
+        if self.is_paused:
+            return
+        if self.voice_client and self.voice_client.is_paused():
+            self.voice_client.resume()
+        self.clock.resume()
+
+    async def update_listener_count(self, listeners: int):
+        """
+        Enter idle mode when the last human leaves and leave it on the next join.
+
+        Args:
+            listeners: Human members across the main and broadcast channels
+        """
+        try:
+            if not self.idle_monitor.update(listeners):
+                return
+
+            stats = self.idle_monitor.get_stats()
+            if self.is_idle:
+                self._hold_for_idle()
+                log_perfect_tree_section(
+                    "Idle Mode - Entered",
+                    [
+                        ("reason", "No human listeners"),
+                        ("held_at", self._format_time(self.current_position)),
+                        ("playing_cpu", f"{stats['active_cpu_percent']:.1f}%"),
+                    ],
+                    "💤",
+                )
+            else:
+                self._release_idle()
+                log_perfect_tree_section(
+                    "Idle Mode - Resumed",
+                    [
+                        ("listeners", listeners),
+                        ("resumed_at", self._format_time(self.current_position)),
+                        ("idle_hours_total", stats["idle_hours"]),
+                        ("cpu_hours_saved", stats["cpu_hours_saved"]),
+                    ],
+                    "▶️",
+                )
+
+        except Exception as e:
+            log_error_with_traceback("Error updating listener count", e)
+
+    def get_current_ayah(self) -> Optional[int]:
+        """Get the ayah being recited now, if the reciter has timing data"""
+        try:
+            return self.ayah_timings.get_ayah(
+                self.current_reciter, self.current_surah, self.current_position
+            )
+        except Exception as e:
+            log_error_with_traceback("Error looking up current ayah", e)
+            return None
+
     def _format_time(self, seconds: float) -> str:
         """Format seconds to MM:SS or H:MM:SS like the control panel"""
         try:
@@ -1100,12 +1751,8 @@ class AudioManager:
 
             current_file = self.current_audio_files[self.current_file_index]
 
-            # Use mutagen to get MP3 duration
-            audio = MP3(current_file)
-            if audio.info and hasattr(audio.info, "length"):
-                return float(audio.info.length)
-            else:
-                return 0.0
+            # Cached in the library manifest - no file parsing on the hot path
+            return self.library.get_duration(current_file)
 
         except Exception as e:
             log_error_with_traceback("Error getting MP3 duration", e)
@@ -1114,18 +1761,8 @@ class AudioManager:
     def _get_playback_time_display(self) -> str:
         """Get formatted playback time display like control panel"""
         try:
-            # Calculate real-time position based on track start time
-            current_time_seconds = 0.0
-
-            if self.is_playing and self.track_start_time:
-                import time
-
-                current_time = time.time()
-                # This calculation already accounts for resumed position
-                current_time_seconds = current_time - self.track_start_time
-            else:
-                # Use saved position when not playing
-                current_time_seconds = self.current_position
+            # Live while playing, the resume point otherwise
+            current_time_seconds = self.current_position
 
             # Get the real duration of the current MP3 file
             total_time_seconds = self._get_current_file_duration()
@@ -1145,11 +1782,607 @@ class AudioManager:
             log_error_with_traceback("Error getting playback time display", e)
             return "00:00 / 00:00"
 
+    def _get_channel_bitrate(self) -> int:
+        """Get the voice channel's bitrate in kbps for Opus output"""
+        try:
+            channel = getattr(self.voice_client, "channel", None)
+            bitrate = getattr(channel, "bitrate", None)
+            if isinstance(bitrate, int) and bitrate > 0:
+                return max(8, min(bitrate // 1000, 512))
+        except Exception:
+            pass
+        return DEFAULT_BITRATE_KBPS
+
+    def _create_audio_source(
+        self, file_path: str, position: float = 0.0
+    ) -> discord.AudioSource:
+        """Build the playback source, preferring the pre-encoded Opus cache"""
+        before_options = f"-ss {position}" if position > 0 else None
+        options = "-vn -nostats -loglevel warning"  # Only problems reach stderr
+        stderr = StderrRing()
+
+        if self.remote_audio and self.remote_audio.owns(file_path):
+            stream = self.remote_audio.open_stream(file_path)
+            if stream:
+                # Still downloading: feed FFmpeg what has arrived through stdin
+                source = discord.FFmpegPCMAudio(
+                    stream,
+                    pipe=True,
+                    executable=self.ffmpeg_path,
+                    before_options=before_options,
+                    options=options,
+                    stderr=stderr,
+                )
+                return SupervisedSource(source, file_path, stderr)
+
+        cached_path = self.opus_cache.get_cached_path(
+            file_path, self._get_channel_bitrate()
+        )
+        if cached_path:
+            # Opus passthrough: no MP3 decode and no PCM → Opus re-encode.
+            # Ogg pages carry granule positions, so -ss seeks accurately here.
+            source = discord.FFmpegOpusAudio(
+                cached_path,
+                codec="copy",
+                executable=self.ffmpeg_path,
+                before_options=before_options,
+                options=options,
+                stderr=stderr,
+            )
+            return SupervisedSource(source, file_path, stderr)
+
+        # Start decoding at the indexed frame and trim the few seconds left
+        offset = 0
+        seek_point = self.seek_index.get_seek_point(file_path, position)
+        if position > 0 and seek_point:
+            offset, residual = seek_point
+            before_options = f"-skip_initial_bytes {offset}"
+            if residual > 0:
+                options += f" -ss {residual:.3f}"
+
+        # The cached encode already has the gain; the PCM path applies it here
+        if self.loudness:
+            gain_db = self.loudness.get_gain_db(file_path)
+            if gain_db:
+                options += f" -af volume={gain_db:.1f}dB"
+
+        if split_packed_path(file_path):
+            # Packed archive: pipe the member from the mmap, already at the frame
+            member = self.packs.open_member(file_path, offset)
+            if member:
+                source = discord.FFmpegPCMAudio(
+                    member,
+                    pipe=True,
+                    executable=self.ffmpeg_path,
+                    before_options=None if offset else before_options,
+                    options=options,
+                    stderr=stderr,
+                )
+                return SupervisedSource(source, file_path, stderr)
+
+        # Fall back to decoding the MP3 until the cache has this track
+        source = discord.FFmpegPCMAudio(
+            file_path,
+            executable=self.ffmpeg_path,
+            before_options=before_options,
+            options=options,
+            stderr=stderr,
+        )
+        return SupervisedSource(source, file_path, stderr)
+
+    def _get_next_file_index(self) -> int:
+        """Decide (once per track) which file index plays after the current one"""
+        if self._planned_next_index is None:
+            queued_index = self._next_queued_index()
+            if queued_index is not None:
+                # Surahs queued by users come before the automatic order
+                self._planned_next_index = queued_index
+            elif self.is_loop_enabled:
+                self._planned_next_index = self.current_file_index
+            elif self.is_shuffle_enabled:
+                # Record the track now playing, then take the bag's next file
+                changed = self.shuffle_bag.sync(self.current_file_index)
+                index = self.shuffle_bag.peek_next()
+                for _ in range(self.shuffle_bag.size - 1):
+                    if not self.integrity.is_known_bad(self.current_audio_files[index]):
+                        break
+                    self.shuffle_bag.drop_next()
+                    index = self.shuffle_bag.peek_next()
+                    changed = True
+                if changed:
+                    self._save_shuffle_bag()
+                self._planned_next_index = index
+            else:
+                self._planned_next_index = self._next_playable_index(
+                    self.current_file_index
+                )
+        return self._planned_next_index
+
+    def _next_queued_index(self) -> Optional[int]:
+        """Get the file index of the first queued surah this reciter has"""
+        dropped = False
+        while self.play_queue:
+            index = self._get_file_index_for_surah(self.play_queue.peek())
+            if index is not None:
+                break
+            # Not in this reciter's collection
+            self.play_queue.pop()
+            dropped = True
+        else:
+            index = None
+
+        if dropped:
+            self._save_play_queue()
+        return index
+
+    def _advance_to_next(self) -> bool:
+        """
+        Move to the planned next track, taking it off the play queue if queued.
+
+        Returns:
+            bool: True if the track came from the play queue
+        """
+        index = self._get_next_file_index()
+        from_queue = bool(self.play_queue) and (
+            self._index_to_surah[index] == self.play_queue.peek()
+        )
+        if from_queue:
+            self.play_queue.pop()
+            self._save_play_queue()
+
+        self.current_file_index = index
+        return from_queue
+
+    def _project_order(self, count: int) -> List[int]:
+        """
+        Predict the file indices of the next tracks without changing any plan.
+
+        Queued surahs come first. Loop mode repeats the last of them, so the
+        projection ends there; shuffle mode follows the bag's drawn order.
+        """
+        order = []
+        for surah in self.play_queue.get_upcoming():
+            index = self._get_file_index_for_surah(surah)
+            if index is not None:
+                order.append(index)
+        if self.is_loop_enabled or len(order) >= count:
+            return order[:count]
+
+        if self.is_shuffle_enabled:
+            # Syncing the bag onto the current and queued files pulls them
+            # forward out of its future
+            bag = self.shuffle_bag
+            future = bag.order[bag.position + 1 :]
+            pulled = order + (
+                [self.current_file_index]
+                if bag.current() != self.current_file_index
+                else []
+            )
+            for index in pulled:
+                if index in future:
+                    future.remove(index)
+            for index in future:
+                if len(order) >= count:
+                    break
+                if not self.integrity.is_known_bad(self.current_audio_files[index]):
+                    order.append(index)
+            return order
+
+        index = order[-1] if order else self.current_file_index
+        while len(order) < count:
+            index = self._next_playable_index(index)
+            order.append(index)
+        return order
+
+    def get_timeline(
+        self, count: int = DEFAULT_PROJECTION_TRACKS
+    ) -> Optional[PlaybackTimeline]:
+        """
+        Get projected start times of the upcoming tracks.
+
+        The projection is cached until the order changes (track change,
+        skip, queue or mode change); durations come from the in-memory
+        library manifest.
+        """
+        try:
+            if not self.current_audio_files:
+                return None
+
+            count = min(count, len(self.current_audio_files))
+            key = (
+                self.current_reciter,
+                len(self.current_audio_files),
+                self.current_file_index,
+                tuple(self.play_queue.upcoming),
+                self.is_loop_enabled,
+                self.is_shuffle_enabled,
+                self.shuffle_bag.position,
+                len(self.shuffle_bag.order),
+                count,
+            )
+            if key != self._timeline_key:
+                order = self._project_order(count)
+                self._timeline = PlaybackTimeline(
+                    [self._index_to_surah[index] for index in order],
+                    [
+                        self.library.get_duration(self.current_audio_files[index])
+                        for index in order
+                    ],
+                )
+                self._timeline_key = key
+            return self._timeline
+
+        except Exception as e:
+            log_error_with_traceback("Error projecting playback timeline", e)
+            return None
+
+    def get_remaining_time(self) -> float:
+        """Get the seconds left in the current track"""
+        duration = self._get_current_file_duration()
+        return max(0.0, duration - self.current_position) if duration > 0 else 0.0
+
+    def _next_playable_index(self, index: int) -> int:
+        """Get the next file index after `index` that is not known to be bad"""
+        count = len(self.current_audio_files)
+        for step in range(1, count + 1):
+            candidate = (index + step) % count
+            if not self.integrity.is_known_bad(self.current_audio_files[candidate]):
+                return candidate
+        return (index + 1) % count  # Everything failed verification; play anyway
+
+    def _skip_known_bad_file(self) -> bool:
+        """
+        Move off the current file if the integrity scan found it corrupt.
+
+        Returns:
+            bool: True if the current file index changed
+        """
+        current_file = self.current_audio_files[self.current_file_index]
+        if not self.integrity.is_known_bad(current_file):
+            return False
+
+        next_index = self._next_playable_index(self.current_file_index)
+        if self.integrity.is_known_bad(self.current_audio_files[next_index]):
+            return False
+
+        health = self.integrity.get_health(current_file) or {}
+        log_perfect_tree_section(
+            "Audio Playback - Skipping Bad File",
+            [
+                ("file", os.path.basename(current_file)),
+                ("health", health.get("status", "unknown")),
+                (
+                    "audio",
+                    f"{health.get('duration', 0):.1f}s of "
+                    f"{health.get('tagged_duration', 0):.1f}s",
+                ),
+            ],
+            "🩺",
+        )
+        self.current_file_index = next_index
+        self._planned_next_index = None
+        return True
+
+    def _schedule_prefetch(self):
+        """(Re)start preparing the track that follows the one now playing"""
+        self._cancel_prefetch()
+        self._planned_next_index = None
+        self.prefetch_task = asyncio.create_task(self._prefetch_next_track())
+        self._prefetch_remote_files()
+
+    def _prefetch_remote_files(self):
+        """Download the next few remote surahs and keep them from eviction"""
+        try:
+            if not self.remote_audio or not self.current_audio_files:
+                return
+            current_file = self.current_audio_files[self.current_file_index]
+            if not self.remote_audio.owns(current_file):
+                return
+
+            upcoming = [current_file]
+            if not self.is_loop_enabled:
+                index = self._get_next_file_index()
+                for step in range(self.remote_audio.prefetch_count):
+                    upcoming.append(self.current_audio_files[index])
+                    bag = self.shuffle_bag
+                    if self.is_shuffle_enabled:
+                        ahead = bag.position + 2 + step
+                        if ahead >= len(bag.order):
+                            break
+                        index = bag.order[ahead]
+                    else:
+                        index = self._next_playable_index(index)
+
+            self.remote_audio.prefetch(upcoming)
+
+        except Exception as e:
+            log_error_with_traceback("Error prefetching remote audio", e)
+
+    async def _sync_remote_library(self):
+        """Merge the origin's reciters into the library (once per session)"""
+        if not self.remote_audio or self._remote_synced:
+            return
+
+        manifest = await self.remote_audio.fetch_manifest()
+        if not manifest:
+            return
+
+        self.library.merge_remote(manifest["reciters"], self.remote_audio.cache_dir)
+        self.available_reciters = self.library.get_reciters() or self.available_reciters
+        self._remote_synced = True
+
+    def _replan_prefetch(self):
+        """Drop a next-track plan made stale by a loop/shuffle change"""
+        if self.playback_task and not self.playback_task.done():
+            self._schedule_prefetch()
+
+    def _cancel_prefetch(self):
+        """Cancel pending prefetch work and tear down any prepared source"""
+        if self.prefetch_task and not self.prefetch_task.done():
+            self.prefetch_task.cancel()
+        self.prefetch_task = None
+
+        if self._prefetched_source:
+            self._prefetched_source.cleanup()
+            self._prefetched_source = None
+
+    def _take_prefetched_source(self, file_path: str) -> Optional[PrimedAudioSource]:
+        """Hand over the prefetched source if it is for this track"""
+        source, self._prefetched_source = self._prefetched_source, None
+        pending = self.prefetch_task is not None and not self.prefetch_task.done()
+        self._cancel_prefetch()
+
+        if source and source.matches(file_path, self._get_channel_bitrate()):
+            self.transition_stats["prefetch_hits"] += 1
+            return source
+
+        # Skip, jump or mode change made the prefetch stale, or it wasn't ready
+        if source:
+            source.cleanup()
+        if source or pending:
+            self.transition_stats["prefetch_misses"] += 1
+        return None
+
+    async def _prefetch_next_track(self):
+        """Spawn and prime the next track's source a few seconds before the end"""
+        try:
+            while self.clock.is_active:
+                duration = self._get_current_file_duration()
+                if duration <= 0:
+                    break
+
+                remaining = duration - self.clock.position()
+                if remaining <= PREFETCH_LEAD_SECONDS:
+                    break
+
+                # Re-check rather than sleep once; pauses and seeks move the position
+                await asyncio.sleep(min(remaining - PREFETCH_LEAD_SECONDS, 30))
+
+            if not self.current_audio_files:
+                return
+
+            next_file = self.current_audio_files[self._get_next_file_index()]
+            source = PrimedAudioSource(
+                self._create_audio_source(next_file),
+                next_file,
+                self._get_channel_bitrate(),
+            )
+            try:
+                # First read blocks on FFmpeg startup; keep it off the event loop
+                ready = await asyncio.to_thread(source.prime)
+            except BaseException:
+                source.cleanup()
+                raise
+
+            if not ready:
+                source.cleanup()
+                return
+
+            self._prefetched_source = source
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log_error_with_traceback("Error prefetching next track", e)
+
+    async def _watch_decoder(self, track_finished: asyncio.Future):
+        """Restart the current track's decoder if it stops producing frames"""
+        supervisor = self.ffmpeg_supervisor
+        while not track_finished.done():
+            await asyncio.sleep(1)
+
+            stalled_for = supervisor.check(paused=self.is_paused or self.is_idle)
+            if stalled_for is None:
+                continue
+
+            supervised = supervisor.current
+            restart = supervisor.can_restart() and self._pending_seek is None
+            if restart:
+                # Replay from the last audio actually produced
+                supervisor.record_restart()
+                self._pending_seek = max(0.0, self.clock.position() - stalled_for)
+                self._jump_occurred = True
+
+            log_perfect_tree_section(
+                "FFmpeg Supervisor - Decoder Stalled",
+                [
+                    ("file", os.path.basename(supervised.file_path)),
+                    ("pid", supervised.pid),
+                    ("stalled_for", f"{stalled_for:.1f}s"),
+                    ("frames", supervised.frames),
+                    (
+                        "action",
+                        f"Restarting at {self._format_time(self._pending_seek)}"
+                        if restart
+                        else "Restart limit reached, moving on",
+                    ),
+                    ("restarts_total", supervisor.stats["restarts"]),
+                    ("stderr", supervised.stderr.tail(3) or "(empty)"),
+                ],
+                "🩺",
+            )
+
+            # Ends the blocked read; the playback loop handles the restart
+            supervised.kill()
+            return
+
+    def _log_decoder_failure(
+        self,
+        filename: str,
+        supervised: Optional[SupervisedSource],
+        error: Optional[Exception],
+    ):
+        """Log a track that ended with an FFmpeg or player error"""
+        self.ffmpeg_supervisor.record_failure()
+        if error:
+            log_error_with_traceback(f"Playback error for: {filename}", error)
+
+        if supervised:
+            log_perfect_tree_section(
+                "FFmpeg Supervisor - Decoder Failed",
+                [
+                    ("file", filename),
+                    ("pid", supervised.pid),
+                    ("exit_code", supervised.returncode),
+                    ("frames", supervised.frames),
+                    ("stderr", supervised.stderr.tail() or "(empty)"),
+                ],
+                "❌",
+            )
+
+    def _make_after_callback(self, track_finished: asyncio.Future):
+        """Bridge the voice client's after callback (audio thread) onto the event loop"""
+        loop = asyncio.get_running_loop()
+
+        def _after(error: Optional[Exception]):
+            ended_at = time.monotonic()
+            try:
+                loop.call_soon_threadsafe(
+                    self._on_track_finished, track_finished, error, ended_at
+                )
+            except RuntimeError:
+                pass  # Event loop already closed during shutdown
+
+        return _after
+
+    def _on_track_finished(
+        self,
+        track_finished: asyncio.Future,
+        error: Optional[Exception],
+        ended_at: float,
+    ):
+        """Resolve the track future when the voice client finishes a track"""
+        # A cancelled future means playback was stopped, not a transition
+        if track_finished.done():
+            return
+        self._last_track_end = ended_at
+        track_finished.set_result(error)
+
+    def _record_transition_gap(self):
+        """Record the time between the previous track ending and the next play()"""
+        if self._last_track_end is None:
+            return
+
+        gap_ms = (time.monotonic() - self._last_track_end) * 1000
+        self._last_track_end = None
+
+        stats = self.transition_stats
+        stats["count"] += 1
+        stats["last_ms"] = gap_ms
+        stats["max_ms"] = max(stats["max_ms"], gap_ms)
+        stats["avg_ms"] += (gap_ms - stats["avg_ms"]) / stats["count"]
+
+    def _record_reciter_switch_latency(self):
+        """Record the time from a reciter switch request to the new reciter's audio"""
+        switch = self._pending_reciter_switch
+        if switch is None:
+            return
+
+        self._pending_reciter_switch = None
+        started_at = switch.pop("started_at")
+        switch["latency_ms"] = round((time.monotonic() - started_at) * 1000, 1)
+        self.last_reciter_switch = switch
+
+        log_perfect_tree_section(
+            "Reciter Switch - Audio Started",
+            [
+                ("reciter", switch["to"]),
+                ("ayah", switch["ayah"] or "Start of surah"),
+                ("position", self._format_time(switch["position"])),
+                ("switch_latency", f"{switch['latency_ms']:.0f}ms"),
+            ],
+            "🎙️",
+        )
+
+    def get_transition_stats(self) -> Dict[str, float]:
+        """Get track transition gap statistics in milliseconds"""
+        return dict(self.transition_stats)
+
+    async def _announce_track_start(self):
+        """Update rich presence, Discord log and control panel for a new track"""
+        # Log automatic surah start to Discord
+        from src.utils.discord_logger import get_discord_logger
+
+        discord_logger = get_discord_logger()
+        if discord_logger:
+            try:
+                surah_name = self._get_surah_name(self.current_surah)
+                await discord_logger.log_bot_activity(
+                    "surah_start",
+                    f"started playing {surah_name}",
+                    {
+                        "Surah Number": str(self.current_surah),
+                        "Surah Name": surah_name,
+                        "Reciter": self.current_reciter,
+                        "File Index": f"{self.current_file_index + 1}/{len(self.current_audio_files)}",
+                        "Position": f"{self.current_position:.1f}s"
+                        if self.current_position > 0
+                        else "From beginning",
+                        "Ayah": str(self.get_current_ayah() or "Unknown"),
+                    },
+                )
+            except:
+                pass
+
+        # Start Rich Presence tracking
+        if self.rich_presence and validate_surah_number(self.current_surah):
+            try:
+                surah_name = get_surah_name(self.current_surah)
+                surah_info = get_surah_info(self.current_surah)
+                verse_count = str(surah_info.verses) if surah_info else "Unknown"
+                surah_emoji = surah_info.emoji if surah_info else "📖"
+
+                self.rich_presence.update_presence_with_template(
+                    "listening",
+                    {
+                        "emoji": surah_emoji,
+                        "surah": surah_name,
+                        "verse": str(self.get_current_ayah() or 1),
+                        "total": verse_count,  # Now shows actual verse count
+                        "reciter": self.current_reciter,
+                        "playback_time": self._get_playback_time_display(),
+                    },
+                )
+
+            except Exception as e:
+                log_error_with_traceback("Error starting rich presence track", e)
+
+        # Update control panel
+        if self.control_panel_view:
+            try:
+                await self.control_panel_view.update_panel()
+            except Exception as e:
+                log_error_with_traceback(
+                    "Error updating control panel during playback",
+                    e,
+                )
+
     async def _playback_loop(self, resume_position: bool = True):
         """Main playback loop with resume capability"""
         try:
             # Check if we should resume from saved position
             should_resume = resume_position and self.current_position > 0
+            start_event = EVENT_START  # Journaled when the clock starts
 
             # Special handling for tracks that are complete or nearly complete
             if should_resume and self.rich_presence:
@@ -1241,6 +2474,10 @@ class AudioManager:
                         )
                         break
 
+                    # Control-panel navigation, coalesced into one target
+                    if self.commands:
+                        should_resume = await self._apply_playback_commands()
+
                     # Get current audio file
                     if self.current_file_index >= len(self.current_audio_files):
                         if self.is_loop_enabled:
@@ -1255,6 +2492,11 @@ class AudioManager:
                             )
                             break
 
+                    # Skip files the integrity scan found corrupt or truncated
+                    if self._skip_known_bad_file():
+                        should_resume = False
+                        self.current_position = 0.0
+
                     current_file = self.current_audio_files[self.current_file_index]
                     filename = os.path.basename(current_file)
 
@@ -1266,26 +2508,6 @@ class AudioManager:
                         self.current_file_index + 1, len(self.current_audio_files)
                     )
 
-                    # Log automatic surah start to Discord
-                    from src.utils.discord_logger import get_discord_logger
-                    discord_logger = get_discord_logger()
-                    if discord_logger:
-                        try:
-                            surah_name = self._get_surah_name(self.current_surah)
-                            await discord_logger.log_bot_activity(
-                                "surah_start",
-                                f"started playing {surah_name}",
-                                {
-                                    "Surah Number": str(self.current_surah),
-                                    "Surah Name": surah_name,
-                                    "Reciter": self.current_reciter,
-                                    "File Index": f"{self.current_file_index + 1}/{len(self.current_audio_files)}",
-                                    "Position": f"{self.current_position:.1f}s" if self.current_position > 0 else "From beginning"
-                                }
-                            )
-                        except:
-                            pass
-
                     if validate_surah_number(self.current_surah):
                         surah_display = get_surah_display(self.current_surah)
                         log_perfect_tree_section(
@@ -1296,41 +2518,7 @@ class AudioManager:
                             "🎵",
                         )
 
-                        # Start Rich Presence tracking
-                        if self.rich_presence:
-                            try:
-                                # Use update_presence_with_template instead of start_track
-                                from src.utils.surah_mapper import (
-                                    get_surah_info,
-                                    get_surah_name,
-                                )
-
-                                surah_name = get_surah_name(self.current_surah)
-                                surah_info = get_surah_info(self.current_surah)
-                                verse_count = (
-                                    str(surah_info.verses) if surah_info else "Unknown"
-                                )
-                                surah_emoji = surah_info.emoji if surah_info else "📖"
-
-                                self.rich_presence.update_presence_with_template(
-                                    "listening",
-                                    {
-                                        "emoji": surah_emoji,
-                                        "surah": surah_name,
-                                        "verse": "1",  # Could be enhanced with actual verse tracking
-                                        "total": verse_count,  # Now shows actual verse count
-                                        "reciter": self.current_reciter,
-                                        "playback_time": self._get_playback_time_display(),
-                                    },
-                                )
-
-                                # Note: seek_to_position doesn't exist either, so we'll skip that
-                                should_resume = False  # Only resume once
-
-                            except Exception as e:
-                                log_error_with_traceback(
-                                    "Error starting rich presence track", e
-                                )
+                    track_error = None
 
                     # Create and play audio source with resume capability
                     try:
@@ -1358,13 +2546,10 @@ class AudioManager:
                                 should_resume = False
 
                         if should_resume and self.current_position > 0:
-                            # Use FFmpeg to start from specific position
-                            seek_options = f"-ss {self.current_position}"
-                            source = discord.FFmpegPCMAudio(
-                                current_file,
-                                executable=self.ffmpeg_path,
-                                before_options=seek_options,
-                                options="-vn -loglevel quiet",  # Suppress FFmpeg logs
+                            # Start at the exact frame (index built once per file)
+                            await self.seek_index.ensure_index(current_file)
+                            source = self._create_audio_source(
+                                current_file, self.current_position
                             )
                             should_resume = False  # Only resume once
                             log_perfect_tree_section(
@@ -1375,24 +2560,40 @@ class AudioManager:
                                 "⏯️",
                             )
                         else:
-                            source = discord.FFmpegPCMAudio(
-                                current_file,
-                                executable=self.ffmpeg_path,
-                                options="-vn -loglevel quiet",  # Suppress FFmpeg logs
-                            )
+                            source = self._take_prefetched_source(
+                                current_file
+                            ) or self._create_audio_source(current_file)
+
+                        # Completion is signalled by the voice client's after callback
+                        track_finished = asyncio.get_running_loop().create_future()
 
                         # Use a wrapper to catch FFmpeg process errors
                         try:
-                            self.voice_client.play(source)
+                            self.voice_client.play(
+                                self.broadcast.wrap(
+                                    source, self._get_channel_bitrate()
+                                ),
+                                after=self._make_after_callback(track_finished),
+                            )
+                            self._record_transition_gap()
+                            self._record_reciter_switch_latency()
                             self.is_playing = True
                             self.is_paused = False
 
-                            # Set track start time for position tracking
-                            import time
+                            # Seeks and decoder restarts replay, they are not new plays
+                            if self.play_queue.get_history(1) != [self.current_surah]:
+                                self.play_queue.record_played(self.current_surah)
+                                self._save_play_queue()
+                            supervised = self.ffmpeg_supervisor.attach(source)
+
+                            # Run the clock from current_position (0, resume point or seek)
+                            self.clock.start()
+                            self._journal_event(start_event)
+                            start_event = EVENT_START
 
-                            # Always account for current position when setting track start time
-                            # This ensures position tracking works correctly on resume
-                            self.track_start_time = time.time() - self.current_position
+                            # Nobody is listening: hold the new track at its start
+                            if self.is_idle:
+                                self._hold_for_idle()
 
                             # Start position tracking task
                             if (
@@ -1403,83 +2604,62 @@ class AudioManager:
                                     self._position_tracking_loop()
                                 )
 
-                            # Update control panel
-                            if self.control_panel_view:
-                                try:
-                                    await self.control_panel_view.update_panel()
-                                except Exception as e:
-                                    log_error_with_traceback(
-                                        "Error updating control panel during playback",
-                                        e,
-                                    )
+                            # Prepare the following track while this one plays
+                            self._schedule_prefetch()
 
-                            # Wait for playback to finish with better error handling
-                            while (
-                                self.voice_client.is_playing()
-                                or self.voice_client.is_paused()
-                            ):
-                                await asyncio.sleep(1)
+                            # Presence, Discord log and panel updates run once audio is flowing
+                            await self._announce_track_start()
 
-                            # Mark surah as completed
-                            state_manager.mark_surah_completed()
+                            # Wait for the voice client to report the end of the track,
+                            # restarting the decoder if it stops producing audio
+                            watchdog = asyncio.create_task(
+                                self._watch_decoder(track_finished)
+                            )
+                            try:
+                                track_error = await track_finished
+                            finally:
+                                watchdog.cancel()
 
-                            # Log successful completion
-                            log_perfect_tree_section(
-                                "Audio Track - Completed",
-                                [
-                                    (
-                                        "track_completed",
-                                        f"Finished playing: {filename}",
-                                    ),
-                                    ("surah", self.current_surah),
-                                    ("status", "✅ Track completed successfully"),
-                                ],
-                                "✅",
+                            ffmpeg_status = (
+                                supervised.exit_status() if supervised else "completed"
                             )
+                            if track_error or ffmpeg_status == "failed":
+                                self._log_decoder_failure(
+                                    filename, supervised, track_error
+                                )
+                            elif self._pending_seek is None and ffmpeg_status != "killed":
+                                # Mark surah as completed
+                                state_manager.mark_surah_completed()
 
-                        except Exception as voice_error:
-                            # Handle voice client specific errors
-                            error_msg = str(voice_error).lower()
-                            if any(
-                                keyword in error_msg
-                                for keyword in ["broken pipe", "ffmpeg", "terminated"]
-                            ):
-                                # This is a normal FFmpeg termination - not an error
+                                # Log successful completion
                                 log_perfect_tree_section(
-                                    "Audio Track - Normal Completion",
+                                    "Audio Track - Completed",
                                     [
-                                        ("track_finished", f"Track ended: {filename}"),
+                                        (
+                                            "track_completed",
+                                            f"Finished playing: {filename}",
+                                        ),
                                         ("surah", self.current_surah),
-                                        ("status", "✅ Normal track completion"),
+                                        ("status", "✅ Track completed successfully"),
                                     ],
                                     "✅",
                                 )
-                            else:
-                                log_error_with_traceback(
-                                    f"Voice client error for: {filename}", voice_error
-                                )
 
-                    except Exception as e:
-                        # Log the error but don't crash - continue to next track
-                        error_msg = str(e).lower()
-                        if "broken pipe" in error_msg or "ffmpeg" in error_msg:
-                            log_perfect_tree_section(
-                                "Audio Track - FFmpeg Transition",
-                                [
-                                    (
-                                        "track_transition",
-                                        f"Track completed: {filename}",
-                                    ),
-                                    ("surah", self.current_surah),
-                                    ("status", "✅ Moving to next track"),
-                                ],
-                                "✅",
-                            )
-                        else:
+                        except Exception as voice_error:
+                            # Voice client refused the source (not connected, already playing)
+                            track_error = voice_error
                             log_error_with_traceback(
-                                f"Error playing audio file: {filename}", e
+                                f"Voice client error for: {filename}", voice_error
                             )
 
+                    except Exception as e:
+                        # Log the error but don't crash - continue to next track.
+                        # FFmpeg exits are classified by the supervisor, not here.
+                        track_error = e
+                        log_error_with_traceback(
+                            f"Error playing audio file: {filename}", e
+                        )
+
                         # Continue to next track on any error
                         pass
 
@@ -1495,11 +2675,17 @@ class AudioManager:
                                 )
 
                     # Reset position for next track
-                    self.current_position = 0.0
-                    self.track_start_time = None  # Reset track timing for next track
+                    self.clock.stop()
+
+                    # A seek restarts the same track at the requested position
+                    if self._pending_seek is not None:
+                        self.current_position = self._pending_seek
+                        self._pending_seek = None
+                        should_resume = True
+                        start_event = EVENT_SEEK
 
-                    # Handle loop mode for individual surah
-                    if self.is_loop_enabled:
+                    # Handle loop mode for individual surah (queued surahs go first)
+                    if self.is_loop_enabled and not self.play_queue:
                         # Loop button is ON - repeat the same surah
                         log_perfect_tree_section(
                             "Audio Loop - Individual Surah",
@@ -1510,10 +2696,11 @@ class AudioManager:
                             "🔁",
                         )
                         # Don't increment index - stay on same surah
+                        self._jump_occurred = False
                         continue
 
-                    # Move to next track (unless a jump occurred)
-                    if self._jump_occurred:
+                    # Move to next track (unless a jump occurred or is queued)
+                    if self._jump_occurred or self.commands:
                         # Jump occurred, don't increment - just clear the flag
                         self._jump_occurred = False
                         log_perfect_tree_section(
@@ -1526,19 +2713,19 @@ class AudioManager:
                             ],
                             "🔄",
                         )
-                    elif self.is_shuffle_enabled:
-                        import random
-
-                        self.current_file_index = random.randint(
-                            0, len(self.current_audio_files) - 1
-                        )
                     else:
-                        # Normal progression - always continue 24/7
-                        self.current_file_index += 1
+                        # Normal progression - always continue 24/7.
+                        # Uses the index the prefetch stage already planned
+                        # (including the shuffle pick) so its source matches.
+                        previous_index = self.current_file_index
+                        from_queue = self._advance_to_next()
 
                         # 24/7 Continuous Playback: Always restart from beginning after last surah
-                        if self.current_file_index >= len(self.current_audio_files):
-                            self.current_file_index = 0
+                        if (
+                            not self.is_shuffle_enabled
+                            and not from_queue
+                            and self.current_file_index < previous_index
+                        ):
                             log_perfect_tree_section(
                                 "Audio Playback - 24/7 Restart",
                                 [
@@ -1567,17 +2754,10 @@ class AudioManager:
                                 except:
                                     pass
 
-                    # Update control panel after track change
-                    if self.control_panel_view:
-                        try:
-                            await self.control_panel_view.update_panel()
-                        except Exception as e:
-                            log_error_with_traceback(
-                                "Error updating control panel after track change", e
-                            )
-
-                    # Small delay to prevent rapid cycling on repeated errors
-                    await asyncio.sleep(0.5)
+                    # Back off only after a failed track to prevent rapid cycling;
+                    # normal transitions start the next track immediately
+                    if track_error:
+                        await asyncio.sleep(0.5)
 
                     # 24/7 mode - never break the loop, always continue playing
 
@@ -1600,6 +2780,10 @@ class AudioManager:
             try:
                 self.is_playing = False
                 self.is_paused = False
+                self._cancel_prefetch()
+
+                # Hold the position reached so a restart resumes from it
+                self.clock.stop(self.current_position)
 
                 # Update control panel
                 if self.control_panel_view:
@@ -1639,17 +2823,38 @@ class AudioManager:
                 "available_reciters": self.available_reciters,
                 "current_time": 0,
                 "total_time": 0,
+                "transition_gap_ms": self.transition_stats["last_ms"],
+                "broadcast_listeners": self.broadcast.get_subscriber_count(),
+                "ffmpeg": self.ffmpeg_supervisor.get_stats(),
+                "current_ayah": self.get_current_ayah(),
+                "last_reciter_switch": self.last_reciter_switch,
+                "remote_cache": (
+                    self.remote_audio.get_stats() if self.remote_audio else None
+                ),
+                "idle": self.idle_monitor.get_stats(),
+                "commands": self.commands.get_stats(),
+                "play_queue": self.play_queue.get_stats(),
+                "state_writes": state_manager.get_write_stats(),
+                "state_reads": state_manager.get_read_stats(),
+                "journal": state_manager.playback_journal.get_stats(),
+                "schedule": None,
             }
 
-            # Use the exact same time calculation as rich presence
-            # This ensures both control panel and rich presence show identical times
-            status[
-                "current_time"
-            ] = self.current_position  # Use actual current position
+            # Next few projected starts (cached until the order changes)
+            timeline = self.get_timeline()
+            if timeline:
+                status["schedule"] = timeline.to_dict(self.get_remaining_time())
 
             # Get the real duration of the current MP3 file
             status["total_time"] = self._get_current_file_duration()
 
+            # Same playback clock as rich presence and state saving
+            status["current_time"] = (
+                min(self.current_position, status["total_time"])
+                if status["total_time"] > 0
+                else self.current_position
+            )
+
             return status
 
         except Exception as e:
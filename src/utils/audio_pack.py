@@ -0,0 +1,280 @@
+# =============================================================================
+# QuranBot - Packed Reciter Archives (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Optional single-file container for a reciter's library. One archive is
+# quicker to copy or sync between machines than 114 MP3s, and discovering it
+# takes one header read instead of listing and stat'ing a folder.
+#
+# Key Features:
+# - Index header with offsets, sizes, durations, seek tables and content
+#   hashes, followed by the unmodified MP3 payloads
+# - Carries the reciter's ayah timings
+# - Payloads are read through a shared read-only mmap per archive
+# - Pack and unpack helpers (tools/pack_audio.py)
+#
+# Technical Implementation:
+# - Layout: b"QPAK" | u16 version | u32 header length | JSON header | payloads
+# - Payload offsets in the header are relative to the end of the header
+# - Library paths look like "<audio>/<reciter>.qpack/001.mp3"
+# - Members are fed to FFmpeg through stdin (discord.py pipe=True)
+#
+# File Structure:
+# /audio/
+#   <reciter>.qpack        - Packed reciter (a folder of the same name wins)
+#
+# Required Dependencies:
+# - None (standard library only)
+# =============================================================================
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from .seek_index import build_seek_index
+from .tree_log import log_error_with_traceback
+
+PACK_SUFFIX = ".qpack"
+PACK_MAGIC = b"QPAK"
+PACK_VERSION = 1
+PREAMBLE = struct.Struct("<4sHI")
+
+AYAH_TIMINGS_FILENAME = "ayah_timings.json"
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Per-file fields copied from the library manifest into the header when present
+CARRIED_FIELDS = ("loudness", "health")
+
+
+def split_packed_path(file_path: str) -> Optional[Tuple[str, str]]:
+    """Split "<archive>.qpack/<member>" into (archive path, member name)"""
+    pack_path, member = os.path.split(file_path)
+    if pack_path.endswith(PACK_SUFFIX):
+        return pack_path, member
+    return None
+
+
+def read_pack_header(pack_path: str) -> Dict[str, Any]:
+    """Read an archive's header (one small read at the start of the file)"""
+    with open(pack_path, "rb") as f:
+        magic, version, length = PREAMBLE.unpack(f.read(PREAMBLE.size))
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"Not a version {PACK_VERSION} audio pack: {pack_path}")
+        header = json.loads(f.read(length).decode("utf-8"))
+
+    header["data_offset"] = PREAMBLE.size + length
+    return header
+
+
+def write_pack(
+    folder: str,
+    pack_path: str,
+    reciter: Optional[str] = None,
+    manifest_entries: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> int:
+    """
+    Pack a reciter folder into a single archive.
+
+    Args:
+        folder: Reciter folder with NNN.mp3 files
+        pack_path: Archive to write (replaced atomically)
+        reciter: Name stored in the header (defaults to the folder name)
+        manifest_entries: Library manifest entries by filename, for
+            measurements worth keeping (loudness, health)
+
+    Returns:
+        int: Number of files packed
+    """
+    from .audio_library import SURAH_FILENAME_PATTERN  # audio_library imports us
+
+    files = {}
+    offset = 0
+    names = sorted(
+        name for name in os.listdir(folder) if SURAH_FILENAME_PATTERN.match(name)
+    )
+    for name in names:
+        path = os.path.join(folder, name)
+        stat = os.stat(path)
+        index = build_seek_index(path)
+        entry = {
+            "surah": int(SURAH_FILENAME_PATTERN.match(name).group(1)),
+            "offset": offset,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "duration": index["duration"] if index else 0.0,
+            "seek_index": index,
+        }
+        known = (manifest_entries or {}).get(name) or {}
+        entry.update({k: known[k] for k in CARRIED_FIELDS if known.get(k)})
+        files[name] = entry
+        offset += stat.st_size
+
+    header = {"reciter": reciter or os.path.basename(folder), "files": files}
+    timings_file = os.path.join(folder, AYAH_TIMINGS_FILENAME)
+    if os.path.exists(timings_file):
+        with open(timings_file, "r", encoding="utf-8") as f:
+            header["ayah_timings"] = json.load(f)
+
+    # Hashes are taken while copying; they are the Opus cache keys
+    temp_file = pack_path + ".tmp"
+    with open(temp_file, "wb") as out:
+        header_size = _write_header(out, header, placeholder=True)
+        for name in names:
+            digest = hashlib.sha1()
+            with open(os.path.join(folder, name), "rb") as src:
+                for chunk in iter(lambda: src.read(COPY_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    out.write(chunk)
+            files[name]["sha1"] = digest.hexdigest()
+
+        out.seek(0)
+        if _write_header(out, header, pad_to=header_size) != header_size:
+            raise ValueError("Audio pack header changed size")
+        out.flush()
+        os.fsync(out.fileno())
+
+    os.replace(temp_file, pack_path)
+    return len(names)
+
+
+def _write_header(
+    out, header: Dict[str, Any], placeholder: bool = False, pad_to: int = 0
+) -> int:
+    """Write the preamble and JSON header, returning the bytes written"""
+    if placeholder:
+        # Reserve room for the SHA-1s added once the payloads are copied
+        for entry in header["files"].values():
+            entry["sha1"] = "0" * 40
+
+    body = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    if pad_to:
+        body = body.ljust(pad_to - PREAMBLE.size, b" ")
+    out.write(PREAMBLE.pack(PACK_MAGIC, PACK_VERSION, len(body)))
+    out.write(body)
+    return PREAMBLE.size + len(body)
+
+
+def unpack(pack_path: str, folder: str) -> int:
+    """
+    Extract an archive back into a reciter folder.
+
+    Returns:
+        int: Number of files extracted
+    """
+    header = read_pack_header(pack_path)
+    os.makedirs(folder, exist_ok=True)
+
+    with open(pack_path, "rb") as f:
+        for name, entry in header["files"].items():
+            path = os.path.join(folder, name)
+            f.seek(header["data_offset"] + entry["offset"])
+            remaining = entry["size"]
+            with open(path, "wb") as out:
+                while remaining:
+                    chunk = f.read(min(COPY_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        raise ValueError(f"Audio pack truncated at {name}")
+                    out.write(chunk)
+                    remaining -= len(chunk)
+            os.utime(path, (entry["mtime"], entry["mtime"]))
+
+    if header.get("ayah_timings"):
+        with open(
+            os.path.join(folder, AYAH_TIMINGS_FILENAME), "w", encoding="utf-8"
+        ) as f:
+            json.dump(header["ayah_timings"], f)
+
+    return len(header["files"])
+
+
+class PackedMemberReader:
+    """File-like reader over one payload of a memory-mapped archive"""
+
+    def __init__(self, data: mmap.mmap, start: int, end: int):
+        self._data = data
+        self.position = start
+        self.end = end
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            size = self.end - self.position
+        chunk = self._data[self.position : min(self.position + size, self.end)]
+        self.position += len(chunk)
+        return chunk
+
+    def close(self):
+        self.position = self.end
+
+
+class AudioPackStore:
+    """
+    Open archives, each mapped once and shared by every reader.
+
+    Implementation Notes:
+    - An archive is re-mapped when its size or mtime changes; readers of the
+      old mapping keep it alive until they finish
+    - Readers run on discord.py's pipe writer threads; mapping is locked
+    """
+
+    def __init__(self):
+        self._packs: Dict[str, Tuple[Tuple[int, float], mmap.mmap, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _get_pack(self, pack_path: str):
+        stat = os.stat(pack_path)
+        version = (stat.st_size, stat.st_mtime)
+        with self._lock:
+            pack = self._packs.get(pack_path)
+            if pack is None or pack[0] != version:
+                header = read_pack_header(pack_path)
+                with open(pack_path, "rb") as f:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                pack = (version, data, header)
+                self._packs[pack_path] = pack
+            return pack
+
+    def open_member(
+        self, file_path: str, byte_offset: int = 0
+    ) -> Optional[PackedMemberReader]:
+        """Get a reader for a packed file, starting byte_offset into it"""
+        try:
+            location = split_packed_path(file_path)
+            if not location:
+                return None
+            pack_path, member = location
+
+            _, data, header = self._get_pack(pack_path)
+            entry = header["files"].get(member)
+            if entry is None:
+                return None
+
+            start = header["data_offset"] + entry["offset"]
+            return PackedMemberReader(
+                data, start + min(byte_offset, entry["size"]), start + entry["size"]
+            )
+
+        except Exception as e:
+            log_error_with_traceback(f"Error opening packed audio {file_path}", e)
+            return None
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "AudioPackStore",
+    "PackedMemberReader",
+    "read_pack_header",
+    "split_packed_path",
+    "unpack",
+    "write_pack",
+    "PACK_SUFFIX",
+]
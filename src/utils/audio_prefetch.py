@@ -0,0 +1,86 @@
+# =============================================================================
+# QuranBot - Audio Prefetch (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Primed audio sources for gapless track transitions. The next track's FFmpeg
+# process is spawned and its first frame buffered while the current track is
+# still playing, so the voice client can switch without waiting on process
+# startup, file probing or the first pipe read.
+#
+# Key Features:
+# - Wraps any discord.py AudioSource (PCM or Opus passthrough)
+# - First frame read ahead of time, served on the first read()
+# - Clean teardown of unused prefetched FFmpeg processes
+#
+# Technical Implementation:
+# - prime() performs the blocking first read; run it in a worker thread
+# - All other calls delegate to the wrapped source
+#
+# Required Dependencies:
+# - discord.py: AudioSource interface
+# =============================================================================
+
+from typing import Optional
+
+import discord
+
+# How long before the end of the current track the next source is prepared
+PREFETCH_LEAD_SECONDS = 5.0
+
+
+class PrimedAudioSource(discord.AudioSource):
+    """
+    AudioSource wrapper that has already pulled its first frame.
+
+    Implementation Notes:
+    - prime() blocks until FFmpeg produces output; call it off the event loop
+    - A source that returns no audio on prime() is reported as not ready
+    - cleanup() is idempotent so discarded prefetches can be torn down safely
+    """
+
+    def __init__(self, source: discord.AudioSource, file_path: str, bitrate_kbps: int):
+        self.source = source
+        self.file_path = file_path
+        self.bitrate_kbps = bitrate_kbps
+        self._first_frame: Optional[bytes] = None
+        self._cleaned_up = False
+
+    def prime(self) -> bool:
+        """Read the first frame so the source is ready to play immediately"""
+        if self._first_frame is None:
+            self._first_frame = self.source.read()
+        return bool(self._first_frame)
+
+    def matches(self, file_path: str, bitrate_kbps: int) -> bool:
+        """Check whether this prefetch is for the given track and bitrate"""
+        return (
+            not self._cleaned_up
+            and self.file_path == file_path
+            and self.bitrate_kbps == bitrate_kbps
+        )
+
+    def read(self) -> bytes:
+        if self._first_frame is not None:
+            frame, self._first_frame = self._first_frame, None
+            return frame
+        return self.source.read()
+
+    def is_opus(self) -> bool:
+        return self.source.is_opus()
+
+    def cleanup(self) -> None:
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
+        self._first_frame = None
+        self.source.cleanup()
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = ["PrimedAudioSource", "PREFETCH_LEAD_SECONDS"]
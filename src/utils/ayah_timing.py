@@ -0,0 +1,164 @@
+# =============================================================================
+# QuranBot - Ayah Timing Index (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Maps a playback position to the ayah being recited, so rich presence, the
+# control panel and Discord logs can show the live verse instead of "1".
+#
+# Key Features:
+# - Optional per-reciter timing file next to the audio files (or inside a
+#   packed reciter archive)
+# - Loaded lazily: a reciter's file is read on first lookup, a surah's
+#   array is built on first lookup within it
+# - Compact sorted float arrays (8 bytes per ayah)
+# - O(log n) position → ayah lookup, O(1) ayah → position
+#
+# Technical Implementation:
+# - array('d') of ayah start times per (reciter, surah)
+# - bisect_right over the array; positions before the first start map to 1
+#
+# File Structure:
+# /audio/<reciter>/
+#   ayah_timings.json  - {"<surah>": [start of ayah 1, start of ayah 2, ...]}
+#                        start times in seconds from the beginning of the file
+#
+# Required Dependencies:
+# - None (standard library only)
+# =============================================================================
+
+import json
+import os
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, Optional, Tuple
+
+from .audio_pack import AYAH_TIMINGS_FILENAME, PACK_SUFFIX, read_pack_header
+from .tree_log import log_error_with_traceback, log_perfect_tree_section
+
+
+class AyahTimingIndex:
+    """
+    Lazily loaded ayah start times for every reciter and surah.
+
+    Implementation Notes:
+    - Reciters without a timing file are remembered so the folder is only
+      checked once
+    - Invalid or unsorted surah entries are skipped (lookups return None)
+    - invalidate() drops a reciter's data after its timing file changes
+    """
+
+    def __init__(self, audio_base_folder: str = "audio"):
+        self.audio_base_folder = audio_base_folder
+        self._raw: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._arrays: Dict[Tuple[str, int], Optional[array]] = {}
+
+    def _load_reciter(self, reciter: str) -> Optional[Dict[str, Any]]:
+        """Read a reciter's timing file once"""
+        if reciter in self._raw:
+            return self._raw[reciter]
+
+        timings = None
+        timing_file = os.path.join(
+            self.audio_base_folder, reciter, AYAH_TIMINGS_FILENAME
+        )
+        pack_path = os.path.join(self.audio_base_folder, reciter + PACK_SUFFIX)
+        try:
+            data = None
+            if os.path.exists(timing_file):
+                with open(timing_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            elif os.path.isfile(pack_path):
+                data = read_pack_header(pack_path).get("ayah_timings")
+
+            if data is not None:
+                if isinstance(data, dict):
+                    timings = data
+
+                log_perfect_tree_section(
+                    "Ayah Timings - Loaded",
+                    [
+                        ("reciter", reciter),
+                        ("surahs", len(timings) if timings else 0),
+                    ],
+                    "🕋",
+                )
+        except Exception as e:
+            log_error_with_traceback(f"Error loading ayah timings for {reciter}", e)
+
+        self._raw[reciter] = timings
+        return timings
+
+    def _get_array(self, reciter: str, surah_number: int) -> Optional[array]:
+        """Get (building once) the sorted start-time array for a surah"""
+        key = (reciter, surah_number)
+        if key in self._arrays:
+            return self._arrays[key]
+
+        starts = None
+        timings = self._load_reciter(reciter)
+        entry = timings.get(str(surah_number)) if timings else None
+        try:
+            if entry:
+                candidate = array("d", (float(t) for t in entry))
+                if all(a <= b for a, b in zip(candidate, candidate[1:])):
+                    starts = candidate
+        except (TypeError, ValueError):
+            starts = None
+
+        self._arrays[key] = starts
+        return starts
+
+    def has_timings(self, reciter: str, surah_number: int) -> bool:
+        return self._get_array(reciter, surah_number) is not None
+
+    def get_ayah(
+        self, reciter: str, surah_number: int, position: float
+    ) -> Optional[int]:
+        """
+        Get the ayah being recited at a position.
+
+        Returns:
+            Optional[int]: 1-based ayah number, or None without timing data
+        """
+        starts = self._get_array(reciter, surah_number)
+        if not starts:
+            return None
+        return max(1, bisect_right(starts, position))
+
+    def get_ayah_start(
+        self, reciter: str, surah_number: int, ayah: int
+    ) -> Optional[float]:
+        """
+        Get the position where an ayah starts in a reciter's recording.
+
+        Returns:
+            Optional[float]: Start in seconds, or None without timing data
+        """
+        starts = self._get_array(reciter, surah_number)
+        if not starts or not 1 <= ayah <= len(starts):
+            return None
+        return starts[ayah - 1]
+
+    def invalidate(self, reciter: Optional[str] = None):
+        """Forget loaded timings (all reciters, or one)"""
+        if reciter is None:
+            self._raw.clear()
+            self._arrays.clear()
+            return
+
+        self._raw.pop(reciter, None)
+        for key in [key for key in self._arrays if key[0] == reciter]:
+            del self._arrays[key]
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "AyahTimingIndex",
+    "AYAH_TIMINGS_FILENAME",
+]
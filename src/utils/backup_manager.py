@@ -43,6 +43,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from .data_store import data_store
 from .tree_log import log_error_with_traceback, log_perfect_tree_section
 
 # EST timezone for backup scheduling and naming
@@ -92,6 +93,14 @@ EXCLUDE_PATTERNS = [
     "*_cache_*",  # Files with cache in name
 ]
 
+# Live SQLite files never zipped directly: committed writes can still be in
+# the -wal file, so the store writes a consistent copy to TEMP_BACKUP_DIR
+LIVE_DATABASE_FILES = {
+    data_store.db_path.name,
+    f"{data_store.db_path.name}-wal",
+    f"{data_store.db_path.name}-shm",
+}
+
 # Backup scheduling configuration
 BACKUP_INTERVAL_HOURS = 1  # Time between backups
 _last_backup_time = None  # Last successful backup
@@ -187,6 +196,9 @@ class BackupManager:
                             should_exclude = True
                             break
 
+                    if file_path.name in LIVE_DATABASE_FILES:
+                        should_exclude = True
+
                     if not should_exclude:
                         discovered_files.append(file_path)
 
@@ -245,6 +257,14 @@ class BackupManager:
             # Dynamically discover all data files
             data_files = self._discover_data_files()
 
+            # Snapshot the SQLite store through its own connection
+            database_snapshot = None
+            if data_store.db_path.exists():
+                database_snapshot = await data_store.backup_to(
+                    self.temp_backup_dir / data_store.db_path.name
+                )
+                data_files.append(database_snapshot)
+
             if not data_files:
                 log_perfect_tree_section(
                     "Backup Manager - No Data Files Found",
@@ -313,6 +333,9 @@ class BackupManager:
                             {"source": str(data_file), "zip_file": str(backup_path)},
                         )
 
+            if database_snapshot is not None:
+                database_snapshot.unlink(missing_ok=True)
+
             # Update last backup time
             self.last_backup_time = datetime.now(timezone.utc)
 
@@ -0,0 +1,236 @@
+# =============================================================================
+# QuranBot - Broadcast Player (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Shared-decode multi-channel playback. The main voice client's track is
+# decoded and Opus-encoded once; the resulting packets are fanned out to any
+# number of additional voice clients, so each extra channel costs a queue
+# append per 20ms frame instead of its own FFmpeg process and Opus encoder.
+#
+# Key Features:
+# - Single decode + encode per track regardless of listener channels
+# - Opus passthrough sources are forwarded without any encode
+# - Bounded per-subscriber queues (backpressure) with drop-oldest handling
+# - Small jitter prebuffer and silence on underrun
+# - Subscribers persist across track changes
+#
+# Technical Implementation:
+# - BroadcastTap wraps the main source; the main player's clock paces it
+# - BroadcastSubscriber is an Opus AudioSource fed from a deque
+# - Copy-on-write subscriber tuple so publishing takes no lock
+#
+# Required Dependencies:
+# - discord.py: AudioSource, Opus encoder (libopus for PCM sources)
+# =============================================================================
+
+import threading
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
+
+import discord
+from discord.opus import OPUS_SILENCE
+
+from .tree_log import log_error_with_traceback
+
+# Per-subscriber queue bound: 50 frames = 1 second of audio
+SUBSCRIBER_BUFFER_FRAMES = 50
+
+# Frames buffered before a subscriber starts (or restarts after an underrun)
+PREBUFFER_FRAMES = 3
+
+
+class BroadcastSubscriber(discord.AudioSource):
+    """
+    Opus AudioSource played by one listener voice client.
+
+    Implementation Notes:
+    - push() runs on the main player thread, read() on this client's player
+      thread; deque append/popleft are thread-safe
+    - A full queue drops its oldest frame so a stalled client never blocks
+      the broadcast or other listeners
+    - read() returns silence while buffering so the player keeps running
+    """
+
+    def __init__(self, voice_client, max_frames: int = SUBSCRIBER_BUFFER_FRAMES):
+        self.voice_client = voice_client
+        self.frames = deque(maxlen=max_frames)
+        self._buffering = True
+        self._closed = False
+        self.stats = {"sent": 0, "dropped": 0, "underruns": 0}
+
+    def push(self, packet: bytes):
+        """Queue a packet, dropping the oldest if this client has fallen behind"""
+        if len(self.frames) == self.frames.maxlen:
+            self.stats["dropped"] += 1
+        self.frames.append(packet)
+
+    def read(self) -> bytes:
+        if self._closed:
+            return b""
+
+        if self._buffering:
+            if len(self.frames) < PREBUFFER_FRAMES:
+                return OPUS_SILENCE
+            self._buffering = False
+
+        try:
+            packet = self.frames.popleft()
+        except IndexError:
+            self.stats["underruns"] += 1
+            self._buffering = True
+            return OPUS_SILENCE
+
+        self.stats["sent"] += 1
+        return packet
+
+    def is_opus(self) -> bool:
+        return True
+
+    def close(self):
+        """End this subscriber's playback on its next read"""
+        self._closed = True
+        self.frames.clear()
+
+
+class BroadcastTap(discord.AudioSource):
+    """
+    Wraps the main voice client's source and publishes each Opus packet.
+
+    PCM sources are encoded here (once) so the main player and every
+    subscriber send the same packets; Opus sources are forwarded as-is.
+    """
+
+    def __init__(
+        self, source: discord.AudioSource, hub: "BroadcastHub", bitrate_kbps: int
+    ):
+        self.source = source
+        self.hub = hub
+        self.encoder = None
+        if not source.is_opus():
+            self.encoder = discord.opus.Encoder(bitrate=max(16, min(bitrate_kbps, 512)))
+
+    def read(self) -> bytes:
+        frame = self.source.read()
+        if not frame:
+            return b""
+
+        packet = (
+            self.encoder.encode(frame, self.encoder.SAMPLES_PER_FRAME)
+            if self.encoder
+            else frame
+        )
+        self.hub.publish(packet)
+        return packet
+
+    def is_opus(self) -> bool:
+        return True
+
+    def cleanup(self) -> None:
+        self.source.cleanup()
+
+
+class BroadcastHub:
+    """
+    Registry of listener voice clients sharing the main playback.
+
+    Implementation Notes:
+    - wrap() is applied to every main-channel source, so listeners that join
+      mid-track start receiving audio immediately
+    - Subscribers keep playing (silence between tracks) until removed or
+      their voice client disconnects
+    """
+
+    def __init__(self, max_frames: int = SUBSCRIBER_BUFFER_FRAMES):
+        self.max_frames = max_frames
+        self._subscribers: Tuple[BroadcastSubscriber, ...] = ()
+        self._lock = threading.Lock()
+
+    def wrap(self, source: discord.AudioSource, bitrate_kbps: int) -> BroadcastTap:
+        """Wrap a main-channel source so its packets reach all subscribers"""
+        return BroadcastTap(source, self, bitrate_kbps)
+
+    def publish(self, packet: bytes):
+        """Fan a packet out to every subscriber"""
+        for subscriber in self._subscribers:
+            subscriber.push(packet)
+
+    def subscribe(self, voice_client) -> Optional[BroadcastSubscriber]:
+        """Start relaying the broadcast to a voice client"""
+        subscriber = None
+        try:
+            self.unsubscribe(voice_client)
+            if voice_client.is_playing() or voice_client.is_paused():
+                voice_client.stop()
+
+            subscriber = BroadcastSubscriber(voice_client, self.max_frames)
+            with self._lock:
+                self._subscribers = self._subscribers + (subscriber,)
+
+            def _after(error: Optional[Exception]):
+                # Voice client disconnected or playback was stopped
+                self._remove(subscriber)
+                if error:
+                    log_error_with_traceback("Broadcast listener stopped", error)
+
+            voice_client.play(subscriber, after=_after)
+            return subscriber
+
+        except Exception as e:
+            if subscriber:
+                self._remove(subscriber)
+            log_error_with_traceback("Error subscribing broadcast listener", e)
+            return None
+
+    def unsubscribe(self, voice_client) -> bool:
+        """Stop relaying to a voice client"""
+        for subscriber in self._subscribers:
+            if subscriber.voice_client is voice_client:
+                subscriber.close()
+                self._remove(subscriber)
+                return True
+        return False
+
+    def _remove(self, subscriber: BroadcastSubscriber):
+        with self._lock:
+            self._subscribers = tuple(
+                s for s in self._subscribers if s is not subscriber
+            )
+
+    def close(self):
+        """Stop relaying to every subscriber"""
+        for subscriber in self._subscribers:
+            subscriber.close()
+        with self._lock:
+            self._subscribers = ()
+
+    def get_subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-listener delivery statistics"""
+        listeners = []
+        for subscriber in self._subscribers:
+            channel = getattr(subscriber.voice_client, "channel", None)
+            listeners.append(
+                {
+                    "channel": getattr(channel, "name", "Unknown"),
+                    "queued": len(subscriber.frames),
+                    **subscriber.stats,
+                }
+            )
+        return {"listeners": len(listeners), "per_listener": listeners}
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "BroadcastHub",
+    "BroadcastSubscriber",
+    "BroadcastTap",
+    "SUBSCRIBER_BUFFER_FRAMES",
+]
@@ -13,6 +13,7 @@ from typing import Optional
 import discord
 from discord.ui import Button, Modal, Select, TextInput, View
 
+from .playback_timeline import format_eta
 from .surah_mapper import get_surah_info, search_surahs
 from .tree_log import (
     log_error_with_traceback,
@@ -457,6 +458,63 @@ class SurahConfirmationView(View):
                 "❌ An error occurred while starting playback.", ephemeral=True
             )
 
+    @discord.ui.button(label="⏭️ Play Next", style=discord.ButtonStyle.success, row=0)
+    async def queue_surah(self, interaction: discord.Interaction, button: Button):
+        """Queue the selected surah to play after the current one"""
+        try:
+            # Log user interaction in dedicated section
+            log_user_interaction(
+                interaction_type="search_queue",
+                user_name=interaction.user.display_name,
+                user_id=interaction.user.id,
+                action_description=f"Queued search result: {self.surah.name_transliteration}",
+                details={
+                    "surah_number": self.surah.number,
+                    "surah_name": self.surah.name_transliteration,
+                    "original_query": self.query,
+                    "action": "play_next",
+                },
+            )
+
+            queued = bool(
+                self.audio_manager
+                and self.audio_manager.queue_surah(self.surah.number, play_next=True)
+            )
+
+            if queued and self.control_panel_view:
+                self.control_panel_view._update_last_activity(
+                    interaction.user,
+                    f"queued `{self.surah.name_transliteration}` to play next",
+                )
+
+            # Disable all buttons
+            for item in self.children:
+                item.disabled = True
+
+            embed = discord.Embed(
+                title="⏭️ Playing Next!" if queued else "❌ Could Not Queue",
+                description=(
+                    "This surah will play after the current one:"
+                    if queued
+                    else "This surah is not available for the current reciter."
+                ),
+                color=0x00D4AA if queued else 0xE74C3C,
+            )
+
+            embed.add_field(
+                name=f"{self.surah.emoji} {self.surah.name_transliteration}",
+                value=f"`{self.surah.name_arabic}` - {self.surah.verses} verses",
+                inline=False,
+            )
+
+            await interaction.response.edit_message(embed=embed, view=self)
+
+        except Exception as e:
+            log_error_with_traceback("Error queueing surah from confirmation", e)
+            await interaction.response.send_message(
+                "❌ An error occurred while queueing the surah.", ephemeral=True
+            )
+
     @discord.ui.button(
         label="🔍 Search Again", style=discord.ButtonStyle.secondary, row=0
     )
@@ -877,6 +935,8 @@ class SimpleControlPanelView(View):
             # Get current status
             current_surah = 1
             current_reciter = "Unknown"
+            current_ayah = None
+            up_next = []
             time_display = "No time available"
 
             # Get info from audio manager
@@ -885,6 +945,8 @@ class SimpleControlPanelView(View):
                 if status:
                     current_surah = status.get("current_surah", 1)
                     current_reciter = status.get("current_reciter", "Unknown")
+                    current_ayah = status.get("current_ayah")
+                    up_next = (status.get("schedule") or {}).get("upcoming", [])
 
                     # Get time display
                     current_time = status.get("current_time", 0)
@@ -924,6 +986,15 @@ class SimpleControlPanelView(View):
                 inline=True,
             )
 
+            # Live ayah, when the reciter has timing data
+            if current_ayah:
+                verse_total = f"/{surah_info.verses}" if surah_info else ""
+                embed.add_field(
+                    name="",
+                    value=f"**Ayah:** `{current_ayah}{verse_total}`",
+                    inline=True,
+                )
+
             # Get Arabic name for reciter
             reciter_display = current_reciter.replace("_", " ").title()
             arabic_names = {
@@ -970,6 +1041,19 @@ class SimpleControlPanelView(View):
                             inline=False,
                         )
 
+            # Projected next surahs (queued ones first), see /schedule
+            if up_next:
+                names = []
+                for entry in up_next[:2]:
+                    info = get_surah_info(entry["surah"])
+                    name = info.name_transliteration if info else f"Surah {entry['surah']}"
+                    names.append(f"{name} ({format_eta(entry['starts_in'])})")
+                embed.add_field(
+                    name="",
+                    value=f"**Up Next:** `{' → '.join(names)}`",
+                    inline=False,
+                )
+
             # Add last activity field
             if (
                 self.last_activity_user
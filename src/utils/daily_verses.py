@@ -30,6 +30,7 @@
 #   daily_verse_state.json    - Current state
 #   daily_verses_pool.json    - Content pool
 #   daily_verses_state.json   - Schedule config
+#   quranbot.db               - Verse and dua statistics (see data_store.py)
 #
 # Required Dependencies:
 # - discord.py: Discord API wrapper
@@ -47,6 +48,7 @@ from typing import Dict, List, Optional, Union
 import discord
 import pytz
 
+from .data_store import data_store
 from .tree_log import (
     log_error_with_traceback,
     log_perfect_tree_section,
@@ -456,55 +458,20 @@ class DailyVerseManager:
     def record_dua_reaction(self, user_id: int, surah: int, verse: int) -> bool:
         """Record a dua reaction for verse statistics"""
         try:
-            # Load existing verse statistics
-            stats_data = {}
-            if self.verses_state_file.exists():
-                with open(self.verses_state_file, "r") as f:
-                    stats_data = json.load(f)
-            
-            # Initialize statistics if not exists
-            if "total_dua_reactions" not in stats_data:
-                stats_data["total_dua_reactions"] = 0
-            if "user_reactions" not in stats_data:
-                stats_data["user_reactions"] = {}
-            if "surah_stats" not in stats_data:
-                stats_data["surah_stats"] = {}
-            
-            # Update statistics
-            stats_data["total_dua_reactions"] += 1
-            
-            # Track user reactions
-            user_id_str = str(user_id)
-            if user_id_str not in stats_data["user_reactions"]:
-                stats_data["user_reactions"][user_id_str] = 0
-            stats_data["user_reactions"][user_id_str] += 1
-            
-            # Track surah statistics
-            surah_str = str(surah)
-            if surah_str not in stats_data["surah_stats"]:
-                stats_data["surah_stats"][surah_str] = {"reactions": 0, "verses_sent": 0}
-            stats_data["surah_stats"][surah_str]["reactions"] += 1
-            
-            # Update timestamp
-            stats_data["last_updated"] = datetime.now(pytz.UTC).isoformat()
-            
-            # Save updated statistics
-            with open(self.verses_state_file, "w") as f:
-                json.dump(stats_data, f, indent=2)
-            
+            # Per-user and per-surah counters are upserted on the data store thread
+            data_store.record_dua_reaction(user_id, surah)
+
             log_perfect_tree_section(
                 "Verse Statistics Updated",
                 [
-                    ("user_id", user_id_str),
-                    ("surah", surah_str),
+                    ("user_id", str(user_id)),
+                    ("surah", str(surah)),
                     ("verse", verse),
-                    ("total_reactions", stats_data["total_dua_reactions"]),
-                    ("user_reactions", stats_data["user_reactions"][user_id_str]),
                     ("status", "✅ Dua reaction recorded"),
                 ],
                 "🤲",
             )
-            
+
             return True
         except Exception as e:
             log_error_with_traceback("Error recording dua reaction", e)
@@ -513,34 +480,7 @@ class DailyVerseManager:
     def record_verse_sent(self, surah: int) -> bool:
         """Record that a verse was sent for statistics"""
         try:
-            # Load existing verse statistics
-            stats_data = {}
-            if self.verses_state_file.exists():
-                with open(self.verses_state_file, "r") as f:
-                    stats_data = json.load(f)
-            
-            # Initialize statistics if not exists
-            if "total_verses_sent" not in stats_data:
-                stats_data["total_verses_sent"] = 0
-            if "surah_stats" not in stats_data:
-                stats_data["surah_stats"] = {}
-            
-            # Update statistics
-            stats_data["total_verses_sent"] += 1
-            
-            # Track surah statistics
-            surah_str = str(surah)
-            if surah_str not in stats_data["surah_stats"]:
-                stats_data["surah_stats"][surah_str] = {"reactions": 0, "verses_sent": 0}
-            stats_data["surah_stats"][surah_str]["verses_sent"] += 1
-            
-            # Update timestamp
-            stats_data["last_updated"] = datetime.now(pytz.UTC).isoformat()
-            
-            # Save updated statistics
-            with open(self.verses_state_file, "w") as f:
-                json.dump(stats_data, f, indent=2)
-            
+            data_store.record_verse_sent(surah)
             return True
         except Exception as e:
             log_error_with_traceback("Error recording verse sent", e)
@@ -0,0 +1,593 @@
+# =============================================================================
+# QuranBot - SQLite Data Store (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# One SQLite database for the per-user data that used to live in separate
+# JSON documents (quiz scores, the user cache, verse and dua statistics).
+# Each event becomes a single-row upsert instead of a whole-file rewrite, and
+# leaderboards are indexed queries.
+#
+# Key Features:
+# - WAL journal: readers never block the writer, commits are cheap
+# - All queries run on one dedicated thread, never on the event loop
+# - Fire-and-forget writes from sync code, awaitable reads from async code
+# - Legacy JSON files are imported automatically on first open; rows already
+#   in the database are never overwritten
+# - Query/write counters and latency for monitoring
+#
+# Technical Implementation:
+# - sqlite3 connection owned by a single-worker ThreadPoolExecutor, so the
+#   connection is only ever used from that thread and writes keep their
+#   submission order
+# - INSERT ... ON CONFLICT DO UPDATE for counters and streaks
+# - Online backups with sqlite3's backup API, so snapshots include commits
+#   still in the WAL
+#
+# File Structure:
+# /data/
+#   quranbot.db      - SQLite database (plus -wal/-shm while open)
+#
+# Required Dependencies:
+# - None (standard library only)
+# =============================================================================
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .tree_log import log_error_with_traceback, log_perfect_tree_section
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+DB_FILE = DATA_DIR / "quranbot.db"
+
+SCHEMA_VERSION = 1
+
+# Legacy JSON documents imported into the database
+QUIZ_STATS_JSON = "quiz_stats.json"
+USER_CACHE_JSON = "user_cache.json"
+VERSE_STATS_JSON = "daily_verses_state.json"
+LEGACY_IMPORTED_KEY = "legacy_imported"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS quiz_scores (
+    user_id INTEGER PRIMARY KEY,
+    points INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    current_streak INTEGER NOT NULL DEFAULT 0,
+    best_streak INTEGER NOT NULL DEFAULT 0,
+    last_answer_time TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_quiz_scores_rank
+    ON quiz_scores (points DESC, correct DESC);
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY,
+    display_name TEXT,
+    avatar_url TEXT,
+    last_seen TEXT
+);
+CREATE TABLE IF NOT EXISTS dua_reactions (
+    user_id INTEGER PRIMARY KEY,
+    reactions INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_dua_reactions_count
+    ON dua_reactions (reactions DESC);
+CREATE TABLE IF NOT EXISTS verse_surah_stats (
+    surah INTEGER PRIMARY KEY,
+    reactions INTEGER NOT NULL DEFAULT 0,
+    verses_sent INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+QUIZ_ANSWER_SQL = """
+INSERT INTO quiz_scores (
+    user_id, points, correct, total, current_streak, best_streak, last_answer_time
+) VALUES (:user_id, :hit, :hit, 1, :hit, :hit, :now)
+ON CONFLICT (user_id) DO UPDATE SET
+    points = MAX(0, points + CASE WHEN :hit THEN 1 ELSE -1 END),
+    correct = correct + :hit,
+    total = total + 1,
+    current_streak = CASE WHEN :hit THEN current_streak + 1 ELSE 0 END,
+    best_streak = MAX(best_streak, CASE WHEN :hit THEN current_streak + 1 ELSE 0 END),
+    last_answer_time = :now
+"""
+
+QUIZ_COLUMNS = (
+    "points",
+    "correct",
+    "total",
+    "current_streak",
+    "best_streak",
+    "last_answer_time",
+)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class DataStore:
+    """
+    SQLite store with a dedicated query thread.
+
+    Implementation Notes:
+    - The database is opened lazily by the first operation, so importing
+      the module never touches the disk
+    - Write methods return a Future; callers on the event loop do not wait
+    - Async read methods await the query thread; call() is the blocking
+      variant for sync code outside the event loop
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DB_FILE):
+        self.db_path = Path(db_path)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # "submitted" and "writes" are only updated by callers, the rest only
+        # by the query thread, so no counter has two writers
+        self.stats = {
+            "submitted": 0,
+            "writes": 0,
+            "queries": 0,
+            "errors": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+        }
+
+    # =========================================================================
+    # Query Thread
+    # =========================================================================
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="quranbot-db"
+                )
+            return self._executor
+
+    def _run(self, fn: Callable, *args) -> Any:
+        """Run one operation on the query thread (called on that thread)"""
+        started = time.perf_counter()
+        try:
+            return fn(self._connection(), *args)
+        except Exception as e:
+            self.stats["errors"] += 1
+            log_error_with_traceback(f"Data store error in {fn.__name__}", e)
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.stats["queries"] += 1
+            self.stats["total_ms"] += elapsed_ms
+            self.stats["max_ms"] = max(self.stats["max_ms"], elapsed_ms)
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """Queue an operation on the query thread without waiting for it"""
+        self.stats["submitted"] += 1
+        return self._get_executor().submit(self._run, fn, *args)
+
+    def call(self, fn: Callable, *args) -> Any:
+        """Run an operation and wait for its result (sync callers)"""
+        return self.submit(fn, *args).result()
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """Run an operation and await its result (async callers)"""
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def _submit_write(self, fn: Callable, *args) -> Future:
+        self.stats["writes"] += 1
+        return self.submit(fn, *args)
+
+    def close(self):
+        """Finish queued operations and close the database"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        executor.submit(self._close_connection)
+        executor.shutdown(wait=True)
+
+    def _close_connection(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use (query thread only)"""
+        if self._conn is not None:
+            return self._conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self.db_path.exists()
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        try:
+            with conn:
+                conn.executescript(SCHEMA)
+                conn.execute(
+                    "INSERT OR IGNORE INTO meta (key, value) "
+                    "VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+
+            # The import commits together with its meta key, so a failed or
+            # interrupted import is retried on the next open
+            imported = {}
+            if not _meta_value(conn, LEGACY_IMPORTED_KEY):
+                imported = _import_legacy_json(
+                    conn, self.db_path.parent, mark_imported=True
+                )
+        except Exception:
+            conn.close()
+            raise
+        self._conn = conn
+
+        log_perfect_tree_section(
+            "Data Store - Opened",
+            [
+                ("database", str(self.db_path)),
+                ("journal_mode", journal_mode),
+                ("created", "✅ New database" if is_new else "Existing database"),
+            ]
+            + [(f"imported_{name}", count) for name, count in imported.items()],
+            "🗄️",
+        )
+        return conn
+
+    # =========================================================================
+    # Quiz Scores
+    # =========================================================================
+
+    def record_quiz_answer(self, user_id: int, is_correct: bool) -> Future:
+        """Add one answer to a user's points, totals and streaks"""
+        return self._submit_write(_record_quiz_answer, int(user_id), bool(is_correct))
+
+    async def get_quiz_score(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Get a user's quiz score row, or None if they never answered"""
+        return await self.run(_get_quiz_score, int(user_id))
+
+    async def get_quiz_leaderboard(
+        self, limit: int = 30
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Get (user_id, score) pairs ranked by points, then correct answers"""
+        return await self.run(_get_quiz_leaderboard, limit)
+
+    # =========================================================================
+    # User Cache
+    # =========================================================================
+
+    def upsert_user(
+        self, user_id: int, display_name: str, avatar_url: Optional[str] = None
+    ) -> Future:
+        """Store a user's current display name and avatar"""
+        return self._submit_write(_upsert_user, int(user_id), display_name, avatar_url)
+
+    def get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Get cached user info (blocking; not for the event loop)"""
+        return self.call(_get_user, int(user_id))
+
+    # =========================================================================
+    # Verse Statistics
+    # =========================================================================
+
+    def record_dua_reaction(self, user_id: int, surah: int) -> Future:
+        """Count a dua reaction for the user and the verse's surah"""
+        return self._submit_write(_record_dua_reaction, int(user_id), int(surah))
+
+    def record_verse_sent(self, surah: int) -> Future:
+        """Count a daily verse sent from a surah"""
+        return self._submit_write(_record_verse_sent, int(surah))
+
+    async def get_verse_stats(self) -> Dict[str, Any]:
+        """Get verse and dua totals, per-surah counts and top reactors"""
+        return await self.run(_get_verse_stats)
+
+    # =========================================================================
+    # Migration & Monitoring
+    # =========================================================================
+
+    def import_json(self, data_dir: Union[str, Path]) -> Dict[str, int]:
+        """Import the legacy JSON documents from a folder (blocking)"""
+        return self.call(_import_legacy_json, Path(data_dir))
+
+    async def backup_to(self, dest_path: Union[str, Path]) -> Path:
+        """
+        Write a consistent copy of the database to dest_path.
+
+        Uses sqlite3's online backup from the query thread, so the copy
+        includes commits that are still in the WAL and not yet checkpointed
+        into the main database file.
+        """
+        dest_path = Path(dest_path)
+        await self.run(_backup_database, dest_path)
+        return dest_path
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get query counts and latency"""
+        queries = self.stats["queries"]
+        return {
+            "queries": queries,
+            "writes": self.stats["writes"],
+            "errors": self.stats["errors"],
+            "pending": self.stats["submitted"] - queries,
+            "avg_ms": round(self.stats["total_ms"] / queries, 3) if queries else 0.0,
+            "max_ms": round(self.stats["max_ms"], 3),
+        }
+
+
+# =============================================================================
+# Operations (run on the query thread)
+# =============================================================================
+
+
+def _record_quiz_answer(conn: sqlite3.Connection, user_id: int, is_correct: bool):
+    with conn:
+        conn.execute(
+            QUIZ_ANSWER_SQL, {"user_id": user_id, "hit": int(is_correct), "now": _now()}
+        )
+
+
+def _get_quiz_score(conn: sqlite3.Connection, user_id: int) -> Optional[Dict]:
+    row = conn.execute(
+        f"SELECT {', '.join(QUIZ_COLUMNS)} FROM quiz_scores WHERE user_id = ?",
+        (user_id,),
+    ).fetchone()
+    return dict(row) if row else None
+
+
+def _get_quiz_leaderboard(conn: sqlite3.Connection, limit: int) -> List[Tuple]:
+    rows = conn.execute(
+        f"SELECT user_id, {', '.join(QUIZ_COLUMNS)} FROM quiz_scores "
+        "ORDER BY points DESC, correct DESC LIMIT ?",
+        (limit,),
+    ).fetchall()
+    return [
+        (str(row["user_id"]), {column: row[column] for column in QUIZ_COLUMNS})
+        for row in rows
+    ]
+
+
+def _upsert_user(
+    conn: sqlite3.Connection, user_id: int, display_name: str, avatar_url: Optional[str]
+):
+    with conn:
+        conn.execute(
+            "INSERT INTO users (user_id, display_name, avatar_url, last_seen) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT (user_id) DO UPDATE SET "
+            "display_name = excluded.display_name, avatar_url = excluded.avatar_url, "
+            "last_seen = excluded.last_seen",
+            (user_id, display_name, avatar_url, _now()),
+        )
+
+
+def _get_user(conn: sqlite3.Connection, user_id: int) -> Optional[Dict]:
+    row = conn.execute(
+        "SELECT display_name, avatar_url, last_seen FROM users WHERE user_id = ?",
+        (user_id,),
+    ).fetchone()
+    return dict(row) if row else None
+
+
+def _bump_counter(conn: sqlite3.Connection, name: str, amount: int = 1):
+    conn.execute(
+        "INSERT INTO counters (name, value) VALUES (?, ?) "
+        "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+        (name, amount),
+    )
+
+
+def _record_dua_reaction(conn: sqlite3.Connection, user_id: int, surah: int):
+    with conn:
+        _bump_counter(conn, "total_dua_reactions")
+        conn.execute(
+            "INSERT INTO dua_reactions (user_id, reactions) VALUES (?, 1) "
+            "ON CONFLICT (user_id) DO UPDATE SET reactions = reactions + 1",
+            (user_id,),
+        )
+        conn.execute(
+            "INSERT INTO verse_surah_stats (surah, reactions) VALUES (?, 1) "
+            "ON CONFLICT (surah) DO UPDATE SET reactions = reactions + 1",
+            (surah,),
+        )
+
+
+def _record_verse_sent(conn: sqlite3.Connection, surah: int):
+    with conn:
+        _bump_counter(conn, "total_verses_sent")
+        conn.execute(
+            "INSERT INTO verse_surah_stats (surah, verses_sent) VALUES (?, 1) "
+            "ON CONFLICT (surah) DO UPDATE SET verses_sent = verses_sent + 1",
+            (surah,),
+        )
+
+
+def _get_verse_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
+    counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+    return {
+        "total_dua_reactions": counters.get("total_dua_reactions", 0),
+        "total_verses_sent": counters.get("total_verses_sent", 0),
+        "surah_stats": {
+            row["surah"]: {
+                "reactions": row["reactions"],
+                "verses_sent": row["verses_sent"],
+            }
+            for row in conn.execute("SELECT * FROM verse_surah_stats")
+        },
+        "top_reactors": [
+            (row["user_id"], row["reactions"])
+            for row in conn.execute(
+                "SELECT user_id, reactions FROM dua_reactions "
+                "ORDER BY reactions DESC LIMIT 10"
+            )
+        ],
+    }
+
+
+def _backup_database(conn: sqlite3.Connection, dest_path: Path):
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    dest_path.unlink(missing_ok=True)
+    target = sqlite3.connect(dest_path)
+    try:
+        conn.backup(target)
+    finally:
+        target.close()
+
+
+def _load_json(path: Path) -> Dict[str, Any]:
+    """Read a legacy JSON document ({} if missing or unreadable)"""
+    try:
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                return data
+    except Exception as e:
+        log_error_with_traceback(f"Could not import {path.name}", e)
+    return {}
+
+
+def _meta_value(conn: sqlite3.Connection, key: str) -> Optional[str]:
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row["value"] if row else None
+
+
+def _legacy_rows(items: Dict[str, Any], build: Callable) -> List[Tuple]:
+    """Build import rows, skipping malformed legacy entries"""
+    rows = []
+    for key, value in items.items():
+        if not str(key).isdigit():
+            continue
+        try:
+            rows.append(build(int(key), value))
+        except (AttributeError, TypeError, ValueError) as e:
+            log_error_with_traceback(f"Skipping malformed legacy entry {key}", e)
+    return rows
+
+
+def _import_legacy_json(
+    conn: sqlite3.Connection, data_dir: Path, mark_imported: bool = False
+) -> Dict[str, int]:
+    """
+    Copy the legacy JSON documents into the tables.
+
+    Rows already in the database are kept as they are, so importing again
+    only adds entries the database does not have yet and never rolls live
+    counters back to the JSON values.
+    """
+    quiz = _load_json(data_dir / QUIZ_STATS_JSON).get("user_scores", {})
+    users = _load_json(data_dir / USER_CACHE_JSON).get("users", {})
+    verses = _load_json(data_dir / VERSE_STATS_JSON)
+
+    with conn:
+        conn.executemany(
+            "INSERT INTO quiz_scores (user_id, points, correct, total, "
+            "current_streak, best_streak, last_answer_time) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT DO NOTHING",
+            _legacy_rows(
+                quiz,
+                lambda user_id, stats: (
+                    user_id,
+                    int(stats.get("points", 0)),
+                    int(stats.get("correct", 0)),
+                    int(stats.get("total", 0)),
+                    int(stats.get("current_streak", 0)),
+                    int(stats.get("best_streak", 0)),
+                    stats.get("last_answer_time"),
+                ),
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO users (user_id, display_name, avatar_url, last_seen) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT DO NOTHING",
+            _legacy_rows(
+                users,
+                lambda user_id, info: (
+                    user_id,
+                    info.get("display_name"),
+                    info.get("avatar_url"),
+                    info.get("last_seen"),
+                ),
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO dua_reactions (user_id, reactions) VALUES (?, ?) "
+            "ON CONFLICT DO NOTHING",
+            _legacy_rows(
+                verses.get("user_reactions", {}),
+                lambda user_id, count: (user_id, int(count)),
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO verse_surah_stats (surah, reactions, verses_sent) "
+            "VALUES (?, ?, ?) ON CONFLICT DO NOTHING",
+            _legacy_rows(
+                verses.get("surah_stats", {}),
+                lambda surah, s: (
+                    surah,
+                    int(s.get("reactions", 0)),
+                    int(s.get("verses_sent", 0)),
+                ),
+            ),
+        )
+        for name in ("total_dua_reactions", "total_verses_sent"):
+            if name not in verses:
+                continue
+            try:
+                value = int(verses[name])
+            except (TypeError, ValueError) as e:
+                log_error_with_traceback(f"Skipping malformed legacy {name}", e)
+                continue
+            conn.execute(
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT DO NOTHING",
+                (name, value),
+            )
+        if mark_imported:
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (LEGACY_IMPORTED_KEY, _now()),
+            )
+
+    return {
+        "quiz_scores": len(quiz),
+        "users": len(users),
+        "dua_reactors": len(verses.get("user_reactions", {})),
+        "surahs": len(verses.get("surah_stats", {})),
+    }
+
+
+# Global data store instance
+data_store = DataStore()
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "DataStore",
+    "data_store",
+    "DB_FILE",
+    "SCHEMA_VERSION",
+]
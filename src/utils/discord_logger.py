@@ -258,8 +258,9 @@ class DiscordLogger:
     async def _get_system_status(self) -> Dict[str, str]:
         """Get current system status information."""
         try:
-            # Import here to avoid circular imports
-            from src.utils.state_manager import state_manager
+            # Import here to avoid circular imports. Relative, so the
+            # heartbeat reads the same instance the bot saves through.
+            from .state_manager import state_manager
             
             status = {
                 "bot_online": True,  # If we're running this, bot is online
@@ -0,0 +1,301 @@
+# =============================================================================
+# QuranBot - FFmpeg Supervisor (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Visibility and recovery for the FFmpeg child behind each audio source.
+# discord.py spawns FFmpeg implicitly; this wraps the source so the bot knows
+# the child's PID, resource use, stderr and frame output, can tell a clean
+# end from a crash without guessing from exception text, and can restart a
+# decoder that stops producing audio.
+#
+# Key Features:
+# - Per-source PID, CPU time, RSS, bytes read and frames produced
+# - FFmpeg stderr captured into a bounded ring buffer
+# - Exit classification (completed, failed, killed by the supervisor)
+# - Stall detection: no frames for N seconds while playing
+# - Counters for restarts and stall durations
+#
+# Technical Implementation:
+# - StderrRing is handed to discord.py as the stderr sink (its reader thread
+#   writes into it)
+# - SupervisedSource counts frames and timestamps the last one on the player
+#   thread; the watchdog compares against time.monotonic()
+# - A stall is broken by killing FFmpeg, which ends the blocked read
+# - Process metrics via psutil, read on demand
+#
+# Required Dependencies:
+# - discord.py: AudioSource
+# - psutil: Process resource metrics
+# =============================================================================
+
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+import discord
+import psutil
+
+# Seconds without a frame (while playing) before the decoder is restarted
+STALL_SECONDS = 10.0
+
+# Restarts allowed for one track before giving up and moving on
+MAX_RESTARTS_PER_TRACK = 3
+
+# Lines of FFmpeg stderr kept per source
+STDERR_RING_LINES = 50
+
+
+class StderrRing:
+    """
+    Bounded sink for FFmpeg's stderr.
+
+    discord.py pipes stderr into any object without a usable fileno() and
+    calls write() from its reader thread, so only complete lines are kept,
+    oldest dropped first.
+    """
+
+    def __init__(self, max_lines: int = STDERR_RING_LINES):
+        self.lines = deque(maxlen=max_lines)
+        self._partial = b""
+
+    def write(self, data: bytes) -> int:
+        chunk = self._partial + data
+        *complete, self._partial = chunk.split(b"\n")
+        for line in complete:
+            line = line.rstrip(b"\r")
+            if line:
+                self.lines.append(line.decode(errors="ignore"))
+        # Cap a runaway line without a newline
+        self._partial = self._partial[-4096:]
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def tail(self, count: int = 10) -> str:
+        """Get the last lines of stderr"""
+        lines = list(self.lines)[-count:]
+        if self._partial:
+            lines.append(self._partial.decode(errors="ignore"))
+        return "\n".join(lines)
+
+
+class SupervisedSource(discord.AudioSource):
+    """
+    AudioSource wrapper that tracks the FFmpeg child behind it.
+
+    Implementation Notes:
+    - read() runs on the player thread and only updates two counters
+    - kill() terminates FFmpeg so a read blocked on its stdout returns
+    - Metrics are read from the OS on demand, never on the audio path
+    """
+
+    def __init__(
+        self,
+        source: discord.AudioSource,
+        file_path: str,
+        stderr: Optional[StderrRing] = None,
+    ):
+        self.source = source
+        self.file_path = file_path
+        self.stderr = stderr or StderrRing()
+        self.process = getattr(source, "_process", None)
+        self.frames = 0
+        self.bytes_out = 0
+        self.killed = False
+        self.ended = False
+        self.returncode: Optional[int] = None
+        self._last_frame_at = time.monotonic()
+        self._psutil_process: Optional[psutil.Process] = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return getattr(self.process, "pid", None)
+
+    def read(self) -> bytes:
+        frame = self.source.read()
+        if frame:
+            self.frames += 1
+            self.bytes_out += len(frame)
+            self._last_frame_at = time.monotonic()
+        elif not self.ended:
+            # End of stream: note how FFmpeg exited before cleanup kills it
+            self.ended = True
+            self.returncode = self.process.poll() if self.process else 0
+        return frame
+
+    def is_opus(self) -> bool:
+        return self.source.is_opus()
+
+    def cleanup(self) -> None:
+        self.source.cleanup()
+
+    def mark_alive(self):
+        """Restart the stall timer (playback started or was paused)"""
+        self._last_frame_at = time.monotonic()
+
+    def seconds_since_frame(self) -> float:
+        return time.monotonic() - self._last_frame_at
+
+    def kill(self):
+        """Kill FFmpeg; the player's pending read then returns end of stream"""
+        self.killed = True
+        try:
+            if self.process and self.process.poll() is None:
+                self.process.kill()
+        except Exception:
+            pass
+
+    def exit_status(self) -> str:
+        """Classify how FFmpeg ended: running, completed, killed or failed"""
+        if self.killed:
+            return "killed"
+        if not self.ended:
+            return "running"
+        # Still exiting at end of stream counts as a clean finish
+        return "failed" if self.returncode not in (None, 0) else "completed"
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get the FFmpeg child's resource use and output counters"""
+        metrics: Dict[str, Any] = {
+            "pid": self.pid,
+            "file": self.file_path,
+            "frames": self.frames,
+            "bytes_out": self.bytes_out,
+            "seconds_since_frame": round(self.seconds_since_frame(), 1),
+            "status": self.exit_status(),
+            "cpu_seconds": None,
+            "rss_bytes": None,
+            "read_bytes": None,
+        }
+        try:
+            if self.pid and self.exit_status() == "running":
+                if self._psutil_process is None:
+                    self._psutil_process = psutil.Process(self.pid)
+                process = self._psutil_process
+                with process.oneshot():
+                    cpu = process.cpu_times()
+                    metrics["cpu_seconds"] = round(cpu.user + cpu.system, 2)
+                    metrics["rss_bytes"] = process.memory_info().rss
+                    if hasattr(process, "io_counters"):
+                        metrics["read_bytes"] = process.io_counters().read_bytes
+        except Exception:
+            pass  # Process already gone or not a real FFmpeg child
+        return metrics
+
+
+def find_supervised(source: Any) -> Optional[SupervisedSource]:
+    """Find the SupervisedSource inside a chain of wrapping sources"""
+    for _ in range(8):
+        if isinstance(source, SupervisedSource):
+            return source
+        source = getattr(source, "source", None)
+        if source is None:
+            return None
+    return None
+
+
+class FFmpegSupervisor:
+    """
+    Stall policy and counters for the main playback's FFmpeg children.
+
+    Implementation Notes:
+    - check() is called periodically by the playback watchdog and returns the
+      stall length when the current decoder should be restarted
+    - Restarts are limited per track so a broken file cannot loop forever
+    """
+
+    def __init__(
+        self,
+        stall_seconds: float = STALL_SECONDS,
+        max_restarts_per_track: int = MAX_RESTARTS_PER_TRACK,
+    ):
+        self.stall_seconds = stall_seconds
+        self.max_restarts_per_track = max_restarts_per_track
+        self.current: Optional[SupervisedSource] = None
+        self._track_file: Optional[str] = None
+        self._track_restarts = 0
+        self.stats = {
+            "sources": 0,
+            "restarts": 0,
+            "stalls": 0,
+            "failures": 0,
+            "last_stall_seconds": 0.0,
+            "max_stall_seconds": 0.0,
+            "total_stall_seconds": 0.0,
+        }
+
+    def attach(self, source: Any) -> Optional[SupervisedSource]:
+        """Start supervising the source that is about to play"""
+        supervised = find_supervised(source)
+        self.current = supervised
+        if supervised:
+            supervised.mark_alive()
+            self.stats["sources"] += 1
+            if supervised.file_path != self._track_file:
+                self._track_file = supervised.file_path
+                self._track_restarts = 0
+        return supervised
+
+    def check(self, paused: bool = False) -> Optional[float]:
+        """
+        Check the current decoder for a stall.
+
+        Returns:
+            Optional[float]: Seconds without a frame if it has stalled
+        """
+        supervised = self.current
+        if not supervised or supervised.killed:
+            return None
+        if paused:
+            # The player does not read while paused
+            supervised.mark_alive()
+            return None
+
+        stalled_for = supervised.seconds_since_frame()
+        if stalled_for < self.stall_seconds:
+            return None
+
+        self.stats["stalls"] += 1
+        self.stats["last_stall_seconds"] = round(stalled_for, 1)
+        self.stats["max_stall_seconds"] = max(
+            self.stats["max_stall_seconds"], self.stats["last_stall_seconds"]
+        )
+        self.stats["total_stall_seconds"] = round(
+            self.stats["total_stall_seconds"] + stalled_for, 1
+        )
+        return stalled_for
+
+    def can_restart(self) -> bool:
+        """Check whether the current track has restarts left"""
+        return self._track_restarts < self.max_restarts_per_track
+
+    def record_restart(self):
+        self._track_restarts += 1
+        self.stats["restarts"] += 1
+
+    def record_failure(self):
+        self.stats["failures"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get counters and the current FFmpeg child's metrics"""
+        return {
+            **self.stats,
+            "current": self.current.get_metrics() if self.current else None,
+        }
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "FFmpegSupervisor",
+    "StderrRing",
+    "SupervisedSource",
+    "find_supervised",
+    "STALL_SECONDS",
+]
@@ -0,0 +1,139 @@
+# =============================================================================
+# QuranBot - Idle Monitor (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Bookkeeping for listener-aware idle mode. AudioManager pauses the audio
+# pipeline while no human is listening; this tracks how long the bot was idle
+# and estimates the CPU time that was not spent decoding and encoding audio
+# for an empty channel.
+#
+# Key Features:
+# - Human listener count with idle enter/exit transitions
+# - Idle periods and total idle time
+# - CPU saved = idle time x (CPU rate while playing - CPU rate while idle)
+#
+# Technical Implementation:
+# - CPU time read via psutil for the bot process and its exited FFmpeg
+#   children; the running FFmpeg child is added by the caller
+# - Rates measured over the most recent playing and idle windows
+#
+# Required Dependencies:
+# - psutil: Process CPU times
+# =============================================================================
+
+import time
+from typing import Any, Callable, Dict, Optional
+
+import psutil
+
+
+def process_cpu_seconds() -> float:
+    """Get CPU seconds used by this process and its exited children"""
+    try:
+        cpu = psutil.Process().cpu_times()
+        return cpu.user + cpu.system + cpu.children_user + cpu.children_system
+    except Exception:
+        return 0.0
+
+
+class IdleMonitor:
+    """
+    Listener count, idle state and CPU savings accounting.
+
+    Implementation Notes:
+    - update() returns True when the idle state flips, so the caller only
+      touches the voice client on transitions
+    - The playing CPU rate is re-measured every time idle mode starts, so the
+      savings estimate follows changes in bitrate or Opus cache coverage
+    """
+
+    def __init__(
+        self,
+        cpu_time: Callable[[], float] = process_cpu_seconds,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._cpu_time = cpu_time
+        self._clock = clock
+        self.listeners: Optional[int] = None  # Unknown until the first count
+        self.is_idle = False
+
+        self._window_started = clock()
+        self._window_cpu = cpu_time()
+        self._active_rate = 0.0  # CPU seconds per second while playing
+
+        self.stats = {
+            "idle_periods": 0,
+            "idle_seconds": 0.0,
+            "cpu_seconds_saved": 0.0,
+        }
+
+    def update(self, listeners: int) -> bool:
+        """
+        Record the current number of human listeners.
+
+        Returns:
+            bool: True if idle mode was entered or left
+        """
+        self.listeners = listeners
+        if listeners == 0 and not self.is_idle:
+            self._enter_idle()
+            return True
+        if listeners > 0 and self.is_idle:
+            self._exit_idle()
+            return True
+        return False
+
+    def _measure_window(self):
+        """Get (seconds, CPU seconds) since the last transition and start anew"""
+        now, cpu = self._clock(), self._cpu_time()
+        elapsed = now - self._window_started
+        used = max(0.0, cpu - self._window_cpu)
+        self._window_started, self._window_cpu = now, cpu
+        return elapsed, used
+
+    def _enter_idle(self):
+        elapsed, used = self._measure_window()
+        if elapsed >= 1.0:
+            self._active_rate = used / elapsed
+        self.is_idle = True
+        self.stats["idle_periods"] += 1
+
+    def _exit_idle(self):
+        elapsed, used = self._measure_window()
+        idle_rate = used / elapsed if elapsed > 0 else 0.0
+        self.is_idle = False
+        self.stats["idle_seconds"] += elapsed
+        self.stats["cpu_seconds_saved"] += elapsed * max(
+            0.0, self._active_rate - idle_rate
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get idle counters, including the idle period in progress"""
+        idle_seconds = self.stats["idle_seconds"]
+        saved = self.stats["cpu_seconds_saved"]
+        if self.is_idle:
+            current = self._clock() - self._window_started
+            idle_seconds += current
+            saved += current * self._active_rate
+
+        return {
+            "is_idle": self.is_idle,
+            "listeners": self.listeners,
+            "idle_periods": self.stats["idle_periods"],
+            "idle_hours": round(idle_seconds / 3600, 3),
+            "cpu_hours_saved": round(saved / 3600, 4),
+            "active_cpu_percent": round(self._active_rate * 100, 1),
+        }
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "IdleMonitor",
+    "process_cpu_seconds",
+]
@@ -0,0 +1,285 @@
+# =============================================================================
+# QuranBot - Audio Integrity Verifier (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Finds corrupt and truncated MP3s before they are played. Every file in each
+# reciter folder is frame-walked once in the background and its health is
+# stored in the audio library manifest, so the playback loop can skip known-bad
+# files instead of discovering them when FFmpeg fails mid-surah.
+#
+# Key Features:
+# - Counts decodable MPEG frames and the audio duration they carry
+# - Compares the walked duration with the tagged duration when a Xing/Info/VBRI
+#   header declares it (without one the tagged length is only an estimate)
+# - Detects a final frame cut off by the end of the file
+# - Counts junk bytes skipped between frames
+# - Results stored in the manifest; only changed files are rescanned
+#
+# Technical Implementation:
+# - mmap'd frame walk (shared MPEG header parsing with the seek index)
+# - Process pool at reduced priority: the walk is pure Python and CPU bound
+# - A changed file (size/mtime) gets a fresh manifest entry without health,
+#   which is what queues it for verification again
+#
+# Required Dependencies:
+# - None (standard library only)
+# =============================================================================
+
+import asyncio
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Optional
+
+from .opus_cache import _lower_priority
+from .seek_index import VBR_HEADER_TAGS, _read_header, _resync, _skip_id3v2
+from .tree_log import (
+    log_error_with_traceback,
+    log_perfect_tree_section,
+    log_warning_with_context,
+)
+
+# Walked audio this much shorter than the tagged duration counts as truncated
+TRUNCATION_TOLERANCE_SECONDS = 2.0
+TRUNCATION_TOLERANCE_RATIO = 0.02
+
+# Manifest saves during background verification (the manifest is rewritten whole)
+SAVE_EVERY_FILES = 25
+
+HEALTH_OK = "ok"
+HEALTH_TRUNCATED = "truncated"
+HEALTH_UNDECODABLE = "undecodable"
+
+
+def verify_audio_file(file_path: str, tagged_duration: float = 0.0) -> Dict[str, Any]:
+    """
+    Walk an MP3's frames and report its health (runs in a worker process).
+
+    The tagged duration is only trusted when the file has a Xing/Info/VBRI
+    header frame. Without one, mutagen estimates the length from the first
+    frame's bitrate, which can be far off for VBR files, so only a cut final
+    frame marks such a file truncated.
+
+    Returns:
+        Dict[str, Any]: {"status", "frames", "duration", "tagged_duration",
+        "vbr_header", "junk_bytes", "cut_frame"}
+    """
+    frames = 0
+    elapsed = 0.0
+    junk_bytes = 0
+    cut_frame = False
+    vbr_header = False
+
+    try:
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= 4:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    offset = _resync(data, _skip_id3v2(data), size)
+                    vbr_checked = False
+
+                    while 0 <= offset and offset + 4 <= size:
+                        frame = _read_header(data, offset, size)
+                        if frame is None:
+                            following = _resync(data, offset + 1, size)
+                            if following > 0:
+                                junk_bytes += following - offset
+                            offset = following
+                            continue
+
+                        length, samples, sample_rate = frame
+                        if offset + length > size:
+                            cut_frame = True
+                            break
+
+                        # A leading VBR header frame carries no audio
+                        if not vbr_checked:
+                            vbr_checked = True
+                            if any(
+                                tag in data[offset : offset + min(length, 64)]
+                                for tag in VBR_HEADER_TAGS
+                            ):
+                                vbr_header = True
+                                offset += length
+                                continue
+
+                        elapsed += samples / sample_rate
+                        frames += 1
+                        offset += length
+    except Exception:
+        frames = 0
+
+    shortfall = tagged_duration - elapsed if vbr_header else 0.0
+    tolerance = max(
+        TRUNCATION_TOLERANCE_SECONDS, tagged_duration * TRUNCATION_TOLERANCE_RATIO
+    )
+
+    if frames == 0:
+        status = HEALTH_UNDECODABLE
+    elif cut_frame or shortfall > tolerance:
+        status = HEALTH_TRUNCATED
+    else:
+        status = HEALTH_OK
+
+    return {
+        "status": status,
+        "frames": frames,
+        "duration": round(elapsed, 3),
+        "tagged_duration": round(tagged_duration, 3),
+        "vbr_header": vbr_header,
+        "junk_bytes": junk_bytes,
+        "cut_frame": cut_frame,
+    }
+
+
+class IntegrityVerifier:
+    """
+    Per-file health records stored in the audio library manifest.
+
+    Implementation Notes:
+    - is_known_bad() only reads the manifest; unverified files are not bad
+    - verify_files() fans the walks out to a niced process pool that exists
+      only for the duration of the run
+    - Files that already have a health record are skipped
+    """
+
+    def __init__(self, library, max_workers: Optional[int] = None):
+        self.library = library
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+        self.verify_task: Optional[asyncio.Task] = None
+
+        # Counters for monitoring the verification stage
+        self.stats = {"verified": 0, "skipped": 0, "bad": 0, "failed": 0}
+
+    def get_health(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Get a file's stored health record, if it has been verified"""
+        entry = self.library.get_entry(file_path)
+        health = entry.get("health") if entry else None
+        # Older records judged truncation on estimated durations; those
+        # are treated as unverified so the file gets checked again
+        if (
+            health
+            and "vbr_header" not in health
+            and health.get("status") == HEALTH_TRUNCATED
+            and not health.get("cut_frame")
+        ):
+            return None
+        return health
+
+    def is_known_bad(self, file_path: str) -> bool:
+        """Check whether a file was verified as corrupt or truncated"""
+        try:
+            health = self.get_health(file_path)
+            return bool(health) and health.get("status") != HEALTH_OK
+        except Exception as e:
+            log_error_with_traceback("Error looking up file health", e)
+            return False
+
+    async def verify_files(self, files: Iterable[str]) -> int:
+        """
+        Verify every file that has no health record yet.
+
+        Returns:
+            int: Number of bad files found in this run
+        """
+        pending = []
+        for file_path in files:
+            if self.library.get_entry(file_path) is None:
+                continue
+            if self.get_health(file_path):
+                self.stats["skipped"] += 1
+            else:
+                pending.append(file_path)
+
+        if not pending:
+            return 0
+
+        bad_files = []
+        unsaved = 0
+        loop = asyncio.get_running_loop()
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_lower_priority if os.name == "posix" else None,
+        )
+        try:
+            for start in range(0, len(pending), self.max_workers):
+                batch = pending[start : start + self.max_workers]
+                results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            executor,
+                            verify_audio_file,
+                            file_path,
+                            self.library.get_duration(file_path),
+                        )
+                        for file_path in batch
+                    ),
+                    return_exceptions=True,
+                )
+
+                for file_path, health in zip(batch, results):
+                    if isinstance(health, BaseException):
+                        self.stats["failed"] += 1
+                        continue
+
+                    self.library.update_entry(file_path, health=health)
+                    self.stats["verified"] += 1
+                    unsaved += 1
+                    if health["status"] != HEALTH_OK:
+                        self.stats["bad"] += 1
+                        bad_files.append((file_path, health))
+
+                if unsaved >= SAVE_EVERY_FILES:
+                    await self.library.save_async()
+                    unsaved = 0
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            if unsaved:
+                await self.library.save_async()
+
+        for file_path, health in bad_files:
+            log_warning_with_context(
+                f"Audio file failed verification: {health['status']}",
+                f"{file_path} ({health['frames']} frames, "
+                f"{health['duration']:.1f}s of {health['tagged_duration']:.1f}s)",
+            )
+
+        log_perfect_tree_section(
+            "Integrity Verifier - Scan Complete",
+            [
+                ("verified", len(pending)),
+                ("bad_files", len(bad_files)),
+                ("unchanged_skipped", self.stats["skipped"]),
+            ],
+            "🩺",
+        )
+        return len(bad_files)
+
+    def start_background_verification(self, files: Iterable[str]):
+        """Start (or restart) the background verification task"""
+        try:
+            self.stop_background_verification()
+            self.verify_task = asyncio.create_task(self.verify_files(list(files)))
+        except Exception as e:
+            log_error_with_traceback("Error starting integrity verification", e)
+
+    def stop_background_verification(self):
+        """Cancel the background verification task if running"""
+        if self.verify_task and not self.verify_task.done():
+            self.verify_task.cancel()
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "IntegrityVerifier",
+    "verify_audio_file",
+    "HEALTH_OK",
+    "HEALTH_TRUNCATED",
+    "HEALTH_UNDECODABLE",
+]
@@ -16,17 +16,22 @@
 # - Backup management
 # - Time zone support
 # - Rich statistics
+# - Constant-time voice events (one appended log line per join/leave)
 #
 # Technical Implementation:
 # - Async/await for Discord operations
 # - JSON-based state storage
+# - Event sourcing: joins and leaves are appended to a session log; the
+#   full stats file is a snapshot written every few minutes and on shutdown,
+#   and startup replays the log on top of the snapshot
 # - Atomic file operations
 # - Error handling and logging
 # - Data validation
 #
 # File Structure:
 # /data/
-#   listening_stats.json - Primary statistics storage
+#   listening_stats.json - Statistics snapshot
+#   listening_sessions.log - Join/leave events since the snapshot (JSON lines)
 # /backup/temp/
 #   *.backup - Automatic backup files
 #
@@ -35,9 +40,11 @@
 # =============================================================================
 
 import asyncio
+import heapq
 import json
 import os
 import shutil
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -55,8 +62,12 @@ from .tree_log import log_error_with_traceback, log_perfect_tree_section
 # File Paths:
 # - DATA_DIR: Primary data storage
 # - STATS_FILE: Statistics database
+# - SESSION_LOG_FILE: Voice events since the last snapshot
 # - TEMP_BACKUP_DIR: Backup staging area
 #
+# Snapshot Settings:
+# - SNAPSHOT_INTERVAL: Seconds between background snapshots
+#
 # Leaderboard Settings:
 # - UPDATE_INTERVAL: Refresh frequency
 # - CHANNEL_ID: Display location
@@ -66,15 +77,54 @@ from .tree_log import log_error_with_traceback, log_perfect_tree_section
 # File paths with Path objects for cross-platform compatibility
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 STATS_FILE = DATA_DIR / "listening_stats.json"
+SESSION_LOG_FILE = DATA_DIR / "listening_sessions.log"
 
 # Backup directory for atomic saves
 TEMP_BACKUP_DIR = Path(__file__).parent.parent.parent / "backup" / "temp"
 
+# Snapshot configuration (the session log covers everything in between)
+SNAPSHOT_INTERVAL = 300  # Seconds between background snapshots
+
 # Leaderboard configuration
 LEADERBOARD_UPDATE_INTERVAL = 60  # Update frequency in seconds
 LEADERBOARD_CHANNEL_ID = None  # Set during bot initialization
 LEADERBOARD_UPDATE_TASK = None  # Background task reference
 
+# =============================================================================
+# Session Log
+# =============================================================================
+# One JSON array per line:
+#   [seq, "join", user_id, start_time]
+#   [seq, "leave", user_id, left_at, duration]
+# seq keeps increasing across snapshots. The snapshot stores the last seq it
+# covers, so replay skips events it already counts even if the bot stopped
+# between writing the snapshot and trimming the log.
+# =============================================================================
+
+
+def _read_session_log(path: Path) -> Tuple[List[list], int]:
+    """
+    Read the session log.
+
+    Returns:
+        Tuple[List[list], int]: Records, and the byte length of the complete
+        lines (a torn last line from a crash is left out)
+    """
+    if not path.exists():
+        return [], 0
+
+    records = []
+    valid_bytes = 0
+    for line in path.read_bytes().splitlines(keepends=True):
+        if not line.endswith(b"\n"):
+            break
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            break
+        valid_bytes += len(line)
+    return records, valid_bytes
+
 # =============================================================================
 # Data Structure Classes
 # =============================================================================
@@ -250,6 +300,8 @@ class ListeningStatsManager:
 
     Implementation Notes:
     - Uses JSON for storage
+    - Voice events only touch memory and append one session log line;
+      save_stats() writes the snapshot and trims the log
     - Implements atomic saves
     - Provides data validation
     - Handles timezone conversion
@@ -273,7 +325,10 @@ class ListeningStatsManager:
     ```
     """
 
-    def __init__(self):
+    def __init__(self, data_dir: Path = DATA_DIR):
+        self.data_dir = Path(data_dir)
+        self.stats_file = self.data_dir / STATS_FILE.name
+        self.session_log_file = self.data_dir / SESSION_LOG_FILE.name
         self.users: Dict[int, UserStats] = {}
         self.active_sessions: Dict[int, ActiveSession] = {}
         self.total_listening_time = 0.0
@@ -286,8 +341,17 @@ class ListeningStatsManager:
         self.update_counter = 0  # Add counter to reduce log spam
         self.last_logged_active_count = 0  # Track changes in active users
 
+        # Session log state
+        self.log_seq = 0  # Last event appended (or replayed)
+        self.snapshot_seq = 0  # Last event covered by the snapshot on disk
+        self.snapshot_interval = SNAPSHOT_INTERVAL
+        self.snapshot_task = None
+        self._session_log = None  # Kept-open append handle
+        self._log_lock = threading.Lock()  # Appends vs. the snapshot trim
+        self.event_stats = {"events_logged": 0, "events_replayed": 0, "snapshots": 0}
+
         # Ensure data directory exists
-        DATA_DIR.mkdir(exist_ok=True)
+        self.data_dir.mkdir(exist_ok=True)
 
         # Ensure temp backup directory exists (keeps data/ clean)
         TEMP_BACKUP_DIR.mkdir(parents=True, exist_ok=True)
@@ -298,10 +362,10 @@ class ListeningStatsManager:
     def load_stats(self) -> None:
         """Load listening statistics from file with backup recovery and corruption detection"""
         try:
-            if STATS_FILE.exists():
+            if self.stats_file.exists():
                 # Try to load main file
                 try:
-                    with open(STATS_FILE, "r", encoding="utf-8") as f:
+                    with open(self.stats_file, "r", encoding="utf-8") as f:
                         data = json.load(f)
 
                     # Validate data integrity
@@ -364,6 +428,7 @@ class ListeningStatsManager:
                         total_stats.get("total_listening_time", 0.0)
                     )
                     self.total_sessions = int(total_stats.get("total_sessions", 0))
+                    self.snapshot_seq = int(total_stats.get("log_seq", 0))
 
                     # Update last loaded timestamp
                     self.last_updated = datetime.now(timezone.utc)
@@ -377,11 +442,11 @@ class ListeningStatsManager:
                     log_error_with_traceback(
                         "Main stats file corrupted, attempting backup recovery",
                         main_error,
-                        {"main_file": str(STATS_FILE)},
+                        {"main_file": str(self.stats_file)},
                     )
 
                     # Try to load from backup with same improved error handling
-                    backup_file = TEMP_BACKUP_DIR / f"{STATS_FILE.stem}.backup"
+                    backup_file = TEMP_BACKUP_DIR / f"{self.stats_file.stem}.backup"
                     if backup_file.exists():
                         try:
                             with open(backup_file, "r", encoding="utf-8") as f:
@@ -451,6 +516,7 @@ class ListeningStatsManager:
                             self.total_sessions = int(
                                 total_stats.get("total_sessions", 0)
                             )
+                            self.snapshot_seq = int(total_stats.get("log_seq", 0))
 
                             log_perfect_tree_section(
                                 "Stats Recovery",
@@ -489,10 +555,13 @@ class ListeningStatsManager:
             log_error_with_traceback(
                 "Unexpected error in load_stats",
                 e,
-                {"stats_file": str(STATS_FILE)},
+                {"stats_file": str(self.stats_file)},
             )
             self._initialize_fresh_state()
 
+        # Events after the snapshot live in the session log
+        self._replay_session_log()
+
     def _initialize_fresh_state(self) -> None:
         """Initialize a fresh state when no valid data is available"""
         self.users = {}
@@ -510,90 +579,299 @@ class ListeningStatsManager:
             "🆕",
         )
 
-    def save_stats(self) -> None:
-        """Save listening statistics to file with atomic writes and backup protection"""
-        try:
-            # Create backup before saving (in temp directory to keep data/ clean)
-            backup_file = TEMP_BACKUP_DIR / f"{STATS_FILE.stem}.backup"
-            # Individual backup files disabled - using hourly ZIP backup system instead
+    # =========================================================================
+    # Session Log
+    # =========================================================================
 
-            # Prepare data structure
-            data = {
-                "users": {
-                    str(user_id): user_stats.to_dict()
-                    for user_id, user_stats in self.users.items()
-                },
-                "active_sessions": {
-                    str(user_id): session.to_dict()
-                    for user_id, session in self.active_sessions.items()
-                },
-                "total_stats": {
-                    "total_listening_time": self.total_listening_time,
-                    "total_sessions": self.total_sessions,
-                    "last_updated": datetime.now(timezone.utc).isoformat(),
-                },
-                "leaderboard_cache": {
-                    "last_calculated": datetime.now(timezone.utc).isoformat(),
-                    "top_users": self.get_top_users(10),
-                },
-                "metadata": {
-                    "version": "2.2.0",
-                    "created_at": datetime.now(timezone.utc).isoformat(),
-                    "total_users_tracked": len(self.users),
-                    "active_sessions_count": len(self.active_sessions),
-                },
-            }
+    def _apply_join(self, user_id: int, start_time: datetime) -> None:
+        """Open a session in memory"""
+        self.active_sessions[user_id] = ActiveSession(
+            user_id=user_id, start_time=start_time
+        )
+        if user_id not in self.users:
+            self.users[user_id] = UserStats(user_id)
 
-            # Atomic write: write to temporary file first, then rename
-            temp_file = STATS_FILE.with_suffix(".json.tmp")
+    def _apply_leave(self, user_id: int, duration: float, left_at: str) -> None:
+        """Close a session in memory and add its time to the totals"""
+        self.active_sessions.pop(user_id, None)
+        if user_id not in self.users:
+            self.users[user_id] = UserStats(user_id)
 
-            try:
-                with open(temp_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                    f.flush()  # Ensure data is written to disk
-                    os.fsync(f.fileno())  # Force OS to write to disk
+        user_stats = self.users[user_id]
+        user_stats.total_time += duration
+        user_stats.sessions += 1
+        user_stats.last_seen = left_at
 
-                # Atomic rename (this is atomic on most filesystems)
-                temp_file.replace(STATS_FILE)
+        self.total_listening_time += duration
+        self.total_sessions += 1
 
-                self.last_updated = datetime.now(timezone.utc).isoformat()
+    def _replay_session_log(self) -> None:
+        """Apply the session log events that are newer than the snapshot"""
+        try:
+            records, valid_bytes = _read_session_log(self.session_log_file)
+            self.log_seq = self.snapshot_seq
+            replayed = 0
 
+            for record in records:
+                try:
+                    seq, kind, user_id, timestamp = record[:4]
+                    self.log_seq = max(self.log_seq, int(seq))
+                    if seq <= self.snapshot_seq:
+                        continue  # Already counted in the snapshot
+                    if kind == "join":
+                        self._apply_join(user_id, datetime.fromisoformat(timestamp))
+                    elif kind == "leave":
+                        self._apply_leave(user_id, float(record[4]), timestamp)
+                    else:
+                        continue
+                    replayed += 1
+                except (ValueError, TypeError, IndexError, KeyError) as record_error:
+                    log_error_with_traceback(
+                        "Skipping invalid session log record",
+                        record_error,
+                        {"record": str(record)[:200]},
+                    )
+
+            # Cut a torn last line so the next append starts on a new line
+            log_size = (
+                self.session_log_file.stat().st_size
+                if self.session_log_file.exists()
+                else 0
+            )
+            if log_size > valid_bytes:
+                with open(self.session_log_file, "r+b") as f:
+                    f.truncate(valid_bytes)
+
+            self.event_stats["events_replayed"] = replayed
+            if replayed or log_size > valid_bytes:
                 log_perfect_tree_section(
-                    "Listening Stats - Saved Successfully",
+                    "Listening Stats - Session Log Replayed",
                     [
-                        ("file_path", f"💾 Data saved to: {STATS_FILE.name}"),
-                        ("users_saved", f"👥 {len(self.users)} users saved"),
-                        (
-                            "active_sessions",
-                            f"🎧 {len(self.active_sessions)} active sessions",
-                        ),
-                        (
-                            "total_time",
-                            f"⏱️ Total time: {self.format_time(self.total_listening_time)}",
-                        ),
-                        (
-                            "file_size",
-                            f"📊 File size: {STATS_FILE.stat().st_size} bytes",
-                        ),
+                        ("events_replayed", replayed),
+                        ("snapshot_seq", self.snapshot_seq),
+                        ("log_seq", self.log_seq),
+                        ("dropped_bytes", log_size - valid_bytes),
+                        ("active_sessions", len(self.active_sessions)),
                     ],
-                    "✅",
+                    "🔄",
                 )
 
-            except Exception as write_error:
-                # Clean up temp file if write failed
-                if temp_file.exists():
-                    try:
-                        temp_file.unlink()
-                    except:
-                        pass
-                raise write_error
+        except Exception as e:
+            log_error_with_traceback(
+                "Failed to replay listening session log",
+                e,
+                {"session_log": str(self.session_log_file)},
+            )
+
+    def _append_session_event(self, kind: str, user_id: int, *fields) -> None:
+        """Append one join/leave record (one short line, flushed, no fsync)"""
+        self.log_seq += 1
+        line = json.dumps([self.log_seq, kind, user_id, *fields], separators=(",", ":"))
+
+        with self._log_lock:
+            if self._session_log is None:
+                self._session_log = open(self.session_log_file, "a", encoding="utf-8")
+            self._session_log.write(line + "\n")
+            self._session_log.flush()
+
+        self.event_stats["events_logged"] += 1
+        self._start_snapshot_task()
+
+    def _close_session_log(self) -> None:
+        if self._session_log is not None:
+            self._session_log.close()
+            self._session_log = None
+
+    def _trim_session_log(self, upto_seq: int) -> None:
+        """Drop log events covered by a snapshot, keeping any that arrived after it"""
+        # Held across the rewrite so an append cannot land in the replaced file
+        with self._log_lock:
+            self._close_session_log()
+
+            records, _ = _read_session_log(self.session_log_file)
+            newer = [
+                record
+                for record in records
+                if isinstance(record, list)
+                and record
+                and isinstance(record[0], int)
+                and record[0] > upto_seq
+            ]
+
+            temp_file = self.session_log_file.with_suffix(".log.tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                for record in newer:
+                    f.write(json.dumps(record, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            temp_file.replace(self.session_log_file)
+
+    # =========================================================================
+    # Snapshots
+    # =========================================================================
+
+    def _build_snapshot(self) -> Dict:
+        """Capture the in-memory statistics as the snapshot structure"""
+        return {
+            "users": {
+                str(user_id): user_stats.to_dict()
+                for user_id, user_stats in self.users.items()
+            },
+            "active_sessions": {
+                str(user_id): session.to_dict()
+                for user_id, session in self.active_sessions.items()
+            },
+            "total_stats": {
+                "total_listening_time": self.total_listening_time,
+                "total_sessions": self.total_sessions,
+                "last_updated": datetime.now(timezone.utc).isoformat(),
+                "log_seq": self.log_seq,
+            },
+            "leaderboard_cache": {
+                "last_calculated": datetime.now(timezone.utc).isoformat(),
+                "top_users": self.get_top_users(10),
+            },
+            "metadata": {
+                "version": "2.2.0",
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "total_users_tracked": len(self.users),
+                "active_sessions_count": len(self.active_sessions),
+            },
+        }
+
+    def _write_snapshot(self, data: Dict) -> None:
+        """Atomically write a snapshot (safe to run in a worker thread)"""
+        # Atomic write: write to temporary file first, then rename
+        temp_file = self.stats_file.with_suffix(".json.tmp")
+
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()  # Ensure data is written to disk
+                os.fsync(f.fileno())  # Force OS to write to disk
+
+            # Atomic rename (this is atomic on most filesystems)
+            temp_file.replace(self.stats_file)
+
+        except Exception as write_error:
+            # Clean up temp file if write failed
+            if temp_file.exists():
+                try:
+                    temp_file.unlink()
+                except:
+                    pass
+            raise write_error
+
+    def _write_snapshot_and_trim(self, data: Dict) -> None:
+        """Write a snapshot, then trim the log events it covers (worker thread)"""
+        self._write_snapshot(data)
+        self._trim_session_log(data["total_stats"]["log_seq"])
+
+    def _finish_snapshot(self, log_seq: int) -> None:
+        """Record a written and trimmed snapshot"""
+        self.snapshot_seq = log_seq
+        self.last_updated = datetime.now(timezone.utc).isoformat()
+        self.event_stats["snapshots"] += 1
+
+    async def snapshot_stats(self) -> bool:
+        """
+        Write a snapshot without blocking the event loop.
+
+        The statistics are captured on the loop; the file is written and the
+        session log trimmed from a worker thread, and events logged meanwhile
+        stay in the log.
+
+        Returns:
+            bool: True if a snapshot was written
+        """
+        if self.log_seq == self.snapshot_seq:
+            return False
+
+        try:
+            data = self._build_snapshot()
+            await asyncio.to_thread(self._write_snapshot_and_trim, data)
+            self._finish_snapshot(data["total_stats"]["log_seq"])
+            return True
+        except Exception as e:
+            log_error_with_traceback(
+                "Failed to write listening stats snapshot",
+                e,
+                {"stats_file": str(self.stats_file), "log_seq": self.log_seq},
+            )
+            return False
+
+    def _start_snapshot_task(self) -> None:
+        """Start the background snapshot task once an event loop is running"""
+        if self.snapshot_task is not None and not self.snapshot_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop (scripts/tests): snapshot with save_stats()
+        self.snapshot_task = loop.create_task(self._snapshot_loop())
+
+    async def _snapshot_loop(self):
+        """Background task that snapshots the statistics periodically"""
+        while True:
+            try:
+                await asyncio.sleep(self.snapshot_interval)
+                await self.snapshot_stats()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                log_error_with_traceback("Error in listening stats snapshot loop", e)
+
+    def close(self) -> None:
+        """Stop background snapshots, write a final one and close the log (shutdown)"""
+        try:
+            if self.snapshot_task is not None and not self.snapshot_task.done():
+                self.snapshot_task.cancel()
+            if self.log_seq != self.snapshot_seq:
+                self.save_stats()
+            with self._log_lock:
+                self._close_session_log()
+        except Exception as e:
+            log_error_with_traceback("Error closing listening stats", e)
+
+    def save_stats(self) -> None:
+        """Write a statistics snapshot (atomic, fsynced) and trim the session log"""
+        try:
+            # Create backup before saving (in temp directory to keep data/ clean)
+            backup_file = TEMP_BACKUP_DIR / f"{self.stats_file.stem}.backup"
+            # Individual backup files disabled - using hourly ZIP backup system instead
+
+            # Write the snapshot, then drop the log events it now covers
+            data = self._build_snapshot()
+            self._write_snapshot_and_trim(data)
+            self._finish_snapshot(data["total_stats"]["log_seq"])
+
+            log_perfect_tree_section(
+                "Listening Stats - Saved Successfully",
+                [
+                    ("file_path", f"💾 Data saved to: {self.stats_file.name}"),
+                    ("users_saved", f"👥 {len(self.users)} users saved"),
+                    (
+                        "active_sessions",
+                        f"🎧 {len(self.active_sessions)} active sessions",
+                    ),
+                    (
+                        "total_time",
+                        f"⏱️ Total time: {self.format_time(self.total_listening_time)}",
+                    ),
+                    (
+                        "file_size",
+                        f"📊 File size: {self.stats_file.stat().st_size} bytes",
+                    ),
+                ],
+                "✅",
+            )
 
         except Exception as e:
             log_error_with_traceback(
                 "CRITICAL: Failed to save listening statistics - Data may be at risk!",
                 e,
                 {
-                    "stats_file": str(STATS_FILE),
+                    "stats_file": str(self.stats_file),
                     "users_count": len(self.users),
                     "active_sessions": len(self.active_sessions),
                     "total_listening_time": self.total_listening_time,
@@ -606,7 +884,7 @@ class ListeningStatsManager:
             # Try emergency save to a different location
             try:
                 emergency_file = (
-                    STATS_FILE.parent
+                    self.stats_file.parent
                     / f"emergency_session_{user_id}_{datetime.now().strftime('%Y-%m-%d_%I-%M-%S_%p')}.json"
                 )
                 with open(emergency_file, "w", encoding="utf-8") as f:
@@ -673,21 +951,16 @@ class ListeningStatsManager:
                 self.user_left_voice(user_id)
 
             # Start new session
-            self.active_sessions[user_id] = ActiveSession(
-                user_id=user_id, start_time=datetime.now(timezone.utc)
-            )
-
-            # Initialize user stats if not exists
-            if user_id not in self.users:
-                self.users[user_id] = UserStats(user_id)
+            start_time = datetime.now(timezone.utc)
+            self._apply_join(user_id, start_time)
 
-            # CRITICAL: Save stats immediately after creating active session
-            # This ensures active sessions persist if bot restarts
+            # Log the join so the active session survives a restart
+            # (constant time; the full file is only rewritten by snapshots)
             try:
-                self.save_stats()
+                self._append_session_event("join", user_id, start_time.isoformat())
             except Exception as save_error:
                 log_error_with_traceback(
-                    "CRITICAL: Failed to save stats after user joined voice",
+                    "CRITICAL: Failed to log voice join",
                     save_error,
                     {"user_id": user_id, "active_sessions": len(self.active_sessions)},
                 )
@@ -701,7 +974,7 @@ class ListeningStatsManager:
                         f"⏰ Session started at {datetime.now(timezone.utc).strftime('%I:%M:%S %p')}",
                     ),
                     ("total_users", f"📊 {len(self.active_sessions)} users in voice"),
-                    ("data_saved", "💾 Active session saved to disk"),
+                    ("data_saved", "📝 Join logged to session log"),
                 ],
                 "🎧",
             )
@@ -720,29 +993,18 @@ class ListeningStatsManager:
             # Calculate session duration
             session = self.active_sessions[user_id]
             duration = session.get_duration()
+            left_at = datetime.now(timezone.utc).isoformat()
 
-            # Update user stats
-            if user_id not in self.users:
-                self.users[user_id] = UserStats(user_id)
+            # Update user and total stats, remove the active session
+            self._apply_leave(user_id, duration, left_at)
 
-            self.users[user_id].total_time += duration
-            self.users[user_id].sessions += 1
-            self.users[user_id].last_seen = datetime.now(timezone.utc).isoformat()
-
-            # Update total stats
-            self.total_listening_time += duration
-            self.total_sessions += 1
-
-            # Remove active session
-            del self.active_sessions[user_id]
-
-            # CRITICAL: Save stats immediately after each session
+            # CRITICAL: Log the session immediately
             # This ensures data is never lost even if bot crashes
             try:
-                self.save_stats()
+                self._append_session_event("leave", user_id, left_at, duration)
             except Exception as save_error:
                 log_error_with_traceback(
-                    "CRITICAL: Failed to save stats after user left voice - attempting emergency save",
+                    "CRITICAL: Failed to log voice leave - attempting emergency save",
                     save_error,
                     {"user_id": user_id, "session_duration": duration},
                 )
@@ -801,7 +1063,7 @@ class ListeningStatsManager:
                         "total_sessions",
                         f"🔢 User total sessions: {self.users[user_id].sessions}",
                     ),
-                    ("data_saved", "💾 Stats saved successfully"),
+                    ("data_saved", "📝 Session logged to session log"),
                 ],
                 "🎧",
             )
@@ -832,9 +1094,8 @@ class ListeningStatsManager:
 
             user_times.append((user_id, total_time, user_stats.sessions))
 
-        # Sort by total time (descending) and return top users
-        user_times.sort(key=lambda x: x[1], reverse=True)
-        return user_times[:limit]
+        # Keep only the top users by total time (no full sort of every user)
+        return heapq.nlargest(limit, user_times, key=lambda x: x[1])
 
     def format_time(self, seconds: float) -> str:
         """Format time in seconds to human-readable format"""
@@ -1082,20 +1343,19 @@ def track_voice_leave(user_id: int) -> float:
 
 
 def get_user_listening_stats(user_id: int) -> Optional[UserStats]:
-    """Get listening statistics for a user (loads fresh data from file)"""
+    """Get listening statistics for a user, including an open session"""
     try:
-        # Load fresh data from file each time (like quiz stats)
-        if STATS_FILE.exists():
-            with open(STATS_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            users_data = data.get("users", {})
-            user_data = users_data.get(str(user_id))
-            
-            if user_data:
-                return UserStats.from_dict(user_data)
-        
-        return None
+        # The manager's in-memory totals are exact (every join/leave is
+        # applied there before it is logged), so no file is read here
+        user_stats = listening_stats_manager.users.get(user_id)
+        if user_stats is None:
+            return None
+
+        stats = UserStats.from_dict(user_stats.to_dict())
+        session = listening_stats_manager.active_sessions.get(user_id)
+        if session is not None:
+            stats.total_time += session.get_duration()
+        return stats
     except Exception as e:
         # Log error but don't crash - return None for missing data
         from .tree_log import log_error_with_traceback
@@ -1267,6 +1527,9 @@ def get_data_protection_status() -> Dict:
             "main_file_size": STATS_FILE.stat().st_size if STATS_FILE.exists() else 0,
             "backup_exists": backup_file.exists(),
             "backup_size": backup_file.stat().st_size if backup_file.exists() else 0,
+            "session_log_size": (
+                SESSION_LOG_FILE.stat().st_size if SESSION_LOG_FILE.exists() else 0
+            ),
             "emergency_backups": len(emergency_files),
             "session_logs": len(session_logs),
             "total_protection_files": len(emergency_files)
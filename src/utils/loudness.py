@@ -0,0 +1,268 @@
+# =============================================================================
+# QuranBot - Loudness Normalization (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Evens out loudness differences between reciters and recordings. Each file's
+# integrated loudness (EBU R128) is measured once in the background and stored
+# in the audio library manifest; playback then applies a static gain, which
+# costs a single volume multiply instead of a two-pass loudnorm per track.
+#
+# Key Features:
+# - One-time FFmpeg ebur128 analysis per file version
+# - Process pool at reduced priority so analysis never starves playback
+# - Gain capped by true peak to avoid clipping on quiet recordings
+# - Results stored in the manifest (rebuilt only when a file changes)
+#
+# Technical Implementation:
+# - ffmpeg -af ebur128=peak=true -f null, summary parsed from stderr
+# - gain = target - integrated, limited to (ceiling - true peak) and ±12 dB
+# - Applied as FFmpeg "volume=<gain>dB" on PCM sources and baked into the
+#   Opus cache encode
+#
+# Required Dependencies:
+# - FFmpeg with the ebur128 filter (path configurable)
+# =============================================================================
+
+import asyncio
+import os
+import re
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Optional
+
+from .opus_cache import _lower_priority
+from .tree_log import log_error_with_traceback, log_perfect_tree_section
+
+# Streaming loudness target (LUFS) and limits on the applied gain
+DEFAULT_TARGET_LUFS = -16.0
+MAX_GAIN_DB = 12.0
+TRUE_PEAK_CEILING_DB = -1.0
+
+# Seconds before a single analysis is abandoned
+ANALYSIS_TIMEOUT = 600
+
+INTEGRATED_PATTERN = re.compile(r"\bI:\s+(-?[\d.]+|-inf) LUFS")
+TRUE_PEAK_PATTERN = re.compile(r"\bPeak:\s+(-?[\d.]+|-inf) dBFS")
+
+
+def parse_ebur128_summary(output: str) -> Optional[Dict[str, Optional[float]]]:
+    """Extract integrated loudness and true peak from ebur128's summary"""
+    integrated = INTEGRATED_PATTERN.findall(output)
+    if not integrated:
+        return None
+
+    peaks = TRUE_PEAK_PATTERN.findall(output)
+    return {
+        # The summary is printed last; earlier matches are per-frame logs
+        "integrated": float(integrated[-1]),
+        "true_peak": float(peaks[-1]) if peaks else None,
+    }
+
+
+def measure_loudness(ffmpeg_path: str, file_path: str) -> Optional[Dict[str, Any]]:
+    """Measure a file's loudness with FFmpeg (runs in a worker process)"""
+    try:
+        result = subprocess.run(
+            [
+                ffmpeg_path,
+                "-nostats",
+                "-hide_banner",
+                "-i",
+                file_path,
+                "-vn",
+                "-af",
+                # Per-frame lines at verbose level stay hidden; the summary is info
+                "ebur128=peak=true:framelog=verbose",
+                "-f",
+                "null",
+                "-",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=ANALYSIS_TIMEOUT,
+        )
+        if result.returncode != 0:
+            return None
+        return parse_ebur128_summary(result.stderr.decode(errors="ignore"))
+
+    except Exception:
+        return None
+
+
+def compute_gain_db(
+    loudness: Optional[Dict[str, Any]], target_lufs: float = DEFAULT_TARGET_LUFS
+) -> float:
+    """Get the static gain that brings a measured file to the target loudness"""
+    if not loudness:
+        return 0.0
+
+    integrated = loudness.get("integrated")
+    if integrated is None or integrated == float("-inf"):
+        return 0.0  # Silence: nothing to normalize
+
+    gain = target_lufs - integrated
+    true_peak = loudness.get("true_peak")
+    if true_peak is not None and true_peak != float("-inf"):
+        gain = min(gain, TRUE_PEAK_CEILING_DB - true_peak)
+
+    return round(max(-MAX_GAIN_DB, min(gain, MAX_GAIN_DB)), 1)
+
+
+class LoudnessAnalyzer:
+    """
+    Per-file loudness measurements stored in the audio library manifest.
+
+    Implementation Notes:
+    - get_gain_db() only reads the manifest; it never runs FFmpeg
+    - analyze_files() fans measurements out to a niced process pool that
+      exists only for the duration of the run
+    - Failed measurements are not recorded, so they are retried next run
+    """
+
+    def __init__(
+        self,
+        ffmpeg_path: str,
+        library,
+        target_lufs: float = DEFAULT_TARGET_LUFS,
+        max_workers: Optional[int] = None,
+    ):
+        self.ffmpeg_path = ffmpeg_path
+        self.library = library
+        self.target_lufs = target_lufs
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+        self.analysis_task: Optional[asyncio.Task] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        # Measurements in progress, shared by the analysis run and Opus encodes
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+        # Counters for monitoring the analysis stage
+        self.stats = {"measured": 0, "skipped": 0, "failed": 0}
+
+    def get_gain_db(self, file_path: str) -> float:
+        """Get the normalization gain for a file (0 dB until it is measured)"""
+        try:
+            entry = self.library.get_entry(file_path)
+            return compute_gain_db(
+                entry.get("loudness") if entry else None, self.target_lufs
+            )
+        except Exception as e:
+            log_error_with_traceback("Error looking up loudness", e)
+            return 0.0
+
+    async def ensure_measured(self, file_path: str, save: bool = True) -> bool:
+        """Measure and store a file's loudness unless it already has one"""
+        try:
+            entry = self.library.get_entry(file_path)
+            if entry is None:
+                return False
+            if entry.get("loudness"):
+                self.stats["skipped"] += 1
+                return True
+
+            measurement = self._in_flight.get(file_path)
+            if measurement is None:
+                measurement = asyncio.ensure_future(self._measure(file_path))
+                self._in_flight[file_path] = measurement
+                measurement.add_done_callback(
+                    lambda _: self._in_flight.pop(file_path, None)
+                )
+
+            if not await asyncio.shield(measurement):
+                return False
+
+            if save:
+                await self.library.save_async()
+            return True
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats["failed"] += 1
+            log_error_with_traceback(f"Error measuring loudness of {file_path}", e)
+            return False
+
+    async def _measure(self, file_path: str) -> bool:
+        """Run one measurement and record it in the manifest"""
+        # Outside a batch run a thread is enough; FFmpeg does the work
+        loudness = await asyncio.get_running_loop().run_in_executor(
+            self._executor, measure_loudness, self.ffmpeg_path, file_path
+        )
+        if not loudness:
+            self.stats["failed"] += 1
+            return False
+
+        self.library.update_entry(file_path, loudness=loudness)
+        self.stats["measured"] += 1
+        return True
+
+    async def analyze_files(self, files: Iterable[str]) -> int:
+        """
+        Measure missing loudness values for a list of files.
+
+        Returns:
+            int: Number of files that have a measurement after the run
+        """
+        files = list(files)
+        measured = 0
+        measured_before = self.stats["measured"]
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_lower_priority if os.name == "posix" else None,
+        )
+        try:
+            for start in range(0, len(files), self.max_workers):
+                batch = files[start : start + self.max_workers]
+                results = await asyncio.gather(
+                    *(self.ensure_measured(f, save=False) for f in batch)
+                )
+                measured += sum(results)
+        finally:
+            executor, self._executor = self._executor, None
+            executor.shutdown(wait=False, cancel_futures=True)
+            # One manifest write per run, off the event loop
+            if self.stats["measured"] != measured_before:
+                await self.library.save_async()
+
+        log_perfect_tree_section(
+            "Loudness - Analysis Complete",
+            [
+                ("files", len(files)),
+                ("measured", measured),
+                ("new_measurements", self.stats["measured"] - measured_before),
+                ("failed", self.stats["failed"]),
+                ("target", f"{self.target_lufs:.1f} LUFS"),
+            ],
+            "🔊",
+        )
+        return measured
+
+    def start_background_analysis(self, files: Iterable[str]):
+        """Start (or restart) the background analysis task"""
+        try:
+            self.stop_background_analysis()
+            self.analysis_task = asyncio.create_task(self.analyze_files(list(files)))
+        except Exception as e:
+            log_error_with_traceback("Error starting loudness analysis", e)
+
+    def stop_background_analysis(self):
+        """Cancel the background analysis task if running"""
+        if self.analysis_task and not self.analysis_task.done():
+            self.analysis_task.cancel()
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "LoudnessAnalyzer",
+    "compute_gain_db",
+    "measure_loudness",
+    "parse_ebur128_summary",
+    "DEFAULT_TARGET_LUFS",
+]
@@ -0,0 +1,284 @@
+# =============================================================================
+# QuranBot - Opus Library Cache (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Pre-encodes each reciter's MP3 files into Discord-ready Ogg Opus once, so
+# 24/7 playback can stream Opus packets straight to the voice connection
+# instead of decoding MP3 → PCM in FFmpeg and re-encoding PCM → Opus in
+# discord.py for every track.
+#
+# Key Features:
+# - Background (low priority) and offline pre-encode stage
+# - Cache files keyed by source content hash, bitrate and loudness gain
+# - Source hashes stored in the audio library manifest (computed once)
+# - O(1) lookup on the playback path with automatic fallback
+#
+# Technical Implementation:
+# - FFmpeg libopus encode to 48kHz stereo Ogg Opus
+# - Atomic temp-file + rename so partial encodes are never played
+# - Sequential encoding with niceness to keep playback responsive
+#
+# File Structure:
+# /audio_cache/opus/
+#   <sha1>_<bitrate>k.opus             - Pre-encoded track
+#   <sha1>_<bitrate>k_<gain>dB.opus    - Pre-encoded track, loudness normalized
+#
+# Required Dependencies:
+# - FFmpeg with libopus (path configurable)
+# =============================================================================
+
+import asyncio
+import hashlib
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .tree_log import (
+    log_error_with_traceback,
+    log_perfect_tree_section,
+    log_warning_with_context,
+)
+
+DEFAULT_BITRATE_KBPS = 64
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(file_path: str) -> str:
+    """Compute the SHA-1 of a file's contents"""
+    digest = hashlib.sha1()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _lower_priority():
+    """Run encoder subprocesses at reduced CPU priority"""
+    try:
+        os.nice(10)
+    except Exception:
+        pass
+
+
+class OpusCache:
+    """
+    Cache of pre-encoded Ogg Opus files for passthrough playback.
+
+    Cache entries are keyed by the SHA-1 of the source MP3, the target
+    bitrate and, when a LoudnessAnalyzer is given, the normalization gain
+    baked into the encode (passthrough cannot apply filters). The hash is
+    stored in the AudioLibrary manifest entry for the file, so it is
+    computed once per file version and looked up in O(1).
+
+    Implementation Notes:
+    - get_cached_path() never hashes or encodes; it only reads the manifest
+    - encode_files() is the pre-encode stage (background task or offline tool)
+    - A changed source file gets a new manifest entry, invalidating its hash
+    - New hashes and measurements only mark the manifest dirty; it is saved
+      once per encode run, off the event loop
+    """
+
+    def __init__(
+        self,
+        ffmpeg_path: str,
+        library,
+        cache_folder: str = "audio_cache/opus",
+        loudness=None,
+    ):
+        self.ffmpeg_path = ffmpeg_path
+        self.library = library
+        self.loudness = loudness
+        self.cache_folder = Path(cache_folder)
+        self.encode_task: Optional[asyncio.Task] = None
+
+        # Counters for monitoring the pre-encode stage
+        self.stats = {"encoded": 0, "skipped": 0, "failed": 0}
+        self._manifest_dirty = False
+
+    def _cache_path(
+        self, source_hash: str, bitrate_kbps: int, gain_db: float = 0.0
+    ) -> Path:
+        gain = f"_{gain_db:+.1f}dB" if gain_db else ""
+        return self.cache_folder / f"{source_hash}_{bitrate_kbps}k{gain}.opus"
+
+    def _get_gain_db(self, file_path: str) -> float:
+        return self.loudness.get_gain_db(file_path) if self.loudness else 0.0
+
+    def get_cached_path(self, file_path: str, bitrate_kbps: int) -> Optional[str]:
+        """Get the pre-encoded Opus file for a source, if one exists"""
+        try:
+            entry = self.library.get_entry(file_path)
+            if not entry or not entry.get("sha1"):
+                return None
+
+            cached = self._cache_path(
+                entry["sha1"], bitrate_kbps, self._get_gain_db(file_path)
+            )
+            return str(cached) if cached.exists() else None
+
+        except Exception as e:
+            log_error_with_traceback("Error looking up Opus cache", e)
+            return None
+
+    async def _get_source_hash(self, file_path: str) -> Optional[str]:
+        """Get a file's content hash, computing and recording it once"""
+        entry = self.library.get_entry(file_path)
+        if entry is None:
+            return None
+        if not entry.get("sha1"):
+            source_hash = await asyncio.to_thread(hash_file, file_path)
+            self.library.update_entry(file_path, sha1=source_hash)
+            self._manifest_dirty = True
+        return entry["sha1"]
+
+    async def _save_library(self):
+        """Persist new hashes and measurements, if any"""
+        if self._manifest_dirty:
+            self._manifest_dirty = False
+            await self.library.save_async()
+
+    async def encode_file(
+        self, file_path: str, bitrate_kbps: int, save: bool = True
+    ) -> bool:
+        """Encode a single MP3 to Ogg Opus unless already cached"""
+        try:
+            return await self._encode_file(file_path, bitrate_kbps)
+        finally:
+            if save:
+                await self._save_library()
+
+    async def _encode_file(self, file_path: str, bitrate_kbps: int) -> bool:
+        """Encode one file without saving the manifest"""
+        try:
+            source_hash = await self._get_source_hash(file_path)
+            if not source_hash:
+                return False
+
+            # Measure first so the normalization gain is part of the encode
+            if self.loudness:
+                measured_before = self.loudness.stats["measured"]
+                await self.loudness.ensure_measured(file_path, save=False)
+                if self.loudness.stats["measured"] != measured_before:
+                    self._manifest_dirty = True
+            gain_db = self._get_gain_db(file_path)
+
+            target = self._cache_path(source_hash, bitrate_kbps, gain_db)
+            if target.exists():
+                self.stats["skipped"] += 1
+                return True
+
+            self.cache_folder.mkdir(parents=True, exist_ok=True)
+            temp_target = target.with_suffix(".tmp")
+
+            process = await asyncio.create_subprocess_exec(
+                self.ffmpeg_path,
+                "-y",
+                "-loglevel",
+                "error",
+                "-i",
+                file_path,
+                "-vn",
+                "-map_metadata",
+                "-1",
+                *(["-af", f"volume={gain_db:.1f}dB"] if gain_db else []),
+                "-c:a",
+                "libopus",
+                "-b:a",
+                f"{bitrate_kbps}k",
+                "-ar",
+                "48000",
+                "-ac",
+                "2",
+                "-application",
+                "audio",
+                "-f",
+                "ogg",
+                str(temp_target),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                preexec_fn=_lower_priority if os.name == "posix" else None,
+            )
+            try:
+                _, stderr = await process.communicate()
+            except asyncio.CancelledError:
+                # Don't leave an orphaned encoder or a partial file behind
+                process.kill()
+                await process.wait()
+                if temp_target.exists():
+                    temp_target.unlink()
+                raise
+
+            if process.returncode != 0 or not temp_target.exists():
+                self.stats["failed"] += 1
+                if temp_target.exists():
+                    temp_target.unlink()
+                log_warning_with_context(
+                    f"Opus encode failed: {os.path.basename(file_path)}",
+                    (stderr or b"").decode(errors="ignore")[-300:],
+                )
+                return False
+
+            os.replace(temp_target, target)
+            self.stats["encoded"] += 1
+            return True
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats["failed"] += 1
+            log_error_with_traceback(f"Error encoding {file_path} to Opus", e)
+            return False
+
+    async def encode_files(self, files: Iterable[str], bitrate_kbps: int) -> int:
+        """
+        Pre-encode a list of files sequentially.
+
+        Returns:
+            int: Number of files that are cached after the run
+        """
+        files = list(files)
+        cached = 0
+        try:
+            for file_path in files:
+                if await self.encode_file(file_path, bitrate_kbps, save=False):
+                    cached += 1
+        finally:
+            await self._save_library()
+
+        log_perfect_tree_section(
+            "Opus Cache - Pre-encode Complete",
+            [
+                ("files", len(files)),
+                ("cached", cached),
+                ("bitrate", f"{bitrate_kbps}k"),
+                ("encoded", self.stats["encoded"]),
+                ("failed", self.stats["failed"]),
+            ],
+            "🗜️",
+        )
+        return cached
+
+    def start_background_encoding(self, files: Iterable[str], bitrate_kbps: int):
+        """Start (or restart) the background pre-encode task"""
+        try:
+            self.stop_background_encoding()
+            self.encode_task = asyncio.create_task(
+                self.encode_files(list(files), bitrate_kbps)
+            )
+        except Exception as e:
+            log_error_with_traceback("Error starting Opus pre-encode", e)
+
+    def stop_background_encoding(self):
+        """Cancel the background pre-encode task if running"""
+        if self.encode_task and not self.encode_task.done():
+            self.encode_task.cancel()
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = ["OpusCache", "hash_file", "DEFAULT_BITRATE_KBPS"]
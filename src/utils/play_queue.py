@@ -0,0 +1,219 @@
+# =============================================================================
+# QuranBot - Play Queue (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Explicit play order state: surahs queued by users, what was played, and the
+# repeat mode. The audio manager asks it what plays next before falling back
+# to the sequential or shuffle order, so prefetching and the playback loop
+# share one answer.
+#
+# Key Features:
+# - O(1) add to the end, "play next" insertion, peek and pop
+# - Bounded history of played surahs
+# - Repeat modes: the whole library (24/7) or the current surah
+# - Persisted as small delta records instead of rewriting the state
+#
+# Technical Implementation:
+# - deques for the queue and the history
+# - Every change is an op list (["push", 36], ["pop"], ...) applied by
+#   one function, so replaying the saved deltas rebuilds the same state
+# - The caller compacts deltas into a snapshot after COMPACT_AFTER_DELTAS
+#
+# Required Dependencies:
+# - None (standard library only)
+# =============================================================================
+
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+REPEAT_ALL = "all"  # 24/7: continue through the library
+REPEAT_ONE = "one"  # Repeat the current surah
+
+HISTORY_SIZE = 50
+MAX_QUEUED = 114
+
+# Deltas written before the state is rewritten as a snapshot
+COMPACT_AFTER_DELTAS = 200
+
+
+class PlayQueue:
+    """
+    User play queue, history and repeat mode.
+
+    Implementation Notes:
+    - Entries are surah numbers, so a queue survives reciter switches
+    - Mutations go through _record(), which applies the op and keeps it
+      for the next persistence flush
+    - Unknown ops in saved deltas are ignored (forward compatible)
+    """
+
+    def __init__(self, history_size: int = HISTORY_SIZE):
+        self.upcoming: Deque[int] = deque()
+        self.history: Deque[int] = deque(maxlen=history_size)
+        self.repeat = REPEAT_ALL
+
+        self._deltas: List[List[Any]] = []
+        self.deltas_since_snapshot = 0
+
+    def __len__(self) -> int:
+        return len(self.upcoming)
+
+    # =========================================================================
+    # Mutations
+    # =========================================================================
+
+    def push(self, surah: int) -> bool:
+        """Add a surah to the end of the queue"""
+        if len(self.upcoming) >= MAX_QUEUED:
+            return False
+        self._record(["push", surah])
+        return True
+
+    def push_next(self, surah: int) -> bool:
+        """Insert a surah at the front of the queue ("play next")"""
+        if len(self.upcoming) >= MAX_QUEUED:
+            return False
+        self._record(["next", surah])
+        return True
+
+    def pop(self) -> Optional[int]:
+        """Remove and return the surah at the front of the queue"""
+        if not self.upcoming:
+            return None
+        surah = self.upcoming[0]
+        self._record(["pop"])
+        return surah
+
+    def clear(self) -> int:
+        """Empty the queue, returning how many entries were dropped"""
+        dropped = len(self.upcoming)
+        if dropped:
+            self._record(["clear"])
+        return dropped
+
+    def record_played(self, surah: int):
+        """Add a surah that started playing to the history"""
+        self._record(["played", surah])
+
+    def set_repeat(self, mode: str):
+        """Set the repeat mode (REPEAT_ALL or REPEAT_ONE)"""
+        if mode != self.repeat:
+            self._record(["repeat", mode])
+
+    def _record(self, op: List[Any]):
+        self.apply(op)
+        self._deltas.append(op)
+
+    def apply(self, op: List[Any]):
+        """Apply one delta op (used for changes and for replaying saved deltas)"""
+        kind = op[0]
+        if kind == "push":
+            self.upcoming.append(op[1])
+        elif kind == "next":
+            self.upcoming.appendleft(op[1])
+        elif kind == "pop":
+            if self.upcoming:
+                self.upcoming.popleft()
+        elif kind == "clear":
+            self.upcoming.clear()
+        elif kind == "played":
+            self.history.append(op[1])
+        elif kind == "repeat":
+            self.repeat = op[1]
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def peek(self) -> Optional[int]:
+        """Get the surah at the front of the queue without removing it"""
+        return self.upcoming[0] if self.upcoming else None
+
+    def get_upcoming(self) -> List[int]:
+        return list(self.upcoming)
+
+    def get_history(self, count: int = 10) -> List[int]:
+        """Get the most recently played surahs, newest first"""
+        recent = list(self.history)[-count:]
+        recent.reverse()
+        return recent
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def drain_deltas(self) -> List[List[Any]]:
+        """Take the ops recorded since the last flush"""
+        deltas, self._deltas = self._deltas, []
+        self.deltas_since_snapshot += len(deltas)
+        return deltas
+
+    def needs_compaction(self) -> bool:
+        return self.deltas_since_snapshot >= COMPACT_AFTER_DELTAS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the full state (a snapshot)"""
+        return {
+            "upcoming": list(self.upcoming),
+            "history": list(self.history),
+            "repeat": self.repeat,
+        }
+
+    def mark_snapshot(self):
+        """Note that the full state was just saved"""
+        self._deltas = []
+        self.deltas_since_snapshot = 0
+
+    def restore(
+        self,
+        snapshot: Optional[Dict[str, Any]],
+        deltas: Iterable[List[Any]] = (),
+    ) -> int:
+        """
+        Rebuild the state from a snapshot plus the deltas saved after it.
+
+        Returns:
+            int: Number of deltas replayed
+        """
+        self.upcoming.clear()
+        self.history.clear()
+        self.repeat = REPEAT_ALL
+        self._deltas = []
+
+        if snapshot:
+            self.upcoming.extend(int(s) for s in snapshot.get("upcoming", []))
+            self.history.extend(int(s) for s in snapshot.get("history", []))
+            if snapshot.get("repeat") in (REPEAT_ALL, REPEAT_ONE):
+                self.repeat = snapshot["repeat"]
+
+        replayed = 0
+        for op in deltas:
+            if isinstance(op, list) and op:
+                self.apply(op)
+                replayed += 1
+
+        self.deltas_since_snapshot = replayed
+        return replayed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the queue for the status view"""
+        return {
+            "upcoming": self.get_upcoming(),
+            "recent": self.get_history(5),
+            "repeat": self.repeat,
+        }
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "PlayQueue",
+    "REPEAT_ALL",
+    "REPEAT_ONE",
+    "COMPACT_AFTER_DELTAS",
+]
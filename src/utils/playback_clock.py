@@ -0,0 +1,110 @@
+# =============================================================================
+# QuranBot - Playback Clock (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Single source of truth for the position within the current track. The
+# control panel, rich presence, state saving and Discord logs all read the
+# position from here instead of recomputing it from wall-clock timestamps.
+#
+# Key Features:
+# - Based on time.monotonic(), immune to NTP and manual clock changes
+# - Pauses freeze the position; resumes continue from it
+# - Seeks reposition without changing the running/paused state
+# - position() is one subtraction while running
+#
+# Technical Implementation:
+# - While running, position = now - anchor (anchor = start time - offset)
+# - While paused or stopped, the position is held as a plain float
+#
+# Required Dependencies:
+# - None (standard library only)
+# =============================================================================
+
+import threading
+import time
+from typing import Callable, Optional
+
+
+class PlaybackClock:
+    """
+    Monotonic track position with pause and seek accounting.
+
+    States:
+    - stopped: no track is playing; position is the resume point
+    - running: position advances with the monotonic clock
+    - paused: a track is loaded but the position is frozen
+
+    Implementation Notes:
+    - State changes take a small lock; position() reads two attributes and
+      is safe to call from any thread without it
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._anchor: Optional[float] = None  # Set only while running
+        self._held = 0.0  # Position while paused or stopped
+        self._active = False  # A track is loaded (running or paused)
+
+    def position(self) -> float:
+        """Get the current position in seconds"""
+        anchor = self._anchor
+        if anchor is None:
+            return self._held
+        return max(0.0, self._clock() - anchor)
+
+    def start(self, position: Optional[float] = None):
+        """Start running from a position (default: the held position)"""
+        with self._lock:
+            if position is not None:
+                self._held = max(0.0, position)
+            self._anchor = self._clock() - self._held
+            self._active = True
+
+    def pause(self):
+        """Freeze the position"""
+        with self._lock:
+            if self._anchor is not None:
+                self._held = max(0.0, self._clock() - self._anchor)
+                self._anchor = None
+
+    def resume(self):
+        """Continue from the frozen position if a track is loaded"""
+        with self._lock:
+            if self._active and self._anchor is None:
+                self._anchor = self._clock() - self._held
+
+    def seek(self, position: float):
+        """Move to a position, keeping the running/paused state"""
+        with self._lock:
+            self._held = max(0.0, position)
+            if self._anchor is not None:
+                self._anchor = self._clock() - self._held
+
+    def stop(self, position: float = 0.0):
+        """Unload the track, holding a position for the next start"""
+        with self._lock:
+            self._anchor = None
+            self._held = max(0.0, position)
+            self._active = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._anchor is not None
+
+    @property
+    def is_active(self) -> bool:
+        """True while a track is loaded, whether running or paused"""
+        return self._active
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "PlaybackClock",
+]
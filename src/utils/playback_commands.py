@@ -0,0 +1,166 @@
+# =============================================================================
+# QuranBot - Playback Command Queue (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Serializes control-panel navigation (next, previous, jump to surah, switch
+# reciter) through the playback task. Rapid clicks are collected for a short
+# window and folded into one final target, so only one audio source is built
+# however many times "Next" was pressed.
+#
+# Key Features:
+# - FIFO of commands, consumed only by the playback loop
+# - Debounce window that restarts on every click, with a hard cap so a
+#   stream of clicks cannot hold playback back indefinitely
+# - Folding: skips add up, a jump replaces earlier navigation, the last
+#   reciter switch wins
+# - Queue depth and coalescing counters for the status view
+#
+# Technical Implementation:
+# - Commands are (kind, value, submitted_at) tuples in a deque
+# - Everything runs on the event loop; no locking needed
+#
+# Required Dependencies:
+# - None (standard library only)
+# =============================================================================
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Tuple
+
+COMMAND_NEXT = "next"
+COMMAND_PREVIOUS = "previous"
+COMMAND_JUMP = "jump"
+COMMAND_RECITER = "reciter"
+
+# Quiet time after the last click before the batch is applied
+DEFAULT_COALESCE_SECONDS = 0.25
+
+# Longest a batch waits from its first click, however many follow
+MAX_COALESCE_SECONDS = 1.0
+
+PlaybackCommand = Tuple[str, Any, float]
+
+
+def coalesce(commands: List[PlaybackCommand]) -> Dict[str, Any]:
+    """
+    Fold a batch of commands into one navigation target.
+
+    Returns:
+        Dict[str, Any]: {"surah": jump target or None, "steps": net skips
+        applied after the jump (negative = previous), "reciter": the last
+        reciter switch's value or None}
+    """
+    surah = None
+    steps = 0
+    reciter = None
+
+    for kind, value, _ in commands:
+        if kind == COMMAND_NEXT:
+            steps += 1
+        elif kind == COMMAND_PREVIOUS:
+            steps -= 1
+        elif kind == COMMAND_JUMP:
+            surah, steps = value, 0
+        elif kind == COMMAND_RECITER:
+            reciter = value
+
+    return {"surah": surah, "steps": steps, "reciter": reciter}
+
+
+class PlaybackCommandQueue:
+    """
+    Pending navigation commands for the playback loop.
+
+    Implementation Notes:
+    - submit() never touches playback state; the caller stops the current
+      track so the loop wakes up and calls take_batch()
+    - take_batch() returns the commands in arrival order once clicking has
+      stopped for the coalesce window
+    """
+
+    def __init__(
+        self,
+        coalesce_seconds: float = DEFAULT_COALESCE_SECONDS,
+        max_wait_seconds: float = MAX_COALESCE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.coalesce_seconds = coalesce_seconds
+        self.max_wait_seconds = max_wait_seconds
+        self._clock = clock
+        self._commands: Deque[PlaybackCommand] = deque()
+
+        # Counters for monitoring control-panel load
+        self.stats = {
+            "submitted": 0,
+            "batches": 0,
+            "coalesced": 0,
+            "max_depth": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def submit(self, kind: str, value: Any = None) -> int:
+        """
+        Queue a command for the playback loop.
+
+        Returns:
+            int: Queue depth including this command
+        """
+        self._commands.append((kind, value, self._clock()))
+        self.stats["submitted"] += 1
+        self.stats["max_depth"] = max(self.stats["max_depth"], len(self._commands))
+        return len(self._commands)
+
+    def _wait_remaining(self) -> float:
+        """Seconds until the pending batch is due (<= 0 when it is)"""
+        now = self._clock()
+        first_at = self._commands[0][2]
+        last_at = self._commands[-1][2]
+        return min(
+            last_at + self.coalesce_seconds - now,
+            first_at + self.max_wait_seconds - now,
+        )
+
+    async def take_batch(self) -> List[PlaybackCommand]:
+        """Wait out the coalesce window, then drain every pending command"""
+        while self._commands:
+            remaining = self._wait_remaining()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(remaining)
+
+        batch = list(self._commands)
+        self._commands.clear()
+        if batch:
+            self.stats["batches"] += 1
+            self.stats["coalesced"] += len(batch) - 1
+        return batch
+
+    def clear(self) -> int:
+        """Drop pending commands (playback stopped), returning how many"""
+        dropped = len(self._commands)
+        self._commands.clear()
+        return dropped
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get queue depth and coalescing counters"""
+        return {"depth": len(self._commands), **self.stats}
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "PlaybackCommandQueue",
+    "coalesce",
+    "COMMAND_NEXT",
+    "COMMAND_PREVIOUS",
+    "COMMAND_JUMP",
+    "COMMAND_RECITER",
+]
@@ -0,0 +1,310 @@
+# =============================================================================
+# QuranBot - Playback Journal (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Append-only log of playback events (track start, seek, pause, resume,
+# reciter switch, position ticks). The last valid record is where playback
+# was when the bot stopped, even after a crash, so resume is accurate to
+# the tick interval instead of the playback state save cadence.
+#
+# Key Features:
+# - Fixed 36-byte binary records with a CRC; a torn or corrupt tail is
+#   detected and cut off instead of failing the whole file
+# - Appends are one small write + flush (no fsync, no rewrite)
+# - Periodic compaction: the file is atomically replaced by one snapshot
+#   record once it holds COMPACT_AFTER_RECORDS records
+# - The latest state is kept in memory, so lookups after startup are O(1)
+#
+# Technical Implementation:
+# - struct record: kind, playing flag, surah, reciter CRC32, position,
+#   time.monotonic() (orders events within a boot) and wall time (ages
+#   records across restarts)
+# - Reciters are stored as the CRC32 of their name to keep records fixed-size
+#
+# File Structure:
+# /data/
+#   playback_journal.bin - Journal records (compacted in place)
+#
+# Required Dependencies:
+# - None (standard library only)
+# =============================================================================
+
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional, Union
+
+from .tree_log import log_error_with_traceback, log_perfect_tree_section
+
+EVENT_START = 1  # Track started (position is its start offset)
+EVENT_SEEK = 2  # Track restarted at a seek position
+EVENT_PAUSE = 3
+EVENT_RESUME = 4
+EVENT_RECITER = 5  # Reciter switched (position lined up in the new recording)
+EVENT_TICK = 6  # Position heartbeat while playing
+EVENT_STOP = 7
+EVENT_SNAPSHOT = 8  # Compacted state
+
+EVENT_NAMES = {
+    EVENT_START: "start",
+    EVENT_SEEK: "seek",
+    EVENT_PAUSE: "pause",
+    EVENT_RESUME: "resume",
+    EVENT_RECITER: "reciter",
+    EVENT_TICK: "tick",
+    EVENT_STOP: "stop",
+    EVENT_SNAPSHOT: "snapshot",
+}
+
+# kind, playing, surah, reciter crc, position, monotonic, wall time
+_BODY = struct.Struct("<BBHIddd")
+_CRC = struct.Struct("<I")
+RECORD_SIZE = _BODY.size + _CRC.size
+
+# Seconds between position ticks while playing
+TICK_SECONDS = 1.0
+
+# Records written before the journal is compacted (~1 hour of ticks)
+COMPACT_AFTER_RECORDS = 3600
+
+
+def reciter_id(reciter: str) -> int:
+    """Get the fixed-size id a reciter name is journaled as"""
+    return zlib.crc32(reciter.encode("utf-8"))
+
+
+def _pack(kind, is_playing, surah, reciter_crc, position, monotonic, wall) -> bytes:
+    body = _BODY.pack(
+        kind, 1 if is_playing else 0, surah, reciter_crc, position, monotonic, wall
+    )
+    return body + _CRC.pack(zlib.crc32(body))
+
+
+def _unpack(record: bytes) -> Optional[Dict[str, Any]]:
+    body = record[: _BODY.size]
+    if _CRC.unpack_from(record, _BODY.size)[0] != zlib.crc32(body):
+        return None
+    kind, playing, surah, reciter_crc, position, monotonic, wall = _BODY.unpack(body)
+    if kind not in EVENT_NAMES or not 1 <= surah <= 114 or position < 0:
+        return None
+    return {
+        "kind": kind,
+        "is_playing": bool(playing),
+        "surah": surah,
+        "reciter_id": reciter_crc,
+        "position": position,
+        "monotonic": monotonic,
+        "wall_time": wall,
+    }
+
+
+class PlaybackJournal:
+    """
+    Append-only playback event journal.
+
+    Implementation Notes:
+    - The file is scanned once, on the first replay() or append(); invalid
+      trailing bytes are truncated so later appends stay record-aligned
+    - append() is called from the event loop; it never fsyncs, compaction
+      and close() do
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        compact_after: int = COMPACT_AFTER_RECORDS,
+    ):
+        self.path = Path(path)
+        self.compact_after = compact_after
+        self._file: Optional[BinaryIO] = None
+        self._scanned = False
+        self.last: Optional[Dict[str, Any]] = None
+        self.records = 0
+
+        self.stats = {"appends": 0, "compactions": 0, "truncated_bytes": 0}
+
+    # =========================================================================
+    # Reading
+    # =========================================================================
+
+    def _scan(self):
+        """Read the journal once, keeping the last valid record"""
+        if self._scanned:
+            return
+        self._scanned = True
+
+        try:
+            if not self.path.exists():
+                return
+            data = self.path.read_bytes()
+        except Exception as e:
+            log_error_with_traceback("Error reading playback journal", e)
+            return
+
+        valid = 0
+        for offset in range(0, len(data) - RECORD_SIZE + 1, RECORD_SIZE):
+            record = _unpack(data[offset : offset + RECORD_SIZE])
+            if record is None:
+                break
+            self.last = record
+            valid += 1
+
+        self.records = valid
+        cut = len(data) - valid * RECORD_SIZE
+        if cut:
+            # Torn write or corruption: drop everything after the last good record
+            self.stats["truncated_bytes"] = cut
+            try:
+                with open(self.path, "r+b") as f:
+                    f.truncate(valid * RECORD_SIZE)
+            except Exception as e:
+                log_error_with_traceback("Error truncating playback journal", e)
+
+            log_perfect_tree_section(
+                "Playback Journal - Tail Recovered",
+                [
+                    ("valid_records", valid),
+                    ("dropped_bytes", cut),
+                ],
+                "🩹",
+            )
+
+    def replay(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the state recorded by the last valid journal record.
+
+        Returns:
+            Optional[Dict[str, Any]]: kind, is_playing, surah, reciter_id,
+            position, monotonic and wall_time, or None for an empty journal
+        """
+        self._scan()
+        return dict(self.last) if self.last else None
+
+    # =========================================================================
+    # Writing
+    # =========================================================================
+
+    def append(
+        self,
+        kind: int,
+        surah: int,
+        position: float,
+        reciter: str,
+        is_playing: bool,
+    ) -> bool:
+        """Append one event record"""
+        try:
+            self._scan()
+            record = _pack(
+                kind,
+                is_playing,
+                surah,
+                reciter_id(reciter),
+                max(0.0, position),
+                time.monotonic(),
+                time.time(),
+            )
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "ab")
+            self._file.write(record)
+            self._file.flush()
+
+            self.last = _unpack(record)
+            self.records += 1
+            self.stats["appends"] += 1
+
+            if self.records >= self.compact_after:
+                self.compact()
+            return True
+        except Exception as e:
+            log_error_with_traceback("Error appending to playback journal", e)
+            return False
+
+    def compact(self) -> bool:
+        """Replace the journal with a single snapshot of the latest state"""
+        if self.last is None:
+            return False
+        try:
+            last = self.last
+            record = _pack(
+                EVENT_SNAPSHOT,
+                last["is_playing"],
+                last["surah"],
+                last["reciter_id"],
+                last["position"],
+                last["monotonic"],
+                last["wall_time"],
+            )
+            temp_path = self.path.with_suffix(".tmp")
+            with open(temp_path, "wb") as f:
+                f.write(record)
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._close_file()
+            os.replace(temp_path, self.path)
+
+            self.last = _unpack(record)
+            self.records = 1
+            self.stats["compactions"] += 1
+            return True
+        except Exception as e:
+            log_error_with_traceback("Error compacting playback journal", e)
+            return False
+
+    def _close_file(self, sync: bool = False):
+        if self._file is not None:
+            if sync:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        """Sync and close the journal (shutdown)"""
+        try:
+            self._close_file(sync=True)
+        except Exception as e:
+            log_error_with_traceback("Error closing playback journal", e)
+
+    def clear(self):
+        """Delete the journal"""
+        self._close_file()
+        self.path.unlink(missing_ok=True)
+        self.last = None
+        self.records = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get journal size and activity counters"""
+        return {
+            "records": self.records,
+            "bytes": self.records * RECORD_SIZE,
+            "last_event": EVENT_NAMES.get(self.last["kind"]) if self.last else None,
+            **self.stats,
+        }
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "PlaybackJournal",
+    "reciter_id",
+    "RECORD_SIZE",
+    "TICK_SECONDS",
+    "COMPACT_AFTER_RECORDS",
+    "EVENT_START",
+    "EVENT_SEEK",
+    "EVENT_PAUSE",
+    "EVENT_RESUME",
+    "EVENT_RECITER",
+    "EVENT_TICK",
+    "EVENT_STOP",
+]
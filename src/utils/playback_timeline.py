@@ -0,0 +1,123 @@
+# =============================================================================
+# QuranBot - Playback Timeline (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Answers "when does Surah X start?". The audio manager predicts the order
+# of the next tracks (play queue, loop, shuffle bag, sequential) and this
+# turns their durations into start times.
+#
+# Key Features:
+# - Start offsets for the next N tracks as a prefix-sum array
+# - O(1) surah → start lookup
+# - Offsets are relative to the end of the current track, so a projection
+#   stays valid while the track plays and is only rebuilt when the order
+#   changes (skip, jump, queue or mode change)
+# - Flags projections that include tracks without a known duration
+#
+# Technical Implementation:
+# - array('d') of cumulative durations, built in one O(N) pass from the
+#   in-memory library manifest (no disk access)
+#
+# Required Dependencies:
+# - None (standard library only)
+# =============================================================================
+
+from array import array
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Tracks projected by default (the whole library)
+DEFAULT_PROJECTION_TRACKS = 114
+
+
+def format_eta(seconds: float) -> str:
+    """Format seconds from now as a short "in 1h 05m" label"""
+    minutes = int(seconds // 60)
+    if minutes < 1:
+        return "in <1m"
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"in {hours}h {minutes:02d}m"
+    return f"in {minutes}m"
+
+
+class PlaybackTimeline:
+    """
+    Projected start times of upcoming tracks.
+
+    starts[k] is when the k-th upcoming track begins, in seconds after the
+    current track ends; add the current track's remaining time for "from now".
+
+    Implementation Notes:
+    - A surah projected more than once (short loops of the library) maps to
+      its first occurrence
+    - Unknown durations count as 0; is_exact says whether any were missing
+    """
+
+    def __init__(self, surahs: Sequence[int], durations: Sequence[float]):
+        self.surahs = list(surahs)
+        self.durations = array("d", durations)
+        self.starts = array("d", [0.0])
+        self.starts.extend(accumulate(self.durations))
+        self.is_exact = all(duration > 0 for duration in self.durations)
+
+        self._first: Dict[int, int] = {}
+        for position, surah in enumerate(self.surahs):
+            self._first.setdefault(surah, position)
+
+    def __len__(self) -> int:
+        return len(self.surahs)
+
+    def start_of(self, surah: int, remaining: float = 0.0) -> Optional[float]:
+        """
+        Get the seconds until a surah starts.
+
+        Args:
+            surah: Surah number
+            remaining: Seconds left in the current track
+
+        Returns:
+            Optional[float]: Seconds from now, or None if it is not projected
+        """
+        position = self._first.get(surah)
+        if position is None:
+            return None
+        return remaining + self.starts[position]
+
+    def entries(
+        self, remaining: float = 0.0, limit: Optional[int] = None
+    ) -> List[Tuple[int, float, float]]:
+        """Get (surah, seconds from now, duration) for the next tracks"""
+        count = len(self.surahs) if limit is None else min(limit, len(self.surahs))
+        return [
+            (self.surahs[k], remaining + self.starts[k], self.durations[k])
+            for k in range(count)
+        ]
+
+    def total_seconds(self) -> float:
+        """Get the length of the whole projection"""
+        return self.starts[-1]
+
+    def to_dict(self, remaining: float = 0.0, limit: int = 3) -> Dict[str, Any]:
+        """Get the first few projected starts for the status view"""
+        return {
+            "upcoming": [
+                {"surah": surah, "starts_in": round(start, 1)}
+                for surah, start, _ in self.entries(remaining, limit)
+            ],
+            "is_exact": self.is_exact,
+        }
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "PlaybackTimeline",
+    "DEFAULT_PROJECTION_TRACKS",
+    "format_eta",
+]
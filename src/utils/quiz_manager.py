@@ -29,7 +29,7 @@
 # File Structure:
 # /data/
 #   quiz_data.json      - Question pool
-#   quiz_stats.json     - Usage statistics
+#   quranbot.db         - User quiz scores (see data_store.py)
 #   quiz_state.json     - Current state
 #   quiz_scores.json    - User scores
 #   recent_questions.json - Anti-duplicate tracking
@@ -50,6 +50,7 @@ import discord
 import pytz
 from discord.ui import Button, View
 
+from .data_store import data_store
 from .tree_log import log_error_with_traceback, log_perfect_tree_section
 
 # Global scheduler task reference
@@ -407,20 +408,12 @@ class QuizView(discord.ui.View):
                         # Check if user would lose points (i.e., they have points to lose)
                         if self.quiz_manager:
                             try:
-                                # Load current user stats to check if they have points
-                                from pathlib import Path
-                                import json
-                                quiz_stats_file = Path("data") / "quiz_stats.json"
-                                if quiz_stats_file.exists():
-                                    with open(quiz_stats_file, "r", encoding="utf-8") as f:
-                                        quiz_stats = json.load(f)
-                                    user_points = quiz_stats.get("user_scores", {}).get(str(user_id), {}).get("points", 0)
-                                    if user_points > 0:
-                                        answers_text += f"👤 <@{user_id}> - {result['answer']} ❌ (-1 pt)\n"
-                                    else:
-                                        answers_text += f"👤 <@{user_id}> - {result['answer']} ❌ (0 pts)\n"
-                                else:
+                                # Check the current score to see if they have points
+                                score = await data_store.get_quiz_score(user_id)
+                                if score and score["points"] > 0:
                                     answers_text += f"👤 <@{user_id}> - {result['answer']} ❌ (-1 pt)\n"
+                                else:
+                                    answers_text += f"👤 <@{user_id}> - {result['answer']} ❌ (0 pts)\n"
                             except Exception:
                                 answers_text += f"👤 <@{user_id}> - {result['answer']} ❌ (-1 pt)\n"
                         else:
@@ -668,7 +661,6 @@ class QuizButton(discord.ui.Button):
 # Data file paths with Path objects for cross-platform compatibility
 DATA_DIR = Path("data")
 QUIZ_DATA_FILE = DATA_DIR / "quiz_data.json"
-QUIZ_STATS_FILE = DATA_DIR / "quiz_stats.json"
 RECENT_QUESTIONS_FILE = DATA_DIR / "recent_questions.json"
 QUIZ_STATE_FILE = DATA_DIR / "quiz_state.json"
 
@@ -1091,94 +1083,34 @@ class QuizManager:
             # Save to quiz state file
             self.save_state()
             
-            # Also update the quiz stats file that the leaderboard reads from
-            self.update_quiz_stats_file(user_id, is_correct)
+            # Also update the quiz score the leaderboard reads from
+            self.update_quiz_stats(user_id, is_correct)
             
             return True
         except Exception as e:
             log_error_with_traceback("Error recording user answer", e)
             return False
 
-    def update_quiz_stats_file(self, user_id: int, is_correct: bool) -> bool:
-        """Update the quiz_stats.json file that the leaderboard command reads from"""
+    def update_quiz_stats(self, user_id: int, is_correct: bool) -> bool:
+        """Record the answer in the quiz_scores table the leaderboard reads from"""
         try:
-            user_id_str = str(user_id)
-            
-            # Load existing quiz stats
-            quiz_stats = {"user_scores": {}}
-            if QUIZ_STATS_FILE.exists():
-                try:
-                    with open(QUIZ_STATS_FILE, "r", encoding="utf-8") as f:
-                        quiz_stats = json.load(f)
-                except Exception as e:
-                    log_error_with_traceback("Error loading quiz stats file", e)
-                    quiz_stats = {"user_scores": {}}
-            
-            # Ensure user_scores exists
-            if "user_scores" not in quiz_stats:
-                quiz_stats["user_scores"] = {}
-            
-            # Initialize user if not exists
-            if user_id_str not in quiz_stats["user_scores"]:
-                quiz_stats["user_scores"][user_id_str] = {
-                    "points": 0,
-                    "correct": 0,
-                    "total": 0,
-                    "current_streak": 0,
-                    "best_streak": 0,
-                    "last_answer_time": None,
-                    "categories": {}
-                }
-            
-            user_stats = quiz_stats["user_scores"][user_id_str]
-            
-            # Ensure all required fields exist (for backwards compatibility)
-            if "correct" not in user_stats:
-                user_stats["correct"] = 0
-            if "total" not in user_stats:
-                user_stats["total"] = 0
-            if "points" not in user_stats:
-                user_stats["points"] = 0
-            if "current_streak" not in user_stats:
-                user_stats["current_streak"] = 0
-            if "best_streak" not in user_stats:
-                user_stats["best_streak"] = 0
-            
-            # Update stats
-            if is_correct:
-                user_stats["points"] += 1
-                user_stats["correct"] += 1
-                user_stats["current_streak"] += 1
-                user_stats["best_streak"] = max(user_stats["best_streak"], user_stats["current_streak"])
-            else:
-                # Subtract 1 point for wrong answers, but don't go below 0
-                user_stats["points"] = max(0, user_stats["points"] - 1)
-                user_stats["current_streak"] = 0
-            
-            user_stats["total"] += 1
-            user_stats["last_answer_time"] = datetime.now(timezone.utc).isoformat()
-            
-            # Save updated quiz stats
-            with open(QUIZ_STATS_FILE, "w", encoding="utf-8") as f:
-                json.dump(quiz_stats, f, indent=2)
-            
+            # One row upsert on the data store thread (points, totals, streaks)
+            data_store.record_quiz_answer(user_id, is_correct)
+
             log_perfect_tree_section(
                 "Quiz Stats Updated",
                 [
-                    ("user_id", user_id_str),
+                    ("user_id", str(user_id)),
                     ("is_correct", "✅ Correct" if is_correct else "❌ Incorrect"),
-                    ("new_points", user_stats["points"]),
-                    ("current_streak", user_stats["current_streak"]),
-                    ("total_answered", user_stats["total"]),
-                    ("status", "✅ Quiz stats file updated successfully"),
+                    ("status", "✅ Quiz score queued for the data store"),
                 ],
                 "📊",
             )
-            
+
             return True
-            
+
         except Exception as e:
-            log_error_with_traceback("Error updating quiz stats file", e)
+            log_error_with_traceback("Error updating quiz stats", e)
             return False
 
     def get_user_stats(self, user_id: str) -> Dict:
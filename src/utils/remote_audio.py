@@ -0,0 +1,437 @@
+# =============================================================================
+# QuranBot - Remote Audio Cache (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Lets reciters live on an HTTP origin instead of the bot's disk. Files are
+# downloaded on demand into a local cache with a byte budget, the next few
+# surahs are fetched ahead of time, and a track that is still downloading can
+# already be played from the part that has arrived.
+#
+# Key Features:
+# - Origin layout mirrors the audio folder: <origin>/<reciter>/<NNN>.mp3
+# - Reciter/file listing from the origin's copy of the library manifest
+# - LRU eviction by last use, bounded by a byte budget
+# - Files being played, streamed or prefetched are never evicted
+# - Streaming reads from a partial download (blocking until data arrives)
+#
+# Technical Implementation:
+# - aiohttp chunked download into "<file>.part", renamed when complete, so a
+#   complete path on disk always means a complete file
+# - Partial files are fed to FFmpeg through its stdin (discord.py pipe=True)
+#   by a reader that waits on the download's condition variable
+# - LRU order kept in an OrderedDict, seeded from file mtimes at startup
+#
+# File Structure:
+# <origin>/
+#   audio_library.json     - Copy of the bot's library manifest
+#   <reciter>/001.mp3 ...  - Reciter folders, same layout as /audio/
+# /audio_cache/remote/
+#   <reciter>/<NNN>.mp3    - Cached files (".part" while downloading)
+#
+# Required Dependencies:
+# - aiohttp: HTTP client for the origin
+# =============================================================================
+
+import asyncio
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set
+from urllib.parse import quote
+
+import aiohttp
+
+from .tree_log import (
+    log_error_with_traceback,
+    log_perfect_tree_section,
+    log_warning_with_context,
+)
+
+DEFAULT_CACHE_DIR = "audio_cache/remote"
+DEFAULT_MAX_CACHE_BYTES = 2 * 1024**3
+DEFAULT_PREFETCH_COUNT = 2
+
+MANIFEST_NAME = "audio_library.json"
+PART_SUFFIX = ".part"
+CHUNK_SIZE = 64 * 1024
+
+# Seconds a streaming read waits for new data before treating the download as dead
+READ_TIMEOUT = 30.0
+
+
+class _Download:
+    """Progress of one file download, shared with its streaming readers"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.part_path = path + PART_SUFFIX
+        self.bytes_written = 0
+        self.done = False
+        self.failed = False
+        self.condition = threading.Condition()
+        self.task: Optional[asyncio.Task] = None
+
+    def advance(self, count: int):
+        with self.condition:
+            self.bytes_written += count
+            self.condition.notify_all()
+
+    def finish(self, failed: bool = False):
+        with self.condition:
+            self.done = True
+            self.failed = failed
+            self.condition.notify_all()
+
+    def wait_for(self, offset: int, timeout: float) -> bool:
+        """Block until data beyond offset exists; False at the end or on timeout"""
+        with self.condition:
+            if self.bytes_written <= offset and not self.done:
+                self.condition.wait(timeout)
+            return self.bytes_written > offset
+
+
+class StreamingFileReader:
+    """
+    Blocking file-like reader over a file that may still be downloading.
+
+    discord.py's pipe writer thread calls read() and forwards the bytes to
+    FFmpeg's stdin; read() waits for the download instead of returning a
+    premature end of file.
+    """
+
+    def __init__(self, path: str, download: Optional[_Download] = None):
+        self.path = path
+        self.download = download
+        self._file = open(download.part_path if download else path, "rb")
+        self.offset = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if self._file is None:
+            return b""
+        try:
+            while True:
+                data = self._file.read(size)
+                if data:
+                    self.offset += len(data)
+                    return data
+
+                download = self.download
+                if download is None or download.failed:
+                    break
+                if download.done and download.bytes_written <= self.offset:
+                    break
+                if not download.wait_for(self.offset, READ_TIMEOUT):
+                    if not download.done:
+                        break  # Origin stopped sending
+        except (OSError, ValueError):
+            pass
+
+        self.close()
+        return b""
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __del__(self):
+        self.close()
+
+
+class RemoteAudioCache:
+    """
+    Local LRU disk cache in front of an HTTP audio origin.
+
+    Implementation Notes:
+    - Paths handed out are inside cache_dir; a path exists only once its
+      file is complete
+    - ensure_download() and open_stream() must run on the event loop
+    - Eviction skips protected paths (current and upcoming tracks), active
+      downloads and files with an open streaming reader
+    """
+
+    def __init__(
+        self,
+        origin_url: str,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        prefetch_count: int = DEFAULT_PREFETCH_COUNT,
+    ):
+        self.origin_url = origin_url.rstrip("/")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.prefetch_count = prefetch_count
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.prefetch_task: Optional[asyncio.Task] = None
+
+        self._lru: "OrderedDict[str, int]" = OrderedDict()  # path -> size
+        self._downloads: Dict[str, _Download] = {}
+        self._readers: "weakref.WeakSet[StreamingFileReader]" = weakref.WeakSet()
+        self._protected: Set[str] = set()
+        self._expected_sizes: Dict[str, int] = {}
+
+        self.stats = {"hits": 0, "misses": 0, "downloaded_bytes": 0, "evictions": 0}
+        self._scan_cache()
+
+    # =========================================================================
+    # Cache bookkeeping
+    # =========================================================================
+
+    def _scan_cache(self):
+        """Seed the LRU order from files already in the cache (oldest first)"""
+        try:
+            found = []
+            for root, _, files in os.walk(self.cache_dir):
+                for name in files:
+                    path = os.path.join(root, name)
+                    if name.endswith(PART_SUFFIX):
+                        os.remove(path)  # Interrupted download
+                        continue
+                    stat = os.stat(path)
+                    found.append((stat.st_mtime, path, stat.st_size))
+
+            for _, path, size in sorted(found):
+                self._lru[path] = size
+        except Exception as e:
+            log_error_with_traceback("Error scanning remote audio cache", e)
+
+    @property
+    def used_bytes(self) -> int:
+        return sum(self._lru.values())
+
+    def owns(self, path: str) -> bool:
+        """Check whether a library path is served from this cache"""
+        return os.path.abspath(path).startswith(
+            os.path.abspath(self.cache_dir) + os.sep
+        )
+
+    def is_cached(self, path: str) -> bool:
+        return path in self._lru
+
+    def touch(self, path: str):
+        """Mark a cached file as just used"""
+        if path in self._lru:
+            self._lru.move_to_end(path)
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+    def _in_use(self) -> Set[str]:
+        busy = set(self._protected) | set(self._downloads)
+        busy.update(reader.path for reader in list(self._readers))
+        return busy
+
+    def _make_room(self, needed: int):
+        """Evict least recently used files until `needed` more bytes fit"""
+        busy = self._in_use()
+        for path in list(self._lru):
+            if self.used_bytes + needed <= self.max_bytes:
+                return
+            if path in busy:
+                continue
+            size = self._lru.pop(path)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self.stats["evictions"] += 1
+            log_perfect_tree_section(
+                "Remote Audio - Evicted",
+                [
+                    ("file", os.path.relpath(path, self.cache_dir)),
+                    ("freed", f"{size / 1024**2:.1f} MB"),
+                ],
+                "🧹",
+            )
+
+    # =========================================================================
+    # Origin access
+    # =========================================================================
+
+    def local_path(self, reciter: str, filename: str) -> str:
+        return os.path.join(self.cache_dir, reciter, filename)
+
+    def _url_for(self, path: str) -> str:
+        relative = os.path.relpath(path, self.cache_dir)
+        return f"{self.origin_url}/" + "/".join(
+            quote(part) for part in relative.split(os.sep)
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=None, sock_read=READ_TIMEOUT)
+            )
+        return self.session
+
+    async def fetch_manifest(self) -> Optional[Dict[str, Any]]:
+        """Download the origin's library manifest"""
+        try:
+            async with self._get_session().get(
+                f"{self.origin_url}/{MANIFEST_NAME}"
+            ) as response:
+                response.raise_for_status()
+                manifest = await response.json(content_type=None)
+
+            if not isinstance(manifest, dict) or not isinstance(
+                manifest.get("reciters"), dict
+            ):
+                log_warning_with_context(
+                    "Remote audio manifest invalid", self.origin_url
+                )
+                return None
+
+            for reciter, record in manifest["reciters"].items():
+                for filename, entry in (record.get("files") or {}).items():
+                    if isinstance(entry, dict) and entry.get("size"):
+                        self._expected_sizes[self.local_path(reciter, filename)] = int(
+                            entry["size"]
+                        )
+            return manifest
+
+        except Exception as e:
+            log_error_with_traceback("Error fetching remote audio manifest", e)
+            return None
+
+    def ensure_download(self, path: str) -> Optional[_Download]:
+        """
+        Start downloading a file unless it is cached or already downloading.
+
+        Returns:
+            Optional[_Download]: The download in progress, None if cached
+        """
+        if path in self._lru:
+            return None
+        download = self._downloads.get(path)
+        if download:
+            return download
+
+        self._make_room(self._expected_sizes.get(path, 0))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        download = _Download(path)
+        # Created before returning so a reader can open it immediately
+        open(download.part_path, "wb").close()
+        self._downloads[path] = download
+        download.task = asyncio.create_task(self._download(download))
+        return download
+
+    async def _download(self, download: _Download):
+        """Stream a file from the origin into its .part file"""
+        failed = True
+        try:
+            async with self._get_session().get(
+                self._url_for(download.path)
+            ) as response:
+                response.raise_for_status()
+                with open(download.part_path, "wb", buffering=0) as f:
+                    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                        f.write(chunk)
+                        download.advance(len(chunk))
+
+            os.replace(download.part_path, download.path)
+            self._lru[download.path] = download.bytes_written
+            self.stats["downloaded_bytes"] += download.bytes_written
+            failed = False
+
+            # The real size may exceed the manifest's estimate
+            self._make_room(0)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log_error_with_traceback(f"Error downloading {download.path}", e)
+        finally:
+            download.finish(failed=failed)
+            self._downloads.pop(download.path, None)
+            if failed:
+                try:
+                    os.remove(download.part_path)
+                except OSError:
+                    pass
+
+    async def fetch(self, path: str) -> bool:
+        """Download a file completely (no-op if cached)"""
+        download = self.ensure_download(path)
+        if download:
+            await asyncio.shield(download.task)
+        return path in self._lru
+
+    def open_stream(self, path: str) -> Optional[StreamingFileReader]:
+        """
+        Get a reader for a file that is not fully cached yet.
+
+        Returns:
+            Optional[StreamingFileReader]: None if the file is already complete
+        """
+        if path in self._lru:
+            self.stats["hits"] += 1
+            self.touch(path)
+            return None
+
+        self.stats["misses"] += 1
+        reader = StreamingFileReader(path, self.ensure_download(path))
+        self._readers.add(reader)
+        return reader
+
+    # =========================================================================
+    # Prefetch
+    # =========================================================================
+
+    def prefetch(self, paths: Iterable[str]):
+        """
+        Protect the given files (current track first) and fetch missing ones.
+
+        The first path is the track playing now; the rest are the upcoming
+        tracks, fetched one at a time in order.
+        """
+        paths = list(paths)[: self.prefetch_count + 1]
+        self._protected = set(paths)
+        for path in paths:
+            self.touch(path)
+
+        if self.prefetch_task and not self.prefetch_task.done():
+            self.prefetch_task.cancel()
+        self.prefetch_task = asyncio.create_task(self._prefetch(paths))
+
+    async def _prefetch(self, paths: List[str]):
+        for path in paths:
+            if path not in self._lru:
+                await self.fetch(path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "cached_files": len(self._lru),
+            "used_bytes": self.used_bytes,
+            "max_bytes": self.max_bytes,
+            "downloading": len(self._downloads),
+        }
+
+    async def close(self):
+        """Cancel downloads and close the HTTP session"""
+        if self.prefetch_task and not self.prefetch_task.done():
+            self.prefetch_task.cancel()
+        for download in list(self._downloads.values()):
+            if download.task:
+                download.task.cancel()
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "RemoteAudioCache",
+    "StreamingFileReader",
+    "DEFAULT_CACHE_DIR",
+    "DEFAULT_MAX_CACHE_BYTES",
+    "DEFAULT_PREFETCH_COUNT",
+]
@@ -0,0 +1,317 @@
+# =============================================================================
+# QuranBot - MP3 Seek Index (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# Frame-accurate seeking for MP3 playback. Each file's MPEG frames are walked
+# once and a byte-offset table sampled every few seconds is stored in the
+# audio library manifest, so resume and /seek can hand FFmpeg an exact byte
+# offset instead of having it scan (or estimate, on VBR files without a TOC)
+# with -ss on the raw MP3.
+#
+# Key Features:
+# - MPEG-1/2/2.5 Layer I/II/III frame header parsing
+# - ID3v2 tag and Xing/Info/VBRI header handling
+# - Resynchronisation over junk bytes between frames
+# - Index stored per file in the manifest (rebuilt only when a file changes)
+# - O(log n) position → (byte offset, residual) lookup
+#
+# Technical Implementation:
+# - mmap'd file walk in a worker thread
+# - FFmpeg -skip_initial_bytes for the offset, output -ss for the residual
+#
+# Required Dependencies:
+# - None (standard library only)
+# =============================================================================
+
+import asyncio
+import mmap
+import os
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .tree_log import log_error_with_traceback, log_perfect_tree_section
+
+# Seconds of audio between index samples
+SEEK_INDEX_INTERVAL = 10.0
+
+# Bitrates in kbps keyed by (is MPEG-1, layer bits); layer bits 3=I, 2=II, 1=III
+BITRATES = {
+    (True, 3): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 1): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 3): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 1): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# Sample rates keyed by version bits; 3=MPEG-1, 2=MPEG-2, 0=MPEG-2.5
+SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+VBR_HEADER_TAGS = (b"Xing", b"Info", b"VBRI")
+
+
+def parse_frame_header(header: int) -> Optional[Tuple[int, int, int]]:
+    """
+    Decode a 32-bit MPEG audio frame header.
+
+    Returns:
+        Optional[Tuple[int, int, int]]: (frame length in bytes, samples per
+        frame, sample rate), or None if the header is invalid/free-format
+    """
+    if (header >> 21) & 0x7FF != 0x7FF:
+        return None
+
+    version = (header >> 19) & 0x3
+    layer = (header >> 17) & 0x3
+    bitrate_index = (header >> 12) & 0xF
+    rate_index = (header >> 10) & 0x3
+    padding = (header >> 9) & 0x1
+
+    if version == 1 or layer == 0 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    bitrate = BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = SAMPLE_RATES[version][rate_index]
+
+    if layer == 3:  # Layer I
+        return (12 * bitrate // sample_rate + padding) * 4, 384, sample_rate
+
+    samples = 1152 if (mpeg1 or layer == 2) else 576
+    return samples // 8 * bitrate // sample_rate + padding, samples, sample_rate
+
+
+def _skip_id3v2(data) -> int:
+    """Get the offset of the first byte after any ID3v2 tag"""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = 0
+    for byte in data[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _read_header(data, offset: int, size: int) -> Optional[Tuple[int, int, int]]:
+    if offset + 4 > size:
+        return None
+    return parse_frame_header(int.from_bytes(data[offset : offset + 4], "big"))
+
+
+def _resync(data, offset: int, size: int) -> int:
+    """Find the next frame header confirmed by the header that follows it"""
+    while True:
+        offset = data.find(b"\xff", offset, size - 3)
+        if offset < 0:
+            return -1
+
+        frame = _read_header(data, offset, size)
+        if frame:
+            following = offset + frame[0]
+            if (
+                following >= size
+                or data[following : following + 3] == b"TAG"
+                or _read_header(data, following, size)
+            ):
+                return offset
+        offset += 1
+
+
+def build_seek_index(
+    file_path: str, interval: float = SEEK_INDEX_INTERVAL
+) -> Optional[Dict[str, Any]]:
+    """
+    Walk an MP3's frames and sample their byte offsets every `interval` seconds.
+
+    Blocking; run it in a worker thread.
+
+    Returns:
+        Optional[Dict[str, Any]]: {"interval", "times_ms", "offsets",
+        "duration"}, or None if no MPEG audio frames were found
+    """
+    times_ms = []
+    offsets = []
+    elapsed = 0.0
+    next_mark = 0.0
+    frames = 0
+
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < 4:
+            return None
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            offset = _resync(data, _skip_id3v2(data), size)
+
+            while 0 <= offset and offset + 4 <= size:
+                frame = _read_header(data, offset, size)
+                if frame is None:
+                    # Lost sync (junk or a trailing tag); find the next real frame
+                    offset = _resync(data, offset + 1, size)
+                    continue
+
+                length, samples, sample_rate = frame
+
+                # A leading VBR header frame carries no audio
+                if frames == 0 and any(
+                    tag in data[offset : offset + min(length, 64)]
+                    for tag in VBR_HEADER_TAGS
+                ):
+                    frames += 1
+                    offset += length
+                    continue
+
+                if elapsed >= next_mark:
+                    times_ms.append(round(elapsed * 1000))
+                    offsets.append(offset)
+                    next_mark += interval
+
+                elapsed += samples / sample_rate
+                offset += length
+                frames += 1
+
+    if not offsets:
+        return None
+
+    return {
+        "interval": interval,
+        "times_ms": times_ms,
+        "offsets": offsets,
+        "duration": round(elapsed, 3),
+    }
+
+
+def find_seek_point(index: Dict[str, Any], position: float) -> Tuple[int, float]:
+    """
+    Map a position to the indexed frame at or before it.
+
+    Returns:
+        Tuple[int, float]: (byte offset of the frame, seconds still to skip
+        after decoding starts there)
+    """
+    times_ms = index["times_ms"]
+    i = max(bisect_right(times_ms, int(position * 1000)) - 1, 0)
+    return index["offsets"][i], max(position - times_ms[i] / 1000, 0.0)
+
+
+class SeekIndex:
+    """
+    Per-file MP3 seek indexes stored in the audio library manifest.
+
+    Implementation Notes:
+    - get_seek_point() only reads the manifest; it never touches the file
+    - ensure_index() builds a missing index once, off the event loop
+    - Manifest saves run through save_async(); index_files() saves once per run
+    - A changed file gets a fresh manifest entry, dropping its stale index
+    """
+
+    def __init__(self, library, interval: float = SEEK_INDEX_INTERVAL):
+        self.library = library
+        self.interval = interval
+        self.index_task: Optional[asyncio.Task] = None
+
+    def get_seek_point(
+        self, file_path: str, position: float
+    ) -> Optional[Tuple[int, float]]:
+        """Get (byte offset, residual seconds) for a position, if indexed"""
+        try:
+            entry = self.library.get_entry(file_path)
+            index = entry.get("seek_index") if entry else None
+            if not index:
+                return None
+            return find_seek_point(index, position)
+
+        except Exception as e:
+            log_error_with_traceback("Error looking up seek index", e)
+            return None
+
+    async def ensure_index(self, file_path: str, save: bool = True) -> bool:
+        """Build and store a file's seek index unless it already has one"""
+        try:
+            entry = self.library.get_entry(file_path)
+            if entry is None:
+                return False
+            if entry.get("seek_index"):
+                return True
+
+            index = await asyncio.to_thread(build_seek_index, file_path, self.interval)
+            if not index:
+                return False
+
+            self.library.update_entry(file_path, seek_index=index)
+            if save:
+                await self.library.save_async()
+            return True
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log_error_with_traceback(f"Error building seek index for {file_path}", e)
+            return False
+
+    async def index_files(self, files: Iterable[str]) -> int:
+        """
+        Build missing seek indexes for a list of files sequentially.
+
+        Returns:
+            int: Number of files that have an index after the run
+        """
+        files = list(files)
+        indexed = 0
+        unsaved = 0
+        try:
+            for file_path in files:
+                entry = self.library.get_entry(file_path)
+                had_index = bool(entry and entry.get("seek_index"))
+
+                if await self.ensure_index(file_path, save=False):
+                    indexed += 1
+                    if not had_index:
+                        unsaved += 1
+        finally:
+            if unsaved:
+                await self.library.save_async()
+
+        log_perfect_tree_section(
+            "Seek Index - Indexing Complete",
+            [
+                ("files", len(files)),
+                ("indexed", indexed),
+                ("interval", f"{self.interval:.0f}s"),
+            ],
+            "🧭",
+        )
+        return indexed
+
+    def start_background_indexing(self, files: Iterable[str]):
+        """Start (or restart) the background indexing task"""
+        try:
+            self.stop_background_indexing()
+            self.index_task = asyncio.create_task(self.index_files(list(files)))
+        except Exception as e:
+            log_error_with_traceback("Error starting seek indexing", e)
+
+    def stop_background_indexing(self):
+        """Cancel the background indexing task if running"""
+        if self.index_task and not self.index_task.done():
+            self.index_task.cancel()
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "SeekIndex",
+    "build_seek_index",
+    "find_seek_point",
+    "parse_frame_header",
+    "SEEK_INDEX_INTERVAL",
+]
@@ -0,0 +1,183 @@
+# =============================================================================
+# QuranBot - Shuffle Bag (Open Source Edition)
+# =============================================================================
+# This is an open source project provided AS-IS without official support.
+# Feel free to use, modify, and learn from this code under the license terms.
+#
+# Purpose:
+# No-repeat shuffle order for shuffle mode. Every file plays once per cycle
+# in a random permutation, and the order played so far is kept so "previous"
+# walks back through what was actually heard.
+#
+# Key Features:
+# - Full coverage: each file plays exactly once per cycle
+# - No back-to-back repeat across cycle boundaries
+# - O(1) next/previous over a cursor into the play order
+# - History reaches back at least one full cycle
+# - Serializable so the order survives restarts
+#
+# Technical Implementation:
+# - Play order is a list of permutations appended cycle by cycle
+# - Older cycles are trimmed when a new one is appended (amortized O(1))
+# - A signature of the file list decides whether a saved bag still applies
+#
+# Required Dependencies:
+# - None (standard library only)
+# =============================================================================
+
+import random
+from typing import Any, Dict, List, Optional
+
+
+class ShuffleBag:
+    """
+    Cursor over a growing list of shuffled permutations of file indices.
+
+    order[position] is the file playing now; order[position + 1:] is what
+    shuffle mode will play next and order[:position] is the history.
+
+    Implementation Notes:
+    - peek_next() appends the next cycle when the current one runs out, so
+      the planned next track is stable until it is played
+    - sync() records manual jumps (jump to surah, non-shuffle skips) so
+      history stays truthful; it only scans the order on those rare jumps
+    """
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self._rng = rng or random.Random()
+        self.size = 0
+        self.signature: Optional[str] = None
+        self.order: List[int] = []
+        self.position = 0
+
+    def reset(self, size: int, signature: str, current: Optional[int] = None):
+        """Start a fresh bag for a file list, with the current file played first"""
+        self.size = size
+        self.signature = signature
+        self.order = self._new_cycle()
+        self.position = 0
+
+        if current is not None and 0 <= current < size:
+            first = self.order.index(current)
+            self.order[0], self.order[first] = self.order[first], self.order[0]
+
+    def _new_cycle(self, avoid: Optional[int] = None) -> List[int]:
+        """Build a permutation that does not start with the file just played"""
+        cycle = list(range(self.size))
+        self._rng.shuffle(cycle)
+        if self.size > 1 and cycle[0] == avoid:
+            swap = self._rng.randrange(1, self.size)
+            cycle[0], cycle[swap] = cycle[swap], cycle[0]
+        return cycle
+
+    def current(self) -> Optional[int]:
+        """Get the file index at the cursor"""
+        return self.order[self.position] if self.order else None
+
+    def peek_next(self) -> int:
+        """Get the next file index without moving the cursor"""
+        if self.position + 1 >= len(self.order):
+            # Keep one cycle of history behind the cursor, drop the rest
+            drop = max(0, len(self.order) - self.size)
+            if drop:
+                del self.order[:drop]
+                self.position -= drop
+            self.order.extend(self._new_cycle(avoid=self.current()))
+        return self.order[self.position + 1]
+
+    def next(self) -> int:
+        """Advance the cursor to the next file index"""
+        index = self.peek_next()
+        self.position += 1
+        return index
+
+    def drop_next(self):
+        """Leave the next planned file out of this cycle"""
+        if self.position + 1 < len(self.order):
+            del self.order[self.position + 1]
+
+    def previous(self) -> Optional[int]:
+        """Step back to the previously played file index, if any"""
+        if self.position == 0:
+            return None
+        self.position -= 1
+        return self.order[self.position]
+
+    def sync(self, index: int) -> bool:
+        """
+        Move the cursor onto a file that is playing now.
+
+        Returns:
+            bool: True if the bag changed
+        """
+        if not self.order or self.order[self.position] == index:
+            return False
+
+        if (
+            self.position + 1 < len(self.order)
+            and self.order[self.position + 1] == index
+        ):
+            self.position += 1
+            return True
+
+        # Manual jump: pull the file forward if it is still due this cycle,
+        # otherwise record it as an extra play
+        try:
+            ahead = self.order.index(index, self.position + 1)
+            self.order[self.position + 1], self.order[ahead] = (
+                self.order[ahead],
+                self.order[self.position + 1],
+            )
+        except ValueError:
+            self.order.insert(self.position + 1, index)
+        self.position += 1
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the bag for the state manager"""
+        return {
+            "signature": self.signature,
+            "size": self.size,
+            "order": list(self.order),
+            "position": self.position,
+        }
+
+    def restore(self, data: Any, size: int, signature: str) -> bool:
+        """
+        Restore a saved bag if it was built for the same file list.
+
+        Returns:
+            bool: True if the saved bag was valid and applied
+        """
+        try:
+            if not isinstance(data, dict) or data.get("signature") != signature:
+                return False
+            if data.get("size") != size:
+                return False
+
+            order = data.get("order")
+            position = data.get("position")
+            if not isinstance(order, list) or not isinstance(position, int):
+                return False
+            if not 0 <= position < len(order):
+                return False
+            if not all(isinstance(i, int) and 0 <= i < size for i in order):
+                return False
+
+            self.size = size
+            self.signature = signature
+            self.order = order
+            self.position = position
+            return True
+
+        except Exception:
+            return False
+
+
+# =============================================================================
+# Export Functions
+# =============================================================================
+
+__all__ = [
+    "ShuffleBag",
+]
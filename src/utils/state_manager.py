@@ -16,6 +16,12 @@
 # - Session tracking and statistics
 # - Environment-based configuration
 # - Silent operation mode for high-frequency saves
+# - Write-behind playback state: changes are coalesced in memory and
+#   flushed at most every few seconds, off the event loop
+# - Playback journal: the newest journaled position overrides an older
+#   playback_state.json on load, so a crash resumes where playback stopped
+# - In-memory versioned playback state: after startup, readers get the
+#   latest state without reading or re-validating the file
 #
 # Technical Implementation:
 # - JSON-based state storage
@@ -23,11 +29,16 @@
 # - Backup rotation with configurable retention
 # - Data integrity verification
 # - Emergency backup system
+# - Atomic temp-file + rename playback state writes in a worker thread
 #
 # File Structure:
 # /data/
 #   playback_state.json     - Current state
 #   bot_stats.json         - Usage statistics
+#   shuffle_bag.json       - Shuffle mode play order
+#   play_queue.json        - Play queue snapshot
+#   play_queue.log         - Play queue changes since the snapshot
+#   playback_journal.bin   - Playback events since the last compaction
 # /backup/
 #   temp/                  - Temporary backup storage
 #   YYYY-MM-DD/           - Daily backup archives
@@ -37,17 +48,20 @@
 # - python-dotenv: Environment configuration
 # =============================================================================
 
+import asyncio
 import json
 import os
 import shutil
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pytz
 from dotenv import load_dotenv
 
+from .playback_journal import PlaybackJournal
 from .tree_log import log_error_with_traceback, log_perfect_tree_section
 
 # Load environment variables from standardized location
@@ -55,6 +69,10 @@ env_path = os.path.join(os.path.dirname(__file__), "..", "..", "config", ".env")
 load_dotenv(env_path)
 
 
+# Minimum seconds between playback state writes while the bot is running
+PLAYBACK_STATE_FLUSH_SECONDS = 5.0
+
+
 class StateManager:
     """
     Enterprise-grade state persistence manager for Discord bots.
@@ -117,6 +135,7 @@ class StateManager:
         default_reciter: str = "Saad Al Ghamdi",
         default_shuffle: bool = False,
         default_loop: bool = False,
+        flush_interval: float = PLAYBACK_STATE_FLUSH_SECONDS,
     ):
         """
         Initialize the StateManager with default settings and bulletproof protection.
@@ -129,6 +148,7 @@ class StateManager:
             default_reciter: Default reciter for new sessions
             default_shuffle: Default shuffle mode setting
             default_loop: Default loop mode setting
+            flush_interval: Minimum seconds between playback state writes
         """
         try:
             self.data_dir = Path(data_dir)
@@ -141,6 +161,39 @@ class StateManager:
             # State file paths
             self.playback_state_file = self.data_dir / "playback_state.json"
             self.bot_stats_file = self.data_dir / "bot_stats.json"
+            self.shuffle_bag_file = self.data_dir / "shuffle_bag.json"
+            self.play_queue_file = self.data_dir / "play_queue.json"
+            self.play_queue_log_file = self.data_dir / "play_queue.log"
+            self.playback_journal = PlaybackJournal(
+                self.data_dir / "playback_journal.bin"
+            )
+
+            # Write-behind playback state (latest state held in memory)
+            self.flush_interval = flush_interval
+            self._pending_playback_state: Optional[Dict[str, Any]] = None
+            self._written_playback_state: Optional[Dict[str, Any]] = None
+            self._last_flush_at = 0.0
+            self._flush_task: Optional[asyncio.Task] = None
+            self._write_lock = threading.Lock()
+
+            # Authoritative in-memory playback state (None until first load)
+            self._playback_snapshot: Optional[Dict[str, Any]] = None
+            self.playback_state_version = 0
+            # Only an instance that saves can trust its snapshot; others
+            # (another import path of this module) revalidate on file mtimes
+            self._writes_playback_state = False
+            self._playback_source_mtimes: Optional[Tuple] = None
+            self.read_stats = {"disk_reads": 0, "cached_reads": 0}
+            self.write_stats = {
+                "saves": 0,
+                "writes": 0,
+                "unchanged_skipped": 0,
+                "coalesced": 0,
+                "failed": 0,
+                "last_flush_ms": 0.0,
+                "avg_flush_ms": 0.0,
+                "max_flush_ms": 0.0,
+            }
 
             # Backup throttling - only create backups when needed
             self.last_backup_time = 0
@@ -187,7 +240,13 @@ class StateManager:
         shuffle_enabled: bool = False,
         silent: bool = False,
     ) -> bool:
-        """Save current playback state"""
+        """
+        Save current playback state.
+
+        The state is kept in memory and written behind: at most once per
+        flush_interval while an event loop is running, immediately otherwise.
+        Saves that change nothing are not written.
+        """
         try:
             # Validate surah number
             if not (1 <= current_surah <= 114):
@@ -202,16 +261,25 @@ class StateManager:
             # Save new state
             state = {
                 "current_surah": current_surah,
-                "current_position": current_position,
+                "current_position": round(current_position, 1),
                 "current_reciter": current_reciter,
                 "is_playing": is_playing,
                 "loop_enabled": loop_enabled,
                 "shuffle_enabled": shuffle_enabled,
-                "timestamp": datetime.now(pytz.UTC).timestamp(),
             }
+            self.write_stats["saves"] += 1
 
-            with open(self.playback_state_file, "w", encoding="utf-8") as f:
-                json.dump(state, f, indent=2)
+            last = self._pending_playback_state or self._written_playback_state
+            if last is not None and all(last.get(k) == v for k, v in state.items()):
+                self.write_stats["unchanged_skipped"] += 1
+            else:
+                if self._pending_playback_state is not None:
+                    self.write_stats["coalesced"] += 1
+                # Stamped when captured, not when the delayed write happens
+                state["timestamp"] = datetime.now(pytz.UTC).timestamp()
+                self._pending_playback_state = state
+                self._update_playback_snapshot(state)
+                self._schedule_playback_flush()
 
             # Only log if not silent
             if not silent:
@@ -230,17 +298,218 @@ class StateManager:
             log_error_with_traceback("Error saving playback state", e)
             return False
 
-    def load_playback_state(self) -> Dict[str, Any]:
+    def _schedule_playback_flush(self):
+        """Start the write-behind flush, or write now without an event loop"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_playback_state()
+            return
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_playback_state_later())
+
+    async def _flush_playback_state_later(self):
+        """Write the pending state once the flush interval allows it"""
+        try:
+            while self._pending_playback_state is not None:
+                delay = self._last_flush_at + self.flush_interval - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                state, self._pending_playback_state = (
+                    self._pending_playback_state,
+                    None,
+                )
+                if state is not None:
+                    await asyncio.to_thread(self._write_playback_state, state)
+        except Exception as e:
+            log_error_with_traceback("Error flushing playback state", e)
+
+    def flush_playback_state(self) -> bool:
+        """
+        Write any pending playback state now (shutdown, no event loop).
+
+        Returns:
+            bool: True if nothing was pending or the write succeeded
+        """
+        state, self._pending_playback_state = self._pending_playback_state, None
+        if state is None:
+            return True
+        return self._write_playback_state(state)
+
+    def _write_playback_state(self, state: Dict[str, Any]) -> bool:
+        """Atomically replace the state file (runs in a worker thread)"""
+        started = time.perf_counter()
+        try:
+            with self._write_lock:
+                temp_file = self.playback_state_file.with_suffix(".tmp")
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    json.dump(state, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                temp_file.replace(self.playback_state_file)
+                self._written_playback_state = state
+        except Exception as e:
+            self.write_stats["failed"] += 1
+            log_error_with_traceback("Error writing playback state", e)
+            return False
+        finally:
+            self._last_flush_at = time.monotonic()
+
+        flush_ms = (time.perf_counter() - started) * 1000
+        stats = self.write_stats
+        stats["writes"] += 1
+        stats["last_flush_ms"] = round(flush_ms, 2)
+        stats["max_flush_ms"] = round(max(stats["max_flush_ms"], flush_ms), 2)
+        stats["avg_flush_ms"] = round(
+            stats["avg_flush_ms"] + (flush_ms - stats["avg_flush_ms"]) / stats["writes"],
+            2,
+        )
+        return True
+
+    def get_write_stats(self) -> Dict[str, Any]:
+        """Get playback state write counters and flush latency"""
+        return {**self.write_stats, "dirty": self._pending_playback_state is not None}
+
+    def record_playback_event(
+        self,
+        kind: int,
+        surah: int,
+        position: float,
+        reciter: str,
+        is_playing: bool,
+    ) -> bool:
+        """
+        Append a playback event (start, seek, pause, tick...) to the journal.
+
+        Args:
+            kind: playback_journal EVENT_* constant
+            surah: Current surah number
+            position: Position within the track in seconds
+            reciter: Current reciter
+            is_playing: Whether audio is advancing
+
+        Returns:
+            bool: True if the record was appended
+        """
+        if not self.playback_journal.append(kind, surah, position, reciter, is_playing):
+            return False
+
+        self._update_playback_snapshot(
+            {
+                "current_surah": surah,
+                "current_position": round(position, 1),
+                "current_reciter": reciter,
+                "is_playing": is_playing,
+                "timestamp": self.playback_journal.last["wall_time"],
+            }
+        )
+        return True
+
+    def _update_playback_snapshot(self, changes: Dict[str, Any]):
+        """Apply a save or journal event to the in-memory playback state"""
+        if self._playback_snapshot is None:
+            self._playback_snapshot = self.default_playback_state.copy()
+        self._playback_snapshot.update(changes)
+        self._writes_playback_state = True
+        self.playback_state_version += 1
+
+    def _get_playback_source_mtimes(self) -> Tuple:
+        """Modification times of the state file and journal (None if missing)"""
+        mtimes = []
+        for path in (self.playback_state_file, self.playback_journal.path):
+            try:
+                mtimes.append(path.stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def load_playback_state(self, reload: bool = False) -> Dict[str, Any]:
+        """
+        Get the playback state.
+
+        The state is read from disk once (startup) and then kept in memory,
+        updated by every save and journal event, so later calls are O(1)
+        and silent. An instance that has never saved re-reads the files
+        when their modification times change. Pass reload=True to read the
+        files again.
+
+        Args:
+            reload: Discard the in-memory state and read it from disk
+
+        Returns:
+            Dict[str, Any]: Playback state dictionary with all required fields
+        """
+        if (
+            self._playback_snapshot is not None
+            and not reload
+            and (
+                self._writes_playback_state
+                or self._playback_source_mtimes == self._get_playback_source_mtimes()
+            )
+        ):
+            self.read_stats["cached_reads"] += 1
+            return self._playback_snapshot.copy()
+        return self.reload_playback_state()
+
+    def reload_playback_state(self) -> Dict[str, Any]:
         """
         Load playback state from persistent storage with corruption recovery.
 
         Loads the saved playback state from JSON file, with automatic fallback
-        to backup files if the main file is corrupted. Validates loaded data
-        and merges with defaults to ensure all required fields exist.
+        to backup files if the main file is corrupted, then applies the
+        playback journal if it recorded a newer position. Validates loaded
+        data and merges with defaults to ensure all required fields exist.
 
         Returns:
             Dict[str, Any]: Playback state dictionary with all required fields
         """
+        # A state still waiting for its write-behind flush is the newest
+        self.flush_playback_state()
+
+        self.read_stats["disk_reads"] += 1
+        self._playback_source_mtimes = self._get_playback_source_mtimes()
+        state = self._read_playback_state_file()
+        try:
+            state = self._apply_playback_journal(state)
+        except Exception as e:
+            log_error_with_traceback("Error applying playback journal", e)
+
+        self._playback_snapshot = dict(state)
+        self.playback_state_version += 1
+        return state
+
+    def get_read_stats(self) -> Dict[str, int]:
+        """Get playback state disk/cached read counts and the state version"""
+        return {**self.read_stats, "version": self.playback_state_version}
+
+    def _apply_playback_journal(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Override the saved surah and position with a newer journal record"""
+        tail = self.playback_journal.replay()
+        if not tail or tail["wall_time"] <= (state.get("timestamp") or 0):
+            return state
+
+        state = dict(state)
+        state["current_surah"] = tail["surah"]
+        state["current_position"] = round(tail["position"], 1)
+        state["is_playing"] = tail["is_playing"]
+        state["timestamp"] = tail["wall_time"]
+
+        log_perfect_tree_section(
+            "Playback State - Journal Applied",
+            [
+                ("surah", tail["surah"]),
+                ("position", f"{tail['position']:.1f}s"),
+                ("journal_records", self.playback_journal.records),
+                ("age", f"{time.time() - tail['wall_time']:.0f}s"),
+            ],
+            "📓",
+        )
+        return state
+
+    def _read_playback_state_file(self) -> Dict[str, Any]:
+        """Read playback_state.json, falling back to backup and emergency files"""
         try:
             if not self.playback_state_file.exists():
                 log_perfect_tree_section(
@@ -849,6 +1118,10 @@ class StateManager:
             bool: True if shutdown was recorded successfully, False otherwise
         """
         try:
+            # Write-behind playback state must not be lost on exit
+            self.flush_playback_state()
+            self.playback_journal.close()
+
             shutdown_time = datetime.now(timezone.utc).isoformat()
             return self.save_bot_stats(last_shutdown=shutdown_time)
         except Exception as e:
@@ -939,6 +1212,128 @@ class StateManager:
                 "should_resume": False,
             }
 
+    def save_shuffle_bag(self, bag: Dict[str, Any]) -> bool:
+        """
+        Save the shuffle mode play order.
+
+        Written on track changes only, so it is kept out of the frequently
+        saved playback state file.
+
+        Args:
+            bag: Serialized ShuffleBag (signature, size, order, position)
+
+        Returns:
+            bool: True if saved successfully, False otherwise
+        """
+        try:
+            temp_file = self.shuffle_bag_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(bag, f)
+            temp_file.replace(self.shuffle_bag_file)
+            return True
+        except Exception as e:
+            log_error_with_traceback("Error saving shuffle bag", e)
+            return False
+
+    def load_shuffle_bag(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the saved shuffle mode play order.
+
+        Returns:
+            Optional[Dict[str, Any]]: Serialized ShuffleBag, or None if absent
+        """
+        try:
+            if not self.shuffle_bag_file.exists():
+                return None
+
+            with open(self.shuffle_bag_file, "r", encoding="utf-8") as f:
+                bag = json.load(f)
+
+            return bag if isinstance(bag, dict) else None
+
+        except Exception as e:
+            log_error_with_traceback("Error loading shuffle bag", e)
+            return None
+
+    def append_play_queue_deltas(self, deltas: List[List[Any]]) -> bool:
+        """
+        Append play queue changes to its log.
+
+        Each change is one short JSON line, so queueing a surah costs a few
+        bytes of I/O instead of rewriting the whole queue.
+
+        Args:
+            deltas: Op lists from PlayQueue.drain_deltas()
+
+        Returns:
+            bool: True if saved successfully, False otherwise
+        """
+        try:
+            if not deltas:
+                return True
+            with open(self.play_queue_log_file, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(op) + "\n" for op in deltas))
+            return True
+        except Exception as e:
+            log_error_with_traceback("Error saving play queue changes", e)
+            return False
+
+    def save_play_queue_snapshot(self, snapshot: Dict[str, Any]) -> bool:
+        """
+        Save the full play queue and truncate its change log.
+
+        Args:
+            snapshot: Serialized PlayQueue (upcoming, history, repeat)
+
+        Returns:
+            bool: True if saved successfully, False otherwise
+        """
+        try:
+            temp_file = self.play_queue_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            temp_file.replace(self.play_queue_file)
+
+            # The snapshot includes every logged change
+            with open(self.play_queue_log_file, "w", encoding="utf-8"):
+                pass
+            return True
+        except Exception as e:
+            log_error_with_traceback("Error saving play queue", e)
+            return False
+
+    def load_play_queue(self) -> Tuple[Optional[Dict[str, Any]], List[List[Any]]]:
+        """
+        Load the play queue snapshot and the changes logged after it.
+
+        A torn last line (crash mid-append) is skipped.
+
+        Returns:
+            Tuple: (snapshot or None, list of change ops)
+        """
+        snapshot = None
+        deltas = []
+        try:
+            if self.play_queue_file.exists():
+                with open(self.play_queue_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                snapshot = data if isinstance(data, dict) else None
+
+            if self.play_queue_log_file.exists():
+                with open(self.play_queue_log_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            op = json.loads(line)
+                        except ValueError:
+                            continue
+                        if isinstance(op, list):
+                            deltas.append(op)
+
+        except Exception as e:
+            log_error_with_traceback("Error loading play queue", e)
+
+        return snapshot, deltas
+
     def clear_state(self) -> bool:
         """
         Clear all saved state files for a fresh start.
@@ -951,6 +1346,10 @@ class StateManager:
         """
         try:
             files_removed = 0
+            self._pending_playback_state = None
+            self._written_playback_state = None
+            self._playback_snapshot = None
+            self.playback_journal.clear()
 
             if self.playback_state_file.exists():
                 self.playback_state_file.unlink()
@@ -960,6 +1359,15 @@ class StateManager:
                 self.bot_stats_file.unlink()
                 files_removed += 1
 
+            if self.shuffle_bag_file.exists():
+                self.shuffle_bag_file.unlink()
+                files_removed += 1
+
+            for queue_file in (self.play_queue_file, self.play_queue_log_file):
+                if queue_file.exists():
+                    queue_file.unlink()
+                    files_removed += 1
+
             log_perfect_tree_section(
                 "State Cleared",
                 [
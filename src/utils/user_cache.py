@@ -4,59 +4,23 @@
 # Utility for caching Discord user information for dashboard display
 # =============================================================================
 
-import json
-import os
-from datetime import datetime, timezone
-from pathlib import Path
 from typing import Dict, Optional
 
-# Data directory path
-DATA_DIR = Path(__file__).parent.parent.parent / "data"
-USER_CACHE_FILE = DATA_DIR / "user_cache.json"
+from .data_store import data_store
 
 def update_user_cache(user_id: int, display_name: str, avatar_url: Optional[str] = None):
     """
     Update the user cache with Discord user information.
     
+    The row is upserted on the data store thread, so this never blocks.
+    
     Args:
         user_id: Discord user ID
         display_name: User's display name
         avatar_url: User's avatar URL (optional)
     """
     try:
-        # Ensure data directory exists
-        DATA_DIR.mkdir(exist_ok=True)
-        
-        # Load existing cache
-        cache_data = {
-            'users': {},
-            'last_updated': datetime.now(timezone.utc).isoformat(),
-            'total_cached_users': 0
-        }
-        
-        if USER_CACHE_FILE.exists():
-            try:
-                with open(USER_CACHE_FILE, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-            except Exception:
-                pass  # Use default cache_data if file is corrupted
-        
-        # Update user info
-        user_id_str = str(user_id)
-        cache_data['users'][user_id_str] = {
-            'display_name': display_name,
-            'avatar_url': avatar_url,
-            'last_seen': datetime.now(timezone.utc).isoformat()
-        }
-        
-        # Update metadata
-        cache_data['last_updated'] = datetime.now(timezone.utc).isoformat()
-        cache_data['total_cached_users'] = len(cache_data['users'])
-        
-        # Save cache
-        with open(USER_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2, ensure_ascii=False)
-            
+        data_store.upsert_user(user_id, display_name, avatar_url)
     except Exception as e:
         # Fail silently to not interfere with bot operations
         pass
@@ -65,6 +29,8 @@ def get_cached_user_info(user_id: int) -> Optional[Dict]:
     """
     Get cached user information.
     
+    Blocks on the data store thread; do not call from the event loop.
+    
     Args:
         user_id: Discord user ID
         
@@ -72,15 +38,7 @@ def get_cached_user_info(user_id: int) -> Optional[Dict]:
         Dict with user info or None if not cached
     """
     try:
-        if not USER_CACHE_FILE.exists():
-            return None
-            
-        with open(USER_CACHE_FILE, 'r', encoding='utf-8') as f:
-            cache_data = json.load(f)
-            
-        user_id_str = str(user_id)
-        return cache_data.get('users', {}).get(user_id_str)
-        
+        return data_store.get_user(user_id)
     except Exception:
         return None
 
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Audio Library Manifest Tests
+# =============================================================================
+# Tests for the persistent audio library manifest and its incremental refresh
+# =============================================================================
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.audio_library import AudioLibrary
+
+
+def fake_mp3(length):
+    """Build a stand-in for mutagen's MP3 object"""
+    audio = MagicMock()
+    audio.info.length = length
+    return audio
+
+
+class TestAudioLibrary:
+    """Test suite for AudioLibrary class"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.audio_dir = Path(self.temp_dir) / "audio"
+        self.manifest_file = Path(self.temp_dir) / "data" / "audio_library.json"
+
+        reciter_dir = self.audio_dir / "Test Reciter"
+        reciter_dir.mkdir(parents=True)
+        for i in (1, 2, 5):
+            (reciter_dir / f"{i:03d}.mp3").write_bytes(b"x" * i)
+        (reciter_dir / "notes.txt").write_text("not audio")
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    def make_library(self):
+        return AudioLibrary(str(self.audio_dir), str(self.manifest_file))
+
+    def test_refresh_builds_manifest(self):
+        """Test initial scan builds lookups and persists the manifest"""
+        with patch("utils.audio_library.MP3", return_value=fake_mp3(120.0)):
+            library = self.make_library()
+            assert library.refresh() is True
+
+        assert library.get_reciters() == ["Test Reciter"]
+        files = library.get_files("Test Reciter")
+        assert [os.path.basename(f) for f in files] == ["001.mp3", "002.mp3", "005.mp3"]
+        assert library.get_duration(files[0]) == 120.0
+        assert library.get_surah_file("Test Reciter", 5) == files[2]
+        assert library.get_surah_numbers("Test Reciter") == [1, 2, 5]
+        assert library.get_surah_file("Test Reciter", 3) is None
+        assert library.get_entry(files[1])["size"] == 2
+        assert self.manifest_file.exists()
+
+    def test_manifest_reused_without_probing(self):
+        """Test a restart reads durations from the manifest, not the files"""
+        with patch("utils.audio_library.MP3", return_value=fake_mp3(60.0)):
+            self.make_library().refresh()
+
+        with patch("utils.audio_library.MP3") as mp3:
+            library = self.make_library()
+            assert library.refresh() is False
+            mp3.assert_not_called()
+
+        path = library.get_surah_file("Test Reciter", 1)
+        assert library.get_duration(path) == 60.0
+
+    def test_incremental_refresh_on_folder_change(self):
+        """Test only new or changed files are probed after a folder change"""
+        with patch("utils.audio_library.MP3", return_value=fake_mp3(60.0)):
+            library = self.make_library()
+            library.refresh()
+
+        reciter_dir = self.audio_dir / "Test Reciter"
+        (reciter_dir / "003.mp3").write_bytes(b"xyz")
+        future = time.time() + 10
+        os.utime(reciter_dir, (future, future))
+
+        with patch("utils.audio_library.MP3", return_value=fake_mp3(90.0)) as mp3:
+            assert library.refresh() is True
+            assert mp3.call_count == 1
+
+        assert library.get_duration(library.get_surah_file("Test Reciter", 3)) == 90.0
+        assert library.get_duration(library.get_surah_file("Test Reciter", 1)) == 60.0
+
+    def test_new_reciter_picked_up(self):
+        """Test a reciter folder added at runtime is discovered"""
+        with patch("utils.audio_library.MP3", return_value=fake_mp3(60.0)):
+            library = self.make_library()
+            library.refresh()
+
+            new_dir = self.audio_dir / "New Reciter"
+            new_dir.mkdir()
+            (new_dir / "001.mp3").write_bytes(b"a")
+
+            assert library.refresh() is True
+
+        assert library.get_reciters() == ["New Reciter", "Test Reciter"]
+
+    def test_removed_reciter_forgotten(self):
+        """Test a deleted reciter folder is dropped from the manifest"""
+        with patch("utils.audio_library.MP3", return_value=fake_mp3(60.0)):
+            library = self.make_library()
+            library.refresh()
+
+        shutil.rmtree(self.audio_dir / "Test Reciter")
+        assert library.refresh() is True
+        assert library.get_reciters() == []
+        assert library.get_files("Test Reciter") == []
+
+    def test_corrupted_manifest_rebuilt(self):
+        """Test a corrupted manifest falls back to a fresh scan"""
+        self.manifest_file.parent.mkdir(parents=True)
+        self.manifest_file.write_text("{not json")
+
+        with patch("utils.audio_library.MP3", return_value=fake_mp3(30.0)):
+            library = self.make_library()
+            assert library.refresh() is True
+
+        assert len(library.get_files("Test Reciter")) == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
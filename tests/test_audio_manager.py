@@ -11,6 +11,7 @@ import os
 import shutil
 import sys
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -20,6 +21,7 @@ import pytest
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+from utils.audio_library import AudioLibrary
 from utils.audio_manager import AudioManager
 
 
@@ -795,3 +797,516 @@ class TestAudioManager:
         await self.manager.start_playback()  # Should handle error gracefully
         assert not self.manager.is_playing
         assert self.manager.playback_task.done()
+
+
+class FakeVoiceClient:
+    """Minimal voice client that reports track completion from another thread"""
+
+    def __init__(self):
+        self.sources = []
+        self.after = None
+        self._playing = False
+        self._paused = False
+
+    def is_connected(self):
+        return True
+
+    def is_playing(self):
+        return self._playing and not self._paused
+
+    def is_paused(self):
+        return self._playing and self._paused
+
+    def pause(self):
+        self._paused = True
+
+    def resume(self):
+        self._paused = False
+
+    def play(self, source, after=None):
+        self.sources.append(source)
+        self.after = after
+        self._playing = True
+
+    def stop(self):
+        """Finish the current track the way discord.py's audio thread does"""
+        if self._playing:
+            self._playing = False
+            threading.Thread(target=self.after, args=(None,)).start()
+
+
+class TestTrackTransitions:
+    """Test suite for event-driven track completion"""
+
+    def setup_method(self):
+        """Set up a manager backed by a temporary library"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.audio_dir = Path(self.temp_dir) / "audio"
+        reciter_dir = self.audio_dir / "Test Reciter"
+        reciter_dir.mkdir(parents=True)
+        for i in range(1, 4):
+            (reciter_dir / f"{i:03d}.mp3").touch()
+
+        manifest_file = str(Path(self.temp_dir) / "audio_library.json")
+        self.state_patch = patch("utils.audio_manager.state_manager")
+        self.mock_state = mock_state = self.state_patch.start()
+        mock_state.load_playback_state.return_value = {
+            "current_surah": 1,
+            "current_position": 0.0,
+        }
+        mock_state.get_resume_info.return_value = {"should_resume": False}
+        mock_state.load_play_queue.return_value = (None, [])
+
+        with patch(
+            "utils.audio_manager.AudioLibrary",
+            lambda folder: AudioLibrary(folder, manifest_file),
+        ):
+            self.manager = AudioManager(
+                MagicMock(),
+                "ffmpeg",
+                audio_base_folder=str(self.audio_dir),
+                default_reciter="Test Reciter",
+            )
+        self.manager.load_audio_files()
+        self.voice_client = FakeVoiceClient()
+        self.manager.voice_client = self.voice_client
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        self.state_patch.stop()
+        shutil.rmtree(self.temp_dir)
+
+    async def wait_for_sources(self, count):
+        for _ in range(200):
+            if len(self.voice_client.sources) >= count:
+                return
+            await asyncio.sleep(0.01)
+        raise AssertionError(f"expected {count} sources")
+
+    @pytest.mark.asyncio
+    async def test_next_track_starts_on_after_callback(self):
+        """Test the next track starts as soon as the voice client reports completion"""
+        with patch("utils.audio_manager.discord.FFmpegPCMAudio"):
+            task = asyncio.create_task(self.manager._playback_loop(False))
+            try:
+                await self.wait_for_sources(1)
+                assert self.manager.current_surah == 1
+
+                self.voice_client.stop()
+                await self.wait_for_sources(2)
+
+                assert self.manager.current_surah == 2
+                stats = self.manager.get_transition_stats()
+                assert stats["count"] == 1
+                assert stats["last_ms"] < 500
+                assert self.manager.get_playback_status()["transition_gap_ms"] == (
+                    stats["last_ms"]
+                )
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_track_not_counted_as_transition(self):
+        """Test stopping playback does not record a transition gap"""
+        with patch("utils.audio_manager.discord.FFmpegPCMAudio"):
+            task = asyncio.create_task(self.manager._playback_loop(False))
+            await self.wait_for_sources(1)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+            self.voice_client.stop()
+            await asyncio.sleep(0.05)
+
+        assert self.manager.get_transition_stats()["count"] == 0
+
+    async def wait_for_prefetch(self):
+        for _ in range(200):
+            if self.manager._prefetched_source:
+                return self.manager._prefetched_source
+            await asyncio.sleep(0.01)
+        raise AssertionError("next track was not prefetched")
+
+    @pytest.mark.asyncio
+    async def test_next_track_uses_prefetched_source(self):
+        """Test the prepared source is handed to the voice client on transition"""
+        with patch(
+            "utils.audio_manager.discord.FFmpegPCMAudio",
+            side_effect=lambda *args, **kwargs: MagicMock(),
+        ):
+            task = asyncio.create_task(self.manager._playback_loop(False))
+            try:
+                await self.wait_for_sources(1)
+                prefetched = await self.wait_for_prefetch()
+                assert prefetched.file_path.endswith("002.mp3")
+
+                self.voice_client.stop()
+                await self.wait_for_sources(2)
+
+                assert self.voice_client.sources[1].source is prefetched
+                assert self.manager.get_transition_stats()["prefetch_hits"] == 1
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_jump_discards_prefetched_source(self):
+        """Test a jump tears down the stale prefetch and plays the target"""
+        with patch(
+            "utils.audio_manager.discord.FFmpegPCMAudio",
+            side_effect=lambda *args, **kwargs: MagicMock(),
+        ):
+            task = asyncio.create_task(self.manager._playback_loop(False))
+            try:
+                await self.wait_for_sources(1)
+                prefetched = await self.wait_for_prefetch()
+
+                await self.manager.jump_to_surah(3)
+                await self.wait_for_sources(2)
+
+                assert self.manager.current_surah == 3
+                assert self.voice_client.sources[1].source is not prefetched
+                prefetched.source.source.cleanup.assert_called_once()
+                assert self.manager.get_transition_stats()["prefetch_misses"] == 1
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_rapid_skips_build_one_source(self):
+        """Test clicks during playback are coalesced into a single transition"""
+        with patch(
+            "utils.audio_manager.discord.FFmpegPCMAudio",
+            side_effect=lambda *args, **kwargs: MagicMock(),
+        ):
+            self.manager.playback_task = asyncio.create_task(
+                self.manager._playback_loop(False)
+            )
+            try:
+                await self.wait_for_sources(1)
+                await self.manager.skip_to_next()
+                await self.manager.skip_to_next()
+                await self.manager.skip_to_previous()
+                await self.manager.jump_to_surah(3)
+                assert self.manager.current_surah == 1  # Applied by the loop
+
+                await self.wait_for_sources(2)
+                await asyncio.sleep(0.1)
+                assert len(self.voice_client.sources) == 2
+                assert self.manager.current_surah == 3
+                stats = self.manager.get_playback_status()["commands"]
+                assert stats["batches"] == 1 and stats["coalesced"] == 3
+                assert stats["depth"] == 0
+            finally:
+                self.manager.playback_task.cancel()
+                await asyncio.gather(self.manager.playback_task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_queued_surah_plays_next_even_in_loop_mode(self):
+        """Test a queued surah replaces the planned next track and is consumed"""
+        self.manager.is_loop_enabled = True
+        with patch(
+            "utils.audio_manager.discord.FFmpegPCMAudio",
+            side_effect=lambda *args, **kwargs: MagicMock(),
+        ):
+            task = asyncio.create_task(self.manager._playback_loop(False))
+            try:
+                await self.wait_for_sources(1)
+                assert self.manager.queue_surah(3, play_next=True)
+                assert not self.manager.queue_surah(99)
+
+                self.voice_client.stop()
+                await self.wait_for_sources(2)
+                assert self.manager.current_surah == 3
+                assert not self.manager.play_queue
+
+                # Loop mode resumes once the queue is empty
+                self.voice_client.stop()
+                await self.wait_for_sources(3)
+                assert self.manager.current_surah == 3
+
+                status = self.manager.get_playback_status()["play_queue"]
+                assert status == {"upcoming": [], "recent": [3, 1], "repeat": "one"}
+                saved = [
+                    op
+                    for call in self.mock_state.append_play_queue_deltas.call_args_list
+                    for op in call.args[0]
+                ]
+                assert ["next", 3] in saved and ["pop"] in saved
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_skip_advances_once(self):
+        """Test skipping plays the following track rather than skipping two"""
+        with patch(
+            "utils.audio_manager.discord.FFmpegPCMAudio",
+            side_effect=lambda *args, **kwargs: MagicMock(),
+        ):
+            task = asyncio.create_task(self.manager._playback_loop(False))
+            try:
+                await self.wait_for_sources(1)
+                await self.manager.skip_to_next()
+                await self.wait_for_sources(2)
+                assert self.manager.current_surah == 2
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_seek_restarts_track_at_indexed_frame(self):
+        """Test /seek replays the current track from an indexed byte offset"""
+        first_file = self.manager.current_audio_files[0]
+        Path(first_file).write_bytes((b"\xff\xfb\x90\x00" + bytes(413)) * 1000)
+
+        with patch("utils.audio_manager.discord.FFmpegPCMAudio") as pcm:
+            task = asyncio.create_task(self.manager._playback_loop(False))
+            self.manager.playback_task = task
+            try:
+                await self.wait_for_sources(1)
+                assert await self.manager.seek_to(12.5)
+                await self.wait_for_sources(2)
+
+                assert self.manager.current_surah == 1
+                self.mock_state.mark_surah_completed.assert_not_called()
+
+                seek_calls = [
+                    call
+                    for call in pcm.call_args_list
+                    if call.args[0] == first_file
+                    and "skip_initial_bytes" in (call.kwargs["before_options"] or "")
+                ]
+                assert len(seek_calls) == 1
+                offset = int(seek_calls[0].kwargs["before_options"].split()[-1])
+                assert offset > 0 and offset % 417 == 0
+                assert " -ss " in seek_calls[0].kwargs["options"]
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_stalled_decoder_restarts_at_position(self):
+        """Test a decoder producing no frames is killed and the track replayed"""
+        self.manager.ffmpeg_supervisor.stall_seconds = 0.2
+        with patch("utils.audio_manager.discord.FFmpegPCMAudio") as pcm:
+            task = asyncio.create_task(self.manager._playback_loop(False))
+            try:
+                await self.wait_for_sources(1)
+                self.manager.clock.seek(60.0)
+                supervised = self.manager.ffmpeg_supervisor.current
+                for _ in range(300):
+                    if supervised.killed:
+                        break
+                    await asyncio.sleep(0.01)
+                assert supervised.killed
+
+                # The killed FFmpeg ends the track the way the audio thread would
+                self.voice_client.stop()
+                await self.wait_for_sources(2)
+
+                assert self.manager.current_surah == 1
+                self.mock_state.mark_surah_completed.assert_not_called()
+                stats = self.manager.get_playback_status()["ffmpeg"]
+                assert stats["restarts"] == 1 and stats["stalls"] == 1
+                restarts = [
+                    call
+                    for call in pcm.call_args_list
+                    if call.args[0] == supervised.file_path
+                    and (call.kwargs["before_options"] or "").startswith("-ss 5")
+                ]
+                assert len(restarts) == 1
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_reciter_switch_continues_from_same_ayah(self):
+        """Test switching reciters mid-surah resumes at the aligned ayah"""
+        other_dir = self.audio_dir / "Other Reciter"
+        other_dir.mkdir()
+        for i in range(1, 4):
+            (other_dir / f"{i:03d}.mp3").touch()
+        (self.audio_dir / "Test Reciter" / "ayah_timings.json").write_text(
+            json.dumps({"1": [0.0, 10.0, 20.0, 30.0]})
+        )
+        (other_dir / "ayah_timings.json").write_text(
+            json.dumps({"1": [0.0, 14.0, 29.5, 44.0]})
+        )
+        self.manager.library.refresh()
+        self.manager.available_reciters = self.manager.library.get_reciters()
+        self.manager.opus_cache = MagicMock(get_cached_path=lambda *args: None)
+        self.manager.seek_index.start_background_indexing = MagicMock()
+        self.manager.loudness = None
+
+        with patch("utils.audio_manager.discord.FFmpegPCMAudio") as pcm:
+            self.manager.playback_task = asyncio.create_task(
+                self.manager._playback_loop(False)
+            )
+            try:
+                await self.wait_for_sources(1)
+                self.manager.clock.seek(25.0)  # Ayah 3 for Test Reciter
+                assert self.manager.get_current_ayah() == 3
+
+                await self.manager.switch_reciter("Other Reciter")
+                await self.wait_for_sources(2)
+
+                assert self.manager.current_reciter == "Other Reciter"
+                assert self.manager.current_surah == 1
+                assert self.manager.get_current_ayah() == 3
+                new_file = self.manager.current_audio_files[0]
+                assert Path(new_file).parent.name == "Other Reciter"
+                starts = [
+                    call.kwargs["before_options"]
+                    for call in pcm.call_args_list
+                    if call.args[0] == new_file
+                ]
+                assert starts == ["-ss 29.5"]
+
+                switch = self.manager.get_playback_status()["last_reciter_switch"]
+                assert switch["ayah"] == 3 and switch["position"] == 29.5
+                assert 0 <= switch["latency_ms"] < 2000
+            finally:
+                await self.manager.stop_playback()
+
+    @pytest.mark.asyncio
+    async def test_known_bad_file_skipped(self):
+        """Test files that failed verification are never planned or played"""
+        bad_file = self.manager.current_audio_files[1]
+        self.manager.library.update_entry(
+            bad_file, health={"status": "truncated", "cut_frame": True}
+        )
+
+        assert self.manager._get_next_file_index() == 2
+        self.manager._planned_next_index = None
+        self.manager.is_shuffle_enabled = True
+        for _ in range(5):
+            self.manager._planned_next_index = None
+            assert self.manager._get_next_file_index() != 1
+
+        # A jump onto the bad file moves past it before FFmpeg starts
+        self.manager.is_shuffle_enabled = False
+        self.manager.current_file_index = 1
+        with patch("utils.audio_manager.discord.FFmpegPCMAudio") as pcm:
+            task = asyncio.create_task(self.manager._playback_loop(False))
+            try:
+                await self.wait_for_sources(1)
+                assert self.manager.current_surah == 3
+                assert bad_file not in [call.args[0] for call in pcm.call_args_list]
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_idle_mode_holds_and_resumes_position(self):
+        """Test playback freezes with no listeners and resumes on the next join"""
+        with patch("utils.audio_manager.discord.FFmpegPCMAudio"):
+            task = asyncio.create_task(self.manager._playback_loop(False))
+            try:
+                await self.wait_for_sources(1)
+                self.manager.clock.seek(42.0)
+
+                await self.manager.update_listener_count(0)
+                assert self.manager.is_idle
+                assert self.voice_client.is_paused()
+                assert not self.manager.clock.is_running
+                held = self.manager.current_position
+                await asyncio.sleep(0.1)
+                assert self.manager.current_position == held
+
+                # A manual resume while idle keeps the pipeline held
+                self.manager.is_paused = True
+                await self.manager.resume_playback()
+                assert self.voice_client.is_paused()
+
+                await self.manager.update_listener_count(1)
+                assert not self.manager.is_idle
+                assert self.voice_client.is_playing()
+                assert self.manager.clock.is_running
+                assert held <= self.manager.current_position < held + 1
+
+                status = self.manager.get_playback_status()["idle"]
+                assert status["idle_periods"] == 1 and status["listeners"] == 1
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_track_started_while_idle_is_held(self):
+        """Test a track that starts with nobody listening is paused at 0"""
+        await self.manager.update_listener_count(0)
+        with patch("utils.audio_manager.discord.FFmpegPCMAudio"):
+            task = asyncio.create_task(self.manager._playback_loop(False))
+            try:
+                await self.wait_for_sources(1)
+                assert self.voice_client.is_paused()
+                assert not self.manager.clock.is_running
+                assert self.manager.current_position < 0.01
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_shuffle_previous_walks_history(self):
+        """Test shuffle plays each file once and previous returns what was heard"""
+        self.manager.is_shuffle_enabled = True
+        played = [self.manager.current_file_index]
+        for _ in range(2):
+            self.manager._planned_next_index = None
+            self.manager.current_file_index = self.manager._get_next_file_index()
+            played.append(self.manager.current_file_index)
+        assert sorted(played) == [0, 1, 2]
+
+        await self.manager.skip_to_previous()
+        assert self.manager.current_file_index == played[1]
+        await self.manager.skip_to_previous()
+        assert self.manager.current_file_index == played[0]
+
+        # The bag is saved with the cursor and reused for the same file list
+        saved = self.mock_state.save_shuffle_bag.call_args.args[0]
+        assert saved["order"][saved["position"]] == played[0]
+        self.mock_state.load_shuffle_bag.return_value = saved
+        self.manager.load_audio_files()
+        assert self.manager.shuffle_bag.order == saved["order"]
+
+    def test_timeline_follows_queue_and_modes(self):
+        """Test projected starts from durations, the play queue and loop mode"""
+        durations = dict(zip(self.manager.current_audio_files, (100.0, 200.0, 300.0)))
+        self.manager.library.get_duration = durations.get
+        self.manager.current_position = 40.0
+        assert self.manager.get_remaining_time() == pytest.approx(60.0, abs=0.1)
+
+        timeline = self.manager.get_timeline()
+        assert timeline.surahs == [2, 3, 1]
+        assert timeline.start_of(3) == 200.0
+        assert self.manager.get_timeline() is timeline  # Cached until the order changes
+
+        self.manager.queue_surah(3)
+        timeline = self.manager.get_timeline()
+        assert timeline.surahs == [3, 1, 2]
+        assert timeline.start_of(2, remaining=60.0) == 460.0
+
+        self.manager.is_loop_enabled = True
+        assert self.manager.get_timeline().surahs == [3]
+        self.manager.clear_play_queue()
+        assert len(self.manager.get_timeline()) == 0
+
+        self.manager.is_loop_enabled = False
+        self.manager.is_shuffle_enabled = True
+        assert sorted(self.manager.get_timeline().surahs) == [2, 3]
+
+    def test_surah_index_with_missing_files(self):
+        """Test surah ↔ file index lookups when the collection has gaps"""
+        (self.audio_dir / "Test Reciter" / "005.mp3").touch()
+        assert self.manager.load_audio_files()
+
+        assert self.manager._get_file_index_for_surah(5) == 3
+        assert self.manager._get_file_index_for_surah(4) is None
+        assert self.manager._get_file_index_for_surah(115) is None
+        assert 4 in self.manager.missing_surahs
+        assert 5 not in self.manager.missing_surahs
+        assert len(self.manager.missing_surahs) == 110
+
+        self.manager.current_file_index = 3
+        self.manager._update_current_surah()
+        assert self.manager.current_surah == 5
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Audio Pack Tests
+# =============================================================================
+# Tests for packed reciter archives, their discovery and mmap reads
+# =============================================================================
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.audio_library import AudioLibrary
+from utils.audio_pack import (
+    AudioPackStore,
+    read_pack_header,
+    split_packed_path,
+    unpack,
+    write_pack,
+)
+from utils.ayah_timing import AyahTimingIndex
+from utils.opus_cache import hash_file
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz: 417-byte frames of 1152 samples
+FRAME = b"\xff\xfb\x90\x00" + bytes(413)
+
+
+class TestAudioPack:
+    """Test suite for packing, unpacking and reading archives"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.audio_dir = self.temp_dir / "audio"
+        self.folder = self.audio_dir / "Test Reciter"
+        self.folder.mkdir(parents=True)
+        for i in range(1, 4):
+            (self.folder / f"{i:03d}.mp3").write_bytes(
+                b"ID3" + bytes(7) + FRAME * (500 * i)
+            )
+        (self.folder / "ayah_timings.json").write_text(json.dumps({"1": [0.0, 4.0]}))
+        self.pack_path = str(self.audio_dir / "Test Reciter.qpack")
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_header_describes_payloads(self):
+        """Test the header carries offsets, durations, seek tables and hashes"""
+        assert write_pack(str(self.folder), self.pack_path) == 3
+        header = read_pack_header(self.pack_path)
+
+        assert header["reciter"] == "Test Reciter"
+        assert header["ayah_timings"] == {"1": [0.0, 4.0]}
+        entry = header["files"]["002.mp3"]
+        assert entry["surah"] == 2
+        assert entry["duration"] == pytest.approx(1000 * 1152 / 44100, abs=0.01)
+        assert entry["seek_index"]["offsets"][0] == 10
+        assert entry["sha1"] == hash_file(str(self.folder / "002.mp3"))
+
+        data = Path(self.pack_path).read_bytes()
+        start = header["data_offset"] + entry["offset"]
+        assert (
+            data[start : start + entry["size"]]
+            == (self.folder / "002.mp3").read_bytes()
+        )
+
+    def test_member_reader_streams_from_mmap(self):
+        """Test a member reads back byte for byte, from the start or an offset"""
+        write_pack(str(self.folder), self.pack_path)
+        store = AudioPackStore()
+        path = os.path.join(self.pack_path, "003.mp3")
+        expected = (self.folder / "003.mp3").read_bytes()
+
+        reader = store.open_member(path)
+        received = b"".join(iter(lambda: reader.read(8192), b""))
+        assert received == expected
+
+        reader = store.open_member(path, byte_offset=10 + 417 * 100)
+        assert reader.read(4) == FRAME[:4]
+        assert store.open_member(os.path.join(self.pack_path, "114.mp3")) is None
+
+    def test_unpack_round_trip(self):
+        """Test unpacking restores the files, mtimes and ayah timings"""
+        write_pack(str(self.folder), self.pack_path)
+        target = self.temp_dir / "restored"
+        assert unpack(self.pack_path, str(target)) == 3
+
+        for name in ("001.mp3", "002.mp3", "003.mp3", "ayah_timings.json"):
+            assert (target / name).read_bytes() == (self.folder / name).read_bytes()
+        assert (
+            os.stat(target / "001.mp3").st_mtime
+            == os.stat(self.folder / "001.mp3").st_mtime
+        )
+
+    def test_library_discovers_pack_with_one_header_read(self):
+        """Test a packed reciter is listed from its header and re-read only on change"""
+        write_pack(str(self.folder), self.pack_path, "Packed Reciter")
+        os.rename(self.pack_path, self.audio_dir / "Packed Reciter.qpack")
+        packed_path = str(self.audio_dir / "Packed Reciter.qpack")
+
+        library = AudioLibrary(str(self.audio_dir), str(self.temp_dir / "library.json"))
+        library.refresh()
+        assert library.get_reciters() == ["Packed Reciter", "Test Reciter"]
+
+        files = library.get_files("Packed Reciter")
+        assert files[0] == os.path.join(packed_path, "001.mp3")
+        assert split_packed_path(files[0]) == (packed_path, "001.mp3")
+        assert library.get_duration(files[2]) > library.get_duration(files[0]) > 0
+        assert library.get_entry(files[0])["seek_index"]
+
+        with patch("utils.audio_library.read_pack_header") as header:
+            library.refresh()
+            header.assert_not_called()
+
+        timings = AyahTimingIndex(str(self.audio_dir))
+        assert timings.get_ayah("Packed Reciter", 1, 5.0) == 2
+
+    def test_folder_takes_precedence_over_pack(self):
+        """Test a reciter folder wins over an archive of the same name"""
+        write_pack(str(self.folder), self.pack_path)
+        library = AudioLibrary(str(self.audio_dir), str(self.temp_dir / "library.json"))
+        library.refresh()
+        assert library.get_files("Test Reciter")[0] == str(self.folder / "001.mp3")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
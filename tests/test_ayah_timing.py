@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Ayah Timing Tests
+# =============================================================================
+# Tests for the lazily loaded position → ayah index
+# =============================================================================
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.ayah_timing import AYAH_TIMINGS_FILENAME, AyahTimingIndex
+
+
+class TestAyahTimingIndex:
+    """Test suite for AyahTimingIndex"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.reciter_dir = self.temp_dir / "Test Reciter"
+        self.reciter_dir.mkdir()
+        self.write_timings(
+            {
+                "1": [0.0, 6.5, 12.0, 18.25, 24.0, 30.5, 37.0],
+                "2": [3.0, 10.0],
+                "3": [5.0, 2.0],  # unsorted, ignored
+            }
+        )
+        self.index = AyahTimingIndex(str(self.temp_dir))
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    def write_timings(self, timings):
+        (self.reciter_dir / AYAH_TIMINGS_FILENAME).write_text(json.dumps(timings))
+
+    def test_position_to_ayah(self):
+        """Test positions map to the ayah whose start precedes them"""
+        assert self.index.get_ayah("Test Reciter", 1, 0.0) == 1
+        assert self.index.get_ayah("Test Reciter", 1, 6.4) == 1
+        assert self.index.get_ayah("Test Reciter", 1, 6.5) == 2
+        assert self.index.get_ayah("Test Reciter", 1, 20.0) == 4
+        assert self.index.get_ayah("Test Reciter", 1, 999.0) == 7
+
+    def test_before_first_ayah_is_ayah_one(self):
+        """Test a lead-in before the first timestamp reports ayah 1"""
+        assert self.index.get_ayah("Test Reciter", 2, 1.0) == 1
+
+    def test_ayah_start(self):
+        """Test ayah numbers map back to their start positions"""
+        assert self.index.get_ayah_start("Test Reciter", 1, 1) == 0.0
+        assert self.index.get_ayah_start("Test Reciter", 1, 4) == 18.25
+        assert self.index.get_ayah_start("Test Reciter", 1, 8) is None
+        assert self.index.get_ayah_start("Test Reciter", 1, 0) is None
+        assert self.index.get_ayah_start("Other Reciter", 1, 1) is None
+
+    def test_missing_or_invalid_timings(self):
+        """Test lookups without usable data return None"""
+        assert self.index.get_ayah("Test Reciter", 3, 4.0) is None
+        assert self.index.get_ayah("Test Reciter", 114, 4.0) is None
+        assert self.index.get_ayah("Other Reciter", 1, 4.0) is None
+        assert not self.index.has_timings("Other Reciter", 1)
+
+    def test_loaded_once_per_reciter(self):
+        """Test the timing file is parsed on first use and then served from memory"""
+        assert self.index.get_ayah("Test Reciter", 1, 13.0) == 3
+        with patch("utils.ayah_timing.json.load") as load:
+            assert self.index.get_ayah("Test Reciter", 1, 25.0) == 5
+            assert self.index.get_ayah("Test Reciter", 2, 11.0) == 2
+            load.assert_not_called()
+
+    def test_invalidate_reloads(self):
+        """Test invalidation picks up a changed timing file"""
+        assert self.index.get_ayah("Test Reciter", 2, 11.0) == 2
+        self.write_timings({"2": [3.0, 10.0, 11.0]})
+        self.index.invalidate("Test Reciter")
+        assert self.index.get_ayah("Test Reciter", 2, 11.0) == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
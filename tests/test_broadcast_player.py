@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Broadcast Player Tests
+# =============================================================================
+# Tests for shared-decode fan-out to multiple voice clients
+# =============================================================================
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from discord.opus import OPUS_SILENCE
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.broadcast_player import (
+    PREBUFFER_FRAMES,
+    BroadcastHub,
+    BroadcastSubscriber,
+)
+
+
+class FakeSource:
+    """Upstream source yielding a fixed list of frames"""
+
+    def __init__(self, frames, opus=True):
+        self.frames = list(frames)
+        self.reads = 0
+        self.opus = opus
+
+    def read(self):
+        self.reads += 1
+        return self.frames.pop(0) if self.frames else b""
+
+    def is_opus(self):
+        return self.opus
+
+    def cleanup(self):
+        pass
+
+
+class FakeVoiceClient:
+    """Voice client that records what it was asked to play"""
+
+    def __init__(self):
+        self.source = None
+        self.after = None
+
+    def is_playing(self):
+        return self.source is not None
+
+    def is_paused(self):
+        return False
+
+    def play(self, source, after=None):
+        self.source = source
+        self.after = after
+
+    def stop(self):
+        if self.after:
+            self.after(None)
+        self.source = None
+
+
+def drain(subscriber, count):
+    return [subscriber.read() for _ in range(count)]
+
+
+class TestBroadcastHub:
+    """Test suite for BroadcastHub fan-out"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.hub = BroadcastHub(max_frames=10)
+        self.listeners = [FakeVoiceClient(), FakeVoiceClient()]
+        self.subscribers = [self.hub.subscribe(vc) for vc in self.listeners]
+
+    def test_single_read_fanned_out(self):
+        """Test each upstream frame is read once and reaches every listener"""
+        packets = [bytes([i]) * 10 for i in range(5)]
+        upstream = FakeSource(packets)
+        tap = self.hub.wrap(upstream, 64)
+
+        played = [tap.read() for _ in range(5)]
+        assert played == packets
+        assert upstream.reads == 5
+
+        for subscriber in self.subscribers:
+            assert drain(subscriber, 5) == packets
+
+        assert tap.read() == b""
+
+    def test_pcm_encoded_once_for_all_listeners(self):
+        """Test PCM sources are encoded once regardless of listener count"""
+        with patch("utils.broadcast_player.discord.opus.Encoder") as encoder_class:
+            encoder = encoder_class.return_value
+            encoder.encode.side_effect = lambda frame, samples: b"opus" + frame[:1]
+
+            tap = self.hub.wrap(
+                FakeSource([b"\x01" * 3840, b"\x02" * 3840], opus=False), 64
+            )
+            assert tap.is_opus()
+            assert tap.read() == b"opus\x01"
+            assert tap.read() == b"opus\x02"
+
+        assert encoder.encode.call_count == 2
+        for subscriber in self.subscribers:
+            subscriber.push(b"pad")  # reach the prebuffer
+            assert drain(subscriber, 2) == [b"opus\x01", b"opus\x02"]
+
+    def test_listener_joins_mid_track(self):
+        """Test a new listener receives packets published after it joins"""
+        tap = self.hub.wrap(FakeSource([b"a", b"b", b"c", b"d", b"e", b"f"]), 64)
+        tap.read()
+
+        late = self.hub.subscribe(FakeVoiceClient())
+        for _ in range(5):
+            tap.read()
+        assert drain(late, 5) == [b"b", b"c", b"d", b"e", b"f"]
+
+    def test_disconnected_listener_removed(self):
+        """Test a listener whose player ends stops receiving packets"""
+        self.listeners[0].stop()
+        assert self.hub.get_subscriber_count() == 1
+
+        assert self.hub.unsubscribe(self.listeners[1])
+        assert self.hub.get_subscriber_count() == 0
+        assert self.subscribers[1].read() == b""
+
+
+class TestBroadcastSubscriber:
+    """Test suite for per-listener queues"""
+
+    def test_prebuffer_and_underrun(self):
+        """Test silence until the prebuffer fills and after an underrun"""
+        subscriber = BroadcastSubscriber(MagicMock(), max_frames=10)
+        subscriber.push(b"1")
+        assert subscriber.read() == OPUS_SILENCE
+
+        for i in range(2, PREBUFFER_FRAMES + 1):
+            subscriber.push(str(i).encode())
+        assert drain(subscriber, PREBUFFER_FRAMES) == [b"1", b"2", b"3"]
+
+        assert subscriber.read() == OPUS_SILENCE
+        assert subscriber.stats["underruns"] == 1
+
+        subscriber.push(b"4")
+        assert subscriber.read() == OPUS_SILENCE  # rebuffering
+
+    def test_slow_listener_drops_oldest(self):
+        """Test a full queue drops its oldest frames instead of blocking"""
+        subscriber = BroadcastSubscriber(MagicMock(), max_frames=5)
+        for i in range(8):
+            subscriber.push(bytes([i]))
+
+        assert subscriber.stats["dropped"] == 3
+        assert drain(subscriber, 5) == [bytes([i]) for i in range(3, 8)]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Data Store Tests
+# =============================================================================
+# Tests for the SQLite store behind quiz scores, users and verse statistics
+# =============================================================================
+
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.data_store import SCHEMA, DataStore
+
+
+class TestDataStore:
+    """Test suite for DataStore"""
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.store = DataStore(self.temp_dir / "quranbot.db")
+
+    def teardown_method(self):
+        self.store.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_database_uses_wal(self):
+        """Test the database is created in WAL mode"""
+        self.store.upsert_user(1, "Ahmad").result()
+        mode = self.store.call(
+            lambda conn: conn.execute("PRAGMA journal_mode").fetchone()[0]
+        )
+        assert mode == "wal"
+
+    @pytest.mark.asyncio
+    async def test_quiz_answers_and_leaderboard(self):
+        """Test points, streaks and the ranked leaderboard"""
+        for is_correct in (True, True, False, True):
+            self.store.record_quiz_answer(111, is_correct)
+        for is_correct in (False, False):
+            self.store.record_quiz_answer(222, is_correct)
+        self.store.record_quiz_answer(333, True)
+
+        score = await self.store.get_quiz_score(111)
+        assert score["points"] == 2
+        assert score["correct"] == 3
+        assert score["total"] == 4
+        assert score["current_streak"] == 1
+        assert score["best_streak"] == 2
+
+        # Points never go below zero
+        assert (await self.store.get_quiz_score(222))["points"] == 0
+        assert await self.store.get_quiz_score(444) is None
+
+        leaderboard = await self.store.get_quiz_leaderboard(limit=2)
+        assert [user_id for user_id, _ in leaderboard] == ["111", "333"]
+
+    @pytest.mark.asyncio
+    async def test_user_and_verse_stats(self):
+        """Test user upserts and dua/verse counters"""
+        self.store.upsert_user(1, "Ahmad", "https://example.com/a.png")
+        self.store.upsert_user(1, "Ahmad K")
+        assert self.store.get_user(1)["display_name"] == "Ahmad K"
+        assert self.store.get_user(2) is None
+
+        self.store.record_verse_sent(2)
+        self.store.record_dua_reaction(1, 2)
+        self.store.record_dua_reaction(1, 2)
+        self.store.record_dua_reaction(5, 36)
+
+        stats = await self.store.get_verse_stats()
+        assert stats["total_dua_reactions"] == 3
+        assert stats["total_verses_sent"] == 1
+        assert stats["surah_stats"][2] == {"reactions": 2, "verses_sent": 1}
+        assert stats["top_reactors"][0] == (1, 2)
+        assert self.store.get_stats()["writes"] == 6
+
+    @pytest.mark.asyncio
+    async def test_legacy_json_imported_on_create(self):
+        """Test a new database picks up the JSON files next to it"""
+        store_dir = self.temp_dir / "legacy"
+        store_dir.mkdir()
+        (store_dir / "quiz_stats.json").write_text(
+            json.dumps(
+                {"user_scores": {"42": {"points": 7, "correct": 9, "total": 12}}}
+            )
+        )
+        (store_dir / "user_cache.json").write_text(
+            json.dumps({"users": {"42": {"display_name": "Yusuf"}}})
+        )
+        (store_dir / "daily_verses_state.json").write_text(
+            json.dumps(
+                {
+                    "interval_hours": 3,
+                    "total_dua_reactions": 4,
+                    "user_reactions": {"42": 4},
+                    "surah_stats": {"18": {"reactions": 4, "verses_sent": 2}},
+                }
+            )
+        )
+
+        store = DataStore(store_dir / "quranbot.db")
+        try:
+            assert (await store.get_quiz_score(42))["points"] == 7
+            assert store.get_user(42)["display_name"] == "Yusuf"
+            stats = await store.get_verse_stats()
+            assert stats["total_dua_reactions"] == 4
+            assert stats["surah_stats"][18]["verses_sent"] == 2
+
+            # Importing again keeps live rows instead of rolling them back
+            store.record_quiz_answer(42, True)
+            store.record_dua_reaction(42, 18)
+            store.import_json(store_dir)
+            assert (await store.get_quiz_score(42))["points"] == 8
+            assert (await store.get_verse_stats())["total_dua_reactions"] == 5
+        finally:
+            store.close()
+
+        # The import is recorded, so reopening never imports again
+        (store_dir / "quiz_stats.json").write_text(
+            json.dumps({"user_scores": {"43": {"points": 1}}})
+        )
+        store = DataStore(store_dir / "quranbot.db")
+        try:
+            assert await store.get_quiz_score(43) is None
+        finally:
+            store.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_legacy_import_is_retried(self):
+        """Test a database whose import never committed imports on next open"""
+        store_dir = self.temp_dir / "retry"
+        store_dir.mkdir()
+        (store_dir / "quiz_stats.json").write_text(
+            json.dumps(
+                {
+                    "user_scores": {
+                        "42": {"points": 7},
+                        "43": {"points": "not a number"},
+                    }
+                }
+            )
+        )
+
+        # Simulate a crash after the schema commit but before the import
+        with sqlite3.connect(store_dir / "quranbot.db") as conn:
+            conn.executescript(SCHEMA)
+
+        store = DataStore(store_dir / "quranbot.db")
+        try:
+            assert (await store.get_quiz_score(42))["points"] == 7
+            assert await store.get_quiz_score(43) is None
+        finally:
+            store.close()
+
+    @pytest.mark.asyncio
+    async def test_backup_includes_wal_commits(self):
+        """Test backups contain writes not yet checkpointed out of the WAL"""
+        for _ in range(20):
+            self.store.record_quiz_answer(7, True)
+
+        backup_path = await self.store.backup_to(self.temp_dir / "copy.db")
+        with sqlite3.connect(backup_path) as conn:
+            total = conn.execute(
+                "SELECT total FROM quiz_scores WHERE user_id = 7"
+            ).fetchone()[0]
+        assert total == 20
+
+    def test_close_flushes_queued_writes(self):
+        """Test writes queued before close() reach the database"""
+        for _ in range(50):
+            self.store.record_quiz_answer(7, True)
+        self.store.close()
+
+        with sqlite3.connect(self.temp_dir / "quranbot.db") as conn:
+            total = conn.execute(
+                "SELECT total FROM quiz_scores WHERE user_id = 7"
+            ).fetchone()[0]
+        assert total == 50
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
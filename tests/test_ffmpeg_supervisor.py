@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - FFmpeg Supervisor Tests
+# =============================================================================
+# Tests for stderr capture, exit classification and stall detection
+# =============================================================================
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.ffmpeg_supervisor import (
+    FFmpegSupervisor,
+    StderrRing,
+    SupervisedSource,
+    find_supervised,
+)
+
+
+class FakeFFmpegSource:
+    """Source backed by a real child process, like discord.py's FFmpeg sources"""
+
+    def __init__(self, frames, exit_code=0):
+        self.frames = list(frames)
+        self._process = subprocess.Popen(
+            [sys.executable, "-c", f"import sys; sys.exit({exit_code})"]
+        )
+        self._process.wait()
+
+    def read(self):
+        return self.frames.pop(0) if self.frames else b""
+
+    def is_opus(self):
+        return False
+
+    def cleanup(self):
+        pass
+
+
+class TestStderrRing:
+    """Test suite for the bounded stderr sink"""
+
+    def test_keeps_last_complete_lines(self):
+        """Test lines are split across writes and old lines are dropped"""
+        ring = StderrRing(max_lines=3)
+        ring.write(b"line 1\nline 2\nli")
+        ring.write(b"ne 3\r\nline 4\n")
+        assert list(ring.lines) == ["line 2", "line 3", "line 4"]
+        assert ring.tail(2) == "line 3\nline 4"
+
+    def test_is_piped_by_discord(self):
+        """Test the ring has no fileno so discord.py pipes stderr into it"""
+        assert not hasattr(StderrRing(), "fileno")
+
+
+class TestSupervisedSource:
+    """Test suite for per-source tracking"""
+
+    def test_counts_frames_and_completion(self):
+        """Test frames are counted and a clean exit is reported as completed"""
+        source = SupervisedSource(FakeFFmpegSource([b"ab", b"cd"]), "001.mp3")
+        assert source.exit_status() == "running"
+        while source.read():
+            pass
+        assert source.frames == 2
+        assert source.bytes_out == 4
+        assert source.exit_status() == "completed"
+
+    def test_nonzero_exit_is_failure(self):
+        """Test a crashed FFmpeg is reported without matching error text"""
+        source = SupervisedSource(FakeFFmpegSource([], exit_code=1), "001.mp3")
+        assert source.read() == b""
+        assert source.exit_status() == "failed"
+        assert source.returncode == 1
+
+    def test_kill_and_metrics(self):
+        """Test killing a live child ends it and metrics describe it"""
+        inner = FakeFFmpegSource([])
+        inner._process = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(30)"]
+        )
+        source = SupervisedSource(inner, "001.mp3")
+
+        metrics = source.get_metrics()
+        assert metrics["pid"] == inner._process.pid
+        assert metrics["rss_bytes"] and metrics["rss_bytes"] > 0
+        assert metrics["cpu_seconds"] is not None
+
+        source.kill()
+        assert inner._process.wait(timeout=5) != 0
+        assert source.exit_status() == "killed"
+
+    def test_find_through_wrappers(self):
+        """Test the supervised source is found inside prefetch/broadcast wrappers"""
+        supervised = SupervisedSource(FakeFFmpegSource([]), "001.mp3")
+
+        class Wrapper:
+            def __init__(self, source):
+                self.source = source
+
+        assert find_supervised(Wrapper(Wrapper(supervised))) is supervised
+        assert find_supervised(Wrapper(object())) is None
+
+
+class TestFFmpegSupervisor:
+    """Test suite for stall detection and restart limits"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.supervisor = FFmpegSupervisor(stall_seconds=0.05, max_restarts_per_track=2)
+        self.source = SupervisedSource(FakeFFmpegSource([b"a"]), "001.mp3")
+        self.supervisor.attach(self.source)
+
+    def test_stall_detected_and_recorded(self):
+        """Test no frames for the stall window is reported with its length"""
+        assert self.supervisor.check() is None
+        time.sleep(0.1)
+        stalled_for = self.supervisor.check()
+        assert stalled_for >= 0.05
+        assert self.supervisor.stats["stalls"] == 1
+        assert self.supervisor.stats["max_stall_seconds"] == round(stalled_for, 1)
+
+    def test_pause_is_not_a_stall(self):
+        """Test a paused player is never reported as stalled"""
+        time.sleep(0.1)
+        assert self.supervisor.check(paused=True) is None
+        assert self.supervisor.check() is None
+
+    def test_restart_limit_per_track(self):
+        """Test restarts are limited per track and reset on a new track"""
+        for _ in range(2):
+            assert self.supervisor.can_restart()
+            self.supervisor.record_restart()
+        assert not self.supervisor.can_restart()
+
+        self.supervisor.attach(SupervisedSource(FakeFFmpegSource([]), "002.mp3"))
+        assert self.supervisor.can_restart()
+        assert self.supervisor.get_stats()["restarts"] == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Idle Monitor Tests
+# =============================================================================
+# Tests for listener-aware idle mode accounting
+# =============================================================================
+
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.idle_monitor import IdleMonitor, process_cpu_seconds
+
+
+class FakeClocks:
+    """Manually advanced wall clock and CPU counter"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.cpu = 50.0
+
+    def run(self, seconds, cpu_rate):
+        self.now += seconds
+        self.cpu += seconds * cpu_rate
+
+
+class TestIdleMonitor:
+    """Test suite for IdleMonitor"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.clocks = FakeClocks()
+        self.monitor = IdleMonitor(
+            cpu_time=lambda: self.clocks.cpu, clock=lambda: self.clocks.now
+        )
+
+    def test_transitions(self):
+        """Test only the last leave and the first join flip idle mode"""
+        assert not self.monitor.update(2)
+        assert not self.monitor.update(1)
+        assert self.monitor.update(0)
+        assert self.monitor.is_idle
+        assert not self.monitor.update(0)
+        assert self.monitor.update(1)
+        assert not self.monitor.is_idle
+        assert self.monitor.get_stats()["idle_periods"] == 1
+
+    def test_cpu_saved_from_playing_and_idle_rates(self):
+        """Test savings use the difference between playing and idle CPU rates"""
+        self.monitor.update(1)
+        self.clocks.run(600, cpu_rate=0.25)  # Playing: 25% of a core
+        self.monitor.update(0)
+        self.clocks.run(7200, cpu_rate=0.05)  # Idle: gateway only
+        self.monitor.update(1)
+
+        stats = self.monitor.get_stats()
+        assert stats["idle_hours"] == pytest.approx(2.0)
+        assert stats["cpu_hours_saved"] == pytest.approx(0.4)
+        assert stats["active_cpu_percent"] == 25.0
+
+    def test_stats_include_current_idle_period(self):
+        """Test an ongoing idle period is reported before it ends"""
+        self.clocks.run(60, cpu_rate=0.5)
+        self.monitor.update(0)
+        self.clocks.run(3600, cpu_rate=0.0)
+
+        stats = self.monitor.get_stats()
+        assert stats["is_idle"]
+        assert stats["idle_hours"] == pytest.approx(1.0)
+        assert stats["cpu_hours_saved"] == pytest.approx(0.5)
+
+    def test_process_cpu_seconds(self):
+        """Test the real CPU reader returns a non-negative total"""
+        assert process_cpu_seconds() >= 0.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
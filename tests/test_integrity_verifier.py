@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Integrity Verifier Tests
+# =============================================================================
+# Tests for MP3 frame-walk health checks and the background verifier
+# =============================================================================
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.audio_library import AudioLibrary
+from utils.integrity_verifier import (
+    HEALTH_OK,
+    HEALTH_TRUNCATED,
+    HEALTH_UNDECODABLE,
+    IntegrityVerifier,
+    verify_audio_file,
+)
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz: 417-byte frames of 1152 samples
+FRAME = b"\xff\xfb\x90\x00" + bytes(413)
+FRAME_SECONDS = 1152 / 44100
+XING_FRAME = FRAME[:4] + bytes(32) + b"Xing" + bytes(377)
+
+
+class TestVerifyAudioFile:
+    """Test suite for the frame-walk health check"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, data):
+        path = self.temp_dir / "001.mp3"
+        path.write_bytes(data)
+        return str(path)
+
+    def test_healthy_file(self):
+        """Test a complete file reports its frames and duration"""
+        health = verify_audio_file(self.write(FRAME * 100 + b"TAG" + bytes(125)), 2.6)
+        assert health["status"] == HEALTH_OK
+        assert health["frames"] == 100
+        assert health["duration"] == pytest.approx(100 * FRAME_SECONDS, abs=0.001)
+        assert health["junk_bytes"] == 0
+
+    def test_cut_off_final_frame(self):
+        """Test a file ending mid-frame is truncated"""
+        health = verify_audio_file(self.write(FRAME * 100 + FRAME[:200]))
+        assert health["status"] == HEALTH_TRUNCATED
+        assert health["cut_frame"]
+        assert health["frames"] == 100
+
+    def test_shorter_than_tagged_duration(self):
+        """Test audio well short of a header-declared duration is truncated"""
+        health = verify_audio_file(self.write(XING_FRAME + FRAME * 100), 60.0)
+        assert health["status"] == HEALTH_TRUNCATED
+        assert health["vbr_header"]
+        assert not health["cut_frame"]
+
+    def test_estimated_duration_not_trusted(self):
+        """Test a headerless file is not judged against an estimated length"""
+        health = verify_audio_file(self.write(FRAME * 100), 60.0)
+        assert health["status"] == HEALTH_OK
+        assert not health["vbr_header"]
+
+    def test_undecodable_file(self):
+        """Test a file without MPEG frames is undecodable"""
+        assert verify_audio_file(self.write(bytes(5000)))["status"] == (
+            HEALTH_UNDECODABLE
+        )
+        assert verify_audio_file(str(self.temp_dir / "missing.mp3"))["status"] == (
+            HEALTH_UNDECODABLE
+        )
+
+    def test_junk_between_frames(self):
+        """Test junk bytes are skipped and counted"""
+        health = verify_audio_file(self.write(FRAME * 50 + bytes(300) + FRAME * 50))
+        assert health["status"] == HEALTH_OK
+        assert health["frames"] == 100
+        assert health["junk_bytes"] == 300
+
+
+class TestIntegrityVerifier:
+    """Test suite for IntegrityVerifier"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.reciter_dir = self.temp_dir / "audio" / "Test Reciter"
+        self.reciter_dir.mkdir(parents=True)
+        (self.reciter_dir / "001.mp3").write_bytes(FRAME * 100)
+        (self.reciter_dir / "002.mp3").write_bytes(FRAME * 100 + FRAME[:100])
+        self.library = AudioLibrary(
+            str(self.temp_dir / "audio"), str(self.temp_dir / "audio_library.json")
+        )
+        self.library.refresh()
+        self.files = self.library.get_files("Test Reciter")
+        self.verifier = IntegrityVerifier(self.library, max_workers=2)
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_records_health_in_manifest(self):
+        """Test verification stores health and flags bad files"""
+        assert not self.verifier.is_known_bad(self.files[1])  # Not verified yet
+
+        assert await self.verifier.verify_files(self.files) == 1
+        assert not self.verifier.is_known_bad(self.files[0])
+        assert self.verifier.is_known_bad(self.files[1])
+
+        reloaded = AudioLibrary(
+            str(self.temp_dir / "audio"), str(self.temp_dir / "audio_library.json")
+        )
+        reloaded.load()
+        assert reloaded.get_entry(self.files[1])["health"]["status"] == (
+            HEALTH_TRUNCATED
+        )
+
+    @pytest.mark.asyncio
+    async def test_only_changed_files_rescanned(self):
+        """Test unchanged files are skipped and a repaired file is rechecked"""
+        await self.verifier.verify_files(self.files)
+        assert self.verifier.stats["verified"] == 2
+
+        await self.verifier.verify_files(self.files)
+        assert self.verifier.stats["verified"] == 2
+        assert self.verifier.stats["skipped"] == 2
+
+        # Replace the truncated file with a complete one
+        bad_file = Path(self.files[1])
+        bad_file.write_bytes(FRAME * 120)
+        os.utime(bad_file, (1, 1))
+        os.utime(self.reciter_dir, (2, 2))
+        self.library.refresh()
+
+        assert await self.verifier.verify_files(self.files) == 0
+        assert self.verifier.stats["verified"] == 3
+        assert not self.verifier.is_known_bad(self.files[1])
+
+    @pytest.mark.asyncio
+    async def test_estimated_truncation_records_rechecked(self):
+        """Test old duration-only truncated records are verified again"""
+        self.library.update_entry(
+            self.files[0],
+            health={"status": HEALTH_TRUNCATED, "frames": 100, "cut_frame": False},
+        )
+        assert not self.verifier.is_known_bad(self.files[0])
+
+        assert await self.verifier.verify_files(self.files) == 1
+        assert self.verifier.stats["verified"] == 2
+        assert not self.verifier.is_known_bad(self.files[0])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -10,6 +10,8 @@ import json
 import os
 import shutil
 import sys
+import tempfile
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -20,10 +22,13 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from utils.listening_stats import (
+    SESSION_LOG_FILE,
+    STATS_FILE,
     ActiveSession,
     ListeningStatsManager,
     UserStats,
     get_data_protection_status,
+    get_user_listening_stats,
     verify_data_integrity,
 )
 
@@ -320,3 +325,138 @@ class TestListeningStats:
         assert status["backup_exists"] is True
         assert status["data_integrity"] is True
         assert status["total_protection_files"] >= 1
+
+
+class TestSessionLog:
+    """Test suite for the event-sourced session log and snapshots"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.data_dir = Path(tempfile.mkdtemp())
+        self.stats_file = self.data_dir / STATS_FILE.name
+        self.log_file = self.data_dir / SESSION_LOG_FILE.name
+        self.manager = ListeningStatsManager(data_dir=self.data_dir)
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        self.manager.close()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def test_voice_events_append_without_snapshot(self):
+        """Test joins and leaves append one line each instead of saving"""
+        with patch.object(self.manager, "save_stats") as save_stats:
+            self.manager.user_joined_voice(1)
+            self.manager.user_joined_voice(2)
+            self.manager.user_left_voice(1)
+        save_stats.assert_not_called()
+
+        lines = self.log_file.read_text().splitlines()
+        assert [json.loads(line)[:3] for line in lines] == [
+            [1, "join", 1],
+            [2, "join", 2],
+            [3, "leave", 1],
+        ]
+        assert not self.stats_file.exists()
+        assert self.manager.users[1].sessions == 1
+        assert 2 in self.manager.active_sessions
+
+    def test_restart_replays_log_on_snapshot(self):
+        """Test recovery is the snapshot plus the events logged after it"""
+        self.manager.user_joined_voice(1)
+        self.manager.user_left_voice(1)
+        self.manager.save_stats()
+        assert self.log_file.read_text() == ""
+
+        self.manager.user_joined_voice(1)
+        self.manager.user_left_voice(1)
+        self.manager.user_joined_voice(2)
+        # Crash: no snapshot, and half a line at the end of the log
+        self.manager._close_session_log()
+        with open(self.log_file, "a") as f:
+            f.write('[6,"join",3,')
+
+        restarted = ListeningStatsManager(data_dir=self.data_dir)
+        assert restarted.users[1].sessions == 2
+        assert restarted.total_sessions == 2
+        assert list(restarted.active_sessions) == [2]
+        assert restarted.log_seq == 5
+        assert self.log_file.read_text().endswith("\n")
+
+        restarted.user_left_voice(2)
+        restarted.close()
+        assert ListeningStatsManager(data_dir=self.data_dir).users[2].sessions == 1
+
+    def test_snapshot_not_double_counted(self):
+        """Test events already in the snapshot are skipped if the log was not trimmed"""
+        self.manager.user_joined_voice(1)
+        self.manager.user_left_voice(1)
+        untrimmed_log = self.log_file.read_text()
+
+        self.manager.save_stats()
+        # Stop between writing the snapshot and trimming the log
+        self.log_file.write_text(untrimmed_log)
+
+        restarted = ListeningStatsManager(data_dir=self.data_dir)
+        assert restarted.users[1].sessions == 1
+        assert restarted.total_sessions == 1
+
+    @pytest.mark.asyncio
+    async def test_background_snapshot_keeps_new_events(self):
+        """Test a snapshot written off the loop keeps events logged meanwhile"""
+        self.manager.user_joined_voice(1)
+        assert self.manager.snapshot_task is not None
+
+        write_snapshot = self.manager._write_snapshot
+
+        def slow_write(data):
+            write_snapshot(data)
+            # An event arriving while the snapshot is being written
+            self.manager._append_session_event("join", 2, "2024-01-01T00:00:00+00:00")
+
+        with patch.object(self.manager, "_write_snapshot", slow_write):
+            assert await self.manager.snapshot_stats() is True
+
+        lines = self.log_file.read_text().splitlines()
+        assert [json.loads(line)[:3] for line in lines] == [[2, "join", 2]]
+
+        # The next snapshot picks it up; with nothing new there is no write
+        assert await self.manager.snapshot_stats() is True
+        assert self.log_file.read_text() == ""
+        assert await self.manager.snapshot_stats() is False
+
+    @pytest.mark.asyncio
+    async def test_background_snapshot_trims_off_loop(self):
+        """Test the session log is trimmed in the snapshot's worker thread"""
+        self.manager.user_joined_voice(1)
+        self.manager.user_left_voice(1)
+
+        trim_threads = []
+        trim_session_log = self.manager._trim_session_log
+
+        def record_thread(upto_seq):
+            trim_threads.append(threading.current_thread())
+            trim_session_log(upto_seq)
+
+        with patch.object(self.manager, "_trim_session_log", record_thread):
+            assert await self.manager.snapshot_stats() is True
+
+        assert trim_threads and trim_threads[0] is not threading.main_thread()
+        assert self.log_file.read_text() == ""
+        assert self.manager.snapshot_seq == 2
+
+    def test_user_lookup_reads_memory(self):
+        """Test per-user lookups use the live totals, not the files"""
+        self.manager.user_joined_voice(1)
+        self.manager.user_left_voice(1)
+        self.manager.user_joined_voice(1)
+        self.manager.active_sessions[1].start_time -= timedelta(seconds=60)
+
+        with patch("utils.listening_stats.listening_stats_manager", self.manager):
+            with patch("builtins.open", side_effect=AssertionError("file read")):
+                stats = get_user_listening_stats(1)
+                assert get_user_listening_stats(2) is None
+
+        assert stats.sessions == 1
+        assert stats.total_time >= 60
+        assert self.manager.users[1].total_time < 60  # Callers get a copy
+
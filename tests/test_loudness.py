@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Loudness Normalization Tests
+# =============================================================================
+# Tests for ebur128 parsing, gain calculation and manifest storage
+# =============================================================================
+
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.audio_library import AudioLibrary
+from utils.loudness import (
+    LoudnessAnalyzer,
+    compute_gain_db,
+    parse_ebur128_summary,
+)
+from utils.opus_cache import OpusCache
+
+SUMMARY = """[Parsed_ebur128_0 @ 0x55d0c8] Summary:
+
+  Integrated loudness:
+    I:         -23.4 LUFS
+    Threshold: -33.9 LUFS
+
+  Loudness range:
+    LRA:         6.1 LU
+    Threshold: -43.9 LUFS
+    LRA low:   -27.2 LUFS
+    LRA high:  -21.1 LUFS
+
+  True peak:
+    Peak:       -4.2 dBFS
+"""
+
+# Stand-in FFmpeg: prints an ebur128 summary, or copies input to output
+FAKE_FFMPEG = """#!{python}
+import shutil, sys
+if "null" in sys.argv:
+    sys.stderr.write({summary!r})
+else:
+    shutil.copy(sys.argv[sys.argv.index("-i") + 1], sys.argv[-1])
+"""
+
+
+class TestGainCalculation:
+    """Test suite for summary parsing and gain limits"""
+
+    def test_parse_summary(self):
+        """Test integrated loudness and true peak are read from the summary"""
+        assert parse_ebur128_summary(SUMMARY) == {
+            "integrated": -23.4,
+            "true_peak": -4.2,
+        }
+        assert parse_ebur128_summary("no summary here") is None
+
+    def test_summary_wins_over_frame_lines(self):
+        """Test per-frame log lines before the summary are ignored"""
+        frames = "t: 0.1 M: -30.0 S: -30.0 I: -40.0 LUFS LRA: 0.0 LU\n"
+        assert parse_ebur128_summary(frames + SUMMARY)["integrated"] == -23.4
+
+    def test_gain_to_target(self):
+        """Test the gain moves the file to the target loudness"""
+        assert compute_gain_db({"integrated": -20.0, "true_peak": -10.0}, -16.0) == 4.0
+        assert compute_gain_db({"integrated": -10.0, "true_peak": 0.0}, -16.0) == -6.0
+
+    def test_gain_limited_by_true_peak_and_cap(self):
+        """Test boosts stop below the peak ceiling and within ±12 dB"""
+        assert compute_gain_db({"integrated": -23.4, "true_peak": -4.2}, -16.0) == 3.2
+        assert compute_gain_db({"integrated": -60.0, "true_peak": -40.0}, -16.0) == 12.0
+        assert compute_gain_db({"integrated": float("-inf")}, -16.0) == 0.0
+        assert compute_gain_db(None) == 0.0
+
+
+class TestLoudnessAnalyzer:
+    """Test suite for LoudnessAnalyzer manifest storage"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        reciter_dir = self.temp_dir / "audio" / "Test Reciter"
+        reciter_dir.mkdir(parents=True)
+        for i in range(1, 4):
+            (reciter_dir / f"{i:03d}.mp3").write_bytes(f"audio {i}".encode())
+
+        self.ffmpeg = self.temp_dir / "ffmpeg"
+        self.ffmpeg.write_text(
+            FAKE_FFMPEG.format(python=sys.executable, summary=SUMMARY)
+        )
+        self.ffmpeg.chmod(self.ffmpeg.stat().st_mode | stat.S_IEXEC)
+
+        with patch("utils.audio_library.MP3", side_effect=Exception("not mp3")):
+            self.library = AudioLibrary(
+                str(self.temp_dir / "audio"), str(self.temp_dir / "audio_library.json")
+            )
+            self.library.refresh()
+        self.files = self.library.get_files("Test Reciter")
+        self.analyzer = LoudnessAnalyzer(
+            str(self.ffmpeg), self.library, -16.0, max_workers=2
+        )
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_analysis_stored_in_manifest(self):
+        """Test a process-pool run measures every file and persists the result"""
+        assert self.analyzer.get_gain_db(self.files[0]) == 0.0
+        assert await self.analyzer.analyze_files(self.files) == 3
+        assert self.analyzer.get_gain_db(self.files[0]) == 3.2
+
+        reloaded = AudioLibrary(
+            str(self.temp_dir / "audio"), str(self.temp_dir / "audio_library.json")
+        )
+        reloaded.refresh()
+        assert reloaded.get_entry(self.files[2])["loudness"]["integrated"] == -23.4
+
+        # Already measured files are not analyzed again
+        with patch("utils.loudness.measure_loudness") as measure:
+            assert (
+                await LoudnessAnalyzer(str(self.ffmpeg), reloaded).analyze_files(
+                    self.files
+                )
+                == 3
+            )
+            measure.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_measurement_not_recorded(self):
+        """Test a failing analysis leaves the file unmeasured for a retry"""
+        self.ffmpeg.write_text(f"#!{sys.executable}\nimport sys\nsys.exit(1)\n")
+        assert await self.analyzer.ensure_measured(self.files[0]) is False
+        assert "loudness" not in self.library.get_entry(self.files[0])
+        assert self.analyzer.stats["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_opus_cache_keyed_by_gain(self):
+        """Test the normalization gain is baked into the Opus cache entry"""
+        cache = OpusCache(
+            str(self.ffmpeg),
+            self.library,
+            str(self.temp_dir / "cache"),
+            loudness=self.analyzer,
+        )
+        assert await cache.encode_file(self.files[0], 64)
+
+        path = cache.get_cached_path(self.files[0], 64)
+        assert path.endswith("_64k_+3.2dB.opus")
+
+        # A different target is a different cache entry
+        self.analyzer.target_lufs = -22.0
+        assert cache.get_cached_path(self.files[0], 64) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
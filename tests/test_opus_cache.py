@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Opus Cache Tests
+# =============================================================================
+# Tests for the pre-encoded Opus cache and its fallback behaviour
+# =============================================================================
+
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.audio_library import AudioLibrary
+from utils.opus_cache import OpusCache, hash_file
+
+FAKE_FFMPEG = """#!{python}
+import shutil, sys
+shutil.copy(sys.argv[sys.argv.index("-i") + 1], sys.argv[-1])
+"""
+
+
+class TestOpusCache:
+    """Test suite for OpusCache class"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.audio_dir = self.temp_dir / "audio"
+        reciter_dir = self.audio_dir / "Test Reciter"
+        reciter_dir.mkdir(parents=True)
+        for i in range(1, 3):
+            (reciter_dir / f"{i:03d}.mp3").write_bytes(f"audio {i}".encode())
+
+        # Stand-in encoder that copies input to output
+        self.ffmpeg = self.temp_dir / "ffmpeg"
+        self.ffmpeg.write_text(FAKE_FFMPEG.format(python=sys.executable))
+        self.ffmpeg.chmod(self.ffmpeg.stat().st_mode | stat.S_IEXEC)
+
+        with patch("utils.audio_library.MP3", side_effect=Exception("not mp3")):
+            self.library = AudioLibrary(
+                str(self.audio_dir), str(self.temp_dir / "audio_library.json")
+            )
+            self.library.refresh()
+
+        self.cache = OpusCache(
+            str(self.ffmpeg), self.library, str(self.temp_dir / "cache")
+        )
+        self.files = self.library.get_files("Test Reciter")
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_no_cached_path_before_encoding(self):
+        """Test lookups fall back when nothing has been encoded"""
+        assert self.cache.get_cached_path(self.files[0], 64) is None
+        assert self.cache.get_cached_path("missing.mp3", 64) is None
+
+    @pytest.mark.asyncio
+    async def test_encode_keyed_by_source_hash(self):
+        """Test encoded files are stored under the source hash and bitrate"""
+        cached = await self.cache.encode_files(self.files, 64)
+        assert cached == 2
+
+        expected_hash = hash_file(self.files[0])
+        path = self.cache.get_cached_path(self.files[0], 64)
+        assert path == str(self.temp_dir / "cache" / f"{expected_hash}_64k.opus")
+        assert Path(path).read_bytes() == b"audio 1"
+
+        # Other bitrates are separate cache entries
+        assert self.cache.get_cached_path(self.files[0], 96) is None
+
+        # Hash is recorded in the manifest so it is never recomputed
+        assert self.library.get_entry(self.files[0])["sha1"] == expected_hash
+
+    @pytest.mark.asyncio
+    async def test_manifest_saved_once_per_run(self):
+        """Test new hashes are saved in one write after the run, off the loop"""
+        with patch.object(self.library, "save") as save:
+            await self.cache.encode_files(self.files, 64)
+        save.assert_not_called()
+
+        reloaded = AudioLibrary(
+            str(self.audio_dir), str(self.temp_dir / "audio_library.json")
+        )
+        reloaded.load()
+        assert reloaded.get_entry(self.files[1])["sha1"] == hash_file(self.files[1])
+
+    @pytest.mark.asyncio
+    async def test_already_cached_files_skipped(self):
+        """Test a second pre-encode pass does not re-run the encoder"""
+        await self.cache.encode_files(self.files, 64)
+        with patch("utils.opus_cache.asyncio.create_subprocess_exec") as spawn:
+            assert await self.cache.encode_files(self.files, 64) == 2
+            spawn.assert_not_called()
+        assert self.cache.stats["skipped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_encode_leaves_no_cache_entry(self):
+        """Test a failing encoder does not produce a playable file"""
+        self.ffmpeg.write_text(f"#!{sys.executable}\nimport sys\nsys.exit(1)\n")
+        assert await self.cache.encode_file(self.files[0], 64) is False
+        assert self.cache.get_cached_path(self.files[0], 64) is None
+        assert self.cache.stats["failed"] == 1
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Play Queue Tests
+# =============================================================================
+# Tests for the user play queue, history, repeat mode and delta persistence
+# =============================================================================
+
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.play_queue import COMPACT_AFTER_DELTAS, REPEAT_ALL, REPEAT_ONE, PlayQueue
+
+
+class TestPlayQueue:
+    """Test suite for PlayQueue"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.queue = PlayQueue(history_size=3)
+
+    def test_push_play_next_and_pop(self):
+        """Test end-of-queue and play-next insertion order"""
+        assert self.queue.pop() is None
+        self.queue.push(36)
+        self.queue.push(67)
+        self.queue.push_next(18)
+
+        assert self.queue.get_upcoming() == [18, 36, 67]
+        assert self.queue.peek() == 18
+        assert self.queue.pop() == 18
+        assert len(self.queue) == 2
+        assert self.queue.clear() == 2
+        assert not self.queue
+
+    def test_history_is_bounded_newest_first(self):
+        """Test the history keeps the most recent plays"""
+        for surah in (1, 2, 3, 4):
+            self.queue.record_played(surah)
+        assert self.queue.get_history() == [4, 3, 2]
+        assert self.queue.get_history(1) == [4]
+
+    def test_deltas_replay_to_the_same_state(self):
+        """Test a snapshot plus drained deltas rebuild the queue"""
+        self.queue.push(2)
+        snapshot = self.queue.to_dict()
+        self.queue.drain_deltas()
+        self.queue.mark_snapshot()
+
+        self.queue.push(3)
+        self.queue.push_next(1)
+        self.queue.pop()
+        self.queue.record_played(1)
+        self.queue.set_repeat(REPEAT_ONE)
+        deltas = self.queue.drain_deltas()
+        assert deltas == [
+            ["push", 3],
+            ["next", 1],
+            ["pop"],
+            ["played", 1],
+            ["repeat", "one"],
+        ]
+
+        restored = PlayQueue(history_size=3)
+        assert restored.restore(snapshot, deltas + [["unknown"]]) == 6
+        assert restored.to_dict() == self.queue.to_dict()
+        assert restored.repeat == REPEAT_ONE
+
+    def test_compaction_threshold(self):
+        """Test compaction is requested after enough deltas"""
+        for _ in range(COMPACT_AFTER_DELTAS):
+            self.queue.record_played(1)
+        self.queue.drain_deltas()
+        assert self.queue.needs_compaction()
+
+        self.queue.mark_snapshot()
+        assert not self.queue.needs_compaction()
+        assert self.queue.repeat == REPEAT_ALL
+        self.queue.set_repeat(REPEAT_ALL)
+        assert self.queue.drain_deltas() == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
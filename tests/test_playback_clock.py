@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Playback Clock Tests
+# =============================================================================
+# Tests for monotonic position tracking with pauses and seeks
+# =============================================================================
+
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.playback_clock import PlaybackClock
+
+
+class FakeMonotonic:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPlaybackClock:
+    """Test suite for PlaybackClock"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.time = FakeMonotonic()
+        self.clock = PlaybackClock(self.time)
+
+    def test_stopped_clock_holds_position(self):
+        """Test a stopped clock reports its resume point without advancing"""
+        self.clock.seek(42.0)
+        self.time.now += 10
+        assert self.clock.position() == 42.0
+        assert not self.clock.is_running
+        assert not self.clock.is_active
+
+    def test_start_runs_from_held_position(self):
+        """Test starting continues from the held (resume) position"""
+        self.clock.seek(30.0)
+        self.clock.start()
+        self.time.now += 5
+        assert self.clock.position() == 35.0
+
+        self.clock.start(0.0)
+        self.time.now += 2
+        assert self.clock.position() == 2.0
+
+    def test_pause_excludes_paused_time(self):
+        """Test time spent paused does not advance the position"""
+        self.clock.start()
+        self.time.now += 10
+        self.clock.pause()
+        self.time.now += 300
+        assert self.clock.position() == 10.0
+        assert self.clock.is_active and not self.clock.is_running
+
+        self.clock.resume()
+        self.time.now += 5
+        assert self.clock.position() == 15.0
+
+    def test_seek_keeps_state(self):
+        """Test seeking repositions without starting or stopping the clock"""
+        self.clock.start()
+        self.time.now += 10
+        self.clock.seek(100.0)
+        self.time.now += 1
+        assert self.clock.position() == 101.0
+
+        self.clock.pause()
+        self.clock.seek(50.0)
+        self.time.now += 20
+        assert self.clock.position() == 50.0
+
+    def test_stop_unloads_track(self):
+        """Test stop holds a position and resume does not restart the clock"""
+        self.clock.start()
+        self.time.now += 10
+        self.clock.stop(self.clock.position())
+        self.clock.resume()
+        self.time.now += 10
+        assert self.clock.position() == 10.0
+        assert not self.clock.is_active
+
+        self.clock.stop()
+        assert self.clock.position() == 0.0
+
+    def test_uses_monotonic_time(self):
+        """Test the default clock source is time.monotonic"""
+        clock = PlaybackClock()
+        clock.start(5.0)
+        assert 5.0 <= clock.position() < 6.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Playback Command Queue Tests
+# =============================================================================
+# Tests for debouncing and folding control-panel navigation
+# =============================================================================
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.playback_commands import (
+    COMMAND_JUMP,
+    COMMAND_NEXT,
+    COMMAND_PREVIOUS,
+    COMMAND_RECITER,
+    PlaybackCommandQueue,
+    coalesce,
+)
+
+
+class TestPlaybackCommands:
+    """Test suite for PlaybackCommandQueue and coalesce"""
+
+    def test_skips_add_up_and_jump_resets_them(self):
+        """Test relative skips fold into net steps after the last jump"""
+        commands = [(COMMAND_NEXT, None, 0.0)] * 3 + [(COMMAND_PREVIOUS, None, 0.0)]
+        assert coalesce(commands) == {"surah": None, "steps": 2, "reciter": None}
+
+        commands = [
+            (COMMAND_NEXT, None, 0.0),
+            (COMMAND_JUMP, 36, 0.0),
+            (COMMAND_NEXT, None, 0.0),
+            (COMMAND_RECITER, {"to": "A"}, 0.0),
+            (COMMAND_RECITER, {"to": "B"}, 0.0),
+        ]
+        assert coalesce(commands) == {"surah": 36, "steps": 1, "reciter": {"to": "B"}}
+
+    @pytest.mark.asyncio
+    async def test_batch_waits_for_clicks_to_stop(self):
+        """Test a click inside the window extends it and joins the batch"""
+        queue = PlaybackCommandQueue(coalesce_seconds=0.05)
+        queue.submit(COMMAND_NEXT)
+
+        async def click_again():
+            await asyncio.sleep(0.03)
+            queue.submit(COMMAND_NEXT)
+
+        clicker = asyncio.create_task(click_again())
+        batch = await queue.take_batch()
+        await clicker
+
+        assert [kind for kind, _, _ in batch] == [COMMAND_NEXT, COMMAND_NEXT]
+        assert len(queue) == 0
+        assert queue.get_stats() == {
+            "depth": 0,
+            "submitted": 2,
+            "batches": 1,
+            "coalesced": 1,
+            "max_depth": 2,
+        }
+
+    @pytest.mark.asyncio
+    async def test_batch_wait_is_capped(self):
+        """Test continuous clicking cannot hold the batch past the cap"""
+        queue = PlaybackCommandQueue(coalesce_seconds=0.05, max_wait_seconds=0.1)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        async def keep_clicking():
+            while True:
+                await asyncio.sleep(0.02)
+                queue.submit(COMMAND_NEXT)
+
+        queue.submit(COMMAND_NEXT)
+
+        clicker = asyncio.create_task(keep_clicking())
+        try:
+            batch = await queue.take_batch()
+        finally:
+            clicker.cancel()
+
+        assert loop.time() - started < 0.2
+        assert len(batch) >= 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Playback Journal Tests
+# =============================================================================
+# Tests for journal appends, tail recovery and compaction
+# =============================================================================
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.playback_journal import (
+    EVENT_PAUSE,
+    EVENT_SEEK,
+    EVENT_START,
+    EVENT_TICK,
+    RECORD_SIZE,
+    PlaybackJournal,
+    reciter_id,
+)
+
+
+class TestPlaybackJournal:
+    """Test suite for PlaybackJournal"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.path = self.temp_dir / "playback_journal.bin"
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_replay_returns_last_event(self):
+        """Test a reopened journal resumes from the last record"""
+        journal = PlaybackJournal(self.path)
+        assert journal.replay() is None
+
+        journal.append(EVENT_START, 18, 0.0, "Saad Al Ghamdi", True)
+        journal.append(EVENT_SEEK, 18, 120.0, "Saad Al Ghamdi", True)
+        journal.append(EVENT_TICK, 18, 121.0, "Saad Al Ghamdi", True)
+        journal.append(EVENT_PAUSE, 18, 121.4, "Saad Al Ghamdi", False)
+        journal.close()
+        assert self.path.stat().st_size == 4 * RECORD_SIZE
+
+        tail = PlaybackJournal(self.path).replay()
+        assert tail["surah"] == 18
+        assert tail["position"] == pytest.approx(121.4)
+        assert tail["is_playing"] is False
+        assert tail["reciter_id"] == reciter_id("Saad Al Ghamdi")
+
+    def test_torn_tail_is_cut_before_appending(self):
+        """Test a partial last record is dropped and appends stay aligned"""
+        journal = PlaybackJournal(self.path)
+        journal.append(EVENT_START, 2, 0.0, "Saad Al Ghamdi", True)
+        journal.append(EVENT_TICK, 2, 30.0, "Saad Al Ghamdi", True)
+        journal.close()
+
+        # Crash halfway through writing a record, then corrupt the one before
+        with open(self.path, "ab") as f:
+            f.write(b"\x06\x01" + b"\x00" * 10)
+        data = bytearray(self.path.read_bytes())
+        data[RECORD_SIZE + 8] ^= 0xFF
+        self.path.write_bytes(bytes(data))
+
+        journal = PlaybackJournal(self.path)
+        assert journal.replay()["position"] == 0.0
+        assert self.path.stat().st_size == RECORD_SIZE
+
+        journal.append(EVENT_TICK, 2, 31.0, "Saad Al Ghamdi", True)
+        journal.close()
+        assert PlaybackJournal(self.path).replay()["position"] == 31.0
+
+    def test_compaction_keeps_latest_state(self):
+        """Test the journal shrinks to one snapshot record"""
+        journal = PlaybackJournal(self.path, compact_after=10)
+        for second in range(25):
+            journal.append(EVENT_TICK, 36, float(second), "Saad Al Ghamdi", True)
+        journal.close()
+
+        assert journal.stats["compactions"] == 2
+        assert self.path.stat().st_size == 7 * RECORD_SIZE  # Snapshot + 6 ticks
+        assert not self.path.with_suffix(".tmp").exists()
+
+        tail = PlaybackJournal(self.path).replay()
+        assert tail["surah"] == 36
+        assert tail["position"] == 24.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Playback Timeline Tests
+# =============================================================================
+# Tests for projected surah start times
+# =============================================================================
+
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.playback_timeline import PlaybackTimeline, format_eta
+
+
+class TestPlaybackTimeline:
+    """Test suite for PlaybackTimeline"""
+
+    def test_prefix_sums_give_start_times(self):
+        """Test each start is the sum of the durations before it"""
+        timeline = PlaybackTimeline([2, 3, 4], [600.0, 300.0, 120.0])
+
+        assert list(timeline.starts) == [0.0, 600.0, 900.0, 1020.0]
+        assert timeline.start_of(2) == 0.0
+        assert timeline.start_of(4, remaining=50.0) == 950.0
+        assert timeline.start_of(5) is None
+        assert timeline.total_seconds() == 1020.0
+        assert timeline.is_exact
+
+    def test_entries_and_status_view(self):
+        """Test listing starts from now and the status summary"""
+        timeline = PlaybackTimeline([7, 8, 7], [10.0, 0.0, 10.0])
+
+        assert timeline.entries(5.0, limit=2) == [(7, 5.0, 10.0), (8, 15.0, 0.0)]
+        assert timeline.start_of(7) == 0.0  # First occurrence
+        assert not timeline.is_exact
+        assert timeline.to_dict(5.0, limit=1) == {
+            "upcoming": [{"surah": 7, "starts_in": 5.0}],
+            "is_exact": False,
+        }
+
+    def test_format_eta(self):
+        """Test short relative time labels"""
+        assert format_eta(30) == "in <1m"
+        assert format_eta(12 * 60 + 59) == "in 12m"
+        assert format_eta(2 * 3600 + 5 * 60) == "in 2h 05m"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
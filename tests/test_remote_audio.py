@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Remote Audio Cache Tests
+# =============================================================================
+# Tests for the HTTP origin cache against a local aiohttp stand-in origin
+# =============================================================================
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.audio_library import AudioLibrary
+from utils.remote_audio import RemoteAudioCache
+
+FILE_SIZE = 100_000
+RECITER = "Remote Reciter"
+
+
+def file_bytes(surah):
+    return bytes([surah]) * FILE_SIZE
+
+
+class TestRemoteAudioCache:
+    """Test suite for RemoteAudioCache"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache_dir = str(self.temp_dir / "remote")
+        self.release = asyncio.Event()
+        self.requests = []
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    async def start_origin(self):
+        """Serve a manifest and three surahs; 003 pauses halfway until released"""
+
+        async def manifest(request):
+            return web.json_response(
+                {
+                    "version": 1,
+                    "reciters": {
+                        RECITER: {
+                            "files": {
+                                f"{i:03d}.mp3": {
+                                    "surah": i,
+                                    "size": FILE_SIZE,
+                                    "mtime": 1.0,
+                                    "duration": 60.0 * i,
+                                }
+                                for i in range(1, 4)
+                            }
+                        }
+                    },
+                }
+            )
+
+        async def audio(request):
+            self.requests.append(request.match_info["name"])
+            surah = int(request.match_info["name"][:3])
+            if request.match_info["reciter"] != RECITER or surah > 3:
+                raise web.HTTPNotFound()
+
+            data = file_bytes(surah)
+            response = web.StreamResponse()
+            response.content_length = len(data)
+            await response.prepare(request)
+            if surah == 3:
+                await response.write(data[: FILE_SIZE // 2])
+                await self.release.wait()
+                await response.write(data[FILE_SIZE // 2 :])
+            else:
+                await response.write(data)
+            await response.write_eof()
+            return response
+
+        app = web.Application()
+        app.router.add_get("/audio_library.json", manifest)
+        app.router.add_get("/{reciter}/{name}", audio)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def make_cache(self, **kwargs):
+        origin = await self.start_origin()
+        cache = RemoteAudioCache(origin, self.cache_dir, **kwargs)
+        return cache
+
+    async def stop(self, cache):
+        self.release.set()
+        await cache.close()
+        await self.runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_manifest_merged_into_library(self):
+        """Test remote reciters appear in the library with cache paths"""
+        cache = await self.make_cache()
+        try:
+            library = AudioLibrary(
+                str(self.temp_dir / "audio"), str(self.temp_dir / "library.json")
+            )
+            library.refresh()
+            manifest = await cache.fetch_manifest()
+            assert library.merge_remote(manifest["reciters"], cache.cache_dir) == [
+                RECITER
+            ]
+
+            files = library.get_files(RECITER)
+            assert files == [
+                cache.local_path(RECITER, f"{i:03d}.mp3") for i in (1, 2, 3)
+            ]
+            assert all(cache.owns(path) for path in files)
+            assert library.get_duration(files[1]) == 120.0
+            assert library.is_remote(RECITER)
+
+            # A refresh of the (empty) local folder keeps remote reciters
+            library.refresh()
+            assert library.get_reciters() == [RECITER]
+        finally:
+            await self.stop(cache)
+
+    @pytest.mark.asyncio
+    async def test_stream_while_downloading(self):
+        """Test a partial download can be read before it completes"""
+        cache = await self.make_cache()
+        try:
+            path = cache.local_path(RECITER, "003.mp3")
+            reader = cache.open_stream(path)
+            assert reader is not None
+
+            received = b""
+            while len(received) < FILE_SIZE // 2:
+                received += await asyncio.to_thread(reader.read, 8192)
+            assert not os.path.exists(path)  # Still only the .part file
+
+            self.release.set()
+            while True:
+                chunk = await asyncio.to_thread(reader.read, 8192)
+                if not chunk:
+                    break
+                received += chunk
+
+            assert received == file_bytes(3)
+            await asyncio.sleep(0.05)
+            assert cache.is_cached(path)
+            assert Path(path).read_bytes() == file_bytes(3)
+            assert cache.open_stream(path) is None  # Complete files play directly
+            assert cache.get_stats()["hits"] == 1
+        finally:
+            await self.stop(cache)
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_within_budget(self):
+        """Test the least recently used unprotected file is evicted"""
+        cache = await self.make_cache(max_bytes=int(FILE_SIZE * 2.5))
+        await cache.fetch_manifest()
+        self.release.set()
+        try:
+            first, second, third = (
+                cache.local_path(RECITER, f"{i:03d}.mp3") for i in (1, 2, 3)
+            )
+            assert await cache.fetch(first)
+            assert await cache.fetch(second)
+            cache.touch(first)
+
+            assert await cache.fetch(third)
+            assert cache.is_cached(first) and cache.is_cached(third)
+            assert not cache.is_cached(second) and not os.path.exists(second)
+            assert cache.used_bytes <= cache.max_bytes
+
+            # Protected (playing/upcoming) files survive even when least recent
+            cache._protected = {first}
+            assert await cache.fetch(second)
+            assert cache.is_cached(first) and not cache.is_cached(third)
+
+            # A restart picks up the cache contents in LRU order
+            reopened = RemoteAudioCache(cache.origin_url, self.cache_dir)
+            assert set(reopened._lru) == {first, second}
+        finally:
+            await self.stop(cache)
+
+    @pytest.mark.asyncio
+    async def test_prefetch_next_surahs(self):
+        """Test prefetch downloads the current and next N files"""
+        cache = await self.make_cache(prefetch_count=1)
+        self.release.set()
+        try:
+            paths = [cache.local_path(RECITER, f"{i:03d}.mp3") for i in (1, 2, 3)]
+            cache.prefetch(paths)
+            await cache.prefetch_task
+
+            assert cache.is_cached(paths[0]) and cache.is_cached(paths[1])
+            assert not cache.is_cached(paths[2])
+            assert sorted(self.requests) == ["001.mp3", "002.mp3"]
+        finally:
+            await self.stop(cache)
+
+    @pytest.mark.asyncio
+    async def test_failed_download_leaves_nothing(self):
+        """Test an origin error leaves no partial file behind"""
+        cache = await self.make_cache()
+        try:
+            path = cache.local_path(RECITER, "004.mp3")
+            assert not await cache.fetch(path)
+            assert not os.path.exists(path)
+            assert not os.path.exists(path + ".part")
+        finally:
+            await self.stop(cache)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Seek Index Tests
+# =============================================================================
+# Tests for MP3 frame walking and the persisted seek index
+# =============================================================================
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.audio_library import AudioLibrary
+from utils.seek_index import (
+    SeekIndex,
+    build_seek_index,
+    find_seek_point,
+    parse_frame_header,
+)
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz: 417/418 bytes and 1152 samples per frame
+HEADER = b"\xff\xfb\x90\x00"
+PADDED_HEADER = b"\xff\xfb\x92\x00"
+FRAME_SECONDS = 1152 / 44100
+
+
+def make_frames(count, padded_every=0):
+    """Build a run of silent MP3 frames"""
+    frames = bytearray()
+    for i in range(count):
+        if padded_every and i % padded_every == 0:
+            frames += PADDED_HEADER + bytes(414)
+        else:
+            frames += HEADER + bytes(413)
+    return bytes(frames)
+
+
+def id3v2_tag(payload_size):
+    """Build an ID3v2 tag header with a syncsafe size"""
+    size = bytes((payload_size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+    return b"ID3\x04\x00\x00" + size + bytes(payload_size)
+
+
+class TestFrameParsing:
+    """Test suite for MPEG frame header parsing"""
+
+    def test_layer3_header(self):
+        """Test frame length and duration for common MPEG-1 Layer III headers"""
+        assert parse_frame_header(int.from_bytes(HEADER, "big")) == (417, 1152, 44100)
+        assert parse_frame_header(int.from_bytes(PADDED_HEADER, "big")) == (
+            418,
+            1152,
+            44100,
+        )
+
+    def test_mpeg2_layer3_header(self):
+        """Test MPEG-2 Layer III frames use 576 samples"""
+        # MPEG-2, Layer III, 64 kbps, 22.05 kHz
+        assert parse_frame_header(0xFFF38000) == (208, 576, 22050)
+
+    def test_invalid_headers(self):
+        """Test sync, reserved and free-format values are rejected"""
+        assert parse_frame_header(0) is None
+        assert parse_frame_header(0xFFFB0000) is None  # free format
+        assert parse_frame_header(0xFFFBF000) is None  # bad bitrate
+        assert parse_frame_header(0xFFFB9C00) is None  # reserved sample rate
+
+
+class TestBuildSeekIndex:
+    """Test suite for building seek indexes from MP3 files"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, data):
+        path = self.temp_dir / "001.mp3"
+        path.write_bytes(data)
+        return str(path)
+
+    def test_samples_frame_offsets(self):
+        """Test samples land on frame boundaries every interval"""
+        path = self.write(make_frames(200))
+        index = build_seek_index(path, interval=1.0)
+
+        assert index["offsets"][0] == 0
+        assert all(offset % 417 == 0 for offset in index["offsets"])
+        assert len(index["offsets"]) == 6  # 200 frames ≈ 5.22s
+        assert index["duration"] == pytest.approx(200 * FRAME_SECONDS, abs=0.001)
+
+        # Each sample is the first frame at or after its mark
+        for k, time_ms in enumerate(index["times_ms"]):
+            assert k * 1000 <= time_ms < k * 1000 + FRAME_SECONDS * 1000 + 1
+
+    def test_id3_tag_and_padding(self):
+        """Test ID3v2 tags are skipped and padded frames are followed"""
+        tag = id3v2_tag(300)
+        frames = make_frames(100, padded_every=3)
+        path = self.write(tag + frames)
+        index = build_seek_index(path, interval=1.0)
+
+        assert index["offsets"][0] == len(tag)
+        assert index["duration"] == pytest.approx(100 * FRAME_SECONDS, abs=0.001)
+
+    def test_vbr_header_frame_not_timed(self):
+        """Test a leading Xing frame is skipped rather than counted as audio"""
+        xing = HEADER + bytes(32) + b"Xing" + bytes(377)
+        path = self.write(xing + make_frames(50))
+        index = build_seek_index(path, interval=1.0)
+
+        assert index["offsets"][0] == 417
+        assert index["duration"] == pytest.approx(50 * FRAME_SECONDS, abs=0.001)
+
+    def test_resyncs_over_junk(self):
+        """Test junk between frames is skipped"""
+        path = self.write(make_frames(40) + b"\x00\xff\x01junk" + make_frames(40))
+        index = build_seek_index(path, interval=0.5)
+        assert index["duration"] == pytest.approx(80 * FRAME_SECONDS, abs=0.001)
+
+    def test_non_mp3_returns_none(self):
+        """Test files without frames produce no index"""
+        assert build_seek_index(self.write(b"not audio at all")) is None
+
+    def test_find_seek_point(self):
+        """Test lookups return the preceding sample and the remaining offset"""
+        index = {"times_ms": [0, 10005, 20010], "offsets": [0, 5000, 9000]}
+        assert find_seek_point(index, 0) == (0, 0.0)
+        assert find_seek_point(index, 15.0) == (5000, pytest.approx(4.995))
+        assert find_seek_point(index, 25.0) == (9000, pytest.approx(4.99))
+
+
+class TestSeekIndex:
+    """Test suite for SeekIndex manifest storage"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        reciter_dir = self.temp_dir / "audio" / "Test Reciter"
+        reciter_dir.mkdir(parents=True)
+        (reciter_dir / "001.mp3").write_bytes(make_frames(1000))
+
+        with patch("utils.audio_library.MP3", side_effect=Exception("no mutagen")):
+            self.library = AudioLibrary(
+                str(self.temp_dir / "audio"), str(self.temp_dir / "audio_library.json")
+            )
+            self.library.refresh()
+        self.file_path = self.library.get_files("Test Reciter")[0]
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_index_built_once_and_persisted(self):
+        """Test an index is stored in the manifest and reused after reload"""
+        seek_index = SeekIndex(self.library)
+        assert seek_index.get_seek_point(self.file_path, 12.0) is None
+
+        assert await seek_index.ensure_index(self.file_path)
+        offset, residual = seek_index.get_seek_point(self.file_path, 12.0)
+        assert offset % 417 == 0
+        assert 0 <= residual < 2.1
+
+        reloaded = AudioLibrary(
+            str(self.temp_dir / "audio"), str(self.temp_dir / "audio_library.json")
+        )
+        reloaded.refresh()
+        with patch("utils.seek_index.build_seek_index") as build:
+            assert await SeekIndex(reloaded).ensure_index(self.file_path)
+            build.assert_not_called()
+        assert SeekIndex(reloaded).get_seek_point(self.file_path, 12.0) == (
+            offset,
+            residual,
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
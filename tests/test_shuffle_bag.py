@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Shuffle Bag Tests
+# =============================================================================
+# Tests for the no-repeat shuffle order and its history
+# =============================================================================
+
+import os
+import random
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.shuffle_bag import ShuffleBag
+
+
+class TestShuffleBag:
+    """Test suite for ShuffleBag ordering and history"""
+
+    def setup_method(self):
+        """Set up test environment"""
+        self.bag = ShuffleBag(random.Random(1234))
+        self.bag.reset(10, "sig", current=4)
+
+    def test_reset_starts_with_current(self):
+        """Test a new bag starts at the file already playing"""
+        assert self.bag.current() == 4
+        assert sorted(self.bag.order) == list(range(10))
+
+    def test_every_file_once_per_cycle(self):
+        """Test each cycle covers the whole library without repeats"""
+        played = [self.bag.current()] + [self.bag.next() for _ in range(29)]
+        for start in range(0, 30, 10):
+            assert sorted(played[start : start + 10]) == list(range(10))
+
+    def test_no_back_to_back_repeat_across_cycles(self):
+        """Test the first file of a cycle differs from the last of the previous"""
+        played = [self.bag.current()] + [self.bag.next() for _ in range(500)]
+        assert all(a != b for a, b in zip(played, played[1:]))
+
+    def test_peek_is_stable_until_played(self):
+        """Test the planned next file does not change between peeks"""
+        for _ in range(25):
+            planned = self.bag.peek_next()
+            assert self.bag.peek_next() == planned
+            assert self.bag.next() == planned
+
+    def test_previous_walks_history(self):
+        """Test previous returns files in reverse play order, then replays forward"""
+        played = [self.bag.current()] + [self.bag.next() for _ in range(14)]
+
+        backwards = [self.bag.previous() for _ in range(5)]
+        assert backwards == played[-2:-7:-1]
+
+        assert [self.bag.next() for _ in range(5)] == played[-5:]
+
+    def test_previous_at_start_returns_none(self):
+        """Test there is no history before the first file"""
+        assert self.bag.previous() is None
+        assert self.bag.current() == 4
+
+    def test_history_is_bounded(self):
+        """Test old cycles are trimmed as new ones are appended"""
+        for _ in range(1000):
+            self.bag.next()
+        assert len(self.bag.order) <= 20
+
+    def test_sync_records_manual_jump(self):
+        """Test jumping to a file keeps coverage and becomes part of history"""
+        upcoming = self.bag.order[5]
+        assert self.bag.sync(upcoming)
+        assert self.bag.current() == upcoming
+        assert sorted(self.bag.order[:10]) == list(range(10))
+        assert self.bag.previous() == 4
+
+        assert not self.bag.sync(4)
+
+    def test_sync_already_played_file(self):
+        """Test jumping back to a played file inserts it as an extra play"""
+        first = self.bag.current()
+        self.bag.next()
+        self.bag.next()
+        assert self.bag.sync(first)
+        assert self.bag.current() == first
+        assert len(self.bag.order) == 11
+
+    def test_restore_requires_matching_library(self):
+        """Test a saved bag is only reused for the same file list"""
+        for _ in range(3):
+            self.bag.next()
+        data = self.bag.to_dict()
+
+        restored = ShuffleBag()
+        assert restored.restore(data, 10, "sig")
+        assert restored.current() == self.bag.current()
+        assert restored.peek_next() == self.bag.peek_next()
+
+        assert not ShuffleBag().restore(data, 10, "other")
+        assert not ShuffleBag().restore(data, 11, "sig")
+        assert not ShuffleBag().restore(dict(data, order=[0, 99]), 10, "sig")
+        assert not ShuffleBag().restore(None, 10, "sig")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
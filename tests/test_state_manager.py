@@ -5,10 +5,12 @@
 # Comprehensive tests for state persistence and data protection
 # =============================================================================
 
+import asyncio
 import json
 import os
 import shutil
 import sys
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -219,6 +221,168 @@ class TestStateManager:
         assert info["duration"] == self.test_duration
         assert info["should_resume"] is True
 
+    def test_shuffle_bag_save_load(self):
+        """Test shuffle bag persistence"""
+        assert self.manager.load_shuffle_bag() is None
+
+        bag = {"signature": "abc", "size": 3, "order": [2, 0, 1], "position": 1}
+        assert self.manager.save_shuffle_bag(bag) is True
+        assert self.manager.load_shuffle_bag() == bag
+
+        self.manager.shuffle_bag_file.write_text("[1, 2]", encoding="utf-8")
+        assert self.manager.load_shuffle_bag() is None
+
+    def test_play_queue_deltas_save_load(self):
+        """Test play queue changes are appended and compacted into a snapshot"""
+        self.manager.play_queue_file = self.data_dir / "play_queue.json"
+        self.manager.play_queue_log_file = self.data_dir / "play_queue.log"
+        assert self.manager.load_play_queue() == (None, [])
+
+        assert self.manager.append_play_queue_deltas([["push", 36], ["next", 18]])
+        assert self.manager.append_play_queue_deltas([["pop"]])
+        with open(self.manager.play_queue_log_file, "a", encoding="utf-8") as f:
+            f.write('["push", 6')  # Torn write
+        assert self.manager.load_play_queue() == (
+            None,
+            [["push", 36], ["next", 18], ["pop"]],
+        )
+
+        snapshot = {"upcoming": [36], "history": [18], "repeat": "all"}
+        assert self.manager.save_play_queue_snapshot(snapshot)
+        assert self.manager.load_play_queue() == (snapshot, [])
+
+    @pytest.mark.asyncio
+    async def test_playback_state_write_behind(self):
+        """Test saves on the event loop are coalesced into one atomic write"""
+        self.manager.playback_state_file = self.data_dir / "playback_state.json"
+        self.manager.flush_interval = 0.2
+        self.manager._last_flush_at = time.monotonic()
+
+        for position in (10.0, 20.0, 30.0):
+            assert self.manager.save_playback_state(
+                current_surah=self.test_surah,
+                current_position=position,
+                current_reciter=self.test_reciter,
+            )
+        assert not self.manager.playback_state_file.exists()
+        assert self.manager.get_write_stats()["dirty"] is True
+
+        await asyncio.sleep(0.4)
+        stats = self.manager.get_write_stats()
+        assert stats["writes"] == 1
+        assert stats["coalesced"] == 2
+        assert stats["dirty"] is False
+        assert not self.manager.playback_state_file.with_suffix(".tmp").exists()
+        with open(self.manager.playback_state_file, encoding="utf-8") as f:
+            assert json.load(f)["current_position"] == 30.0
+
+        # Unchanged saves are not written again
+        self.manager.save_playback_state(
+            current_surah=self.test_surah,
+            current_position=30.0,
+            current_reciter=self.test_reciter,
+        )
+        assert self.manager.get_write_stats()["unchanged_skipped"] == 1
+
+        # Shutdown writes whatever is still pending
+        self.manager.save_playback_state(
+            current_surah=self.test_surah,
+            current_position=40.0,
+            current_reciter=self.test_reciter,
+        )
+        self.manager.mark_shutdown()
+        assert self.manager.load_playback_state()["current_position"] == 40.0
+        assert self.manager.get_write_stats()["writes"] == 2
+
+    def test_playback_journal_overrides_older_state(self):
+        """Test a newer journaled position wins over playback_state.json"""
+        from utils.playback_journal import EVENT_TICK, PlaybackJournal
+
+        self.manager.playback_state_file = self.data_dir / "playback_state.json"
+        self.manager.playback_journal = PlaybackJournal(
+            self.data_dir / "playback_journal.bin"
+        )
+        self.manager.save_playback_state(
+            current_surah=self.test_surah,
+            current_position=self.test_position,
+            current_reciter=self.test_reciter,
+        )
+
+        # Ticks after the last full save, then a crash (no final save)
+        for position in (31.0, 32.0, 33.5):
+            self.manager.record_playback_event(
+                EVENT_TICK, self.test_surah, position, self.test_reciter, True
+            )
+        self.manager.playback_journal = PlaybackJournal(
+            self.data_dir / "playback_journal.bin"
+        )
+
+        state = self.manager.load_playback_state()
+        assert state["current_surah"] == self.test_surah
+        assert state["current_position"] == 33.5
+        assert self.manager.get_resume_info()["position"] == 33.5
+
+    def test_playback_state_read_from_memory(self):
+        """Test the file is read once and later reads come from memory"""
+        from utils.playback_journal import EVENT_PAUSE, PlaybackJournal
+
+        self.manager.playback_state_file = self.data_dir / "playback_state.json"
+        self.manager.playback_journal = PlaybackJournal(
+            self.data_dir / "playback_journal.bin"
+        )
+        assert self.manager.load_playback_state()["current_surah"] == 1
+
+        self.manager.save_playback_state(
+            current_surah=self.test_surah,
+            current_position=self.test_position,
+            current_reciter=self.test_reciter,
+            is_playing=True,
+        )
+        version = self.manager.get_read_stats()["version"]
+        self.manager.record_playback_event(
+            EVENT_PAUSE, self.test_surah, 42.0, self.test_reciter, False
+        )
+
+        for _ in range(3):
+            state = self.manager.load_playback_state()
+            assert state["current_position"] == 42.0
+            assert state["is_playing"] is False
+        state["current_surah"] = 99  # Callers get a copy
+        assert self.manager.get_resume_info()["surah"] == self.test_surah
+
+        stats = self.manager.get_read_stats()
+        assert stats["disk_reads"] == 1
+        assert stats["cached_reads"] == 4
+        assert stats["version"] == version + 1
+
+        # An explicit reload reads the files again and agrees with memory
+        assert self.manager.load_playback_state(reload=True)["current_position"] == 42.0
+        assert self.manager.get_read_stats()["disk_reads"] == 2
+
+    def test_reader_instance_sees_other_instance_saves(self):
+        """Test an instance that never saves re-reads files that changed"""
+        from utils.playback_journal import PlaybackJournal
+
+        self.manager.playback_state_file = self.data_dir / "playback_state.json"
+        self.manager.playback_journal = PlaybackJournal(
+            self.data_dir / "playback_journal.bin"
+        )
+        reader = StateManager(data_dir=self.data_dir)
+        reader.playback_state_file = self.manager.playback_state_file
+        reader.playback_journal = PlaybackJournal(
+            self.data_dir / "playback_journal.bin"
+        )
+
+        self.manager.save_playback_state(5, 10.0, self.test_reciter)
+        assert reader.load_playback_state()["current_surah"] == 5
+        assert reader.load_playback_state()["current_surah"] == 5
+        assert reader.get_read_stats()["cached_reads"] == 1
+
+        time.sleep(0.01)
+        self.manager.save_playback_state(6, 0.0, self.test_reciter)
+        assert reader.load_playback_state()["current_surah"] == 6
+        assert reader.get_read_stats()["disk_reads"] == 2
+
     def test_state_clearing(self):
         """Test state file clearing"""
         # Create state files
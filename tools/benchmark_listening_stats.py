@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Listening Stats Benchmark
+# =============================================================================
+# Times voice join/leave handling against listening stats with a growing
+# number of tracked users (in a temporary folder, real data is not touched)
+# Usage: python tools/benchmark_listening_stats.py [--users 1000 10000 50000]
+# =============================================================================
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import utils.listening_stats as listening_stats
+from utils.listening_stats import ListeningStatsManager, UserStats
+
+
+def benchmark(user_count: int, events: int) -> tuple:
+    """Get the average join+leave time and the snapshot time, in milliseconds"""
+    with tempfile.TemporaryDirectory() as data_dir:
+        manager = ListeningStatsManager(data_dir=Path(data_dir))
+        for user_id in range(user_count):
+            manager.users[user_id] = UserStats(user_id, total_time=60.0, sessions=1)
+        manager.save_stats()
+
+        started = time.perf_counter()
+        for i in range(events):
+            manager.user_joined_voice(i % user_count)
+            manager.user_left_voice(i % user_count)
+        voice_ms = (time.perf_counter() - started) * 1000 / events
+
+        started = time.perf_counter()
+        manager.close()
+        snapshot_ms = (time.perf_counter() - started) * 1000
+    return voice_ms, snapshot_ms
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark listening stats voice events by user count"
+    )
+    parser.add_argument("--users", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--events", type=int, default=200, help="Join/leave pairs")
+    args = parser.parse_args()
+
+    # Per-event tree logging would dominate the timings
+    listening_stats.log_perfect_tree_section = lambda *a, **k: None
+
+    print(f"{'users':>8}  {'join+leave':>12}  {'snapshot':>10}")
+    for user_count in args.users:
+        voice_ms, snapshot_ms = benchmark(user_count, args.events)
+        print(f"{user_count:>8}  {voice_ms:>9.3f} ms  {snapshot_ms:>7.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Opus Cache Builder
+# =============================================================================
+# Offline pre-encode of reciter MP3s into the Ogg Opus passthrough cache
+# Usage: python tools/build_opus_cache.py [--reciter NAME] [--bitrate 64]
+#        [--loudness-target -16 | --loudness-target off]
+# =============================================================================
+
+import argparse
+import asyncio
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.audio_library import AudioLibrary
+from utils.loudness import DEFAULT_TARGET_LUFS, LoudnessAnalyzer
+from utils.opus_cache import DEFAULT_BITRATE_KBPS, OpusCache
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description="Pre-encode QuranBot audio into the Opus passthrough cache"
+    )
+    parser.add_argument("--audio-folder", default="audio", help="Audio base folder")
+    parser.add_argument("--reciter", help="Only encode this reciter")
+    parser.add_argument(
+        "--bitrate",
+        type=int,
+        default=DEFAULT_BITRATE_KBPS,
+        help="Target bitrate in kbps (match the voice channel bitrate)",
+    )
+    parser.add_argument(
+        "--loudness-target",
+        default=os.getenv("LOUDNESS_TARGET_LUFS", str(DEFAULT_TARGET_LUFS)),
+        help="Normalization target in LUFS baked into the encode, or 'off' (match the bot)",
+    )
+    parser.add_argument("--ffmpeg", default=os.getenv("FFMPEG_PATH", "ffmpeg"))
+    args = parser.parse_args()
+
+    library = AudioLibrary(args.audio_folder)
+    library.refresh()
+
+    reciters = [args.reciter] if args.reciter else library.get_reciters()
+    files = [f for reciter in reciters for f in library.get_files(reciter)]
+    if not files:
+        print("❌ No audio files found")
+        return 1
+
+    loudness = None
+    if args.loudness_target.strip().lower() not in ("", "off", "none"):
+        loudness = LoudnessAnalyzer(args.ffmpeg, library, float(args.loudness_target))
+
+    print(f"🗜️ Encoding {len(files)} files at {args.bitrate}k...")
+    cache = OpusCache(args.ffmpeg, library, loudness=loudness)
+    cached = asyncio.run(cache.encode_files(files, args.bitrate))
+
+    print(f"✅ {cached}/{len(files)} files cached ({cache.stats['failed']} failed)")
+    return 0 if cached == len(files) else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - JSON to SQLite Migration
+# =============================================================================
+# Imports quiz_stats.json, user_cache.json and the verse statistics from
+# daily_verses_state.json into data/quranbot.db. Rows already in the database
+# are never overwritten, so running it again only adds missing entries
+# Usage: python tools/migrate_to_sqlite.py [--data-dir data] [--db data/quranbot.db]
+# =============================================================================
+
+import argparse
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.data_store import DB_FILE, DataStore
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description="Import QuranBot's JSON statistics into the SQLite data store"
+    )
+    parser.add_argument("--data-dir", default="data", help="Folder with the JSON files")
+    parser.add_argument("--db", default=str(DB_FILE), help="SQLite database path")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.data_dir):
+        print(f"❌ Data folder not found: {args.data_dir}")
+        return 1
+
+    store = DataStore(args.db)
+    try:
+        counts = store.import_json(args.data_dir)
+    finally:
+        store.close()
+
+    for name, count in counts.items():
+        print(f"🗄️ {name}: {count}")
+    print(f"✅ Imported into {args.db} (the JSON files were left in place)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
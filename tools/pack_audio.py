@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# =============================================================================
+# QuranBot - Audio Packer
+# =============================================================================
+# Packs reciter folders into single .qpack archives and unpacks them again
+# Usage: python tools/pack_audio.py pack [--reciter NAME] [--remove-folder]
+#        python tools/pack_audio.py unpack --reciter NAME
+# =============================================================================
+
+import argparse
+import os
+import shutil
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.audio_library import AudioLibrary
+from utils.audio_pack import PACK_SUFFIX, unpack, write_pack
+
+
+def pack_reciter(library: AudioLibrary, audio_folder: str, reciter: str, remove: bool):
+    folder = os.path.join(audio_folder, reciter)
+    pack_path = folder + PACK_SUFFIX
+
+    # Keep measurements the bot already made (loudness, health)
+    entries = {
+        os.path.basename(path): library.get_entry(path) or {}
+        for path in library.get_files(reciter)
+    }
+    count = write_pack(folder, pack_path, reciter, entries)
+    print(f"📦 {reciter}: {count} files → {pack_path}")
+
+    if remove:
+        shutil.rmtree(folder)
+        print(f"🗑️ Removed {folder} (the archive is used from now on)")
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description="Pack QuranBot reciter folders into .qpack archives, or unpack them"
+    )
+    parser.add_argument("action", choices=["pack", "unpack"])
+    parser.add_argument("--audio-folder", default="audio", help="Audio base folder")
+    parser.add_argument("--reciter", help="Only this reciter (required for unpack)")
+    parser.add_argument(
+        "--remove-folder",
+        action="store_true",
+        help="Delete each folder after packing (a folder takes precedence over its archive)",
+    )
+    args = parser.parse_args()
+
+    if args.action == "unpack":
+        if not args.reciter:
+            print("❌ --reciter is required for unpack")
+            return 1
+        pack_path = os.path.join(args.audio_folder, args.reciter + PACK_SUFFIX)
+        folder = os.path.join(args.audio_folder, args.reciter)
+        count = unpack(pack_path, folder)
+        print(f"📂 {args.reciter}: {count} files → {folder}")
+        return 0
+
+    library = AudioLibrary(args.audio_folder)
+    library.refresh()
+
+    reciters = (
+        [args.reciter]
+        if args.reciter
+        else [
+            name
+            for name in library.get_reciters()
+            if os.path.isdir(os.path.join(args.audio_folder, name))
+        ]
+    )
+    if not reciters:
+        print("❌ No reciter folders found")
+        return 1
+
+    for reciter in reciters:
+        pack_reciter(library, args.audio_folder, reciter, args.remove_folder)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())